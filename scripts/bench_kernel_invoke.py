@@ -0,0 +1,110 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Microbenchmark for Kernel invocation overhead.
+
+Reports the time per call added by the kernel on top of calling the plugin
+function directly, for sync and async functions with and without filters.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_kernel_invoke.py [--calls 100000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from openstackai.kernel import FunctionFilter, Kernel
+from openstackai.plugins import Plugin, function
+
+
+class BenchPlugin(Plugin):
+    name = "bench"
+
+    @function
+    def add(self, a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    @function
+    async def add_async(self, a: int, b: int) -> int:
+        """Add two numbers asynchronously."""
+        return a + b
+
+
+class PassThroughFilter(FunctionFilter):
+    pass
+
+
+def _per_call_us(elapsed: float, calls: int) -> float:
+    return elapsed / calls * 1_000_000
+
+
+def bench_sync(kernel: Kernel, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        kernel.invoke("bench", "add", a=1, b=2)
+    return _per_call_us(time.perf_counter() - start, calls)
+
+
+def bench_async(kernel: Kernel, function_name: str, calls: int) -> float:
+    async def run() -> float:
+        start = time.perf_counter()
+        for _ in range(calls):
+            await kernel.invoke_async("bench", function_name, a=1, b=2)
+        return time.perf_counter() - start
+
+    loop = asyncio.new_event_loop()
+    try:
+        return _per_call_us(loop.run_until_complete(run()), calls)
+    finally:
+        loop.close()
+
+
+def bench_sync_wrapper_async(kernel: Kernel, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        kernel.invoke("bench", "add_async", a=1, b=2)
+    return _per_call_us(time.perf_counter() - start, calls)
+
+
+def bench_direct(calls: int) -> float:
+    plugin = BenchPlugin()
+    start = time.perf_counter()
+    for _ in range(calls):
+        plugin.add(a=1, b=2)
+    return _per_call_us(time.perf_counter() - start, calls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--filters", type=int, default=3)
+    args = parser.parse_args()
+
+    plain = Kernel().add_plugin(BenchPlugin())
+    filtered = Kernel().add_plugin(BenchPlugin())
+    for _ in range(args.filters):
+        filtered.add_filter(PassThroughFilter())
+    sampled = Kernel(invocation_sample_rate=0.01).add_plugin(BenchPlugin())
+
+    baseline = bench_direct(args.calls)
+    rows = [
+        ("direct call (baseline)", baseline),
+        ("invoke, sync function", bench_sync(plain, args.calls)),
+        (f"invoke, sync function, {args.filters} filters", bench_sync(filtered, args.calls)),
+        ("invoke, sync function, 1% history sample", bench_sync(sampled, args.calls)),
+        ("invoke_async, sync function", bench_async(plain, "add", args.calls)),
+        ("invoke_async, async function", bench_async(plain, "add_async", args.calls)),
+        ("invoke, async function", bench_sync_wrapper_async(plain, args.calls // 10)),
+    ]
+    plain.close()
+
+    print(f"{'case':<44} {'us/call':>9} {'overhead':>9}")
+    for label, per_call in rows:
+        print(f"{label:<44} {per_call:>9.2f} {per_call - baseline:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,16 @@ Patterns - Common multi-agent orchestration patterns
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
 
 from openstackai.blueprint.orchestrator import AgentRole, Orchestrator
+from openstackai.core.ratelimit import RateLimiter
+
+_DONE = object()
+
+
+def _content(result: Any) -> str:
+    return result.content if hasattr(result, "content") else str(result)
 
 
 class RouterPattern(Orchestrator):
@@ -172,38 +179,163 @@ class MapReducePattern(Orchestrator):
     """
 
     def __init__(
-        self, mapper_agent: Any, reducer_agent: Any, num_workers: int = 3, name: str = "MapReduce"
+        self,
+        mapper_agent: Any,
+        reducer_agent: Any,
+        num_workers: int = 3,
+        name: str = "MapReduce",
+        rate_limit: Optional[float] = None,
+        reduce_token_budget: int = 8000,
+        model: str = "gpt-4",
     ):
+        """
+        Args:
+            mapper_agent: Agent run once per item
+            reducer_agent: Agent that synthesizes mapped outputs
+            num_workers: Maximum concurrent mapper (and reducer) calls
+            name: Pattern name
+            rate_limit: Maximum mapper calls started per second
+            reduce_token_budget: Token budget for one reduce prompt; larger
+                result sets are reduced hierarchically
+            model: Model used to count prompt tokens
+        """
         super().__init__(name)
         self.mapper = mapper_agent
         self.reducer = reducer_agent
         self.num_workers = num_workers
+        self.rate_limit = rate_limit
+        self.reduce_token_budget = reduce_token_budget
+        self.model = model
 
         self.pool.add(mapper_agent, name="mapper", role=AgentRole.WORKER)
         self.pool.add(reducer_agent, name="reducer", role=AgentRole.WORKER)
 
-    async def run(self, task: str, items: Optional[List[Any]] = None, **kwargs) -> Any:
-        """Execute map-reduce"""
-        items = items or [task]
+    async def iter_map(
+        self, task: str, items: Iterable[Any], **kwargs
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Map items with at most ``num_workers`` mapper calls in flight.
+
+        Items are pulled lazily, so generators of any size use constant memory.
+
+        Yields:
+            (item index, mapped output) pairs as each call finishes
+        """
+        results: asyncio.Queue = asyncio.Queue(maxsize=max(self.num_workers, 1) * 2)
+        pending = iter(enumerate(items))
+        limiter = RateLimiter(self.rate_limit) if self.rate_limit else None
+
+        async def worker() -> None:
+            try:
+                for index, item in pending:
+                    if limiter:
+                        await limiter.acquire()
+                    map_input = f"{task}\n\nItem to analyze: {item}"
+                    result = await self.mapper.run(map_input, **kwargs)
+                    await results.put((index, _content(result)))
+                await results.put(_DONE)
+            except Exception as e:
+                await results.put(e)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(self.num_workers, 1))]
+        running = len(workers)
+        try:
+            while running:
+                entry = await results.get()
+                if entry is _DONE:
+                    running -= 1
+                elif isinstance(entry, Exception):
+                    raise entry
+                else:
+                    yield entry
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def run(
+        self,
+        task: str,
+        items: Optional[Iterable[Any]] = None,
+        on_result: Optional[Callable[[int, str], Any]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Execute map-reduce
 
-        # Map phase - process items in parallel
-        map_tasks = []
-        for item in items:
-            map_input = f"{task}\n\nItem to analyze: {item}"
-            map_tasks.append(self.mapper.run(map_input, **kwargs))
+        Args:
+            task: Task description given to every mapper and reducer call
+            items: Items to map (defaults to the task itself)
+            on_result: Called with (index, output) as each mapped result arrives
+        """
+        items = items or [task]
 
-        map_results = await asyncio.gather(*map_tasks)
+        # Map phase - bounded parallelism, partial results streamed to on_result
+        mapped: Dict[int, str] = {}
+        async for index, output in self.iter_map(task, items, **kwargs):
+            mapped[index] = output
+            if on_result:
+                callback_result = on_result(index, output)
+                if asyncio.iscoroutine(callback_result):
+                    await callback_result
 
-        # Extract content from results
-        mapped_outputs = [r.content if hasattr(r, "content") else str(r) for r in map_results]
+        mapped_outputs = [mapped[i] for i in range(len(mapped))]
+        return await self.reduce(task, mapped_outputs, **kwargs)
 
-        # Reduce phase - combine results
+    def _reduce_prompt(self, task: str, outputs: List[str]) -> str:
         reduce_input = f"{task}\n\nResults to synthesize:\n"
-        for i, output in enumerate(mapped_outputs):
+        for i, output in enumerate(outputs):
             reduce_input += f"\n--- Result {i + 1} ---\n{output}\n"
+        return reduce_input
 
-        reduce_result = await self.reducer.run(reduce_input, **kwargs)
+    def _group(self, task: str, outputs: List[str]) -> List[List[str]]:
+        """Pack outputs into reduce groups that fit the token budget."""
+        from openstackai.tokens import get_counter
 
+        counter = get_counter(self.model)
+        header = counter.count_text(self._reduce_prompt(task, []))
+        sizes = counter.count_batch(
+            [f"\n--- Result {i + 1} ---\n{output}\n" for i, output in enumerate(outputs)]
+        )
+
+        groups: List[List[str]] = [[]]
+        used = header
+        for output, size in zip(outputs, sizes):
+            current = groups[-1]
+            # Two per group at minimum so every level shrinks
+            if current and len(current) >= 2 and used + size > self.reduce_token_budget:
+                groups.append([])
+                used = header
+            groups[-1].append(output)
+            used += size
+        return groups
+
+    async def reduce(self, task: str, outputs: List[str], **kwargs) -> Any:
+        """
+        Reduce mapped outputs, hierarchically if they exceed the token budget.
+
+        Outputs are packed into budget-sized groups which are reduced in
+        parallel (up to ``num_workers`` at once); the partial syntheses form
+        the next level until one prompt fits. A lone trailing output is
+        carried to the next level as is rather than overfilling a group.
+        """
+        level = list(outputs)
+        semaphore = asyncio.Semaphore(max(self.num_workers, 1))
+
+        async def reduce_group(group: List[str]) -> str:
+            if len(group) == 1:
+                return group[0]
+            async with semaphore:
+                result = await self.reducer.run(self._reduce_prompt(task, group), **kwargs)
+            return _content(result)
+
+        while True:
+            groups = self._group(task, level)
+            if len(groups) == 1:
+                break
+            level = await asyncio.gather(*[reduce_group(group) for group in groups])
+
+        reduce_result = await self.reducer.run(self._reduce_prompt(task, level), **kwargs)
         return reduce_result.content if hasattr(reduce_result, "content") else reduce_result
 
 
@@ -4,7 +4,17 @@ Pipeline - Data flow between agents/skills
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Callable, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, List, Optional, Union
+
+# Marks the end of a stream on the queues between stages
+_END = object()
+
+
+class _Failure:
+    """Carries an exception from a stream worker to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
 
 
 @dataclass
@@ -14,17 +24,39 @@ class PipelineStage:
 
     Each stage transforms input data and passes it to the next stage.
 
+    The streaming options only apply to ``Pipeline.stream``:
+
+    - concurrency: Number of items this stage processes at once
+    - batch_size: Items handed to the processor together; the processor then
+      receives a list and must return a list of results of the same length
+    - batch_timeout: Seconds to wait for a batch to fill before sending it short
+    - blocking: Run a synchronous processor in a thread so it does not stall
+      the event loop
+
     Example:
         >>> stage = PipelineStage(
         ...     name="parse",
         ...     processor=lambda data: json.loads(data),
         ... )
+        >>> embed = PipelineStage("embed", embed_batch, batch_size=32, concurrency=4)
     """
 
     name: str
     processor: Callable[[Any], Any]
     validator: Optional[Callable[[Any], bool]] = None
     error_handler: Optional[Callable[[Exception], Any]] = None
+    concurrency: int = 1
+    batch_size: int = 1
+    batch_timeout: float = 0.0
+    blocking: bool = False
+
+    async def _call(self, data: Any) -> Any:
+        if self.blocking:
+            return await asyncio.get_running_loop().run_in_executor(None, self.processor, data)
+        result = self.processor(data)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
 
     async def process(self, data: Any) -> Any:
         """Process data through this stage"""
@@ -33,15 +65,32 @@ class PipelineStage:
             raise ValueError(f"Validation failed for stage '{self.name}'")
 
         try:
-            result = self.processor(data)
-            if asyncio.iscoroutine(result):
-                result = await result
-            return result
+            return await self._call(data)
         except Exception as e:
             if self.error_handler:
                 return self.error_handler(e)
             raise
 
+    async def process_batch(self, items: List[Any]) -> List[Any]:
+        """Process a micro-batch; the processor maps a list to a list of equal length"""
+        if self.validator:
+            for item in items:
+                if not self.validator(item):
+                    raise ValueError(f"Validation failed for stage '{self.name}'")
+
+        try:
+            results = list(await self._call(items))
+        except Exception as e:
+            if self.error_handler:
+                return [self.error_handler(e) for _ in items]
+            raise
+
+        if len(results) != len(items):
+            raise ValueError(
+                f"Stage '{self.name}' returned {len(results)} results for {len(items)} items"
+            )
+        return results
+
 
 class Pipeline:
     """
@@ -101,6 +150,162 @@ class Pipeline:
 
         return current_data
 
+    async def stream(
+        self,
+        source: Union[AsyncIterable[Any], Iterable[Any]],
+        *,
+        ordered: bool = True,
+        buffer_size: int = 16,
+        max_in_flight: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream items through the pipeline with all stages running concurrently.
+
+        Each stage runs ``stage.concurrency`` workers reading from a bounded
+        queue, so a slow stage throttles the stages before it instead of
+        buffering without limit.
+
+        Args:
+            source: Async or regular iterable of input items
+            ordered: Yield results in input order (otherwise as they finish)
+            buffer_size: Capacity of the queue in front of each stage
+            max_in_flight: Items read from ``source`` but not yet yielded
+                (default: ``buffer_size`` per stage plus one)
+
+        Yields:
+            Transformed items
+
+        Raises:
+            Exception: The first error raised by a stage; remaining work is cancelled
+
+        Example:
+            >>> async for summary in pipeline.stream(documents, buffer_size=8):
+            ...     print(summary)
+        """
+        queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=buffer_size) for _ in range(len(self.stages) + 1)
+        ]
+        in_flight = asyncio.Semaphore(max_in_flight or buffer_size * (len(self.stages) + 1))
+        output = queues[-1]
+
+        async def feed() -> None:
+            try:
+                sequence = 0
+                if hasattr(source, "__aiter__"):
+                    async for item in source:
+                        await in_flight.acquire()
+                        await queues[0].put((sequence, item))
+                        sequence += 1
+                else:
+                    for item in source:
+                        await in_flight.acquire()
+                        await queues[0].put((sequence, item))
+                        sequence += 1
+                await queues[0].put(_END)
+            except Exception as e:
+                await output.put(_Failure(e))
+
+        workers = [asyncio.ensure_future(feed())]
+        for index, stage in enumerate(self.stages):
+            remaining = [max(stage.concurrency, 1)]
+            for _ in range(remaining[0]):
+                worker = self._stage_worker(
+                    stage, queues[index], queues[index + 1], remaining, output
+                )
+                workers.append(asyncio.ensure_future(worker))
+
+        waiting = {}
+        next_sequence = 0
+        try:
+            while True:
+                entry = await output.get()
+                if entry is _END:
+                    break
+                if isinstance(entry, _Failure):
+                    raise entry.error
+
+                sequence, value = entry
+                if not ordered:
+                    in_flight.release()
+                    yield value
+                    continue
+
+                waiting[sequence] = value
+                while next_sequence in waiting:
+                    value = waiting.pop(next_sequence)
+                    next_sequence += 1
+                    in_flight.release()
+                    yield value
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _stage_worker(
+        self,
+        stage: PipelineStage,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        remaining: List[int],
+        output: asyncio.Queue,
+    ) -> None:
+        """Process items for one stage until the end marker arrives"""
+        try:
+            while True:
+                batch = await self._take_batch(stage, inbox)
+                if not batch:
+                    # Let sibling workers see the end too; the last one forwards it
+                    await inbox.put(_END)
+                    remaining[0] -= 1
+                    if remaining[0] == 0:
+                        await outbox.put(_END)
+                    return
+
+                sequences = [sequence for sequence, _ in batch]
+                values = []
+                for _, value in batch:
+                    for middleware in self._middleware:
+                        value = await self._apply_middleware(middleware, stage, value)
+                    values.append(value)
+
+                if stage.batch_size > 1:
+                    results = await stage.process_batch(values)
+                else:
+                    results = [await stage.process(values[0])]
+
+                for sequence, result in zip(sequences, results):
+                    await outbox.put((sequence, result))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await output.put(_Failure(e))
+
+    @staticmethod
+    async def _take_batch(stage: PipelineStage, inbox: asyncio.Queue) -> List[Any]:
+        """Take up to ``stage.batch_size`` items; empty once the stream has ended"""
+        first = await inbox.get()
+        if first is _END:
+            return []
+
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            try:
+                wait = deadline - loop.time()
+                if wait > 0:
+                    entry = await asyncio.wait_for(inbox.get(), wait)
+                else:
+                    entry = inbox.get_nowait()
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            if entry is _END:
+                # Put it back so the next take ends this worker
+                inbox.put_nowait(entry)
+                break
+            batch.append(entry)
+        return batch
+
     async def _apply_middleware(self, middleware: Callable, stage: PipelineStage, data: Any) -> Any:
         """Apply middleware to a stage execution"""
         result = middleware(stage, data)
@@ -225,13 +430,39 @@ class DataPipeline(Pipeline):
     Provides common data transformation utilities.
     """
 
-    def map(self, func: Callable) -> "DataPipeline":
-        """Map a function over a list of items"""
+    def map(self, func: Callable, concurrency: Optional[int] = None) -> "DataPipeline":
+        """
+        Map a function over a list of items
+
+        Args:
+            func: Sync or async function applied to each item
+            concurrency: Maximum calls in flight. Async functions default to
+                unbounded; sync functions run serially unless this is set, in
+                which case they run in a thread pool
+        """
 
         async def map_processor(data: List[Any]) -> List[Any]:
             if asyncio.iscoroutinefunction(func):
-                return await asyncio.gather(*[func(item) for item in data])
-            return [func(item) for item in data]
+                if not concurrency:
+                    return await asyncio.gather(*[func(item) for item in data])
+                semaphore = asyncio.Semaphore(concurrency)
+
+                async def bounded(item: Any) -> Any:
+                    async with semaphore:
+                        return await func(item)
+
+                return await asyncio.gather(*[bounded(item) for item in data])
+
+            if not concurrency:
+                return [func(item) for item in data]
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                return await asyncio.gather(
+                    *[loop.run_in_executor(executor, func, item) for item in data]
+                )
 
         return self.add_stage(PipelineStage(name="map", processor=map_processor))
 
@@ -3,9 +3,12 @@ Workflow - Multi-step agent processes
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 
 class StepType(Enum):
@@ -16,7 +19,12 @@ class StepType(Enum):
     FUNCTION = "function"  # Run a custom function
     CONDITION = "condition"  # Conditional branching
     PARALLEL = "parallel"  # Parallel execution
-    LOOP = "loop"  # Loop over items
+    LOOP = "loop"  # Loop over items (fan-out)
+    JOIN = "join"  # Barrier collecting dependency results
+
+
+# Step types that only see their mapped inputs and dependency results
+_MAPPED_INPUT_STEPS = (StepType.AGENT, StepType.SKILL, StepType.JOIN)
 
 
 class StepStatus(Enum):
@@ -80,6 +88,7 @@ class Step:
     - Skill executions
     - Custom functions
     - Conditional branches
+    - Fan-out over a list (LOOP) and joins (JOIN)
 
     Example:
         >>> step = Step(
@@ -108,6 +117,13 @@ class Step:
     # For parallel steps
     parallel_steps: List["Step"] = field(default_factory=list)
 
+    # For loop (fan-out) steps: run loop_step once per item of context[items_key]
+    loop_step: Optional["Step"] = None
+    items_key: Optional[str] = None
+    item_key: str = "item"  # Context key holding the current item
+    item_filter: Optional[Callable[[Any], bool]] = None
+    max_concurrency: Optional[int] = None  # None = all items at once
+
     # Data mapping
     input_mapping: Dict[str, str] = field(default_factory=dict)  # step_input -> context_key
     output_mapping: Dict[str, str] = field(default_factory=dict)  # result_key -> context_key
@@ -116,6 +132,8 @@ class Step:
     next_step: Optional[str] = None
     on_error: Optional[str] = None  # Step to run on error
     retry_count: int = 0
+    depends_on: List[str] = field(default_factory=list)  # Run once these complete
+    memoize: Optional[bool] = None  # None = use the workflow's setting
 
     # Status
     status: StepStatus = StepStatus.PENDING
@@ -159,6 +177,12 @@ class Step:
                 results = await asyncio.gather(*tasks)
                 self.result = results
 
+            elif self.step_type == StepType.LOOP and self.loop_step:
+                self.result = await self._fan_out(context)
+
+            elif self.step_type == StepType.JOIN:
+                self.result = {name: context.get(name) for name in self.depends_on}
+
             # Map outputs to context
             self._set_outputs(context, self.result)
 
@@ -172,6 +196,25 @@ class Step:
             self.error = str(e)
             raise
 
+    async def _fan_out(self, context: WorkflowContext) -> List[Any]:
+        """Run loop_step for every (filtered) item, up to max_concurrency at once"""
+        items = context.get(self.items_key) or []
+        if self.item_filter:
+            items = [item for item in items if self.item_filter(item)]
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+        async def run_item(item: Any) -> Any:
+            item_context = context.clone()
+            item_context.set(self.item_key, item)
+            # Each item gets its own copy so status and result do not collide
+            step = copy.copy(self.loop_step)
+            if semaphore is None:
+                return await step.execute(item_context)
+            async with semaphore:
+                return await step.execute(item_context)
+
+        return list(await asyncio.gather(*[run_item(item) for item in items]))
+
     def _get_inputs(self, context: WorkflowContext) -> Dict[str, Any]:
         """Get inputs from context using mapping"""
         inputs = {}
@@ -207,6 +250,19 @@ class Workflow:
     - Error handling
     - Data flow between steps
 
+    Once any step declares ``depends_on``, the workflow runs as a dependency
+    graph: every step starts as soon as the steps it depends on complete, so
+    independent branches overlap. Steps without ``depends_on`` start
+    immediately; steps named only as another step's ``on_error`` run only
+    when that step fails. As in sequential mode, a handled failure does not
+    resume the failed step's path: its dependents, direct and transitive,
+    never start and end up SKIPPED.
+
+    With ``memoize=True`` a step whose inputs (mapped inputs plus dependency
+    results) match a previous run reuses its result instead of running again.
+    Function, condition, parallel and loop steps are handed the whole
+    context, so for them every context value counts as an input.
+
     Example:
         >>> workflow = (Workflow("ResearchWorkflow")
         ...     .add_step(Step("search", step_type=StepType.SKILL, skill=search_skill))
@@ -214,14 +270,23 @@ class Workflow:
         ...     .add_step(Step("summarize", step_type=StepType.AGENT, agent=writer_agent))
         ... )
         >>> result = await workflow.run(topic="AI trends")
+
+        >>> graph = (Workflow("Report", memoize=True)
+        ...     .add_step(agent_step("news", news_agent))
+        ...     .add_step(agent_step("market", market_agent))
+        ...     .add_step(join_step("gather", ["news", "market"]))
+        ...     .add_step(agent_step("write", writer_agent, depends_on=["gather"]))
+        ... )
     """
 
-    def __init__(self, name: str = "Workflow"):
+    def __init__(self, name: str = "Workflow", memoize: bool = False):
         self.name = name
+        self.memoize = memoize
         self.steps: Dict[str, Step] = {}
         self.step_order: List[str] = []
         self.start_step: Optional[str] = None
         self._context: Optional[WorkflowContext] = None
+        self._memo: Dict[str, Any] = {}
 
     def add_step(self, step: Step) -> "Workflow":
         """Add a step to the workflow"""
@@ -273,6 +338,10 @@ class Workflow:
         for step in self.steps.values():
             step.status = StepStatus.PENDING
 
+        if any(step.depends_on for step in self.steps.values()):
+            await self._run_graph(self._context)
+            return self._context
+
         # Execute steps
         current_step_name = self.start_step
 
@@ -282,7 +351,7 @@ class Workflow:
                 break
 
             try:
-                await step.execute(self._context)
+                await self._execute(step, self._context)
                 current_step_name = step.next_step
 
             except Exception:
@@ -293,6 +362,113 @@ class Workflow:
 
         return self._context
 
+    async def _run_graph(self, context: WorkflowContext) -> None:
+        """Run steps as a dependency graph, starting each as soon as it is unblocked"""
+        handlers = {step.on_error for step in self.steps.values() if step.on_error}
+        nodes = {
+            name: step
+            for name, step in self.steps.items()
+            if name not in handlers or step.depends_on
+        }
+        children: Dict[str, List[str]] = {name: [] for name in nodes}
+        waiting: Dict[str, int] = {}
+        for name, step in nodes.items():
+            for dependency in step.depends_on:
+                if dependency not in nodes:
+                    raise ValueError(f"Step '{name}' depends on unknown step '{dependency}'")
+                children[dependency].append(name)
+            waiting[name] = len(set(step.depends_on))
+        self._check_acyclic(nodes, children, waiting)
+
+        running: Dict[asyncio.Future, str] = {}
+
+        def start(name: str) -> None:
+            running[asyncio.ensure_future(self._execute(nodes[name], context))] = name
+
+        for name, count in waiting.items():
+            if count == 0:
+                start(name)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        step = nodes[name]
+                        handler = self.steps.get(step.on_error) if step.on_error else None
+                        if handler is None:
+                            raise error
+                        await self._execute(handler, context)
+                        # Dependents never start; they are marked SKIPPED below
+                        continue
+
+                    for child in set(children[name]):
+                        waiting[child] -= 1
+                        if waiting[child] == 0:
+                            start(child)
+        finally:
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for step in nodes.values():
+                if step.status == StepStatus.PENDING:
+                    step.status = StepStatus.SKIPPED
+
+    @staticmethod
+    def _check_acyclic(
+        nodes: Dict[str, Step], children: Dict[str, List[str]], waiting: Dict[str, int]
+    ) -> None:
+        remaining = dict(waiting)
+        ready = [name for name, count in remaining.items() if count == 0]
+        seen: Set[str] = set()
+        while ready:
+            name = ready.pop()
+            seen.add(name)
+            for child in set(children[name]):
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if len(seen) < len(nodes):
+            cycle = sorted(set(nodes) - seen)
+            raise ValueError(f"Workflow steps form a dependency cycle: {', '.join(cycle)}")
+
+    async def _execute(self, step: Step, context: WorkflowContext) -> Any:
+        """Execute a step, reusing a memoized result when its inputs are unchanged"""
+        memoize = self.memoize if step.memoize is None else step.memoize
+        if not memoize:
+            return await step.execute(context)
+
+        key = self._memo_key(step, context)
+        if key in self._memo:
+            step.result = self._memo[key]
+            step._set_outputs(context, step.result)
+            step.status = StepStatus.COMPLETED
+            context.add_to_history(step.name, step.result)
+            return step.result
+
+        result = await step.execute(context)
+        self._memo[key] = result
+        return result
+
+    def _memo_key(self, step: Step, context: WorkflowContext) -> str:
+        payload = {
+            "step": step.name,
+            "inputs": step._get_inputs(context),
+            "dependencies": {name: context.get(name) for name in step.depends_on},
+        }
+        if step.step_type not in _MAPPED_INPUT_STEPS:
+            # Handlers and conditions are passed the whole context, so any of it may matter
+            payload["context"] = context.data
+        encoded = json.dumps(payload, sort_keys=True, default=repr)
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+    def clear_cache(self) -> None:
+        """Forget memoized step results"""
+        self._memo.clear()
+
     def get_step(self, name: str) -> Optional[Step]:
         """Get a step by name"""
         return self.steps.get(name)
@@ -334,6 +510,31 @@ def skill_step(
     )
 
 
+def join_step(name: str, after: List[str], **kwargs) -> Step:
+    """Create a join (barrier) step whose result maps each dependency to its result"""
+    return Step(name=name, step_type=StepType.JOIN, depends_on=list(after), **kwargs)
+
+
+def loop_step(
+    name: str,
+    step: Step,
+    items_key: str,
+    max_concurrency: Optional[int] = None,
+    item_filter: Optional[Callable[[Any], bool]] = None,
+    **kwargs,
+) -> Step:
+    """Create a fan-out step that runs ``step`` once per item of context[items_key]"""
+    return Step(
+        name=name,
+        step_type=StepType.LOOP,
+        loop_step=step,
+        items_key=items_key,
+        max_concurrency=max_concurrency,
+        item_filter=item_filter,
+        **kwargs,
+    )
+
+
 def function_step(
     name: str, handler: Callable, input_mapping: Optional[Dict[str, str]] = None, **kwargs
 ) -> Step:
@@ -4,16 +4,26 @@ Core module - Foundation classes for openstackai
 
 from openstackai.core.agent import Agent
 from openstackai.core.base import BaseComponent
-from openstackai.core.llm import AzureOpenAIProvider, LLMConfig, LLMProvider, OpenAIProvider
-from openstackai.core.memory import ConversationMemory, Memory
+from openstackai.core.llm import (
+    AzureOpenAIProvider,
+    CachedLLMProvider,
+    LLMConfig,
+    LLMProvider,
+    OpenAIProvider,
+    SemanticCache,
+)
+from openstackai.core.memory import ContextWindow, ConversationMemory, Memory
 
 __all__ = [
     "Agent",
     "BaseComponent",
     "Memory",
     "ConversationMemory",
+    "ContextWindow",
     "LLMProvider",
     "LLMConfig",
     "OpenAIProvider",
     "AzureOpenAIProvider",
+    "SemanticCache",
+    "CachedLLMProvider",
 ]
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 from openstackai.core.base import BaseComponent, Executable
 from openstackai.core.llm import LLMProvider
 from openstackai.core.memory import ConversationMemory, Memory
+from openstackai.tokens.counter import get_counter
 
 
 @dataclass
@@ -22,6 +23,11 @@ class AgentConfig:
     retry_on_failure: bool = True
     max_retries: int = 3
 
+    # Context window: prompt (system + messages) budget in tokens, and
+    # tokens kept free for the completion (default: the LLM's max_tokens)
+    max_context_tokens: Optional[int] = None
+    reserve_output_tokens: Optional[int] = None
+
 
 @dataclass
 class AgentResponse:
@@ -148,6 +154,7 @@ class Agent(BaseComponent, Executable):
 
             # Build the prompt with instructions
             system_prompt = self._build_system_prompt()
+            budget = self._context_budget(system_prompt)
 
             # Main agent loop
             while self._current_iteration < self.config.max_iterations:
@@ -156,7 +163,9 @@ class Agent(BaseComponent, Executable):
                 # Get LLM response
                 response = await self._get_llm_response(
                     system_prompt=system_prompt,
-                    messages=self.memory.get_messages(),
+                    messages=self.memory.get_context(
+                        max_tokens=budget, model=self._model, query=message
+                    ),
                     context=context,
                 )
 
@@ -198,6 +207,23 @@ class Agent(BaseComponent, Executable):
             return "You are a helpful AI assistant."
         return self.instructions.render()
 
+    @property
+    def _model(self) -> str:
+        """Model name used for token counting."""
+        config = getattr(self.llm, "config", None)
+        return getattr(config, "model", None) or "gpt-4"
+
+    def _context_budget(self, system_prompt: str) -> Optional[int]:
+        """Tokens available for conversation messages (None = unlimited)."""
+        if self.config.max_context_tokens is None:
+            return None
+        reserve = self.config.reserve_output_tokens
+        if reserve is None:
+            reserve = getattr(getattr(self.llm, "config", None), "max_tokens", 0) or 0
+        counter = get_counter(self._model)
+        system_tokens = counter.count_message({"role": "system", "content": system_prompt})
+        return max(self.config.max_context_tokens - reserve - system_tokens, 0)
+
     async def _get_llm_response(
         self,
         system_prompt: str,
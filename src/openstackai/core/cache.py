@@ -8,13 +8,18 @@ Cache contexts and prompts to reduce token costs.
 Like Google ADK's context caching.
 """
 
+import asyncio
 import hashlib
+import heapq
 import json
 import threading
 import time
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .disk_cache import DiskCache
+from .eviction import EvictionPolicy, create_policy
 
 
 @dataclass
@@ -28,6 +33,7 @@ class CacheEntry:
         expires_at: Expiration timestamp
         hits: Number of cache hits
         tokens: Estimated token count
+        stale_at: When the value stops being fresh (served stale until expiry)
     """
 
     key: str
@@ -36,6 +42,7 @@ class CacheEntry:
     expires_at: Optional[float] = None
     hits: int = 0
     tokens: int = 0
+    stale_at: Optional[float] = None
 
     @property
     def is_expired(self) -> bool:
@@ -44,6 +51,33 @@ class CacheEntry:
             return False
         return time.time() > self.expires_at
 
+    @property
+    def is_stale(self) -> bool:
+        """Check if entry should be revalidated."""
+        if self.stale_at is None:
+            return False
+        return time.time() > self.stale_at
+
+
+class _CachedError:
+    """Negative cache entry: re-raised instead of recomputing."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Flight:
+    """A computation other threads can wait on (single-flight)."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
 
 class ContextCache:
     """Cache for context data to reduce token costs.
@@ -66,10 +100,22 @@ class ContextCache:
         @cache.cached
         def get_knowledge_base():
             return expensive_load()
+
+        # Size-aware eviction under a token budget
+        cache = ContextCache(max_tokens=200_000, policy="gdsf")
+
+        # Survive restarts and share across worker processes
+        cache = ContextCache(ttl=3600, disk=DiskCache("~/.cache/openstackai"))
     """
 
     def __init__(
-        self, ttl: Optional[float] = None, max_entries: int = 1000, max_tokens: Optional[int] = None
+        self,
+        ttl: Optional[float] = None,
+        max_entries: int = 1000,
+        max_tokens: Optional[int] = None,
+        policy: Union[str, EvictionPolicy] = "lru",
+        sweep_batch: int = 16,
+        disk: Optional[DiskCache] = None,
     ):
         """Initialize cache.
 
@@ -77,19 +123,41 @@ class ContextCache:
             ttl: Default time-to-live in seconds
             max_entries: Maximum cache entries
             max_tokens: Maximum total tokens to cache
+            policy: Eviction policy name ("lru", "lfu", "fifo", "tinylfu",
+                "gdsf") or an EvictionPolicy instance
+            sweep_batch: Expired entries purged per write (amortized TTL sweep)
+            disk: Persistent second tier; writes go through to it and memory
+                misses are served (and promoted) from it
         """
         self.ttl = ttl
         self.max_entries = max_entries
         self.max_tokens = max_tokens
+        self.sweep_batch = sweep_batch
+        self.disk = disk
 
         self._entries: Dict[str, CacheEntry] = {}
+        self._policy = create_policy(policy, capacity=max_entries)
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._total_tokens = 0
         self._lock = threading.RLock()
         self._stats = {
             "hits": 0,
             "misses": 0,
             "evictions": 0,
+            "expirations": 0,
+            "rejections": 0,
+            "coalesced": 0,
+            "stale_hits": 0,
+            "disk_hits": 0,
         }
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], "asyncio.Future"] = {}
+        self._background: Set["asyncio.Task"] = set()
+
+    @property
+    def policy(self) -> EvictionPolicy:
+        """The eviction policy in use."""
+        return self._policy
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a cached value.
@@ -101,24 +169,56 @@ class ContextCache:
         Returns:
             Cached value or default
         """
+        entry = self._lookup(key)
+        return default if entry is None else entry.value
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        """Find a live entry, updating hit/miss statistics."""
         with self._lock:
+            self._policy.record(key)
+            self._sweep_expired(self.sweep_batch)
             entry = self._entries.get(key)
 
-            if entry is None:
-                self._stats["misses"] += 1
-                return default
-
-            if entry.is_expired:
+            if entry is not None and entry.is_expired:
                 self._remove_entry(key)
+                self._stats["expirations"] += 1
+                entry = None
+
+            if entry is not None:
+                entry.hits += 1
+                self._policy.on_access(key, entry)
+                self._stats["hits"] += 1
+                return entry
+
+            if self.disk is None:
                 self._stats["misses"] += 1
-                return default
+                return None
 
-            entry.hits += 1
-            self._stats["hits"] += 1
-            return entry.value
+        # Disk I/O happens outside the lock
+        found = self.disk.get_entry(key)
+        with self._lock:
+            if found is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            value, info = found
+            return self._insert(
+                CacheEntry(
+                    key=key,
+                    value=value,
+                    expires_at=info["expires_at"],
+                    tokens=info["tokens"],
+                    stale_at=info["stale_at"],
+                )
+            )
 
     def set(
-        self, key: str, value: Any, ttl: Optional[float] = None, tokens: Optional[int] = None
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tokens: Optional[int] = None,
+        stale_after: Optional[float] = None,
     ) -> CacheEntry:
         """Set a cached value.
 
@@ -127,35 +227,66 @@ class ContextCache:
             value: Value to cache
             ttl: Override TTL for this entry
             tokens: Estimated token count
+            stale_after: Seconds after which the entry is stale (still
+                returned, but decorators refresh it in the background)
 
         Returns:
             The cache entry
         """
+        # Calculate expiration
+        entry_ttl = ttl if ttl is not None else self.ttl
+        expires_at = None
+        if entry_ttl is not None:
+            expires_at = time.time() + entry_ttl
+
+        # Estimate tokens if not provided
+        if tokens is None:
+            tokens = self._estimate_tokens(value)
+
+        stale_at = None
+        if stale_after is not None:
+            stale_at = time.time() + stale_after
+
+        entry = CacheEntry(
+            key=key, value=value, expires_at=expires_at, tokens=tokens, stale_at=stale_at
+        )
         with self._lock:
-            # Calculate expiration
-            entry_ttl = ttl if ttl is not None else self.ttl
-            expires_at = None
-            if entry_ttl is not None:
-                expires_at = time.time() + entry_ttl
-
-            # Estimate tokens if not provided
-            if tokens is None:
-                tokens = self._estimate_tokens(value)
+            self._policy.record(key)
+            self._insert(entry)
 
-            # Evict if necessary
-            self._evict_if_needed(tokens)
-
-            # Remove existing entry
-            if key in self._entries:
-                self._remove_entry(key)
+        # Negative (error) entries stay process-local
+        if self.disk is not None and not isinstance(value, _CachedError):
+            try:
+                self.disk.set(key, value, ttl=entry_ttl, tokens=tokens, stale_after=stale_after)
+            except TypeError:
+                # Needs pickle and the disk tier doesn't allow it: memory only
+                pass
+
+        return entry
+
+    def _insert(self, entry: CacheEntry) -> CacheEntry:
+        """Store an entry in memory, running admission and eviction."""
+        key = entry.key
+        self._sweep_expired(self.sweep_batch)
+
+        # Remove existing entry
+        if key in self._entries:
+            self._remove_entry(key)
+        elif not self._admit(key):
+            # Admission policy preferred the current contents
+            self._stats["rejections"] += 1
+            return entry
 
-            # Create entry
-            entry = CacheEntry(key=key, value=value, expires_at=expires_at, tokens=tokens)
+        # Evict if necessary
+        self._evict_if_needed(entry.tokens)
 
-            self._entries[key] = entry
-            self._total_tokens += tokens
+        self._entries[key] = entry
+        self._total_tokens += entry.tokens
+        self._policy.on_insert(key, entry)
+        if entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
 
-            return entry
+        return entry
 
     def delete(self, key: str) -> bool:
         """Delete a cached entry.
@@ -167,66 +298,103 @@ class ContextCache:
             True if deleted, False if not found
         """
         with self._lock:
-            if key in self._entries:
+            found = key in self._entries
+            if found:
                 self._remove_entry(key)
-                return True
-            return False
+        if self.disk is not None:
+            found = self.disk.delete(key) or found
+        return found
 
     def clear(self):
-        """Clear all cached entries."""
+        """Clear all cached entries (including the disk tier)."""
         with self._lock:
             self._entries.clear()
+            self._policy.clear()
+            self._expiry_heap.clear()
             self._total_tokens = 0
+        if self.disk is not None:
+            self.disk.clear()
 
     def has(self, key: str) -> bool:
         """Check if key is cached and not expired."""
         with self._lock:
             entry = self._entries.get(key)
-            if entry is None:
-                return False
-            if entry.is_expired:
+            if entry is not None and entry.is_expired:
                 self._remove_entry(key)
-                return False
+                self._stats["expirations"] += 1
+                entry = None
+        if entry is not None:
             return True
+        return self.disk is not None and self.disk.has(key)
+
+    def purge_expired(self) -> int:
+        """Remove every expired entry (in memory and on disk).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._sweep_expired(None)
+        if self.disk is not None:
+            removed += self.disk.purge_expired()
+        return removed
 
     def _remove_entry(self, key: str):
         """Remove an entry and update token count."""
         entry = self._entries.pop(key, None)
         if entry:
             self._total_tokens -= entry.tokens
+            self._policy.on_remove(key)
+
+    def _sweep_expired(self, limit: Optional[int]) -> int:
+        """Pop up to ``limit`` expired entries off the expiry heap."""
+        removed = 0
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now and (limit is None or removed < limit):
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Skip heap records for keys that were overwritten or deleted
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_entry(key)
+                self._stats["expirations"] += 1
+                removed += 1
+
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (e.expires_at, k) for k, e in self._entries.items() if e.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+        return removed
+
+    def _admit(self, key: str) -> bool:
+        """Ask the policy whether a new key may displace the next victim."""
+        if len(self._entries) < self.max_entries:
+            return True
+        victim = self._policy.victim()
+        return victim is None or self._policy.admit(key, victim)
 
     def _evict_if_needed(self, incoming_tokens: int):
         """Evict entries if limits exceeded."""
         # Check entry limit
         while len(self._entries) >= self.max_entries:
-            self._evict_oldest()
+            if not self._evict_one():
+                break
 
         # Check token limit
         if self.max_tokens:
             while self._total_tokens + incoming_tokens > self.max_tokens:
-                if not self._evict_oldest():
+                if not self._evict_one():
                     break
 
-    def _evict_oldest(self) -> bool:
-        """Evict the oldest entry."""
-        if not self._entries:
+    def _evict_one(self) -> bool:
+        """Evict the entry chosen by the policy."""
+        key = self._policy.victim()
+        if key is None:
             return False
-
-        # Find oldest entry
-        oldest_key = None
-        oldest_time = float("inf")
-
-        for key, entry in self._entries.items():
-            if entry.created_at < oldest_time:
-                oldest_time = entry.created_at
-                oldest_key = key
-
-        if oldest_key:
-            self._remove_entry(oldest_key)
-            self._stats["evictions"] += 1
-            return True
-
-        return False
+        self._remove_entry(key)
+        self._stats["evictions"] += 1
+        return True
 
     def _estimate_tokens(self, value: Any) -> int:
         """Estimate token count for a value."""
@@ -243,12 +411,26 @@ class ContextCache:
         else:
             return 10  # Default for unknown types
 
-    def cached(self, key: Optional[str] = None, ttl: Optional[float] = None) -> Callable:
+    def cached(
+        self,
+        key: Optional[str] = None,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+    ) -> Callable:
         """Decorator to cache function results.
 
+        Works on both sync and async functions. Concurrent misses on the
+        same key are coalesced: one caller computes, the others wait for
+        its result (threads) or await it (asyncio tasks).
+
         Args:
             key: Cache key (defaults to function name)
             ttl: Override TTL
+            stale_ttl: Keep serving an expired value for this many extra
+                seconds while it is recomputed in the background
+            negative_ttl: Cache exceptions for this many seconds and
+                re-raise them instead of calling the function again
 
         Returns:
             Decorator function
@@ -259,35 +441,25 @@ class ContextCache:
             @cache.cached
             def load_knowledge():
                 return expensive_operation()
+
+            @cache.cached(ttl=60, stale_ttl=300)
+            async def retrieve(query):
+                return await rag.search(query)
         """
 
         def decorator(func: Callable) -> Callable:
             cache_key = key or func.__name__
 
-            @wraps(func)
-            def wrapper(*args, **kwargs):
+            def make_key(args, kwargs):
                 # Build key with args
                 if args or kwargs:
                     arg_key = hashlib.md5(
                         json.dumps((args, kwargs), sort_keys=True, default=str).encode()
                     ).hexdigest()[:8]
-                    full_key = f"{cache_key}:{arg_key}"
-                else:
-                    full_key = cache_key
-
-                # Check cache
-                cached_value = self.get(full_key)
-                if cached_value is not None:
-                    return cached_value
-
-                # Call function
-                result = func(*args, **kwargs)
-
-                # Cache result
-                self.set(full_key, result, ttl=ttl)
-
-                return result
+                    return f"{cache_key}:{arg_key}"
+                return cache_key
 
+            wrapper = self._decorate(func, make_key, ttl, stale_ttl, negative_ttl)
             wrapper._cache_key = cache_key
             return wrapper
 
@@ -299,31 +471,215 @@ class ContextCache:
 
         return decorator
 
+    def _decorate(
+        self,
+        func: Callable,
+        make_key: Callable,
+        ttl: Optional[float],
+        stale_ttl: Optional[float],
+        negative_ttl: Optional[float],
+    ) -> Callable:
+        """Wrap ``func`` with lookup, single-flight loading and refresh."""
+        options = (ttl, stale_ttl, negative_ttl)
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                full_key = make_key(args, kwargs)
+                entry = self._lookup(full_key)
+                if entry is not None:
+                    if entry.is_stale and self._mark_stale_hit(full_key):
+                        self._spawn_refresh(full_key, lambda: func(*args, **kwargs), options)
+                    return self._unwrap(entry.value)
+                return await self._load_async(full_key, lambda: func(*args, **kwargs), options)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            full_key = make_key(args, kwargs)
+            entry = self._lookup(full_key)
+            if entry is not None:
+                if entry.is_stale and self._mark_stale_hit(full_key):
+                    threading.Thread(
+                        target=self._refresh_sync,
+                        args=(full_key, lambda: func(*args, **kwargs), options),
+                        daemon=True,
+                    ).start()
+                return self._unwrap(entry.value)
+            return self._load_sync(full_key, lambda: func(*args, **kwargs), options)
+
+        return wrapper
+
+    def _mark_stale_hit(self, key: str) -> bool:
+        """Count a stale hit; True if no refresh for ``key`` is running yet."""
+        with self._lock:
+            self._stats["stale_hits"] += 1
+            return key not in self._flights and not any(
+                flight_key == key for _, flight_key in self._async_flights
+            )
+
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        if isinstance(value, _CachedError):
+            raise value.error
+        return value
+
+    def _store(self, key: str, result: Any, options: Tuple) -> None:
+        ttl, stale_ttl, _ = options
+        entry_ttl = ttl if ttl is not None else self.ttl
+        if stale_ttl is not None and entry_ttl is not None:
+            self.set(key, result, ttl=entry_ttl + stale_ttl, stale_after=entry_ttl)
+        else:
+            self.set(key, result, ttl=ttl)
+
+    def _store_error(self, key: str, error: BaseException, options: Tuple) -> None:
+        negative_ttl = options[2]
+        if negative_ttl is not None and isinstance(error, Exception):
+            self.set(key, _CachedError(error), ttl=negative_ttl, tokens=1)
+
+    def _load_sync(self, key: str, loader: Callable, options: Tuple, refresh: bool = False) -> Any:
+        """Run ``loader`` once per key no matter how many threads miss."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                # Another leader may have finished between our miss and now
+                entry = self._entries.get(key)
+                if entry is not None and not entry.is_expired and not (refresh and entry.is_stale):
+                    return None if refresh else self._unwrap(entry.value)
+                flight = self._flights[key] = _Flight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            if refresh:
+                return None
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = loader()
+        except BaseException as e:
+            flight.error = e
+            if not refresh:
+                self._store_error(key, e, options)
+            raise
+        else:
+            self._store(key, flight.result, options)
+            return flight.result
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def _refresh_sync(self, key: str, loader: Callable, options: Tuple) -> None:
+        """Background revalidation; failures keep the stale value."""
+        try:
+            self._load_sync(key, loader, options, refresh=True)
+        except Exception:
+            pass
+
+    async def _load_async(
+        self, key: str, loader: Callable, options: Tuple, refresh: bool = False
+    ) -> Any:
+        """Await ``loader`` once per key and event loop no matter how many tasks miss."""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            future = self._async_flights.get(flight_key)
+            leader = future is None
+            if leader:
+                entry = self._entries.get(key)
+                if entry is not None and not entry.is_expired and not (refresh and entry.is_stale):
+                    return None if refresh else self._unwrap(entry.value)
+                future = self._async_flights[flight_key] = loop.create_future()
+                # Avoid "exception was never retrieved" when nobody else waits
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            if refresh:
+                return None
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # This caller was cancelled
+                # The leader was cancelled, not us: load again, with one of
+                # the waiting followers taking over as leader
+                return await self._load_async(key, loader, options)
+
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not refresh:
+                self._store_error(key, e, options)
+            future.set_exception(e)
+            raise
+        else:
+            self._store(key, result, options)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._async_flights.pop(flight_key, None)
+
+    def _spawn_refresh(self, key: str, loader: Callable, options: Tuple) -> None:
+        """Schedule background revalidation on the running event loop."""
+
+        async def refresh():
+            try:
+                await self._load_async(key, loader, options, refresh=True)
+            except Exception:
+                pass
+
+        task = asyncio.ensure_future(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
     @property
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
             hit_rate = 0.0
-            total = self._stats["hits"] + self._stats["misses"]
+            hits = self._stats["hits"] + self._stats["disk_hits"]
+            total = hits + self._stats["misses"]
             if total > 0:
-                hit_rate = self._stats["hits"] / total
+                hit_rate = hits / total
 
             return {
                 **self._stats,
                 "entries": len(self._entries),
                 "total_tokens": self._total_tokens,
                 "hit_rate": hit_rate,
+                "policy": self._policy.stats,
             }
 
 
-def cache_context(ttl: Optional[float] = None, key: Optional[str] = None) -> Callable:
+def cache_context(
+    ttl: Optional[float] = None,
+    key: Optional[str] = None,
+    stale_ttl: Optional[float] = None,
+    negative_ttl: Optional[float] = None,
+) -> Callable:
     """Decorator to cache context-returning functions.
 
-    Creates a shared cache for context caching.
+    Creates a shared cache for context caching. Sync and async functions
+    are supported, and concurrent first calls share one computation.
 
     Args:
         ttl: Time-to-live in seconds
         key: Cache key (defaults to function name)
+        stale_ttl: Serve the expired value this much longer while refreshing
+        negative_ttl: Cache raised exceptions for this many seconds
 
     Returns:
         Decorator function
@@ -338,19 +694,9 @@ def cache_context(ttl: Optional[float] = None, key: Optional[str] = None) -> Cal
     def decorator(func: Callable) -> Callable:
         cache_key = key or func.__name__
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Check cache
-            cached = _shared_cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-            # Execute and cache
-            result = func(*args, **kwargs)
-            _shared_cache.set(cache_key, result)
-
-            return result
-
+        wrapper = _shared_cache._decorate(
+            func, lambda args, kwargs: cache_key, None, stale_ttl, negative_ttl
+        )
         wrapper._cache = _shared_cache
         return wrapper
 
@@ -0,0 +1,524 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Disk Cache
+
+Persistent, size-bounded cache tier shared by every process on a host.
+Entries are indexed in SQLite (WAL mode); large values live in
+content-addressed blob files that are memory-mapped on read.
+
+Values are stored as text, bytes or JSON. Pickle is only used when the
+cache is created with ``allow_pickle=True``: unpickling runs arbitrary
+code, so only enable it for a directory no other user can write to.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Value encodings stored alongside each entry
+_STR, _BYTES, _JSON, _PICKLE = "s", "b", "j", "p"
+
+# Buffered access-time updates written in one transaction once this many
+# keys were read
+_MAX_PENDING_TOUCHES = 256
+
+
+class MappedValue:
+    """Read-only view of a cached value without copying it into memory.
+
+    Large values are backed by an ``mmap`` of their blob file; small ones
+    by the bytes read from the index.
+
+    Example:
+        with disk.get_mapped("corpus") as value:
+            header = value.view[:1024]
+    """
+
+    def __init__(self, data: Any, encoding: str, mapping: Optional[mmap.mmap] = None):
+        self._mapping = mapping
+        self.view = memoryview(data)
+        self.encoding = encoding
+        self.info: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def bytes(self) -> bytes:
+        """Copy the raw bytes."""
+        return self.view.tobytes()
+
+    def text(self) -> str:
+        """Decode as UTF-8 text."""
+        return str(self.view, "utf-8")
+
+    def value(self) -> Any:
+        """Decode into the originally cached object."""
+        return _decode(self.view, self.encoding)
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self.view.release()
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self) -> "MappedValue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest used to address blob files."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(value: Any, allow_pickle: bool = False) -> Tuple[bytes, str]:
+    if isinstance(value, str):
+        return value.encode("utf-8"), _STR
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value), _BYTES
+    try:
+        data = json.dumps(value)
+        # Tuples, non-string dict keys etc. don't survive JSON unchanged
+        if json.loads(data) == value:
+            return data.encode("utf-8"), _JSON
+    except (TypeError, ValueError):
+        pass
+    if not allow_pickle:
+        raise TypeError(
+            f"Cannot store {type(value).__name__} without pickle "
+            "(create the DiskCache with allow_pickle=True)"
+        )
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), _PICKLE
+
+
+def _decode(data: Any, encoding: str) -> Any:
+    if encoding == _STR:
+        return str(data, "utf-8")
+    if encoding == _BYTES:
+        return bytes(data)
+    if encoding == _JSON:
+        return json.loads(bytes(data))
+    # Only reached for caches created with allow_pickle=True, whose owner
+    # vouches that nobody else can write to the cache directory
+    return pickle.loads(data)  # nosec B301
+
+
+class DiskCache:
+    """SQLite-indexed on-disk cache.
+
+    - Index in SQLite WAL mode: many readers and one writer across
+      processes on the same host
+    - Values above ``inline_threshold`` bytes are written once per content
+      hash to ``blobs/`` (identical values share a file) and read through
+      ``mmap``
+    - Total size is bounded by ``max_size``; least recently read entries
+      are evicted first. Reads record their access time in memory and
+      write it back in batches, so readers don't take the write lock
+
+    Example:
+        disk = DiskCache("~/.cache/openstackai", max_size=1 << 30)
+        disk.set("system_prompt", long_prompt, ttl=86400)
+        prompt = disk.get("system_prompt")
+
+        # Put it behind the in-memory cache
+        cache = ContextCache(ttl=3600, disk=disk)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = 1 << 30,
+        inline_threshold: int = 16384,
+        timeout: float = 5.0,
+        allow_pickle: bool = False,
+        touch_interval: float = 1.0,
+    ):
+        """Initialize disk cache.
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_size: Maximum total bytes of cached values
+            inline_threshold: Values up to this size are stored in SQLite
+            timeout: Seconds to wait for another process's write lock
+            allow_pickle: Store values that aren't str, bytes or JSON with
+                pickle. Reading them executes code from the cache files, so
+                only enable this for a directory only you can write to
+            touch_interval: Seconds between write-backs of access times
+        """
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+        self.inline_threshold = inline_threshold
+        self.timeout = timeout
+        self.allow_pickle = allow_pickle
+        self.touch_interval = touch_interval
+        self._touches: Dict[str, float] = {}  # key -> last read time not yet written
+        self._touch_lock = threading.Lock()
+        self._last_touch_flush = time.monotonic()
+        self._blob_dir = self.directory / "blobs"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        if not hasattr(self._local, "connection"):
+            conn = sqlite3.connect(
+                str(self.directory / "index.db"),
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+        return self._local.connection
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        conn = self._get_connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                encoding TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                tokens INTEGER DEFAULT 0,
+                inline BLOB,
+                created_at REAL,
+                accessed_at REAL,
+                expires_at REAL,
+                stale_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest);
+            CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_at);
+
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER);
+            INSERT OR IGNORE INTO meta VALUES ('total_size', 0);
+
+            CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+                UPDATE meta SET value = value + NEW.size WHERE name = 'total_size';
+            END;
+            CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+                UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'total_size';
+            END;
+            CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+                UPDATE meta SET value = value - OLD.size WHERE name = 'total_size';
+            END;
+        """)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blob_dir / digest[:2] / digest
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tokens: int = 0,
+        stale_after: Optional[float] = None,
+    ) -> str:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value (str, bytes, JSON-serializable, or picklable with
+                ``allow_pickle``)
+            ttl: Time-to-live in seconds
+            tokens: Token count recorded with the entry
+            stale_after: Seconds until the entry is considered stale
+
+        Returns:
+            Content hash of the stored value
+
+        Raises:
+            TypeError: If the value needs pickle and ``allow_pickle`` is off
+        """
+        data, encoding = _encode(value, self.allow_pickle)
+        digest = content_hash(data)
+        inline = data if len(data) <= self.inline_threshold else None
+
+        now = time.time()
+        conn = self._get_connection()
+        # Blob files are created and released under the write lock so a
+        # concurrent release can't delete a blob another process just reused
+        with _transaction(conn):
+            if inline is None:
+                self._write_blob(digest, data)
+            # Eviction below must see the latest reads
+            self._write_touches(conn, self._take_touches())
+            previous = conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                """
+                INSERT INTO entries
+                (key, digest, encoding, size, tokens, inline, created_at, accessed_at,
+                 expires_at, stale_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    digest = excluded.digest, encoding = excluded.encoding,
+                    size = excluded.size, tokens = excluded.tokens, inline = excluded.inline,
+                    created_at = excluded.created_at, accessed_at = excluded.accessed_at,
+                    expires_at = excluded.expires_at, stale_at = excluded.stale_at
+            """,
+                (
+                    key,
+                    digest,
+                    encoding,
+                    len(data),
+                    tokens,
+                    inline,
+                    now,
+                    now,
+                    now + ttl if ttl is not None else None,
+                    now + stale_after if stale_after is not None else None,
+                ),
+            )
+            orphans = [previous[0]] if previous and previous[0] != digest else []
+            orphans.extend(self._evict(conn))
+            self._release_blobs(conn, orphans)
+        return digest
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value, decoded.
+
+        Args:
+            key: Cache key
+            default: Default if not found or expired
+
+        Returns:
+            Cached value or default
+        """
+        found = self.get_entry(key)
+        return default if found is None else found[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, dict]]:
+        """Get a value together with its entry metadata.
+
+        Returns:
+            ``(value, info)`` where info has ``tokens``, ``expires_at`` and
+            ``stale_at``; or None if missing or expired
+        """
+        mapped = self.get_mapped(key)
+        if mapped is None:
+            return None
+        with mapped:
+            value = mapped.value()
+        return value, mapped.info
+
+    def get_mapped(self, key: str) -> Optional[MappedValue]:
+        """Get a value without decoding or copying it.
+
+        Blob-backed values are memory-mapped; close the result (or use it as
+        a context manager) when done.
+
+        Returns:
+            MappedValue or None if missing or expired
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            """
+            SELECT digest, encoding, size, tokens, inline, expires_at, stale_at
+            FROM entries WHERE key = ?
+        """,
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        digest, encoding, size, tokens, inline, expires_at, stale_at = row
+        now = time.time()
+        if expires_at is not None and now > expires_at:
+            self.delete(key)
+            return None
+        if encoding == _PICKLE and not self.allow_pickle:
+            # Written by a cache that allowed pickle; refuse to load it
+            return None
+
+        if inline is not None:
+            mapped = MappedValue(inline, encoding)
+        else:
+            try:
+                with open(self._blob_path(digest), "rb") as f:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            except FileNotFoundError:
+                # Evicted by another process between the lookup and the read
+                return None
+            mapped = MappedValue(mapping if mapping is not None else b"", encoding, mapping)
+
+        mapped.info = {"tokens": tokens, "expires_at": expires_at, "stale_at": stale_at}
+        self._touch(key, now)
+        return mapped
+
+    def has(self, key: str) -> bool:
+        """Check if key is cached and not expired."""
+        row = (
+            self._get_connection()
+            .execute("SELECT expires_at FROM entries WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row is not None and (row[0] is None or time.time() <= row[0])
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry.
+
+        Returns:
+            True if deleted, False if not found
+        """
+        conn = self._get_connection()
+        with _transaction(conn):
+            row = conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._release_blobs(conn, [row[0]])
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry and blob."""
+        conn = self._get_connection()
+        with _transaction(conn):
+            digests = [r[0] for r in conn.execute("SELECT DISTINCT digest FROM entries")]
+            conn.execute("DELETE FROM entries")
+            self._release_blobs(conn, digests)
+
+    def purge_expired(self) -> int:
+        """Remove every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._get_connection()
+        with _transaction(conn):
+            rows = conn.execute(
+                "SELECT key, digest FROM entries WHERE expires_at < ?", (time.time(),)
+            ).fetchall()
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(r[0],) for r in rows])
+            self._release_blobs(conn, [r[1] for r in rows])
+        return len(rows)
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached values."""
+        row = (
+            self._get_connection()
+            .execute("SELECT value FROM meta WHERE name = 'total_size'")
+            .fetchone()
+        )
+        return row[0]
+
+    def count(self) -> int:
+        """Number of cached entries."""
+        return self._get_connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Write pending access times and close this thread's database connection."""
+        self.flush_touches()
+        if hasattr(self._local, "connection"):
+            self._local.connection.close()
+            del self._local.connection
+
+    # ========== Access Times ==========
+
+    def _touch(self, key: str, now: float) -> None:
+        """Record a read; write the batch back when it is big or old enough."""
+        with self._touch_lock:
+            self._touches[key] = now
+            due = (
+                len(self._touches) >= _MAX_PENDING_TOUCHES
+                or time.monotonic() - self._last_touch_flush >= self.touch_interval
+            )
+        if due:
+            self.flush_touches()
+
+    def _take_touches(self) -> List[Tuple[float, str]]:
+        with self._touch_lock:
+            touches, self._touches = self._touches, {}
+            self._last_touch_flush = time.monotonic()
+        return [(accessed_at, key) for key, accessed_at in touches.items()]
+
+    def _write_touches(self, conn: sqlite3.Connection, touches: List[Tuple[float, str]]) -> None:
+        if touches:
+            conn.executemany(
+                "UPDATE entries SET accessed_at = MAX(accessed_at, ?) WHERE key = ?", touches
+            )
+
+    def flush_touches(self) -> None:
+        """Write buffered access times to the index in one transaction."""
+        touches = self._take_touches()
+        if not touches:
+            return
+        conn = self._get_connection()
+        try:
+            with _transaction(conn):
+                self._write_touches(conn, touches)
+        except sqlite3.OperationalError as e:
+            # Access times only steer eviction order; losing a batch is harmless
+            print(f"Failed to record cache access times: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> List[str]:
+        """Delete least recently read entries until under ``max_size``."""
+        total = conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()[0]
+        if total <= self.max_size:
+            return []
+
+        digests = []
+        victims = []
+        cursor = conn.execute("SELECT key, digest, size FROM entries ORDER BY accessed_at")
+        for key, digest, size in cursor:
+            if total <= self.max_size:
+                break
+            victims.append((key,))
+            digests.append(digest)
+            total -= size
+        cursor.close()
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        return digests
+
+    def _write_blob(self, digest: str, data: bytes) -> None:
+        path = self._blob_path(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(exist_ok=True)
+        # Write to a private temp file then rename, so readers never see partial data
+        tmp = path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _release_blobs(self, conn: sqlite3.Connection, digests: List[str]) -> None:
+        """Delete blob files no longer referenced by any entry."""
+        for digest in set(digests):
+            referenced = conn.execute(
+                "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if referenced is None:
+                try:
+                    self._blob_path(digest).unlink()
+                except FileNotFoundError:
+                    pass
+
+
+class _transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` on an autocommit connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
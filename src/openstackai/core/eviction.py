@@ -0,0 +1,356 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Cache Eviction Policies
+
+Pluggable eviction policies for ContextCache. Every policy tracks the keys
+currently held by the cache and answers "which key goes next" in O(1)
+amortized time (GDSF: O(log n)).
+"""
+
+import heapq
+import random
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class EvictionPolicy(ABC):
+    """Base class for cache eviction policies.
+
+    The cache calls the hooks below while holding its lock, so policies
+    need no locking of their own.
+
+    Example:
+        class RandomPolicy(EvictionPolicy):
+            name = "random"
+            ...
+
+        cache = ContextCache(policy=RandomPolicy())
+    """
+
+    name = "base"
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize policy.
+
+        Args:
+            capacity: Expected number of cache entries
+        """
+        self.capacity = capacity
+
+    @abstractmethod
+    def on_insert(self, key: str, entry: Any) -> None:
+        """Called after a new entry is stored."""
+        pass
+
+    @abstractmethod
+    def on_access(self, key: str, entry: Any) -> None:
+        """Called on every cache hit."""
+        pass
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        """Called when an entry leaves the cache for any reason."""
+        pass
+
+    @abstractmethod
+    def victim(self) -> Optional[str]:
+        """Return the key that should be evicted next (None if empty)."""
+        pass
+
+    def record(self, key: str) -> None:
+        """Called on every lookup or insert, hit or miss."""
+        pass
+
+    def admit(self, key: str, victim: str) -> bool:
+        """Decide whether a new key may replace ``victim`` when full."""
+        return True
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        pass
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Policy-specific statistics."""
+        return {"name": self.name}
+
+
+class FIFOPolicy(EvictionPolicy):
+    """Evict the oldest inserted entry; reads don't change the order."""
+
+    name = "fifo"
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__(capacity)
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def on_insert(self, key: str, entry: Any) -> None:
+        self._order[key] = None
+
+    def on_access(self, key: str, entry: Any) -> None:
+        pass
+
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LRUPolicy(FIFOPolicy):
+    """Evict the least recently used entry."""
+
+    name = "lru"
+
+    def on_access(self, key: str, entry: Any) -> None:
+        self._order.move_to_end(key)
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently used entry (LRU among ties).
+
+    Keys are kept in one insertion-ordered bucket per access count, so
+    touching a key moves it to the next bucket in O(1).
+    """
+
+    name = "lfu"
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__(capacity)
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_freq = 0
+
+    def on_insert(self, key: str, entry: Any) -> None:
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def on_access(self, key: str, entry: Any) -> None:
+        freq = self._freq[key]
+        self._unlink(key, freq)
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+        if self._min_freq == freq and freq not in self._buckets:
+            self._min_freq = freq + 1
+
+    def on_remove(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is not None:
+            self._unlink(key, freq)
+
+    def victim(self) -> Optional[str]:
+        if not self._freq:
+            return None
+        if self._min_freq not in self._buckets:
+            # Only stale after explicit removals
+            self._min_freq = min(self._buckets)
+        return next(iter(self._buckets[self._min_freq]))
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def _unlink(self, key: str, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name, "min_frequency": self._min_freq}
+
+
+class CountMinSketch:
+    """Approximate frequency counter with periodic aging.
+
+    Counters saturate at 15 and are halved every ``sample_size``
+    increments, so the sketch tracks recent popularity in fixed memory.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, width: int, sample_size: Optional[int] = None, seed: int = 0):
+        bits = max(6, (max(width, 1) - 1).bit_length())
+        self.width = 1 << bits
+        self._shift = 64 - bits
+        self._table: List[List[int]] = [[0] * self.width for _ in range(self.DEPTH)]
+        rng = random.Random(seed)
+        self._seeds = [rng.getrandbits(64) | 1 for _ in range(self.DEPTH)]
+        self.sample_size = sample_size or 10 * width
+        self._additions = 0
+        self.resets = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        # Multiply-shift hashing: independent-looking rows from one hash() call
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [((h * seed) & 0xFFFFFFFFFFFFFFFF) >> self._shift for seed in self._seeds]
+
+    def add(self, key: str) -> None:
+        """Count one occurrence of ``key``."""
+        for row, index in zip(self._table, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        """Estimated recent frequency of ``key``."""
+        return min(row[index] for row, index in zip(self._table, self._indexes(key)))
+
+    def _age(self) -> None:
+        for row in self._table:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
+        self.resets += 1
+
+    def clear(self) -> None:
+        for row in self._table:
+            row[:] = [0] * self.width
+        self._additions = 0
+
+
+class TinyLFUPolicy(LRUPolicy):
+    """LRU eviction with TinyLFU admission.
+
+    A new key is only admitted over the LRU victim when a count-min sketch
+    says it has been requested more often recently. One-off lookups then
+    can't flush a hot working set.
+    """
+
+    name = "tinylfu"
+
+    def __init__(self, capacity: int = 1000, sample_size: Optional[int] = None):
+        super().__init__(capacity)
+        self._sketch = CountMinSketch(capacity, sample_size)
+        self.admitted = 0
+        self.rejected = 0
+
+    def record(self, key: str) -> None:
+        self._sketch.add(key)
+
+    def admit(self, key: str, victim: str) -> bool:
+        if self._sketch.estimate(key) > self._sketch.estimate(victim):
+            self.admitted += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def clear(self) -> None:
+        super().clear()
+        self._sketch.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "sketch_resets": self._sketch.resets,
+        }
+
+
+class GDSFPolicy(EvictionPolicy):
+    """Greedy-Dual-Size-Frequency eviction weighted by token count.
+
+    Each entry gets priority ``L + frequency * cost / tokens`` where ``L``
+    is the priority of the last evicted entry. Large, rarely used contexts
+    go first while frequently reused ones survive; ``L`` ages out entries
+    that stop being used. Uses a lazily-invalidated heap (O(log n)).
+    """
+
+    name = "gdsf"
+
+    def __init__(self, capacity: int = 1000, cost: Optional[Callable[[Any], float]] = None):
+        """Initialize policy.
+
+        Args:
+            capacity: Expected number of cache entries
+            cost: Cost of recomputing an entry (default: 1 per entry)
+        """
+        super().__init__(capacity)
+        self._cost = cost or (lambda entry: 1.0)
+        self._clock = 0.0
+        self._heap: List[Tuple[float, int, str]] = []
+        # key -> (priority, frequency, cost per token, heap sequence number)
+        self._state: Dict[str, Tuple[float, int, float, int]] = {}
+        self._sequence = 0
+
+    def on_insert(self, key: str, entry: Any) -> None:
+        weight = self._cost(entry) / max(getattr(entry, "tokens", 1), 1)
+        self._push(key, 1, weight)
+
+    def on_access(self, key: str, entry: Any) -> None:
+        _, freq, weight, _ = self._state[key]
+        self._push(key, freq + 1, weight)
+
+    def on_remove(self, key: str) -> None:
+        self._state.pop(key, None)
+        if len(self._heap) > 2 * len(self._state) + 64:
+            self._heap = [(p, seq, k) for k, (p, _, _, seq) in self._state.items()]
+            heapq.heapify(self._heap)
+
+    def victim(self) -> Optional[str]:
+        while self._heap:
+            priority, sequence, key = self._heap[0]
+            state = self._state.get(key)
+            if state is not None and state[3] == sequence:
+                self._clock = priority
+                return key
+            heapq.heappop(self._heap)
+        return None
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._state.clear()
+        self._clock = 0.0
+
+    def _push(self, key: str, freq: int, weight: float) -> None:
+        priority = self._clock + freq * weight
+        self._sequence += 1
+        self._state[key] = (priority, freq, weight, self._sequence)
+        heapq.heappush(self._heap, (priority, self._sequence, key))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name, "clock": self._clock}
+
+
+EVICTION_POLICIES: Dict[str, type] = {
+    "fifo": FIFOPolicy,
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "tinylfu": TinyLFUPolicy,
+    "gdsf": GDSFPolicy,
+}
+
+
+def create_policy(policy: Any, capacity: int = 1000) -> EvictionPolicy:
+    """Build an eviction policy from a name or return an instance as-is.
+
+    Args:
+        policy: Policy name (see ``EVICTION_POLICIES``) or instance
+        capacity: Expected number of cache entries
+
+    Returns:
+        EvictionPolicy instance
+    """
+    if isinstance(policy, EvictionPolicy):
+        return policy
+    try:
+        return EVICTION_POLICIES[policy](capacity=capacity)
+    except KeyError:
+        raise ValueError(
+            f"Unknown eviction policy: {policy}. Available: {', '.join(EVICTION_POLICIES)}"
+        )
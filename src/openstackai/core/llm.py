@@ -2,10 +2,19 @@
 LLM - Language Model Provider interfaces and implementations
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from openstackai.core.cache import ContextCache
 
 
 class ModelProvider(Enum):
@@ -403,3 +412,298 @@ class AnthropicProvider(LLMProvider):
         ) as stream:
             async for text in stream.text_stream:
                 yield text
+
+
+class SemanticCache:
+    """
+    Response cache keyed by prompt similarity.
+
+    Every (system prompt, messages) pair is looked up twice: first by exact
+    content hash (no embedding call), then by embedding similarity in a
+    VectorStore. A cached completion is returned when its prompt's cosine
+    similarity reaches ``threshold``. Entries are namespaced by model and
+    generation parameters, so a paraphrase never returns another model's
+    answer.
+
+    Example:
+        >>> cache = SemanticCache(embedding_function, threshold=0.92, ttl=3600)
+        >>> provider = CachedLLMProvider(OpenAIProvider(config), cache)
+        >>> await provider.complete("You are helpful", [{"role": "user", "content": "Hi"}])
+        >>> cache.stats["hit_rate"], cache.stats["latency_saved"]
+    """
+
+    def __init__(
+        self,
+        embedding_function: Any,
+        vector_store: Any = None,
+        threshold: float = 0.95,
+        ttl: Optional[float] = None,
+        max_entries: int = 10000,
+        candidates: int = 4,
+    ):
+        """Initialize cache.
+
+        Args:
+            embedding_function: EmbeddingFunction used to embed prompts
+            vector_store: VectorStore holding prompt embeddings (default: an
+                in-process MemoryVectorStore)
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Seconds a cached completion stays valid (None = forever)
+            max_entries: Maximum cached completions; oldest are dropped first
+            candidates: Nearest neighbours checked per lookup (skips expired)
+        """
+        if vector_store is None:
+            from openstackai.vectordb.memory import MemoryVectorStore
+
+            vector_store = MemoryVectorStore(
+                embedding_function=embedding_function, indexed_fields=["namespace"]
+            )
+
+        self.embedding_function = embedding_function
+        self.vector_store = vector_store
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.candidates = candidates
+
+        self._exact = ContextCache(ttl=ttl, max_entries=max_entries)
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.RLock()
+        # The vector store may be used from executor threads
+        self._store_lock = threading.Lock()
+        self._stats = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "latency_saved": 0.0,
+        }
+
+    @staticmethod
+    def namespace(model: str, **params) -> str:
+        """Build the namespace for a model and its generation parameters."""
+        if not params:
+            return model
+        return f"{model}|{json.dumps(params, sort_keys=True, default=str)}"
+
+    @staticmethod
+    def render(system_prompt: str, messages: List[Dict[str, str]]) -> str:
+        """Render a prompt as the text that gets hashed and embedded."""
+        lines = [f"system: {system_prompt}"]
+        lines.extend(f"{m.get('role', 'user')}: {m.get('content', '')}" for m in messages)
+        return "\n".join(lines)
+
+    def lookup(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        namespace: str = "",
+    ) -> Optional[str]:
+        """Find a cached completion for this prompt or a near-duplicate.
+
+        Args:
+            system_prompt: The system instruction
+            messages: Conversation messages
+            namespace: Model/parameter namespace (see ``namespace``)
+
+        Returns:
+            Cached completion, or None on a miss
+        """
+        return self._lookup(system_prompt, messages, namespace)[0]
+
+    def _lookup(
+        self, system_prompt: str, messages: List[Dict[str, str]], namespace: str
+    ) -> Tuple[Optional[str], Optional[List[float]]]:
+        """``lookup`` that also returns the prompt embedding it computed (if any)."""
+        text = self.render(system_prompt, messages)
+        key = self._key(namespace, text)
+
+        found = self._exact.get(key)
+        if found is not None:
+            response, latency = found
+            self._record_hit("exact_hits", latency)
+            return response, None
+
+        now = time.time()
+        embedding, results = self._search(text, namespace)
+        for result in results:
+            if result.score < self.threshold:
+                break
+            metadata = result.metadata
+            expires_at = metadata.get("expires_at")
+            if expires_at is not None and now > expires_at:
+                self._forget(result.id)
+                continue
+            self._record_hit("semantic_hits", metadata.get("latency", 0.0))
+            return metadata["response"], embedding
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None, embedding
+
+    def store(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        response: str,
+        namespace: str = "",
+        latency: float = 0.0,
+        embedding: Optional[List[float]] = None,
+    ) -> str:
+        """Cache a completion.
+
+        Args:
+            system_prompt: The system instruction
+            messages: Conversation messages
+            response: Completion text to cache
+            namespace: Model/parameter namespace (see ``namespace``)
+            latency: Seconds the original call took (reported as saved on hits)
+            embedding: Prompt embedding from the preceding lookup (computed
+                if not given)
+
+        Returns:
+            Cache entry ID
+        """
+        text = self.render(system_prompt, messages)
+        key = self._key(namespace, text)
+        metadata = {
+            "namespace": namespace,
+            "response": response,
+            "latency": latency,
+            "expires_at": time.time() + self.ttl if self.ttl is not None else None,
+        }
+
+        if embedding is None:
+            embedding = self.embedding_function.embed_query(text)
+
+        self._exact.set(key, (response, latency), tokens=1)
+        with self._store_lock:
+            self.vector_store.add(id=key, content=text, metadata=metadata, embedding=embedding)
+
+        with self._lock:
+            self._order[key] = None
+            self._order.move_to_end(key)
+            overflow = len(self._order) - self.max_entries
+            evicted = [self._order.popitem(last=False)[0] for _ in range(max(overflow, 0))]
+        for old in evicted:
+            self._forget(old)
+        return key
+
+    def clear(self) -> None:
+        """Remove every cached completion."""
+        with self._lock:
+            keys = list(self._order)
+            self._order.clear()
+        with self._store_lock:
+            for key in keys:
+                self.vector_store.delete(key)
+        self._exact.clear()
+
+    def _search(self, text: str, namespace: str) -> Tuple[Optional[List[float]], List[Any]]:
+        """Find the nearest cached prompts; also return the embedding computed."""
+        filter = {"namespace": namespace}
+        if hasattr(self.vector_store, "search_by_vector"):
+            embedding = self.embedding_function.embed_query(text)
+            with self._store_lock:
+                results = self.vector_store.search_by_vector(
+                    embedding, k=self.candidates, filter=filter
+                )
+            return embedding, results
+        # Remote stores embed the query with their own embedding function
+        with self._store_lock:
+            return None, self.vector_store.search(text, k=self.candidates, filter=filter)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._order.pop(key, None)
+        self._exact.delete(key)
+        with self._store_lock:
+            self.vector_store.delete(key)
+
+    def _record_hit(self, kind: str, latency: float) -> None:
+        with self._lock:
+            self._stats[kind] += 1
+            self._stats["latency_saved"] += latency
+
+    @staticmethod
+    def _key(namespace: str, text: str) -> str:
+        return hashlib.sha256(f"{namespace}\x00{text}".encode()).hexdigest()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            hits = self._stats["exact_hits"] + self._stats["semantic_hits"]
+            total = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hits": hits,
+                "entries": len(self._order),
+                "hit_rate": hits / total if total else 0.0,
+            }
+
+
+class CachedLLMProvider(LLMProvider):
+    """
+    Wraps a provider so ``complete`` is served from a SemanticCache.
+
+    Tool calls and streams pass straight through: their results depend on
+    more than the prompt text. Cache lookups and stores (embedding calls
+    included) run in the default executor so they never block the event
+    loop, and a failing cache falls through to the provider.
+
+    Example:
+        >>> provider = CachedLLMProvider(
+        ...     OpenAIProvider(config),
+        ...     SemanticCache(embedding_function, threshold=0.92),
+        ... )
+    """
+
+    def __init__(self, provider: LLMProvider, cache: SemanticCache):
+        super().__init__(provider.config)
+        self.provider = provider
+        self.cache = cache
+
+    async def complete(self, system_prompt: str, messages: List[Dict[str, str]], **kwargs) -> str:
+        namespace = SemanticCache.namespace(self.config.model, **kwargs)
+        loop = asyncio.get_running_loop()
+        try:
+            cached, embedding = await loop.run_in_executor(
+                None, self.cache._lookup, system_prompt, messages, namespace
+            )
+        except Exception as e:
+            print(f"Semantic cache lookup failed: {e}")
+            cached, embedding = None, None
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        response = await self.provider.complete(system_prompt, messages, **kwargs)
+        latency = time.perf_counter() - start
+
+        store = functools.partial(
+            self.cache.store,
+            system_prompt,
+            messages,
+            response,
+            namespace,
+            latency,
+            embedding=embedding,
+        )
+        try:
+            await loop.run_in_executor(None, store)
+        except Exception as e:
+            print(f"Semantic cache store failed: {e}")
+        return response
+
+    async def complete_with_tools(
+        self,
+        system_prompt: str,
+        messages: List[Dict[str, str]],
+        tools: List[Dict[str, Any]],
+        **kwargs,
+    ) -> LLMResponse:
+        return await self.provider.complete_with_tools(system_prompt, messages, tools, **kwargs)
+
+    async def stream(self, system_prompt: str, messages: List[Dict[str, str]], **kwargs):
+        async for chunk in self.provider.stream(system_prompt, messages, **kwargs):
+            yield chunk
@@ -6,7 +6,9 @@ from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from openstackai.tokens.counter import TokenCounter, get_counter
 
 
 @dataclass
@@ -18,6 +20,22 @@ class Message:
     timestamp: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Cached prompt dict and (model, token count); messages are not edited
+    _prompt: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _tokens: Optional[Tuple[str, int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_prompt(self) -> Dict[str, str]:
+        """Provider-format dict (role/content), built once and reused."""
+        if self._prompt is None:
+            self._prompt = {"role": self.role, "content": self.content}
+        return self._prompt
+
+    def count_tokens(self, counter: TokenCounter) -> int:
+        """Token count for this message, cached per model."""
+        if self._tokens is None or self._tokens[0] != counter.model:
+            self._tokens = (counter.model, counter.count_message(self.to_prompt()))
+        return self._tokens[1]
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "role": self.role,
@@ -27,6 +45,99 @@ class Message:
         }
 
 
+class ContextWindow:
+    """
+    Assembles a prompt that fits a token budget.
+
+    The window is built from, in order: pinned messages (system prompt,
+    summary), retrieved older turns (up to ``retrieval_ratio`` of the
+    budget, more if recent turns leave room), then as many recent turns
+    as fit.
+    Recent turns are walked newest-first and token counts are cached on
+    each Message, so assembly costs O(window), not O(history).
+
+    Example:
+        >>> window = ContextWindow(max_tokens=4000, model="gpt-4")
+        >>> messages = window.assemble(history, pinned=[system_message])
+        >>> window.last_tokens
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        model: str = "gpt-4",
+        min_recent: int = 1,
+        retrieval_ratio: float = 0.25,
+    ):
+        """Initialize window.
+
+        Args:
+            max_tokens: Token budget for the assembled messages
+            model: Model whose tokenizer is used for counting
+            min_recent: Recent turns always kept, even over budget
+            retrieval_ratio: Share of the budget held back for retrieved turns
+        """
+        self.max_tokens = max_tokens
+        self.counter = get_counter(model)
+        self.min_recent = min_recent
+        self.retrieval_ratio = retrieval_ratio
+        self.last_tokens = 0
+
+    def tokens(self, message: Message) -> int:
+        """Token count of a message (cached on the message)."""
+        return message.count_tokens(self.counter)
+
+    def assemble(
+        self,
+        history: Sequence[Message],
+        pinned: Iterable[Message] = (),
+        retrieved: Iterable[Message] = (),
+        max_tokens: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        """Build the message list for one LLM call.
+
+        Args:
+            history: Conversation turns, oldest first
+            pinned: Messages always included first (e.g. system prompt)
+            retrieved: Older turns worth including if budget remains
+            max_tokens: Override the window's budget for this call
+
+        Returns:
+            Messages in provider format; the dicts are shared, don't mutate
+        """
+        budget = self.max_tokens if max_tokens is None else max_tokens
+
+        head = list(pinned)
+        used = sum(self.tokens(m) for m in head)
+
+        retrieved = list(retrieved)
+        reserved = 0
+        if retrieved:
+            wanted = sum(self.tokens(m) for m in retrieved)
+            reserved = min(wanted, int(budget * self.retrieval_ratio))
+
+        recent: List[Message] = []
+        for message in reversed(history):
+            cost = self.tokens(message)
+            if used + cost > budget - reserved and len(recent) >= self.min_recent:
+                break
+            recent.append(message)
+            used += cost
+        recent.reverse()
+
+        in_window = {id(m) for m in recent}
+        for message in retrieved:
+            if id(message) in in_window:
+                continue
+            cost = self.tokens(message)
+            if used + cost <= budget:
+                head.append(message)
+                used += cost
+
+        self.last_tokens = used
+        return [m.to_prompt() for m in head] + [m.to_prompt() for m in recent]
+
+
 class Memory(ABC):
     """
     Abstract base class for agent memory systems.
@@ -55,6 +166,31 @@ class Memory(ABC):
         """Search memory for relevant messages"""
         pass
 
+    def get_context(
+        self,
+        max_tokens: Optional[int] = None,
+        model: str = "gpt-4",
+        query: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """Get messages that fit a token budget.
+
+        Subclasses keep Message objects around and override this to reuse
+        cached token counts; this fallback recounts ``get_messages()``.
+
+        Args:
+            max_tokens: Token budget (None = no limit)
+            model: Model whose tokenizer is used for counting
+            query: Optional query for retrieving relevant older turns
+
+        Returns:
+            Messages in provider format, oldest first
+        """
+        messages = self.get_messages()
+        if max_tokens is None:
+            return messages
+        history = [Message(role=m["role"], content=m["content"]) for m in messages]
+        return ContextWindow(max_tokens, model).assemble(history)
+
 
 class ConversationMemory(Memory):
     """
@@ -74,9 +210,19 @@ class ConversationMemory(Memory):
         self,
         max_messages: int = 100,
         include_system: bool = True,
+        retrieve_limit: int = 0,
     ):
+        """Initialize memory.
+
+        Args:
+            max_messages: Messages kept in the sliding window
+            include_system: Include the system message in prompts
+            retrieve_limit: Older turns matching the query that
+                ``get_context`` may add when budget remains
+        """
         self.max_messages = max_messages
         self.include_system = include_system
+        self.retrieve_limit = retrieve_limit
         self._messages: deque = deque(maxlen=max_messages)
         self._system_message: Optional[Message] = None
 
@@ -101,28 +247,41 @@ class ConversationMemory(Memory):
 
         # Add system message first if exists
         if self.include_system and self._system_message:
-            messages.append(
-                {
-                    "role": "system",
-                    "content": self._system_message.content,
-                }
-            )
+            messages.append(self._system_message.to_prompt())
 
         # Get recent messages
         recent = list(self._messages)
         if limit:
             recent = recent[-limit:]
 
-        for msg in recent:
-            messages.append(
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                }
-            )
-
+        messages.extend(msg.to_prompt() for msg in recent)
         return messages
 
+    def get_context(
+        self,
+        max_tokens: Optional[int] = None,
+        model: str = "gpt-4",
+        query: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """Get the system message plus as many recent turns as fit the budget.
+
+        With ``retrieve_limit`` set and a ``query`` given, older turns that
+        match the query are added when they fit.
+        """
+        if max_tokens is None:
+            return self.get_messages()
+
+        pinned = []
+        if self.include_system and self._system_message:
+            pinned.append(self._system_message)
+        retrieved: List[Message] = []
+        if query and self.retrieve_limit:
+            retrieved = self.search(query, limit=self.retrieve_limit)
+
+        return ContextWindow(max_tokens, model).assemble(
+            self._messages, pinned=pinned, retrieved=retrieved
+        )
+
     def clear(self) -> None:
         """Clear conversation history"""
         self._messages.clear()
@@ -156,44 +315,97 @@ class BufferMemory(Memory):
 
     When the buffer exceeds a threshold, older messages are
     summarized to maintain context while reducing token usage.
+
+    Example:
+        >>> memory = BufferMemory(max_tokens=4000, summarizer=summarize_turns)
+        >>> memory.add_message("user", "Hello!")
+        >>> messages = memory.get_messages()  # summary + turns within 4000 tokens
     """
 
     def __init__(
         self,
         max_tokens: int = 4000,
         summary_threshold: int = 3000,
+        summarizer: Optional[Callable[[Optional[str], List[Message]], str]] = None,
+        model: str = "gpt-4",
     ):
+        """Initialize memory.
+
+        Args:
+            max_tokens: Token budget for ``get_messages``
+            summary_threshold: Buffered tokens that trigger summarization
+            summarizer: ``(previous_summary, messages) -> summary``; without
+                one, old turns simply fall out of the window
+            model: Model whose tokenizer is used for counting
+        """
         self.max_tokens = max_tokens
         self.summary_threshold = summary_threshold
-        self._messages: List[Message] = []
+        self.summarizer = summarizer
+        self.model = model
+        self._messages: deque = deque()
         self._summary: Optional[str] = None
+        self._summary_message: Optional[Message] = None
+        self._counter = get_counter(model)
+        self._total_tokens = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens currently buffered (excluding the summary)."""
+        return self._total_tokens
 
     def add_message(self, role: str, content: str, **kwargs) -> None:
         """Add message and trigger summarization if needed"""
-        self._messages.append(Message(role=role, content=content))
-        # Could trigger summarization here based on token count
+        message = Message(role=role, content=content)
+        self._messages.append(message)
+        self._total_tokens += message.count_tokens(self._counter)
+        if self.summarizer and self._total_tokens > self.summary_threshold:
+            self._summarize()
+
+    def _summarize(self) -> None:
+        """Fold the oldest turns into the summary until under threshold."""
+        # Keep at least the latest turn verbatim
+        target = self.summary_threshold // 2
+        folded: List[Message] = []
+        while len(self._messages) > 1 and self._total_tokens > target:
+            message = self._messages.popleft()
+            self._total_tokens -= message.count_tokens(self._counter)
+            folded.append(message)
+        if folded:
+            self._summary = self.summarizer(self._summary, folded)
+            self._summary_message = None
 
     def get_messages(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """Get messages, prepending summary if exists"""
-        messages = []
+        if limit:
+            return [m.to_prompt() for m in self._pinned()] + [
+                m.to_prompt() for m in list(self._messages)[-limit:]
+            ]
+        return self.get_context(self.max_tokens, self.model)
 
-        if self._summary:
-            messages.append(
-                {
-                    "role": "system",
-                    "content": f"Previous conversation summary: {self._summary}",
-                }
+    def get_context(
+        self,
+        max_tokens: Optional[int] = None,
+        model: str = "gpt-4",
+        query: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """Get the summary plus as many recent turns as fit the budget."""
+        budget = self.max_tokens if max_tokens is None else min(max_tokens, self.max_tokens)
+        return ContextWindow(budget, model).assemble(self._messages, pinned=self._pinned())
+
+    def _pinned(self) -> List[Message]:
+        if not self._summary:
+            return []
+        if self._summary_message is None:
+            self._summary_message = Message(
+                role="system", content=f"Previous conversation summary: {self._summary}"
             )
-
-        recent = self._messages[-limit:] if limit else self._messages
-        for msg in recent:
-            messages.append({"role": msg.role, "content": msg.content})
-
-        return messages
+        return [self._summary_message]
 
     def clear(self) -> None:
         self._messages.clear()
         self._summary = None
+        self._summary_message = None
+        self._total_tokens = 0
 
     def search(self, query: str, limit: int = 5) -> List[Message]:
         query_lower = query.lower()
@@ -0,0 +1,38 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Rate Limiting
+
+Async start-rate limiter shared by components that fan calls out to agents
+(map-reduce patterns, evaluation runs).
+"""
+
+import asyncio
+
+
+class RateLimiter:
+    """Spaces call starts at least ``1 / rate`` seconds apart.
+
+    Example:
+        limiter = RateLimiter(rate=5)  # at most 5 starts per second
+        await limiter.acquire()
+    """
+
+    def __init__(self, rate: float):
+        """Initialize the limiter.
+
+        Args:
+            rate: Maximum call starts per second
+        """
+        self.interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next call may start."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
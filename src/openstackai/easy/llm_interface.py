@@ -33,12 +33,13 @@ def _log_llm_call(
                 },
             )
             # Add to current span or create a temporary one
-            if _tracer._current_span:
-                _tracer._current_span.events.append(event)
+            current = _tracer.current_span
+            if current is not None:
+                current.add_event(event)
             else:
                 # Create implicit span for standalone calls
                 with _tracer.span("llm_call") as span:
-                    span.events.append(event)
+                    span.add_event(event)
     except ImportError:
         pass  # trace module not available
 
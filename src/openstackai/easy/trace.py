@@ -20,19 +20,43 @@ Examples:
     # Export traces
     >>> trace.export("traces.json")
 
+    # Stream finished spans in the background
+    >>> trace.add_exporter(trace.JSONLSink("spans.jsonl"))
+
+    # Keep 10% of traces, plus every failed or slow one
+    >>> trace.configure(sample_rate=0.1, tail_sample_rate=0.0, slow_ms=2000)
+
     # Custom handlers
     >>> @trace.handler
     ... def my_logger(event):
     ...     print(f"[{event.type}] {event.message}")
+
+The current span lives in a context variable, so nesting is tracked
+correctly per thread and per asyncio task. Finished spans go into a
+fixed-size ring buffer (the oldest are overwritten), and handlers and
+exporters run on background threads, so tracing never blocks the traced
+code and memory stays bounded. When tracing is disabled, ``span()``
+returns a shared no-op span.
 """
 
+import asyncio
+import atexit
+import collections
+import contextvars
 import functools
+import itertools
 import json
+import random
 import threading
-import time
+import urllib.request
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _new_id(bits: int) -> str:
+    """Random hex ID (64 bits for spans, 128 for traces, as in OpenTelemetry)."""
+    return format(random.getrandbits(bits), f"0{bits // 4}x")
 
 
 @dataclass
@@ -67,37 +91,55 @@ class Span:
     """A trace span representing a unit of work."""
 
     name: str
-    span_id: str = field(default_factory=lambda: f"span_{int(time.time() * 1000)}")
+    span_id: str = field(default_factory=lambda: _new_id(64))
     parent_span_id: str = None
     start_time: datetime = field(default_factory=datetime.now)
     end_time: datetime = None
     events: List[TraceEvent] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     status: str = "running"  # "running", "completed", "error"
+    trace_id: str = field(default_factory=lambda: _new_id(128))
+    max_events: Optional[int] = None  # Events kept per span (None = unbounded)
+    dropped_events: int = 0
+    _tracer: Any = field(default=None, repr=False, compare=False)
+    _token: Any = field(default=None, repr=False, compare=False)
+
+    def add_event(self, event: TraceEvent) -> None:
+        """Attach an event, dropping it once the span holds max_events."""
+        if self.max_events is not None and len(self.events) >= self.max_events:
+            self.dropped_events += 1
+            return
+        self.events.append(event)
 
     def log(self, message: str, **metadata) -> None:
         """Log an event within this span."""
-        self.events.append(
-            TraceEvent(type="log", message=message, span_id=self.span_id, metadata=metadata)
-        )
+        event = TraceEvent(type="log", message=message, span_id=self.span_id, metadata=metadata)
+        self.add_event(event)
+        if self._tracer is not None:
+            self._tracer._emit(event)
 
     def error(self, message: str, exception: Exception = None) -> None:
         """Log an error event."""
-        self.events.append(
-            TraceEvent(
-                type="error",
-                message=message,
-                span_id=self.span_id,
-                metadata={"exception": str(exception) if exception else None},
-            )
+        event = TraceEvent(
+            type="error",
+            message=message,
+            span_id=self.span_id,
+            metadata={"exception": str(exception) if exception else None},
         )
+        self.add_event(event)
         self.status = "error"
+        if self._tracer is not None:
+            self._tracer._emit(event)
 
     def end(self) -> None:
-        """End this span."""
+        """End this span (later calls are ignored)."""
+        if self.end_time is not None:
+            return
         self.end_time = datetime.now()
         if self.status == "running":
             self.status = "completed"
+        if self._tracer is not None:
+            self._tracer._finish(self)
 
     @property
     def duration_ms(self) -> float:
@@ -108,6 +150,7 @@ class Span:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
+            "trace_id": self.trace_id,
             "span_id": self.span_id,
             "parent_span_id": self.parent_span_id,
             "start_time": self.start_time.isoformat(),
@@ -115,28 +158,436 @@ class Span:
             "duration_ms": self.duration_ms,
             "status": self.status,
             "events": [e.to_dict() for e in self.events],
+            "dropped_events": self.dropped_events,
             "metadata": self.metadata,
         }
 
     def __enter__(self):
+        if self._tracer is not None:
+            self._token = self._tracer._current.set(self)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type:
             self.error(str(exc_val), exc_val)
         self.end()
+        if self._token is not None:
+            try:
+                self._tracer._current.reset(self._token)
+            except ValueError:
+                # Exited in a different context than it was entered in
+                self._tracer._current.set(None)
+            self._token = None
+
+
+class _NonRecordingSpan:
+    """
+    Span handed out when a trace is not sampled or tracing is disabled.
+
+    Accepts the Span API and records nothing. Entering one marks the
+    context as unsampled so child spans are skipped as well.
+    """
+
+    __slots__ = ("_current", "_token")
+
+    name = ""
+    span_id = None
+    parent_span_id = None
+    trace_id = None
+    status = "unsampled"
+    duration_ms = 0.0
+
+    def __init__(self, current: Optional[contextvars.ContextVar] = None):
+        self._current = current
+        self._token = None
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        return []
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return {}
+
+    def add_event(self, event: TraceEvent) -> None:
+        pass
+
+    def log(self, message: str, **metadata) -> None:
+        pass
+
+    def error(self, message: str, exception: Exception = None) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self):
+        if self._current is not None:
+            self._token = self._current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            try:
+                self._current.reset(self._token)
+            except ValueError:
+                self._current.set(None)
+            self._token = None
+
+
+# Shared no-op span returned while tracing is disabled
+_DISABLED_SPAN = _NonRecordingSpan()
+
+
+class SpanRingBuffer:
+    """
+    Fixed-size buffer of finished spans.
+
+    Writers claim a sequence number from an ``itertools.count`` (atomic
+    under the GIL) and store into slot ``sequence % capacity``, so appends
+    take no lock and the oldest spans are overwritten when full. Readers
+    scan the slots; ``read_since`` lets an exporter follow the stream and
+    notice spans it lost to overwrites.
+    """
+
+    def __init__(self, capacity: int = 2048):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._slots: List[Optional[Tuple[int, Span]]] = [None] * capacity
+        self._sequence = itertools.count()
+        self.head = 0  # Sequence number after the newest append
+
+    def append(self, span: Span) -> None:
+        sequence = next(self._sequence)
+        self._slots[sequence % self.capacity] = (sequence, span)
+        if sequence >= self.head:
+            self.head = sequence + 1
+
+    def snapshot(self) -> List[Span]:
+        """Buffered spans, oldest first."""
+        entries = [entry for entry in list(self._slots) if entry is not None]
+        entries.sort(key=lambda entry: entry[0])
+        return [span for _, span in entries]
+
+    def read_since(self, sequence: int, limit: int) -> Tuple[List[Span], int, int]:
+        """
+        Read spans appended at or after ``sequence``.
+
+        Args:
+            sequence: First sequence number wanted
+            limit: Maximum spans to return
+
+        Returns:
+            Tuple of (spans in order, next sequence to read, spans lost to overwrites)
+        """
+        entries = [entry for entry in list(self._slots) if entry and entry[0] >= sequence]
+        if not entries:
+            return [], sequence, 0
+        entries.sort(key=lambda entry: entry[0])
+
+        dropped = 0
+        if entries[-1][0] - sequence >= self.capacity:
+            # Writers lapped the reader; resume at the oldest surviving span
+            dropped = entries[0][0] - sequence
+            sequence = entries[0][0]
+
+        spans = []
+        for entry_sequence, span in entries:
+            if entry_sequence != sequence or len(spans) >= limit:
+                # A gap is a write still in progress; pick it up next time
+                break
+            spans.append(span)
+            sequence += 1
+        return spans, sequence, dropped
+
+    def clear(self) -> None:
+        self._slots = [None] * self.capacity
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._slots if entry is not None)
+
+
+# =============================================================================
+# Export
+# =============================================================================
+
+
+class JSONLSink:
+    """Append finished spans to a JSON Lines file, one span per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+def _unix_nanos(when: Optional[datetime]) -> str:
+    return str(int(when.timestamp() * 1_000_000_000)) if when else "0"
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    return {"stringValue": json.dumps(value, default=str)}
+
+
+def _otlp_attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": str(key), "value": _otlp_value(value)}
+        for key, value in values.items()
+        if value is not None
+    ]
+
+
+class OTLPSink:
+    """
+    Send finished spans to an OpenTelemetry collector (OTLP/HTTP JSON).
+
+    Works with any local OTLP receiver, e.g. the OpenTelemetry Collector
+    or Jaeger on port 4318. Uses only the standard library.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        service_name: str = "openstackai",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def to_otlp(self, spans: List[Span]) -> Dict[str, Any]:
+        """Build an OTLP ExportTraceServiceRequest body."""
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": _unix_nanos(span.start_time),
+                "endTimeUnixNano": _unix_nanos(span.end_time),
+                "attributes": _otlp_attributes(span.metadata),
+                "events": [
+                    {
+                        "timeUnixNano": _unix_nanos(event.timestamp),
+                        "name": event.type,
+                        "attributes": _otlp_attributes(
+                            {"message": event.message, **event.metadata}
+                        ),
+                    }
+                    for event in span.events
+                ],
+                "status": {"code": 2} if span.status == "error" else {"code": 1},
+            }
+            if span.parent_span_id:
+                otlp_span["parentSpanId"] = span.parent_span_id
+            otlp_spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes({"service.name": self.service_name})
+                    },
+                    "scopeSpans": [{"scope": {"name": "openstackai"}, "spans": otlp_spans}],
+                }
+            ]
+        }
+
+    def export(self, spans: List[Span]) -> None:
+        body = json.dumps(self.to_otlp(spans)).encode("utf-8")
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json", **self.headers},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class BatchExporter:
+    """
+    Background thread that ships finished spans to a sink in batches.
+
+    Follows the tracer's ring buffer, so recording a span never waits on
+    the sink. Spans overwritten before they were exported are counted in
+    ``dropped``.
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        sink: Any,
+        interval: float = 1.0,
+        max_batch: int = 512,
+    ):
+        """
+        Initialize the exporter (not started).
+
+        Args:
+            tracer: Tracer whose spans are exported
+            sink: Object with an ``export(spans)`` method
+            interval: Seconds between exports
+            max_batch: Most spans per ``export`` call
+        """
+        self.sink = sink
+        self.interval = interval
+        self.max_batch = max_batch
+        self.exported = 0
+        self.dropped = 0
+        self.failures = 0
+
+        self._tracer = tracer
+        self._ring = tracer._ring
+        self._sequence = self._ring.head
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BatchExporter":
+        self._thread = threading.Thread(
+            target=self._loop, name="openstackai-trace-export", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self) -> int:
+        """Export everything buffered so far; returns the number of spans sent."""
+        sent = 0
+        with self._lock:
+            if self._tracer._ring is not self._ring:
+                # The tracer was reconfigured with a new buffer
+                self._ring = self._tracer._ring
+                self._sequence = 0
+            while True:
+                spans, self._sequence, dropped = self._ring.read_since(
+                    self._sequence, self.max_batch
+                )
+                self.dropped += dropped
+                if not spans:
+                    return sent
+                try:
+                    self.sink.export(spans)
+                except Exception as e:
+                    self.failures += 1
+                    print(f"Trace export to {type(self.sink).__name__} failed: {e}")
+                    return sent
+                self.exported += len(spans)
+                sent += len(spans)
+
+    def shutdown(self) -> None:
+        """Stop the thread after a final export."""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 5)
+        self.flush()
+
+
+# Sentinel for configure() options where None is a meaningful value
+_UNSET: Any = object()
 
 
 class Tracer:
     """Main tracer class for tracking AI operations."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        buffer_size: int = 2048,
+        sample_rate: float = 1.0,
+        tail_sample_rate: Optional[float] = None,
+        slow_ms: Optional[float] = None,
+        keep_errors: bool = True,
+        max_span_events: Optional[int] = 256,
+    ):
+        """
+        Initialize the tracer (disabled until ``enable()``).
+
+        Args:
+            buffer_size: Finished spans kept in memory
+            sample_rate: Head sampling; fraction of traces recorded at all
+            tail_sample_rate: Tail sampling; when set, a trace's spans are held
+                until its root span ends and kept if it failed (keep_errors),
+                was slower than slow_ms, or with this probability otherwise
+            slow_ms: Root span duration above which tail sampling keeps a trace
+            keep_errors: Tail sampling keeps traces containing an error
+            max_span_events: Events kept per span (None = unbounded)
+        """
         self._enabled = False
-        self._spans: List[Span] = []
-        self._current_span: Span = None
+        self._current: contextvars.ContextVar = contextvars.ContextVar(
+            f"openstackai_trace_{id(self)}", default=None
+        )
         self._handlers: List[Callable] = []
         self._lock = threading.Lock()
 
+        # Handler events are queued and dispatched off the hot path
+        self._events: collections.deque = collections.deque(maxlen=10000)
+        self._events_ready = threading.Event()
+        self._dispatch_lock = threading.Lock()
+        self._dispatcher: Optional[threading.Thread] = None
+
+        self._exporters: List[BatchExporter] = []
+        self._pending: Dict[str, List[Span]] = {}  # trace_id -> spans awaiting their root
+        self.max_pending_traces = 1000
+
+        self.configure(
+            buffer_size=buffer_size,
+            sample_rate=sample_rate,
+            tail_sample_rate=tail_sample_rate,
+            slow_ms=slow_ms,
+            keep_errors=keep_errors,
+            max_span_events=max_span_events,
+        )
+
+    def configure(
+        self,
+        *,
+        buffer_size: Optional[int] = None,
+        sample_rate: Optional[float] = None,
+        tail_sample_rate: Optional[float] = _UNSET,
+        slow_ms: Optional[float] = _UNSET,
+        keep_errors: Optional[bool] = None,
+        max_span_events: Optional[int] = _UNSET,
+    ) -> None:
+        """
+        Change buffering and sampling; see ``__init__`` for the options.
+
+        Only the options passed are changed. ``tail_sample_rate``, ``slow_ms``
+        and ``max_span_events`` accept None to turn the setting off. A new
+        ``buffer_size`` discards the spans currently buffered.
+        """
+        if buffer_size is not None:
+            self._ring = SpanRingBuffer(buffer_size)
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if tail_sample_rate is not _UNSET:
+            self.tail_sample_rate = tail_sample_rate
+        if slow_ms is not _UNSET:
+            self.slow_ms = slow_ms
+        if keep_errors is not None:
+            self.keep_errors = keep_errors
+        if max_span_events is not _UNSET:
+            self.max_span_events = max_span_events
+
     def enable(self) -> None:
         """Enable tracing."""
         self._enabled = True
@@ -149,10 +600,19 @@ class Tracer:
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def current_span(self) -> Optional[Span]:
+        """The span active in this thread or task, if it is being recorded."""
+        span = self._current.get()
+        return span if isinstance(span, Span) else None
+
     def span(self, name: str, **metadata) -> Span:
         """
         Create a new trace span.
 
+        The span becomes the parent of spans created inside its ``with``
+        block, in the same thread or asyncio task.
+
         Args:
             name: Span name
             **metadata: Additional metadata
@@ -165,40 +625,85 @@ class Tracer:
             ...     span.log("Starting work")
             ...     result = do_work()
         """
-        parent_id = self._current_span.span_id if self._current_span else None
-        span = Span(name=name, parent_span_id=parent_id, metadata=metadata)
+        if not self._enabled:
+            return _DISABLED_SPAN
+
+        parent = self._current.get()
+        if parent is None:
+            trace_id = _new_id(128)
+            # Head sampling: decided once per trace from its ID
+            if self.sample_rate < 1.0 and int(trace_id[:16], 16) >= self.sample_rate * 2**64:
+                return _NonRecordingSpan(self._current)
+            parent_id = None
+        elif isinstance(parent, Span):
+            trace_id = parent.trace_id
+            parent_id = parent.span_id
+        else:
+            return _NonRecordingSpan(self._current)
+
+        span = Span(
+            name=name,
+            parent_span_id=parent_id,
+            metadata=metadata,
+            trace_id=trace_id,
+            max_events=self.max_span_events,
+            _tracer=self,
+        )
 
-        with self._lock:
-            self._spans.append(span)
-            self._current_span = span
-
-        self._emit(
-            TraceEvent(
-                type="start",
-                message=f"Started span: {name}",
-                span_id=span.span_id,
-                parent_span_id=parent_id,
+        if self._handlers:
+            self._emit(
+                TraceEvent(
+                    type="start",
+                    message=f"Started span: {name}",
+                    span_id=span.span_id,
+                    parent_span_id=parent_id,
+                )
             )
-        )
 
         return span
 
+    def _finish(self, span: Span) -> None:
+        """Buffer a finished span, applying tail sampling."""
+        if self.tail_sample_rate is None:
+            self._ring.append(span)
+            return
+
+        if span.parent_span_id is not None:
+            self._pending.setdefault(span.trace_id, []).append(span)
+            if len(self._pending) > self.max_pending_traces:
+                # Roots that never ended: give up on the oldest trace
+                try:
+                    self._pending.pop(next(iter(self._pending)), None)
+                except (RuntimeError, StopIteration):
+                    pass
+            return
+
+        spans = self._pending.pop(span.trace_id, [])
+        spans.append(span)
+        if self._keep_trace(span, spans):
+            for finished in spans:
+                self._ring.append(finished)
+
+    def _keep_trace(self, root: Span, spans: List[Span]) -> bool:
+        if self.keep_errors and any(s.status == "error" for s in spans):
+            return True
+        if self.slow_ms is not None and root.duration_ms >= self.slow_ms:
+            return True
+        return random.random() < self.tail_sample_rate
+
+    def _record(self, event: TraceEvent) -> None:
+        span = self._current.get()
+        if isinstance(span, Span):
+            event.span_id = span.span_id
+            span.add_event(event)
+        self._emit(event)
+
     def log(self, message: str, **metadata) -> None:
         """Log an event."""
         if not self._enabled:
             return
 
-        event = TraceEvent(
-            type="log",
-            message=message,
-            span_id=self._current_span.span_id if self._current_span else None,
-            metadata=metadata,
-        )
-
-        if self._current_span:
-            self._current_span.events.append(event)
-
-        self._emit(event)
+        self._record(TraceEvent(type="log", message=message, metadata=metadata))
 
     def llm_call(
         self,
@@ -217,7 +722,6 @@ class Tracer:
             type="llm_call",
             message=f"LLM call to {provider}/{model}",
             duration_ms=duration_ms,
-            span_id=self._current_span.span_id if self._current_span else None,
             metadata={
                 "provider": provider,
                 "model": model,
@@ -228,11 +732,7 @@ class Tracer:
                 "tokens": tokens,
             },
         )
-
-        if self._current_span:
-            self._current_span.events.append(event)
-
-        self._emit(event)
+        self._record(event)
 
     def tool_call(
         self,
@@ -249,23 +749,25 @@ class Tracer:
             type="tool_call",
             message=f"Tool call: {tool_name}",
             duration_ms=duration_ms,
-            span_id=self._current_span.span_id if self._current_span else None,
             metadata={
                 "tool": tool_name,
                 "args": args,
                 "result_preview": str(result)[:100] if result else None,
             },
         )
+        self._record(event)
 
-        if self._current_span:
-            self._current_span.events.append(event)
-
-        self._emit(event)
+    # =========================================================================
+    # Handlers & Exporters
+    # =========================================================================
 
     def handler(self, func: Callable) -> Callable:
         """
         Register a trace event handler.
 
+        Handlers run on a background thread; call ``flush()`` to wait for
+        pending events.
+
         Args:
             func: Function to call for each trace event
 
@@ -274,16 +776,78 @@ class Tracer:
             ... def log_events(event):
             ...     print(f"[{event.type}] {event.message}")
         """
-        self._handlers.append(func)
+        with self._lock:
+            self._handlers.append(func)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop, name="openstackai-trace-handlers", daemon=True
+                )
+                self._dispatcher.start()
         return func
 
     def _emit(self, event: TraceEvent) -> None:
-        """Emit an event to all handlers."""
-        for handler in self._handlers:
-            try:
-                handler(event)
-            except Exception:
-                pass  # Don't let handler errors break tracing
+        """Queue an event for the handlers."""
+        if not self._handlers:
+            return
+        self._events.append(event)
+        if not self._events_ready.is_set():
+            self._events_ready.set()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            self._events_ready.wait()
+            self._events_ready.clear()
+            self._dispatch_pending()
+
+    def _dispatch_pending(self) -> None:
+        with self._dispatch_lock:
+            while True:
+                try:
+                    event = self._events.popleft()
+                except IndexError:
+                    return
+                for handler in self._handlers:
+                    try:
+                        handler(event)
+                    except Exception:
+                        pass  # Don't let handler errors break tracing
+
+    def add_exporter(self, sink: Any, interval: float = 1.0, max_batch: int = 512) -> BatchExporter:
+        """
+        Export finished spans to a sink in the background.
+
+        Args:
+            sink: JSONLSink, OTLPSink, or any object with ``export(spans)``
+            interval: Seconds between batches
+            max_batch: Most spans per batch
+
+        Returns:
+            The running exporter
+        """
+        exporter = BatchExporter(self, sink, interval=interval, max_batch=max_batch).start()
+        with self._lock:
+            if not self._exporters:
+                atexit.register(self.shutdown)
+            self._exporters.append(exporter)
+        return exporter
+
+    def flush(self) -> None:
+        """Run pending handlers and export buffered spans now."""
+        self._dispatch_pending()
+        for exporter in list(self._exporters):
+            exporter.flush()
+
+    def shutdown(self) -> None:
+        """Flush and stop every exporter."""
+        self._dispatch_pending()
+        with self._lock:
+            exporters, self._exporters = self._exporters, []
+        for exporter in exporters:
+            exporter.shutdown()
+
+    # =========================================================================
+    # Inspection
+    # =========================================================================
 
     def show(self, last_n: int = 10) -> None:
         """
@@ -296,7 +860,7 @@ class Tracer:
         print("TRACE OUTPUT")
         print("=" * 60)
 
-        for span in self._spans[-last_n:]:
+        for span in self._ring.snapshot()[-last_n:]:
             status_icon = (
                 "✅" if span.status == "completed" else "❌" if span.status == "error" else "🔄"
             )
@@ -318,35 +882,37 @@ class Tracer:
         Args:
             filepath: Path to output file
         """
+        spans = self._ring.snapshot()
         data = {
             "exported_at": datetime.now().isoformat(),
-            "spans": [s.to_dict() for s in self._spans],
+            "spans": [s.to_dict() for s in spans],
         }
 
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2)
 
-        print(f"Exported {len(self._spans)} spans to {filepath}")
+        print(f"Exported {len(spans)} spans to {filepath}")
 
     def clear(self) -> None:
         """Clear all traces."""
-        with self._lock:
-            self._spans.clear()
-            self._current_span = None
+        self._ring.clear()
+        self._pending.clear()
+        self._current.set(None)
 
     def get_spans(self) -> List[Span]:
-        """Get all recorded spans."""
-        return list(self._spans)
+        """Get the finished spans still in the buffer, oldest first."""
+        return self._ring.snapshot()
 
     def summary(self) -> Dict[str, Any]:
         """Get trace summary statistics."""
-        total_spans = len(self._spans)
-        completed = sum(1 for s in self._spans if s.status == "completed")
-        errors = sum(1 for s in self._spans if s.status == "error")
+        spans = self._ring.snapshot()
+        total_spans = len(spans)
+        completed = sum(1 for s in spans if s.status == "completed")
+        errors = sum(1 for s in spans if s.status == "error")
 
-        llm_calls = sum(1 for s in self._spans for e in s.events if e.type == "llm_call")
+        llm_calls = sum(1 for s in spans for e in s.events if e.type == "llm_call")
 
-        total_duration = sum(s.duration_ms for s in self._spans)
+        total_duration = sum(s.duration_ms for s in spans)
 
         return {
             "total_spans": total_spans,
@@ -362,6 +928,8 @@ def traced(name: str = None):
     """
     Decorator to trace a function.
 
+    Works on regular and async functions.
+
     Args:
         name: Span name (defaults to function name)
 
@@ -374,19 +942,29 @@ def traced(name: str = None):
     def decorator(func: Callable) -> Callable:
         span_name = name or func.__name__
 
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _tracer.enabled:
+                    return await func(*args, **kwargs)
+
+                with _tracer.span(span_name) as span:
+                    result = await func(*args, **kwargs)
+                    span.log("Completed successfully")
+                    return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if not _tracer.enabled:
                 return func(*args, **kwargs)
 
             with _tracer.span(span_name) as span:
-                try:
-                    result = func(*args, **kwargs)
-                    span.log("Completed successfully")
-                    return result
-                except Exception as e:
-                    span.error(str(e), e)
-                    raise
+                result = func(*args, **kwargs)
+                span.log("Completed successfully")
+                return result
 
         return wrapper
 
@@ -409,11 +987,15 @@ class TraceModule:
     # Core functions
     enable = _tracer.enable
     disable = _tracer.disable
+    configure = _tracer.configure
     span = _tracer.span
     log = _tracer.log
     llm_call = _tracer.llm_call
     tool_call = _tracer.tool_call
     handler = _tracer.handler
+    add_exporter = _tracer.add_exporter
+    flush = _tracer.flush
+    shutdown = _tracer.shutdown
     show = _tracer.show
     export = _tracer.export
     clear = _tracer.clear
@@ -428,10 +1010,16 @@ class TraceModule:
     def enabled(self) -> bool:
         return _tracer.enabled
 
+    @property
+    def current_span(self) -> Optional[Span]:
+        return _tracer.current_span
+
     # Classes
     Event = TraceEvent
     Span = Span
     Tracer = Tracer
+    JSONLSink = JSONLSink
+    OTLPSink = OTLPSink
 
 
 # Module-level instance
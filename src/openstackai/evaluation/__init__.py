@@ -30,6 +30,11 @@ Example:
     results = evaluate_agent(agent, eval_set)
     print(results.summary())
 
+    # Large runs: cached, resumable, concurrency-bounded
+    from openstackai.evaluation import EvalRunner
+    runner = EvalRunner(agent, cache_path="cache.jsonl", checkpoint_path="run.jsonl")
+    metrics = runner.run(eval_set)
+
     # Compare multiple agents
     from openstackai.evaluation import compare_agents
     comparison = compare_agents(
@@ -75,6 +80,7 @@ if TYPE_CHECKING:
         evaluate_agent,
         load_eval_set,
     )
+    from .runner import EvalRunner, ResultCache, agent_fingerprint
 
 
 # Lazy imports to avoid circular dependencies
@@ -89,6 +95,7 @@ def __getattr__(name):
         "load_eval_set",
         "create_eval_set",
     }
+    _runner_exports = {"EvalRunner", "ResultCache", "agent_fingerprint"}
     _criteria_exports = {
         "EvalCriteria",
         "CriteriaResult",
@@ -122,6 +129,10 @@ def __getattr__(name):
         from . import evaluator
 
         return getattr(evaluator, name)
+    elif name in _runner_exports:
+        from . import runner
+
+        return getattr(runner, name)
     elif name in _criteria_exports:
         from . import criteria
 
@@ -144,6 +155,10 @@ __all__ = [
     "compare_agents",
     "load_eval_set",
     "create_eval_set",
+    # Runner
+    "EvalRunner",
+    "ResultCache",
+    "agent_fingerprint",
     # Criteria classes
     "EvalCriteria",
     "CriteriaResult",
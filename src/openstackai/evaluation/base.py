@@ -130,6 +130,27 @@ class EvalResult:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], test_case: TestCase) -> "EvalResult":
+        """Create from dictionary.
+
+        Args:
+            data: Output of ``to_dict``
+            test_case: The test case the result belongs to
+        """
+        timestamp = data.get("timestamp")
+        return cls(
+            test_case=test_case,
+            status=EvalStatus(data["status"]),
+            actual_output=data.get("actual_output", ""),
+            score=data.get("score", 0.0),
+            details=data.get("details") or {},
+            latency_ms=data.get("latency_ms", 0.0),
+            tokens_used=data.get("tokens_used", 0),
+            error=data.get("error"),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else datetime.utcnow(),
+        )
+
 
 @dataclass
 class EvalMetrics:
@@ -8,11 +8,13 @@ Run evaluations against agents and collect results.
 """
 
 import asyncio
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from ..core.ratelimit import RateLimiter
 from .base import EvalMetrics, EvalResult, EvalSet, EvalStatus, TestCase
 from .criteria import (
     ContainsMatch,
@@ -34,6 +36,8 @@ class EvalConfig:
         timeout_seconds: Per-test timeout
         fail_fast: Stop on first failure
         verbose: Print progress
+        max_concurrency: Max test cases in flight for async runs (default: max_workers)
+        rate_limit: Max agent calls started per second for async runs (None = unlimited)
     """
 
     criteria: Optional[List[EvalCriteria]] = None
@@ -42,6 +46,8 @@ class EvalConfig:
     timeout_seconds: float = 60.0
     fail_fast: bool = False
     verbose: bool = True
+    max_concurrency: Optional[int] = None
+    rate_limit: Optional[float] = None
 
 
 class Evaluator:
@@ -83,6 +89,10 @@ class Evaluator:
         if not self.config.criteria:
             self.config.criteria = self._get_default_criteria()
 
+        # Worker pool for sync agents, shared by every run of this evaluator
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
     def _get_default_criteria(self) -> List[EvalCriteria]:
         """Get default criteria based on test case fields."""
         return [
@@ -92,6 +102,24 @@ class Evaluator:
             JSONSchema(),
         ]
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool, creating it on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.config.max_workers,
+                        thread_name_prefix="openstackai-eval",
+                    )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     def _run_agent(self, input_text: str, context: Optional[Dict] = None) -> tuple:
         """Run agent and measure time.
 
@@ -131,76 +159,106 @@ class Evaluator:
             latency_ms = (time.perf_counter() - start) * 1000
             raise RuntimeError(f"Agent execution failed: {e}") from e
 
+    async def _run_agent_async(self, test_case: TestCase) -> Tuple[str, float, int]:
+        """Run agent without blocking the event loop.
+
+        Sync agents run on the shared worker pool.
+
+        Returns:
+            Tuple of (output, latency_ms, tokens_used)
+        """
+        if hasattr(self.agent, "arun"):
+            start = time.perf_counter()
+            result = await self.agent.arun(test_case.input)
+            output = result.output if hasattr(result, "output") else str(result)
+            return output, (time.perf_counter() - start) * 1000, 0
+        if asyncio.iscoroutinefunction(self.agent):
+            start = time.perf_counter()
+            output = await self.agent(test_case.input)
+            if not isinstance(output, str):
+                output = str(output)
+            return output, (time.perf_counter() - start) * 1000, 0
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self._run_agent, test_case.input, test_case.context
+        )
+
+    def _score(
+        self, test_case: TestCase, output: str, latency_ms: float, tokens: int
+    ) -> EvalResult:
+        """Apply the criteria to an agent output."""
+        all_passed = True
+        total_score = 0.0
+        criteria_count = 0
+        details = {"criteria_results": []}
+
+        for criterion in self.config.criteria:
+            # Skip inapplicable criteria
+            if isinstance(criterion, ExactMatch) and not test_case.expected:
+                continue
+            if isinstance(criterion, ContainsMatch) and not test_case.expected_contains:
+                continue
+            if isinstance(criterion, NotContainsMatch) and not test_case.expected_not_contains:
+                continue
+            if isinstance(criterion, JSONSchema) and not test_case.expected_schema:
+                continue
+
+            # Build context for criteria (a copy, so the test case is left untouched)
+            ctx = dict(test_case.context or {})
+            ctx.update(
+                {
+                    "expected_contains": test_case.expected_contains,
+                    "expected_not_contains": test_case.expected_not_contains,
+                    "expected_schema": test_case.expected_schema,
+                }
+            )
+
+            result = criterion.evaluate(actual=output, expected=test_case.expected, context=ctx)
+
+            all_passed = all_passed and result.passed
+            total_score += result.score
+            criteria_count += 1
+
+            details["criteria_results"].append(
+                {
+                    "criteria": criterion.name,
+                    "passed": result.passed,
+                    "score": result.score,
+                    "reason": result.reason,
+                }
+            )
+
+        # Calculate final score
+        avg_score = total_score / criteria_count if criteria_count > 0 else 1.0
+
+        return EvalResult(
+            test_case=test_case,
+            status=EvalStatus.PASSED if all_passed else EvalStatus.FAILED,
+            actual_output=output,
+            score=avg_score,
+            details=details,
+            latency_ms=latency_ms,
+            tokens_used=tokens,
+        )
+
+    def _error_result(self, test_case: TestCase, error: Exception) -> EvalResult:
+        return EvalResult(
+            test_case=test_case,
+            status=EvalStatus.ERROR,
+            actual_output="",
+            score=0.0,
+            error=str(error),
+            details={"error": str(error)},
+        )
+
     def _evaluate_test(self, test_case: TestCase) -> EvalResult:
         """Evaluate a single test case."""
         try:
-            # Run agent
             output, latency_ms, tokens = self._run_agent(test_case.input, test_case.context)
-
-            # Apply criteria
-            all_passed = True
-            total_score = 0.0
-            criteria_count = 0
-            details = {"criteria_results": []}
-
-            for criterion in self.config.criteria:
-                # Skip inapplicable criteria
-                if isinstance(criterion, ExactMatch) and not test_case.expected:
-                    continue
-                if isinstance(criterion, ContainsMatch) and not test_case.expected_contains:
-                    continue
-                if isinstance(criterion, NotContainsMatch) and not test_case.expected_not_contains:
-                    continue
-                if isinstance(criterion, JSONSchema) and not test_case.expected_schema:
-                    continue
-
-                # Build context for criteria
-                ctx = test_case.context or {}
-                ctx.update(
-                    {
-                        "expected_contains": test_case.expected_contains,
-                        "expected_not_contains": test_case.expected_not_contains,
-                        "expected_schema": test_case.expected_schema,
-                    }
-                )
-
-                result = criterion.evaluate(actual=output, expected=test_case.expected, context=ctx)
-
-                all_passed = all_passed and result.passed
-                total_score += result.score
-                criteria_count += 1
-
-                details["criteria_results"].append(
-                    {
-                        "criteria": criterion.name,
-                        "passed": result.passed,
-                        "score": result.score,
-                        "reason": result.reason,
-                    }
-                )
-
-            # Calculate final score
-            avg_score = total_score / criteria_count if criteria_count > 0 else 1.0
-
-            return EvalResult(
-                test_case=test_case,
-                status=EvalStatus.PASSED if all_passed else EvalStatus.FAILED,
-                actual_output=output,
-                score=avg_score,
-                details=details,
-                latency_ms=latency_ms,
-                tokens_used=tokens,
-            )
-
+            return self._score(test_case, output, latency_ms, tokens)
         except Exception as e:
-            return EvalResult(
-                test_case=test_case,
-                status=EvalStatus.ERROR,
-                actual_output="",
-                score=0.0,
-                error=str(e),
-                details={"error": str(e)},
-            )
+            return self._error_result(test_case, e)
 
     def evaluate(
         self, eval_set: Union[EvalSet, List[TestCase]], tags: Optional[List[str]] = None
@@ -230,9 +288,9 @@ class Evaluator:
 
         if self.config.parallel and len(eval_set) > 1:
             # Parallel execution
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                futures = {executor.submit(self._evaluate_test, tc): tc for tc in eval_set}
-
+            executor = self._get_executor()
+            futures = {executor.submit(self._evaluate_test, tc): tc for tc in eval_set}
+            try:
                 for future in as_completed(futures):
                     result = future.result()
                     metrics.add_result(result)
@@ -243,6 +301,9 @@ class Evaluator:
 
                     if self.config.fail_fast and not result.passed:
                         break
+            finally:
+                for future in futures:
+                    future.cancel()
         else:
             # Sequential execution
             for test_case in eval_set:
@@ -268,6 +329,9 @@ class Evaluator:
     ) -> EvalMetrics:
         """Async evaluation for async agents.
 
+        At most ``config.max_concurrency`` test cases run at once, and agent
+        calls start no faster than ``config.rate_limit`` per second.
+
         Args:
             eval_set: Test cases to run
             tags: Only run tests with these tags
@@ -275,7 +339,6 @@ class Evaluator:
         Returns:
             EvalMetrics with aggregated results
         """
-        # For async agents
         if isinstance(eval_set, list):
             eval_set = EvalSet(eval_set)
 
@@ -284,92 +347,71 @@ class Evaluator:
 
         metrics = EvalMetrics()
         start_time = time.perf_counter()
+        limiter = RateLimiter(self.config.rate_limit) if self.config.rate_limit else None
 
-        # Run with asyncio
-        tasks = [self._evaluate_test_async(tc) for tc in eval_set]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, Exception):
-                # Create error result
-                metrics.add_result(
-                    EvalResult(
-                        test_case=TestCase(input="unknown"),
-                        status=EvalStatus.ERROR,
-                        actual_output="",
-                        error=str(result),
-                    )
-                )
-            else:
-                metrics.add_result(result)
+        await self._run_bounded(
+            eval_set,
+            lambda tc: self._evaluate_test_async(tc, limiter),
+            metrics.add_result,
+        )
 
         metrics.duration_seconds = time.perf_counter() - start_time
         return metrics
 
-    async def _evaluate_test_async(self, test_case: TestCase) -> EvalResult:
-        """Async test evaluation."""
-        try:
-            start = time.perf_counter()
+    async def _run_bounded(
+        self,
+        test_cases: Iterable[TestCase],
+        evaluate: Callable[[TestCase], Awaitable[EvalResult]],
+        on_result: Callable[[EvalResult], Any],
+    ) -> None:
+        """Evaluate test cases with at most ``max_concurrency`` in flight.
 
-            # Handle async agents
-            if hasattr(self.agent, "arun"):
-                result = await self.agent.arun(test_case.input)
-                output = result.output if hasattr(result, "output") else str(result)
-            elif asyncio.iscoroutinefunction(self.agent):
-                output = await self.agent(test_case.input)
-            else:
-                # Fall back to sync in executor
-                loop = asyncio.get_event_loop()
-                output, latency_ms, tokens = await loop.run_in_executor(
-                    None, self._run_agent, test_case.input, test_case.context
-                )
-                # Apply criteria (same as sync version)
-                return self._evaluate_test(test_case)
+        Test cases are pulled lazily by a fixed set of workers, so memory
+        stays constant however many cases there are.
 
-            latency_ms = (time.perf_counter() - start) * 1000
+        Args:
+            test_cases: Test cases to evaluate
+            evaluate: Coroutine function producing the result of one case
+            on_result: Called with each result as it completes
+        """
+        pending = iter(test_cases)
+        stopped = False
+
+        async def worker() -> None:
+            nonlocal stopped
+            for test_case in pending:
+                result = await evaluate(test_case)
+                on_result(result)
+                if self.config.fail_fast and not result.passed:
+                    stopped = True
+                if stopped:
+                    return
 
-            # Apply criteria
-            all_passed = True
-            total_score = 0.0
-            criteria_count = 0
-
-            for criterion in self.config.criteria:
-                if isinstance(criterion, ExactMatch) and not test_case.expected:
-                    continue
-                if isinstance(criterion, ContainsMatch) and not test_case.expected_contains:
-                    continue
-
-                ctx = test_case.context or {}
-                ctx.update(
-                    {
-                        "expected_contains": test_case.expected_contains,
-                        "expected_not_contains": test_case.expected_not_contains,
-                    }
-                )
-
-                result = criterion.evaluate(output, test_case.expected, ctx)
-                all_passed = all_passed and result.passed
-                total_score += result.score
-                criteria_count += 1
-
-            avg_score = total_score / criteria_count if criteria_count > 0 else 1.0
-
-            return EvalResult(
-                test_case=test_case,
-                status=EvalStatus.PASSED if all_passed else EvalStatus.FAILED,
-                actual_output=output,
-                score=avg_score,
-                latency_ms=latency_ms,
+        concurrency = max(self.config.max_concurrency or self.config.max_workers, 1)
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+
+    async def _evaluate_test_async(
+        self, test_case: TestCase, limiter: Optional[RateLimiter] = None
+    ) -> EvalResult:
+        """Async test evaluation."""
+        try:
+            if limiter:
+                await limiter.acquire()
+            output, latency_ms, tokens = await asyncio.wait_for(
+                self._run_agent_async(test_case), self.config.timeout_seconds
             )
-
-        except Exception as e:
-            return EvalResult(
-                test_case=test_case,
-                status=EvalStatus.ERROR,
-                actual_output="",
-                error=str(e),
+            return self._score(test_case, output, latency_ms, tokens)
+        except asyncio.TimeoutError:
+            return self._error_result(
+                test_case, TimeoutError(f"Timed out after {self.config.timeout_seconds}s")
             )
+        except Exception as e:
+            return self._error_result(test_case, e)
 
 
 def evaluate_agent(
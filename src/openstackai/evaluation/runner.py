@@ -0,0 +1,437 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Evaluation Runner
+
+Resumable, cached evaluation runs for large eval sets.
+
+Every test case gets a key hashed from the agent fingerprint, the test case
+content and the criteria. Results are stored under that key in two JSON
+Lines files:
+
+- the cache, shared across runs: a rerun only calls the agent for cases
+  whose key changed, so editing one prompt re-runs only what it affects
+- the checkpoint, written as the run goes: an interrupted run resumes from
+  it instead of starting over
+
+Errors are never cached, so they are retried on the next run.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..core.ratelimit import RateLimiter
+from .base import EvalMetrics, EvalResult, EvalSet, EvalStatus, TestCase
+from .criteria import EvalCriteria
+from .evaluator import EvalConfig, Evaluator
+
+# Agent attributes that decide its behaviour, checked in this order
+_AGENT_FIELDS = (
+    "name",
+    "instructions",
+    "system_prompt",
+    "model",
+    "temperature",
+    "config",
+    "llm",
+    "skills",
+    "tools",
+)
+
+# Test case fields that affect the result (id, tags and metadata do not)
+_CASE_FIELDS = (
+    "input",
+    "expected",
+    "expected_contains",
+    "expected_not_contains",
+    "expected_schema",
+    "context",
+    "conversation",
+)
+
+
+def _hash(value: Any) -> str:
+    data = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _code_hash(code: types.CodeType) -> str:
+    """Hash a code object by its bytecode, constants and referenced names."""
+    consts = [_const_key(c) for c in code.co_consts]
+    return _hash([code.co_code.hex(), consts, list(code.co_names)])
+
+
+def _const_key(const: Any) -> Any:
+    """A code constant as data that is the same in every process."""
+    if isinstance(const, types.CodeType):
+        return _code_hash(const)
+    if isinstance(const, tuple):
+        return [_const_key(c) for c in const]
+    if isinstance(const, frozenset):
+        # Iteration order (and so repr) depends on PYTHONHASHSEED for str items
+        return {"frozenset": sorted((_const_key(c) for c in const), key=repr)}
+    return repr(const)
+
+
+def _global_names(code: types.CodeType) -> List[str]:
+    """Names a code object (including nested functions) may load as globals."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_global_names(const))
+    return sorted(names)
+
+
+def _describe_captured(value: Any, depth: int) -> Any:
+    if isinstance(value, (list, dict, set)):
+        # Mutable captures are runtime state, not configuration
+        value = type(value)()
+    return _describe(value, depth)
+
+
+def _describe(value: Any, depth: int = 1) -> Any:
+    """Reduce a value to stable JSON-able data for fingerprinting."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_describe(v, depth) for v in value]
+        return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+    if isinstance(value, dict):
+        return {str(k): _describe(v, depth) for k, v in value.items()}
+    func = getattr(value, "__func__", value)
+    if isinstance(func, types.FunctionType):
+        closure = []
+        for cell in (func.__closure__ or ()) if depth >= 0 else ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:  # Cell not filled yet
+                contents = None
+            closure.append(_describe_captured(contents, depth - 1))
+        # Module-level values the code reads (prompts, constants, helpers)
+        referenced = {}
+        if depth > 0:
+            for name in _global_names(func.__code__):
+                if name in func.__globals__:
+                    referenced[name] = _describe_captured(func.__globals__[name], depth - 1)
+        return {
+            "function": func.__qualname__,
+            "code": _code_hash(func.__code__),
+            "defaults": _describe(func.__defaults__, depth - 1),
+            "closure": closure,
+            "globals": referenced,
+        }
+
+    description = {"type": f"{type(value).__module__}.{type(value).__qualname__}"}
+    if depth > 0 and hasattr(value, "__dict__"):
+        for key, attr in vars(value).items():
+            if not key.startswith("_"):
+                description[key] = _describe(attr, depth - 1)
+    return description
+
+
+def agent_fingerprint(agent: Any) -> str:
+    """Fingerprint the parts of an agent that decide its outputs.
+
+    Covers the instructions, model and configuration of Agent-like objects
+    and the code, defaults, closure and referenced module globals of plain
+    functions, so changing a prompt, a module constant or the function body
+    changes the fingerprint.
+
+    Args:
+        agent: Agent instance or callable
+
+    Returns:
+        Hex digest
+    """
+    func = getattr(agent, "__func__", agent)
+    if isinstance(func, types.FunctionType):
+        # A bound method also depends on the object it is bound to
+        owner = getattr(agent, "__self__", None)
+        return _hash([_describe(func), agent_fingerprint(owner) if owner is not None else None])
+
+    description = {"type": f"{type(agent).__module__}.{type(agent).__qualname__}"}
+    for field in _AGENT_FIELDS:
+        if hasattr(agent, field):
+            description[field] = _describe(getattr(agent, field))
+    if len(description) == 1:
+        # Not Agent-like (e.g. a callable object): use its public attributes
+        description = _describe(agent)
+    return _hash(description)
+
+
+def criteria_fingerprint(criteria: List[EvalCriteria]) -> str:
+    """Fingerprint criteria by type and settings.
+
+    Args:
+        criteria: Criteria applied to each result
+
+    Returns:
+        Hex digest
+    """
+    return _hash([_describe(c) for c in criteria])
+
+
+def _case_key(fingerprint: str, test_case: TestCase, criteria_key: str) -> str:
+    case = test_case.to_dict()
+    return _hash(
+        {
+            "agent": fingerprint,
+            "case": {field: case[field] for field in _CASE_FIELDS},
+            "criteria": criteria_key,
+        }
+    )
+
+
+class ResultCache:
+    """Evaluation results stored by key in a JSON Lines file.
+
+    The file is read once on first use; ``put`` appends a line, so a crash
+    loses at most the result being written. A torn final line is ignored
+    and the last line for a key wins.
+
+    Example:
+        cache = ResultCache("results.cache.jsonl")
+        cache.put(key, result)
+        cache.get(key, test_case)
+    """
+
+    def __init__(self, path: str):
+        """Initialize cache.
+
+        Args:
+            path: JSON Lines file (created on first write)
+        """
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            entries = {}
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            entries[record["key"]] = record["result"]
+                        except (json.JSONDecodeError, KeyError, TypeError):
+                            # Torn write at the tail of an interrupted run
+                            continue
+            self._entries = entries
+        return self._entries
+
+    def get(self, key: str, test_case: TestCase) -> Optional[EvalResult]:
+        """Get the stored result for a key.
+
+        Args:
+            key: Result key
+            test_case: Test case to attach to the result
+
+        Returns:
+            The result, or None if there is none
+        """
+        with self._lock:
+            data = self._load().get(key)
+        return EvalResult.from_dict(data, test_case) if data is not None else None
+
+    def put(self, key: str, result: EvalResult) -> None:
+        """Store a result and append it to the file."""
+        data = result.to_dict()
+        with self._lock:
+            self._load()[key] = data
+            try:
+                if self._file is None:
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(json.dumps({"key": key, "result": data}, default=str) + "\n")
+                self._file.flush()
+            except OSError as e:
+                print(f"Failed to write eval results to {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Drop every stored result and truncate the file."""
+        with self._lock:
+            self._close_file()
+            self._entries = {}
+            open(self.path, "w").close()
+
+    def compact(self) -> None:
+        """Rewrite the file with only the latest result per key."""
+        with self._lock:
+            entries = self._load()
+            self._close_file()
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for key, data in entries.items():
+                    f.write(json.dumps({"key": key, "result": data}, default=str) + "\n")
+            os.replace(temp_path, self.path)
+
+    def close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._load()
+
+
+class EvalRunner:
+    """Run large evaluations with caching, checkpoints and bounded concurrency.
+
+    Example:
+        runner = EvalRunner(
+            agent,
+            EvalConfig(max_concurrency=16, rate_limit=5, verbose=False),
+            cache_path="evals/cache.jsonl",
+            checkpoint_path="evals/run.jsonl",
+            on_result=lambda result, metrics: print(f"{metrics.total}: {metrics.accuracy:.1%}"),
+        )
+        metrics = runner.run(eval_set)
+
+        # After editing the prompt, only the affected cases call the agent
+        metrics = runner.run(eval_set)
+        print(runner.executed, runner.cache_hits)
+    """
+
+    def __init__(
+        self,
+        agent: Any,
+        config: Optional[EvalConfig] = None,
+        *,
+        cache_path: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+        on_result: Optional[Callable[[EvalResult, EvalMetrics], Any]] = None,
+    ):
+        """Initialize runner.
+
+        Args:
+            agent: Agent to evaluate (any callable or Agent instance)
+            config: Evaluation configuration (concurrency, rate limit, criteria)
+            cache_path: Result cache shared across runs (None = no cache)
+            checkpoint_path: Per-run results file to resume from (None = no checkpoint)
+            fingerprint: Agent fingerprint (default: ``agent_fingerprint(agent)``)
+            on_result: Called with each result and the metrics so far
+        """
+        self.evaluator = Evaluator(agent, config)
+        self.config = self.evaluator.config
+        self.cache = ResultCache(cache_path) if cache_path else None
+        self.checkpoint = ResultCache(checkpoint_path) if checkpoint_path else None
+        self.fingerprint = fingerprint or agent_fingerprint(agent)
+        self.on_result = on_result
+
+        # Counts for the last run
+        self.executed = 0
+        self.cache_hits = 0
+        self.resumed = 0
+
+    def case_key(self, test_case: TestCase) -> str:
+        """Key of a test case's result under the current agent and criteria."""
+        return _case_key(self.fingerprint, test_case, criteria_fingerprint(self.config.criteria))
+
+    async def run_async(
+        self,
+        eval_set: Union[EvalSet, List[TestCase]],
+        tags: Optional[List[str]] = None,
+        resume: bool = True,
+    ) -> EvalMetrics:
+        """Evaluate test cases, reusing stored results where the key matches.
+
+        Args:
+            eval_set: Test cases to run
+            tags: Only run tests with these tags
+            resume: Continue from the checkpoint; False starts a fresh one
+
+        Returns:
+            EvalMetrics with aggregated results
+        """
+        if isinstance(eval_set, list):
+            eval_set = EvalSet(eval_set)
+        if tags:
+            eval_set = eval_set.filter(tags=tags)
+
+        if self.checkpoint is not None and not resume:
+            self.checkpoint.clear()
+
+        self.executed = self.cache_hits = self.resumed = 0
+        metrics = EvalMetrics()
+        start_time = time.perf_counter()
+        limiter = RateLimiter(self.config.rate_limit) if self.config.rate_limit else None
+        criteria_key = criteria_fingerprint(self.config.criteria)
+
+        if self.config.verbose:
+            print(f"🧪 Running {len(eval_set)} test cases...")
+
+        async def evaluate(test_case: TestCase) -> EvalResult:
+            key = _case_key(self.fingerprint, test_case, criteria_key)
+
+            if self.checkpoint is not None:
+                result = self.checkpoint.get(key, test_case)
+                if result is not None and result.status != EvalStatus.ERROR:
+                    self.resumed += 1
+                    return result
+
+            result = self.cache.get(key, test_case) if self.cache is not None else None
+            if result is not None:
+                self.cache_hits += 1
+            else:
+                result = await self.evaluator._evaluate_test_async(test_case, limiter)
+                self.executed += 1
+                if self.cache is not None and result.status != EvalStatus.ERROR:
+                    self.cache.put(key, result)
+
+            if self.checkpoint is not None:
+                self.checkpoint.put(key, result)
+            return result
+
+        def record(result: EvalResult) -> None:
+            metrics.add_result(result)
+            if self.config.verbose:
+                status_icon = "✅" if result.passed else "❌"
+                print(f"  {status_icon} {result.test_case.id}: {result.status.value}")
+            if self.on_result:
+                self.on_result(result, metrics)
+
+        await self.evaluator._run_bounded(eval_set, evaluate, record)
+
+        metrics.duration_seconds = time.perf_counter() - start_time
+        if self.config.verbose:
+            print(metrics.summary())
+        return metrics
+
+    def run(
+        self,
+        eval_set: Union[EvalSet, List[TestCase]],
+        tags: Optional[List[str]] = None,
+        resume: bool = True,
+    ) -> EvalMetrics:
+        """Synchronous wrapper around ``run_async``."""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.run_async(eval_set, tags=tags, resume=resume))
+        finally:
+            loop.close()
+
+    def close(self) -> None:
+        """Close the result files and the evaluator's worker pool."""
+        for store in (self.cache, self.checkpoint):
+            if store is not None:
+                store.close()
+        self.evaluator.close()
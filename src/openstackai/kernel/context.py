@@ -80,6 +80,10 @@ class KernelContext:
     - Invocation history
     - Parent context (for nested executions)
 
+    Invocation history keeps the most recent ``max_invocations`` entries
+    (None = unbounded). ``sample_rate`` below 1.0 makes
+    ``record_invocation`` track only that fraction of calls, evenly spaced.
+
     Example:
         ctx = KernelContext()
         ctx.variables["user_input"] = "Hello"
@@ -98,6 +102,10 @@ class KernelContext:
     parent: Optional["KernelContext"] = None
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    max_invocations: Optional[int] = 1000
+    sample_rate: float = 1.0
+    dropped_invocations: int = 0
+    _sample_credit: float = field(default=0.0, init=False, repr=False)
 
     def create_invocation(
         self, plugin_name: str, function_name: str, arguments: Optional[Dict[str, Any]] = None
@@ -116,8 +124,32 @@ class KernelContext:
             plugin_name=plugin_name, function_name=function_name, arguments=arguments or {}
         )
         self.invocations.append(inv)
+        if self.max_invocations is not None and len(self.invocations) > self.max_invocations:
+            excess = len(self.invocations) - self.max_invocations
+            del self.invocations[:excess]
+            self.dropped_invocations += excess
         return inv
 
+    def record_invocation(
+        self, plugin_name: str, function_name: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> Optional[InvocationContext]:
+        """Create and track an invocation if it falls within the sample.
+
+        Args:
+            plugin_name: Name of the plugin
+            function_name: Name of the function
+            arguments: Function arguments
+
+        Returns:
+            New invocation context, or None if this call is not sampled
+        """
+        if self.sample_rate < 1.0:
+            self._sample_credit += self.sample_rate
+            if self._sample_credit < 1.0:
+                return None
+            self._sample_credit -= 1.0
+        return self.create_invocation(plugin_name, function_name, arguments)
+
     def get_variable(self, name: str, default: Any = None) -> Any:
         """Get a variable value.
 
@@ -154,7 +186,9 @@ class KernelContext:
         Returns:
             New child context
         """
-        return KernelContext(parent=self)
+        return KernelContext(
+            parent=self, max_invocations=self.max_invocations, sample_rate=self.sample_rate
+        )
 
     @property
     def total_invocations(self) -> int:
@@ -196,6 +230,7 @@ class KernelContext:
                 }
                 for inv in self.invocations
             ],
+            "dropped_invocations": self.dropped_invocations,
             "created_at": self.created_at.isoformat(),
             "metadata": self.metadata,
         }
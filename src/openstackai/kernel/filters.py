@@ -11,7 +11,7 @@ Filters can intercept and modify prompts, function calls, and results.
 from abc import ABC
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class FilterType(Enum):
@@ -146,6 +146,10 @@ class FilterRegistry:
     - Type-based filtering
     - Filter lifecycle management
 
+    Chains are compiled per filter type on first use and reused until a
+    filter is added or removed, so applying them does no sorting or
+    type checks per call.
+
     Example:
         registry = FilterRegistry()
 
@@ -162,6 +166,7 @@ class FilterRegistry:
     def __init__(self):
         """Initialize empty registry."""
         self._filters: List[tuple[int, Filter]] = []
+        self._chains: Dict[Optional[FilterType], Tuple[Filter, ...]] = {}
 
     def add(self, filter: Filter, priority: int = 100) -> "FilterRegistry":
         """Add a filter.
@@ -176,6 +181,7 @@ class FilterRegistry:
         # Store with priority for sorting
         self._filters.append((priority, filter))
         self._filters.sort(key=lambda x: x[0])
+        self._chains.clear()
         return self
 
     def remove(self, filter: Filter) -> bool:
@@ -190,6 +196,7 @@ class FilterRegistry:
         for i, (_, f) in enumerate(self._filters):
             if f is filter:
                 self._filters.pop(i)
+                self._chains.clear()
                 return True
         return False
 
@@ -202,10 +209,26 @@ class FilterRegistry:
         Returns:
             List of filters
         """
-        filters = [f for _, f in self._filters]
-        if filter_type is not None:
-            filters = [f for f in filters if f.filter_type == filter_type]
-        return filters
+        return list(self.chain(filter_type))
+
+    def chain(self, filter_type: Optional[FilterType] = None) -> Tuple[Filter, ...]:
+        """Get the compiled filter chain for a type.
+
+        Args:
+            filter_type: Filter by type (optional)
+
+        Returns:
+            Filters in priority order (cached until the registry changes)
+        """
+        chain = self._chains.get(filter_type)
+        if chain is None:
+            chain = tuple(
+                f for _, f in self._filters if filter_type is None or f.filter_type == filter_type
+            )
+            if filter_type == FilterType.PROMPT:
+                chain = tuple(f for f in chain if isinstance(f, PromptFilter))
+            self._chains[filter_type] = chain
+        return chain
 
     def apply_function_invoking(
         self, context: FilterContext, arguments: Dict[str, Any]
@@ -220,7 +243,7 @@ class FilterRegistry:
             Modified arguments
         """
         result = arguments
-        for filter in self.get_filters(FilterType.FUNCTION):
+        for filter in self.chain(FilterType.FUNCTION):
             result = filter.on_function_invoking(context, result)
         return result
 
@@ -234,7 +257,7 @@ class FilterRegistry:
         Returns:
             Modified result
         """
-        for filter in self.get_filters(FilterType.FUNCTION):
+        for filter in self.chain(FilterType.FUNCTION):
             result = filter.on_function_invoked(context, result)
         return result
 
@@ -249,9 +272,8 @@ class FilterRegistry:
             Modified prompt
         """
         result = prompt
-        for filter in self.get_filters(FilterType.PROMPT):
-            if isinstance(filter, PromptFilter):
-                result = filter.on_prompt_rendering(context, result)
+        for filter in self.chain(FilterType.PROMPT):
+            result = filter.on_prompt_rendering(context, result)
         return result
 
     def apply_prompt_rendered(self, context: FilterContext, prompt: str, result: str) -> str:
@@ -265,11 +287,11 @@ class FilterRegistry:
         Returns:
             Modified result
         """
-        for filter in self.get_filters(FilterType.PROMPT):
-            if isinstance(filter, PromptFilter):
-                result = filter.on_prompt_rendered(context, prompt, result)
+        for filter in self.chain(FilterType.PROMPT):
+            result = filter.on_prompt_rendered(context, prompt, result)
         return result
 
     def clear(self) -> None:
         """Remove all filters."""
         self._filters.clear()
+        self._chains.clear()
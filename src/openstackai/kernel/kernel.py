@@ -11,16 +11,55 @@ Manages services, plugins, filters, and provides unified execution.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
-
-from .context import KernelContext
-from .filters import Filter, FilterContext, FilterRegistry
+import functools
+import inspect
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .context import InvocationContext, KernelContext
+from .filters import Filter, FilterContext, FilterRegistry, FilterType
 from .services import Service, ServiceRegistry, ServiceType
 
 if TYPE_CHECKING:
     from ..plugins import PluginRegistry
 
 
+class _CompiledFunction(NamedTuple):
+    """A resolved plugin function, valid while the registry returns the same ``source``."""
+
+    source: Any
+    func: Callable
+    is_async: bool
+
+
+class _ThreadLoop:
+    """An event loop owned by one thread, closed once that thread exits."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        # Runs when the thread's locals are released, or earlier from Kernel.close()
+        self.close = weakref.finalize(self, _close_loop, self.loop)
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    if not loop.is_running() and not loop.is_closed():
+        loop.close()
+
+
 class Kernel:
     """Central kernel for AI application orchestration.
 
@@ -67,6 +106,9 @@ class Kernel:
         services: Optional[ServiceRegistry] = None,
         filters: Optional[FilterRegistry] = None,
         plugins: Optional["PluginRegistry"] = None,
+        max_invocations: Optional[int] = 1000,
+        invocation_sample_rate: float = 1.0,
+        max_workers: Optional[int] = None,
     ):
         """Initialize kernel.
 
@@ -74,6 +116,10 @@ class Kernel:
             services: Pre-configured service registry
             filters: Pre-configured filter registry
             plugins: Pre-configured plugin registry
+            max_invocations: Invocations kept in the context history (None = all)
+            invocation_sample_rate: Fraction of invocations recorded in the history
+            max_workers: Threads for sync functions run by invoke_many
+                (None = ThreadPoolExecutor default)
         """
         self._services = services or ServiceRegistry()
         self._filters = filters or FilterRegistry()
@@ -83,9 +129,22 @@ class Kernel:
 
         self._plugins = plugins or PluginRegistry()
 
-        self._context = KernelContext()
+        self._max_invocations = max_invocations
+        self._sample_rate = invocation_sample_rate
+        self._context = self._new_context()
         self._agents: Dict[str, Any] = {}
 
+        # (plugin, function) -> resolved callable, reused while the registered function is unchanged
+        self._compiled: Dict[Tuple[str, str], _CompiledFunction] = {}
+        # Event loops reused by the sync wrappers, one per calling thread and
+        # closed when it exits; only weakly tracked so close() can reach them
+        self._local = threading.local()
+        self._loops: weakref.WeakSet[_ThreadLoop] = weakref.WeakSet()
+        self._loops_lock = threading.Lock()
+        # Shared pool that keeps sync functions off the event loop in invoke_many
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
     # ========== Service Management ==========
 
     @property
@@ -230,9 +289,12 @@ class Kernel:
         Returns:
             New context (also sets as current)
         """
-        self._context = KernelContext()
+        self._context = self._new_context()
         return self._context
 
+    def _new_context(self) -> KernelContext:
+        return KernelContext(max_invocations=self._max_invocations, sample_rate=self._sample_rate)
+
     def set_variable(self, name: str, value: Any) -> "Kernel":
         """Set a context variable.
 
@@ -260,6 +322,27 @@ class Kernel:
 
     # ========== Invocation ==========
 
+    def _resolve(self, plugin_name: str, function_name: str) -> _CompiledFunction:
+        """Look up a plugin function, reusing the cached resolution when still valid."""
+        func = self.get_function(plugin_name, function_name)
+        if func is None:
+            raise ValueError(f"Function '{function_name}' not found in plugin '{plugin_name}'")
+        # Keyed on the registered object, so replacing it (re-registering the plugin,
+        # Plugin.add_function) is picked up without any invalidation hook
+        compiled = self._compiled.get((plugin_name, function_name))
+        if compiled is not None and compiled.source is func:
+            return compiled
+
+        # Call the wrapped function directly rather than through PluginFunction.__call__;
+        # unwrap to see through @function's sync wrapper around async methods
+        target = getattr(func, "func", func)
+        is_async = getattr(func, "is_async", False) or asyncio.iscoroutinefunction(
+            inspect.unwrap(target)
+        )
+        compiled = _CompiledFunction(func, target, is_async)
+        self._compiled[(plugin_name, function_name)] = compiled
+        return compiled
+
     async def invoke_async(self, plugin_name: str, function_name: str, **arguments) -> Any:
         """Invoke a plugin function asynchronously.
 
@@ -274,46 +357,96 @@ class Kernel:
         Raises:
             ValueError: If plugin/function not found
         """
-        # Get function
-        func = self.get_function(plugin_name, function_name)
-        if func is None:
-            raise ValueError(f"Function '{function_name}' not found in plugin '{plugin_name}'")
-
-        # Create invocation context
-        inv = self._context.create_invocation(
-            plugin_name=plugin_name, function_name=function_name, arguments=arguments
-        )
-
-        # Create filter context
-        filter_ctx = FilterContext(
-            kernel=self, plugin_name=plugin_name, function_name=function_name, arguments=arguments
+        compiled = self._resolve(plugin_name, function_name)
+        if not compiled.is_async:
+            return self._invoke_compiled(compiled, plugin_name, function_name, arguments)
+
+        inv = self._context.record_invocation(plugin_name, function_name, arguments)
+        chain = self._filters.chain(FilterType.FUNCTION)
+        filter_ctx = (
+            FilterContext(
+                kernel=self,
+                plugin_name=plugin_name,
+                function_name=function_name,
+                arguments=arguments,
+            )
+            if chain
+            else None
         )
 
         try:
-            inv.start()
+            if inv is not None:
+                inv.start()
 
             # Apply pre-invocation filters
-            modified_args = self._filters.apply_function_invoking(filter_ctx, arguments)
+            for filter_instance in chain:
+                arguments = filter_instance.on_function_invoking(filter_ctx, arguments)
 
-            # Invoke function
-            if asyncio.iscoroutinefunction(func):
-                result = await func(**modified_args)
-            else:
-                result = func(**modified_args)
+            result = await compiled.func(**arguments)
 
             # Apply post-invocation filters
-            result = self._filters.apply_function_invoked(filter_ctx, result)
+            for filter_instance in chain:
+                result = filter_instance.on_function_invoked(filter_ctx, result)
 
+        except Exception as e:
+            if inv is not None:
+                inv.fail(e)
+            raise
+
+        if inv is not None:
             inv.complete(result)
-            return result
+        return result
+
+    def _invoke_compiled(
+        self,
+        compiled: _CompiledFunction,
+        plugin_name: str,
+        function_name: str,
+        arguments: Dict[str, Any],
+    ) -> Any:
+        """Invoke a synchronous function without touching an event loop.
+
+        Mirrors invoke_async; kept separate so sync calls need no coroutine.
+        """
+        inv = self._context.record_invocation(plugin_name, function_name, arguments)
+        chain = self._filters.chain(FilterType.FUNCTION)
+        filter_ctx = (
+            FilterContext(
+                kernel=self,
+                plugin_name=plugin_name,
+                function_name=function_name,
+                arguments=arguments,
+            )
+            if chain
+            else None
+        )
+
+        try:
+            if inv is not None:
+                inv.start()
+
+            for filter_instance in chain:
+                arguments = filter_instance.on_function_invoking(filter_ctx, arguments)
+
+            result = compiled.func(**arguments)
+
+            for filter_instance in chain:
+                result = filter_instance.on_function_invoked(filter_ctx, result)
 
         except Exception as e:
-            inv.fail(e)
+            if inv is not None:
+                inv.fail(e)
             raise
 
+        if inv is not None:
+            inv.complete(result)
+        return result
+
     def invoke(self, plugin_name: str, function_name: str, **arguments) -> Any:
         """Invoke a plugin function (sync wrapper).
 
+        Synchronous functions are called directly. Async functions run on an
+        event loop that is reused across calls from the same thread.
         For async invocation, use invoke_async().
 
         Args:
@@ -322,15 +455,141 @@ class Kernel:
             **arguments: Function arguments
 
         Returns:
-            Function result
+            Function result (a Task if called from async context)
         """
         try:
             asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
             # Already in async context
             return asyncio.create_task(self.invoke_async(plugin_name, function_name, **arguments))
+
+        compiled = self._resolve(plugin_name, function_name)
+        if not compiled.is_async:
+            return self._invoke_compiled(compiled, plugin_name, function_name, arguments)
+        return self._run_sync(self.invoke_async(plugin_name, function_name, **arguments))
+
+    async def invoke_many_async(
+        self,
+        calls: Iterable[Sequence[Any]],
+        *,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[InvocationContext]:
+        """Invoke several plugin functions concurrently.
+
+        Async functions run on the event loop; sync functions run on a thread
+        pool shared by the kernel so they do not block it. A failing or timed
+        out call does not affect the others. A sync function that times out
+        keeps running in its thread; only its result is discarded.
+
+        Args:
+            calls: (plugin_name, function_name[, arguments]) tuples
+            max_concurrency: Maximum calls in flight at once (None = all)
+            timeout: Seconds allowed for each call
+
+        Returns:
+            One invocation per call, in call order, with its result or error
+
+        Example:
+            results = await kernel.invoke_many_async(
+                [("weather", "get_forecast", {"city": "NYC"}),
+                 ("search", "web", {"query": "news"})],
+                max_concurrency=4,
+                timeout=10,
+            )
+            errors = [inv.error for inv in results if not inv.success]
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(call: Sequence[Any]) -> InvocationContext:
+            plugin_name, function_name = call[0], call[1]
+            arguments = dict(call[2]) if len(call) > 2 and call[2] else {}
+            outcome = InvocationContext(
+                plugin_name=plugin_name, function_name=function_name, arguments=arguments
+            )
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                outcome.start()
+                compiled = self._resolve(plugin_name, function_name)
+                if compiled.is_async:
+                    pending = self.invoke_async(plugin_name, function_name, **arguments)
+                else:
+                    pending = loop.run_in_executor(
+                        self._thread_pool(),
+                        functools.partial(
+                            self._invoke_compiled,
+                            compiled,
+                            plugin_name,
+                            function_name,
+                            dict(arguments),
+                        ),
+                    )
+                result = await asyncio.wait_for(pending, timeout)
+            except Exception as e:
+                outcome.fail(e)
+            else:
+                outcome.complete(result)
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+            return outcome
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
+
+    def invoke_many(
+        self,
+        calls: Iterable[Sequence[Any]],
+        *,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[List[InvocationContext], "asyncio.Task[List[InvocationContext]]"]:
+        """Invoke several plugin functions concurrently (sync wrapper).
+
+        See invoke_many_async() for details.
+
+        Returns:
+            One invocation per call (a Task if called from async context)
+        """
+        coro = self.invoke_many_async(calls, max_concurrency=max_concurrency, timeout=timeout)
+        try:
+            asyncio.get_running_loop()
         except RuntimeError:
-            # No running loop, run synchronously
-            return asyncio.run(self.invoke_async(plugin_name, function_name, **arguments))
+            return self._run_sync(coro)
+        return asyncio.create_task(coro)
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._loops_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="openstackai-kernel"
+                )
+            return self._executor
+
+    def _run_sync(self, coro: Any) -> Any:
+        """Run a coroutine on this thread's reusable event loop."""
+        owned = getattr(self._local, "loop", None)
+        if owned is None or owned.loop.is_closed():
+            owned = _ThreadLoop()
+            self._local.loop = owned
+            with self._loops_lock:
+                self._loops.add(owned)
+        return owned.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Close the event loops and thread pool created for invocations."""
+        with self._loops_lock:
+            loops = list(self._loops)
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for owned in loops:
+            # A loop still running elsewhere is left to its thread's exit
+            if not owned.loop.is_running():
+                owned.close()
 
     # ========== Agent Creation ==========
 
@@ -461,9 +720,9 @@ class Kernel:
         """
         try:
             asyncio.get_running_loop()
-            return asyncio.create_task(self.invoke_prompt_async(prompt, **kwargs))
         except RuntimeError:
-            return asyncio.run(self.invoke_prompt_async(prompt, **kwargs))
+            return self._run_sync(self.invoke_prompt_async(prompt, **kwargs))
+        return asyncio.create_task(self.invoke_prompt_async(prompt, **kwargs))
 
     # ========== Utilities ==========
 
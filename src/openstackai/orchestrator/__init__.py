@@ -38,14 +38,26 @@ Examples:
 """
 
 import asyncio
+import functools
 import json
+import queue
 import threading
 import time
 import uuid
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as futures_wait
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+from .cron import CronExpression
+from .dag import CycleError, DAGReport, DAGScheduler, critical_path, topological_sort
+from .executor import WorkerPool, _cancel_future
+from .journal import StateJournal, callable_ref, jsonable, resolve_callable
+from .scheduler import JobScheduler
 
 
 class TaskStatus(Enum):
@@ -69,6 +81,7 @@ class ExecutionPattern(Enum):
     BROADCAST = "broadcast"
     ROUTER = "router"
     CONSENSUS = "consensus"
+    DAG = "dag"
 
 
 @dataclass
@@ -90,6 +103,13 @@ class Task:
     max_retries: int = 3
     timeout: int = None  # seconds
     dependencies: List[str] = field(default_factory=list)
+    priority: int = 0  # Higher runs first
+    future: Future = field(default_factory=Future, repr=False, compare=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the task has reached a final status."""
+        return self.status in _FINAL_STATUSES
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -103,6 +123,62 @@ class Task:
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
 
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Journal record: ``to_dict`` plus what is needed to resume the task.
+
+        The result is kept whole when it is JSON-serializable (None otherwise)
+        rather than ``to_dict``'s truncated string.
+        """
+        record = self.to_dict()
+        record.update(
+            result=jsonable(self.result),
+            func=callable_ref(self.func),
+            args=jsonable(list(self.args)),
+            kwargs=jsonable(self.kwargs),
+            dependencies=self.dependencies,
+            priority=self.priority,
+            retry_count=self.retry_count,
+            max_retries=self.max_retries,
+            timeout=self.timeout,
+        )
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Task":
+        """Rebuild a task from a journal record; ``func`` is None if it cannot be imported."""
+
+        def parse(value):
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            id=record["id"],
+            name=record.get("name", ""),
+            func=resolve_callable(record.get("func")),
+            args=tuple(record.get("args") or ()),
+            kwargs=record.get("kwargs") or {},
+            status=TaskStatus(record.get("status", "pending")),
+            result=record.get("result"),
+            error=record.get("error"),
+            created_at=parse(record.get("created_at")) or datetime.now(),
+            started_at=parse(record.get("started_at")),
+            completed_at=parse(record.get("completed_at")),
+            retry_count=record.get("retry_count", 0),
+            max_retries=record.get("max_retries", 3),
+            timeout=record.get("timeout"),
+            dependencies=record.get("dependencies") or [],
+            priority=record.get("priority", 0),
+        )
+
+
+_FINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+
+def _cancel_run(run: Future, task_future: Future) -> None:
+    """Drop a task's queued pool work once its future has been cancelled."""
+    if task_future.cancelled():
+        run.cancel()
+
 
 @dataclass
 class Workflow:
@@ -113,6 +189,7 @@ class Workflow:
     pattern: ExecutionPattern = ExecutionPattern.SEQUENTIAL
     context: Dict[str, Any] = field(default_factory=dict)
     state: Dict[str, Any] = field(default_factory=dict)
+    report: Optional[DAGReport] = None  # Set by DAG runs
 
     def add_step(self, task: Task) -> "Workflow":
         """Add a step to the workflow."""
@@ -140,6 +217,10 @@ class ScheduledJob:
     last_run: datetime = None
     next_run: datetime = None
     enabled: bool = True
+    misfire_grace_time: float = None  # Skip runs later than this (None = always run)
+    coalesce: bool = True  # Run once for several missed occurrences
+    run_count: int = 0
+    misfire_count: int = 0
 
 
 class Orchestrator:
@@ -150,23 +231,58 @@ class Orchestrator:
     - Workflow definition and execution
     - Task scheduling (one-time, recurring, cron)
     - Dependency management
-    - Parallel execution
+    - Parallel execution on a bounded worker pool
     - State persistence
     - Event handling
     """
 
-    def __init__(self, *, max_workers: int = 4, state_file: str = None, auto_save: bool = True):
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        state_file: str = None,
+        auto_save: bool = True,
+        backend: str = "thread",
+        max_queue: int = 0,
+        retry_backoff: float = 1.0,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            max_workers: Maximum number of tasks running at once
+            state_file: Snapshot path; task changes are journaled to
+                ``{state_file}.journal`` and replayed on start
+            auto_save: Journal every task state change
+            backend: "thread" or "process" worker pool backend
+            max_queue: Maximum queued tasks before submit blocks (0 = unbounded)
+            retry_backoff: Base delay in seconds; retry n waits retry_backoff * 2**n
+        """
         self.max_workers = max_workers
         self.state_file = state_file
         self.auto_save = auto_save
+        self.retry_backoff = retry_backoff
+        self._pool = WorkerPool(max_workers, max_queue=max_queue, backend=backend)
 
         self._tasks: Dict[str, Task] = {}
         self._workflows: Dict[str, Workflow] = {}
         self._jobs: Dict[str, ScheduledJob] = {}
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._running = False
-        self._executor = None
         self._lock = threading.Lock()
+        # Dependents released while the pool queue was full; workers must never
+        # block on their own pool, so these are queued as slots free up
+        self._overflow: Deque[Task] = deque()
+        self._overflow_lock = threading.RLock()
+        self._completing = threading.local()
+        # Scheduled jobs run on their own pool so they never hold task workers
+        self._job_pool = WorkerPool(max_workers, name="openstackai-job")
+        self._timers = JobScheduler(self._dispatch_job)
+        self._scheduler = DAGScheduler(
+            dispatch=self._dispatch, cancel=self._cancel_task, lookup=self._tasks.get
+        )
+
+        self._journal = StateJournal(state_file) if state_file else None
 
         # Load state if exists
         if state_file:
@@ -183,6 +299,8 @@ class Orchestrator:
         name: str = None,
         timeout: int = None,
         dependencies: List[str] = None,
+        priority: int = 0,
+        max_retries: int = 3,
         **kwargs,
     ) -> Task:
         """
@@ -193,12 +311,17 @@ class Orchestrator:
             *args: Positional arguments
             name: Task name
             timeout: Execution timeout in seconds
-            dependencies: List of task IDs this task depends on
+            dependencies: List of task IDs this task depends on; the task is
+                cancelled if any of them fails or is cancelled
+            priority: Higher priority tasks are dequeued first
+            max_retries: Retries before the task is marked failed
             **kwargs: Keyword arguments
 
         Returns:
             Task object
 
+        Blocks while the worker pool queue is full (see ``max_queue``).
+
         Examples:
             >>> task = orch.submit(my_agent, "analyze data", name="analysis")
             >>> print(task.id)
@@ -210,58 +333,152 @@ class Orchestrator:
             kwargs=kwargs,
             timeout=timeout,
             dependencies=dependencies or [],
+            priority=priority,
+            max_retries=max_retries,
         )
 
         with self._lock:
             self._tasks[task.id] = task
+        self._journal_task(task)
 
-        # Execute if no dependencies
-        if not task.dependencies:
-            self._execute_task(task)
+        # Queued now, or as soon as every dependency has completed
+        self._execute_task(task)
 
         return task
 
     def _execute_task(self, task: Task):
-        """Execute a single task."""
+        """Schedule a task; it is queued once its dependencies have completed."""
+        self._reset_task(task)
+        self._scheduler.add(task)
+
+    def _reset_task(self, task: Task):
+        """Prepare a finished task to run again (e.g. a recurring scheduled job)."""
+        if task.future.done():
+            task.future = Future()
+            task.status = TaskStatus.PENDING
+            task.retry_count = 0
+            task.error = None
+            task.result = None
+            task.started_at = None
+            task.completed_at = None
+
+    def _dispatch(self, task: Task, delay: float = None):
+        """
+        Queue a task whose dependencies have completed on the worker pool.
+
+        Only the task's callable and arguments go to the pool, so they are
+        all a process backend has to pickle; status, retries and the task
+        future are handled in this process as the pool future settles.
 
-        def run():
-            task.status = TaskStatus.RUNNING
-            task.started_at = datetime.now()
+        Callers of ``submit`` wait for queue space, but tasks released while
+        another task completes never do: that runs on a pool worker, which
+        would be waiting for itself. If the queue is full they go to an
+        overflow queue instead, drained each time a worker takes a task.
+        """
+        if delay is not None or not getattr(self._completing, "active", False):
+            self._track_run(task, self._submit_run(task, delay=delay))
+            return
+        with self._overflow_lock:
+            self._overflow.append(task)
+        self._drain_overflow()
+
+    def _submit_run(self, task: Task, delay: float = None, block: bool = True) -> Future:
+        """Queue a task's callable on the worker pool and return the pool future."""
+        # Bound up front so task kwargs never collide with the pool's own options
+        call = functools.partial(task.func, *task.args, **task.kwargs)
+        start = functools.partial(self._start_task, task)
+        if delay is None:
+            return self._pool.submit(call, priority=task.priority, block=block, on_start=start)
+        return self._pool.submit_after(delay, call, priority=task.priority, on_start=start)
+
+    def _track_run(self, task: Task, run: Future):
+        """Tie a queued pool future to its task."""
+        task.future.add_done_callback(functools.partial(_cancel_run, run))
+        run.add_done_callback(functools.partial(self._run_done, task))
+
+    def _drain_overflow(self):
+        """Queue overflowed tasks, oldest first, until the pool queue is full."""
+        closed: List[Task] = []
+        with self._overflow_lock:
+            while self._overflow:
+                task = self._overflow[0]
+                try:
+                    run = self._submit_run(task, block=False)
+                except queue.Full:
+                    break
+                except RuntimeError:  # Pool shut down before the task was queued
+                    closed.append(self._overflow.popleft())
+                    continue
+                self._overflow.popleft()
+                self._track_run(task, run)
+        for task in closed:
+            self._cancel_task(task, "Worker pool shut down")
+
+    def _cancel_task(self, task: Task, reason: str):
+        """Cancel a task that can no longer run."""
+        task.status = TaskStatus.CANCELLED
+        task.error = reason
+        task.completed_at = datetime.now()
+        _cancel_future(task.future)
+        self._journal_task(task)
+        self._emit("task_cancelled", task)
+
+    def _start_task(self, task: Task):
+        """Mark a task running as a pool worker picks it up."""
+        task.status = TaskStatus.RUNNING
+        task.started_at = datetime.now()
+        # Taking the task freed a queue slot
+        self._drain_overflow()
+
+    def _run_done(self, task: Task, run: Future):
+        """Record the outcome of a task's pool future, retrying failures."""
+        if run.cancelled() or task.future.cancelled():
+            return
+        completing = getattr(self._completing, "active", False)
+        self._completing.active = True
+        try:
+            self._record_run(task, run)
+        finally:
+            self._completing.active = completing
+
+    def _record_run(self, task: Task, run: Future):
+        """Set a task's result or error from its settled pool future."""
+        error = run.exception()
+        if error is None:
+            task.result = run.result()
+            task.status = TaskStatus.COMPLETED
+            self._finish_task(task)
+            return
 
+        task.error = str(error)
+        if task.retry_count < task.max_retries:
+            task.retry_count += 1
+            task.status = TaskStatus.RETRYING
+            self._journal_task(task)
+            # Exponential backoff without holding the worker
             try:
-                # Check dependencies
-                for dep_id in task.dependencies:
-                    dep_task = self._tasks.get(dep_id)
-                    if dep_task and dep_task.status != TaskStatus.COMPLETED:
-                        # Wait for dependency
-                        while dep_task.status not in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                            time.sleep(0.1)
-                        if dep_task.status == TaskStatus.FAILED:
-                            raise Exception(f"Dependency {dep_id} failed")
-
-                # Execute
-                result = task.func(*task.args, **task.kwargs)
-                task.result = result
-                task.status = TaskStatus.COMPLETED
+                self._dispatch(task, delay=self.retry_backoff * 2**task.retry_count)
+                return
+            except RuntimeError as e:  # Pool shut down before the retry was queued
+                error = e
+        task.status = TaskStatus.FAILED
+        self._finish_task(task, error)
+
+    def _finish_task(self, task: Task, error: Exception = None):
+        """Resolve a finished task's future and release or cancel its dependents."""
+        task.completed_at = datetime.now()
+        if task.future.cancelled():
+            return
+        if error is None:
+            task.future.set_result(task.result)
+        else:
+            task.future.set_exception(error)
+        self._scheduler.task_finished(task)
 
-            except Exception as e:
-                task.error = str(e)
-                if task.retry_count < task.max_retries:
-                    task.retry_count += 1
-                    task.status = TaskStatus.RETRYING
-                    time.sleep(2**task.retry_count)  # Exponential backoff
-                    self._execute_task(task)
-                else:
-                    task.status = TaskStatus.FAILED
-
-            finally:
-                task.completed_at = datetime.now()
-                self._emit("task_complete", task)
-                if self.auto_save:
-                    self._save_state()
-
-        thread = threading.Thread(target=run)
-        thread.start()
+        self._journal_task(task)
+        self._emit("task_complete", task)
+        if error is not None:
+            self._emit("task_failed", task)
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
@@ -269,16 +486,42 @@ class Orchestrator:
 
     def wait(self, task: Task, timeout: int = None) -> Any:
         """Wait for a task to complete."""
-        start = time.time()
-        while task.status in [TaskStatus.PENDING, TaskStatus.RUNNING, TaskStatus.RETRYING]:
-            if timeout and (time.time() - start) > timeout:
-                raise TimeoutError(f"Task {task.id} timed out")
-            time.sleep(0.1)
-
-        if task.status == TaskStatus.FAILED:
+        try:
+            return task.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Task {task.id} timed out")
+        except CancelledError:
+            if task.error:
+                raise Exception(f"Task cancelled: {task.error}")
+            return task.result
+        except Exception:
             raise Exception(f"Task failed: {task.error}")
 
-        return task.result
+    def shutdown(self, wait: bool = True, *, cancel_pending: bool = False):
+        """
+        Stop the scheduler and the worker pool.
+
+        Args:
+            wait: Block until queued and running tasks finish
+            cancel_pending: Cancel tasks that have not started
+        """
+        self.stop()
+        if cancel_pending:
+            self._scheduler.clear()
+            with self._overflow_lock:
+                self._overflow.clear()
+            with self._lock:
+                for task in self._tasks.values():
+                    if task.status in (TaskStatus.PENDING, TaskStatus.RETRYING):
+                        task.status = TaskStatus.CANCELLED
+                        _cancel_future(task.future)
+        self._job_pool.shutdown(wait=wait, cancel_pending=cancel_pending)
+        self._pool.shutdown(wait=wait, cancel_pending=cancel_pending)
+        if self._journal:
+            if wait:
+                self._journal.close()
+            else:
+                self._journal.flush()
 
     # =========================================================================
     # Workflow Management
@@ -327,6 +570,8 @@ class Orchestrator:
             return self._run_parallel(workflow)
         elif workflow.pattern == ExecutionPattern.SUPERVISOR:
             return self._run_supervisor(workflow)
+        elif workflow.pattern == ExecutionPattern.DAG:
+            return self._run_dag(workflow)
         else:
             return self._run_sequential(workflow)
 
@@ -350,6 +595,74 @@ class Orchestrator:
 
         return workflow.state
 
+    def _run_dag(self, workflow: Workflow) -> Dict[str, Any]:
+        """Run workflow steps as a dependency graph."""
+        workflow.report = self.run_graph(workflow.steps)
+        for step in workflow.steps:
+            if step.status == TaskStatus.COMPLETED:
+                workflow.state[step.name] = step.result
+        return workflow.state
+
+    def run_graph(self, tasks: List[Task], *, timeout: float = None) -> DAGReport:
+        """
+        Run tasks as a dependency graph.
+
+        Each task starts as soon as all of its dependencies have completed,
+        so independent branches run in parallel up to ``max_workers``.
+        Dependencies may name a task by ID or by name.
+
+        Args:
+            tasks: Tasks to run
+            timeout: Maximum seconds to wait for the whole graph
+
+        Returns:
+            DAGReport with outcomes and critical-path timing
+
+        Raises:
+            CycleError: If the dependencies form a cycle (nothing is run)
+            TimeoutError: If the graph does not finish within ``timeout``
+
+        Examples:
+            >>> fetch = Task(name="fetch", func=download)
+            >>> parse = Task(name="parse", func=parse_all, dependencies=["fetch"])
+            >>> report = orch.run_graph([fetch, parse])
+            >>> report.critical_path
+        """
+        ids_by_name = {task.name: task.id for task in tasks if task.name}
+        ids = {task.id for task in tasks}
+        for task in tasks:
+            task.dependencies = [
+                dep if dep in ids or dep not in ids_by_name else ids_by_name[dep]
+                for dep in task.dependencies
+            ]
+
+        ordered = topological_sort(tasks)
+        for task in ordered:
+            self._reset_task(task)
+        with self._lock:
+            for task in ordered:
+                self._tasks[task.id] = task
+        for task in ordered:
+            self._journal_task(task)
+
+        start = time.monotonic()
+        self._scheduler.add_all(ordered)
+        _, not_done = futures_wait([task.future for task in ordered], timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"Task graph did not finish within {timeout} seconds")
+        elapsed = time.monotonic() - start
+
+        path, path_seconds = critical_path(ordered)
+        return DAGReport(
+            order=[task.id for task in ordered],
+            completed=[t.id for t in ordered if t.status == TaskStatus.COMPLETED],
+            failed=[t.id for t in ordered if t.status == TaskStatus.FAILED],
+            cancelled=[t.id for t in ordered if t.status == TaskStatus.CANCELLED],
+            critical_path=[task.id for task in path],
+            critical_path_seconds=path_seconds,
+            elapsed_seconds=elapsed,
+        )
+
     def _run_supervisor(self, workflow: Workflow) -> Dict[str, Any]:
         """Run with supervisor pattern - first step oversees others."""
         if not workflow.steps:
@@ -387,6 +700,8 @@ class Orchestrator:
         run_at: Union[datetime, str] = None,
         interval: int = None,
         cron: str = None,
+        misfire_grace_time: float = None,
+        coalesce: bool = True,
         **kwargs,
     ) -> ScheduledJob:
         """
@@ -398,6 +713,9 @@ class Orchestrator:
             run_at: One-time execution (datetime or ISO string)
             interval: Repeat interval in seconds
             cron: Cron expression (e.g., "0 9 * * *" for 9am daily)
+            misfire_grace_time: Skip occurrences found more than this many
+                seconds late (None = always run)
+            coalesce: Run once, not once per occurrence, after several misses
             **kwargs: Keyword arguments
 
         Returns:
@@ -417,6 +735,10 @@ class Orchestrator:
         if isinstance(run_at, str):
             run_at = datetime.fromisoformat(run_at)
 
+        next_run = run_at or datetime.now()
+        if cron and not run_at:
+            next_run = CronExpression(cron).next_fire(datetime.now())
+
         # Create task for the job
         task = Task(name=func.__name__, func=func, args=args, kwargs=kwargs)
 
@@ -429,57 +751,58 @@ class Orchestrator:
             run_at=run_at,
             interval=interval,
             cron=cron,
-            next_run=run_at or datetime.now(),
+            next_run=next_run,
+            misfire_grace_time=misfire_grace_time,
+            coalesce=coalesce,
         )
 
         self._jobs[job.id] = job
+        self._timers.add(job)
         return job
 
-    def start(self):
-        """Start the scheduler background thread."""
-        self._running = True
-
-        def scheduler_loop():
-            while self._running:
-                now = datetime.now()
-
-                for job in self._jobs.values():
-                    if not job.enabled:
-                        continue
-
-                    if job.next_run and job.next_run <= now:
-                        # Execute
-                        self.run_workflow(job.workflow)
-                        job.last_run = now
+    def unschedule(self, job: Union[str, ScheduledJob]) -> bool:
+        """
+        Remove a scheduled job.
 
-                        # Calculate next run
-                        if job.interval:
-                            job.next_run = now + timedelta(seconds=job.interval)
-                        elif job.cron:
-                            job.next_run = self._parse_cron_next(job.cron, now)
-                        else:
-                            job.enabled = False  # One-time job
+        Args:
+            job: Job or job ID
 
-                time.sleep(1)
+        Returns:
+            True if the job was scheduled
+        """
+        job_id = job if isinstance(job, str) else job.id
+        scheduled = self._jobs.pop(job_id, None)
+        if scheduled:
+            scheduled.enabled = False
+        return self._timers.remove(job_id)
+
+    def _dispatch_job(self, job: ScheduledJob, runs: int) -> Future:
+        """Hand a due job to the job pool."""
+        return self._job_pool.submit(self._run_job, job, runs)
+
+    def _run_job(self, job: ScheduledJob, runs: int):
+        """Run a scheduled job's workflow ``runs`` times."""
+        for _ in range(runs):
+            try:
+                self.run_workflow(job.workflow)
+            except Exception:
+                self._emit("job_failed", job)
+            else:
+                self._emit("job_complete", job)
 
-        self._executor = threading.Thread(target=scheduler_loop, daemon=True)
-        self._executor.start()
+    def start(self):
+        """Start the scheduler background thread."""
+        self._running = True
+        self._timers.start()
 
     def stop(self):
         """Stop the scheduler."""
         self._running = False
-        if self._executor:
-            self._executor.join(timeout=5)
+        self._timers.stop()
 
     def _parse_cron_next(self, cron: str, after: datetime) -> datetime:
         """Parse cron expression and return next run time."""
-        # Simplified cron parsing (minute hour day month weekday)
-        parts = cron.split()
-        if len(parts) != 5:
-            raise ValueError(f"Invalid cron expression: {cron}")
-
-        # For now, just add 1 day for daily jobs
-        return after + timedelta(days=1)
+        return CronExpression(cron).next_fire(after)
 
     # =========================================================================
     # Event System
@@ -520,33 +843,69 @@ class Orchestrator:
     # State Persistence
     # =========================================================================
 
+    def _journal_task(self, task: Task):
+        """Append a task's current state to the journal (off the hot path)."""
+        if self._journal and self.auto_save and task.id in self._tasks:
+            self._journal.append(task.to_record())
+
     def _save_state(self):
-        """Save orchestrator state to file."""
-        if not self.state_file:
+        """Write a full snapshot and truncate the journal."""
+        if not self._journal:
             return
 
+        with self._lock:
+            tasks = list(self._tasks.values())
         state = {
-            "tasks": {k: v.to_dict() for k, v in self._tasks.items()},
-            "workflows": {k: v.name for k, v in self._workflows.items()},
+            "tasks": {task.id: task.to_record() for task in tasks},
             "jobs": {k: {"id": v.id, "enabled": v.enabled} for k, v in self._jobs.items()},
         }
-
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        self._journal.snapshot(state)
 
     def _load_state(self):
-        """Load orchestrator state from file."""
-        import os
-
-        if not self.state_file or not os.path.exists(self.state_file):
-            return
+        """
+        Replay the snapshot and journal, resuming unfinished tasks.
 
+        Tasks that were pending, running or retrying are queued again (so a
+        task interrupted mid-run executes at least once more). This needs an
+        importable function and JSON-serializable arguments.
+        """
         try:
-            with open(self.state_file, "r") as f:
-                json.load(f)
-            # Restore state as needed
+            state = self._journal.replay()
         except Exception as e:
             print(f"Failed to load state: {e}")
+            return
+
+        resumable, unrestorable = [], []
+        for record in state["tasks"].values():
+            try:
+                task = Task.from_record(record)
+            except (KeyError, ValueError) as e:
+                print(f"Failed to restore task: {e}")
+                continue
+
+            if task.status == TaskStatus.COMPLETED:
+                task.future.set_result(task.result)
+            elif task.status == TaskStatus.CANCELLED:
+                _cancel_future(task.future)
+            elif task.status != TaskStatus.FAILED and (
+                task.func is None or record.get("args") is None or record.get("kwargs") is None
+            ):
+                # Lambdas, closures and unserializable arguments cannot be rebuilt
+                task.status = TaskStatus.FAILED
+                task.error = "Cannot resume after restart: function or arguments not restorable"
+                unrestorable.append(task)
+            elif task.status != TaskStatus.FAILED:
+                task.status = TaskStatus.PENDING
+                resumable.append(task)
+
+            if task.status == TaskStatus.FAILED:
+                task.future.set_exception(Exception(task.error))
+            self._tasks[task.id] = task
+
+        for task in unrestorable:
+            self._journal_task(task)
+        if resumable:
+            self._scheduler.add_all(resumable)
 
     # =========================================================================
     # Status & Monitoring
@@ -564,9 +923,11 @@ class Orchestrator:
                     1 for t in self._tasks.values() if t.status == TaskStatus.COMPLETED
                 ),
                 "failed": sum(1 for t in self._tasks.values() if t.status == TaskStatus.FAILED),
+                "waiting": self._scheduler.waiting,
             },
             "workflows": len(self._workflows),
             "jobs": len(self._jobs),
+            "pool": self._pool.stats(),
         }
 
     def __repr__(self) -> str:
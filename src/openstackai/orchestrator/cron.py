@@ -0,0 +1,235 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Five-field cron expressions.
+
+Supports the standard syntax: ``minute hour day-of-month month day-of-week``
+with ``*``, lists (``1,15``), ranges (``9-17``), steps (``*/5``, ``10-50/10``),
+month and weekday names (``jan``, ``mon-fri``), ``7`` as Sunday, and the
+``@yearly``, ``@monthly``, ``@weekly``, ``@daily`` and ``@hourly`` macros.
+
+As in Vixie cron, when both day fields are restricted a time matches if
+either of them does.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import FrozenSet, Iterator, List, Optional, Tuple
+
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+_DAY_NAMES = ["sun", "mon", "tue", "wed", "thu", "fri", "sat"]
+
+# (name, minimum, maximum, names mapped to minimum + index)
+_FIELDS = (
+    ("minute", 0, 59, None),
+    ("hour", 0, 23, None),
+    ("day", 1, 31, None),
+    ("month", 1, 12, _MONTH_NAMES),
+    ("weekday", 0, 7, _DAY_NAMES),
+)
+
+# A 29 February schedule can skip up to eight years (e.g. 2096 -> 2104)
+_MAX_YEARS = 9
+
+
+def _parse_value(text: str, field: str, low: int, names: Optional[List[str]]) -> int:
+    if names and text.lower() in names:
+        return low + names.index(text.lower())
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"Invalid {field} value: {text!r}")
+
+
+def _parse_field(
+    text: str, field: str, low: int, high: int, names: Optional[List[str]]
+) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        body, _, step_text = part.partition("/")
+        step = _parse_value(step_text, field, 0, None) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid {field} step: {part!r}")
+
+        if body == "*":
+            start, end = low, high
+        elif "-" in body:
+            start_text, end_text = body.split("-", 1)
+            start = _parse_value(start_text, field, low, names)
+            end = _parse_value(end_text, field, low, names)
+        else:
+            start = _parse_value(body, field, low, names)
+            end = high if step_text else start
+
+        if not low <= start <= end <= high:
+            raise ValueError(f"Invalid {field} range: {part!r} (allowed {low}-{high})")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    """
+    A parsed cron expression.
+
+    Example:
+        >>> cron = CronExpression("*/15 9-17 * * mon-fri")
+        >>> cron.next_fire(datetime(2024, 1, 5, 17, 50))
+        datetime.datetime(2024, 1, 8, 9, 0)
+    """
+
+    def __init__(self, expression: str):
+        """
+        Parse a cron expression.
+
+        Args:
+            expression: Five fields or a macro such as "@daily"
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        self.expression = expression
+        fields = _MACROS.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression: {expression}")
+
+        parsed = [
+            _parse_field(text, name, low, high, names)
+            for text, (name, low, high, names) in zip(fields, _FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 0 and 7 are both Sunday
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._day_any = fields[2].startswith("*")
+        self._weekday_any = fields[4].startswith("*")
+
+        self._sorted_minutes = sorted(self.minutes)
+        self._sorted_hours = sorted(self.hours)
+        self._sorted_months = sorted(self.months)
+
+    def _day_matches(self, when: datetime) -> bool:
+        in_days = when.day in self.days
+        in_weekdays = when.isoweekday() % 7 in self.weekdays
+        if self._day_any or self._weekday_any:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def matches(self, when: datetime) -> bool:
+        """Whether the expression fires at ``when`` (to the minute)."""
+        return (
+            when.minute in self.minutes
+            and when.hour in self.hours
+            and when.month in self.months
+            and self._day_matches(when)
+        )
+
+    def next_fire(self, after: datetime) -> datetime:
+        """
+        Get the first firing time strictly after ``after``.
+
+        Skips whole months, days and hours that cannot match rather than
+        stepping minute by minute.
+
+        Args:
+            after: Reference time (naive or aware; the tzinfo is kept)
+
+        Returns:
+            Next firing time, truncated to the minute
+
+        Raises:
+            ValueError: If the expression can never fire (e.g. "0 0 30 2 *")
+        """
+        when = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        last_year = when.year + _MAX_YEARS
+
+        while when.year <= last_year:
+            if when.month not in self.months:
+                index = bisect_right(self._sorted_months, when.month)
+                if index < len(self._sorted_months):
+                    when = when.replace(month=self._sorted_months[index], day=1, hour=0, minute=0)
+                else:
+                    when = when.replace(
+                        year=when.year + 1, month=self._sorted_months[0], day=1, hour=0, minute=0
+                    )
+                continue
+
+            if not self._day_matches(when):
+                when = when.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            if when.hour not in self.hours:
+                index = bisect_right(self._sorted_hours, when.hour)
+                if index < len(self._sorted_hours):
+                    when = when.replace(hour=self._sorted_hours[index], minute=0)
+                else:
+                    when = when.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            if when.minute not in self.minutes:
+                index = bisect_right(self._sorted_minutes, when.minute)
+                if index < len(self._sorted_minutes):
+                    when = when.replace(minute=self._sorted_minutes[index])
+                else:
+                    when = when.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return when
+
+        raise ValueError(f"Cron expression never fires: {self.expression}")
+
+    def iter_fires(self, after: datetime) -> Iterator[datetime]:
+        """Yield successive firing times after ``after``."""
+        while True:
+            after = self.next_fire(after)
+            yield after
+
+    def fires_between(self, start: datetime, end: datetime, limit: int = 1000) -> List[datetime]:
+        """
+        List firing times in ``(start, end]``.
+
+        Args:
+            start: Exclusive lower bound
+            end: Inclusive upper bound
+            limit: Maximum number of times to return
+
+        Returns:
+            Firing times in ascending order
+        """
+        fires = []
+        for when in self.iter_fires(start):
+            if when > end or len(fires) >= limit:
+                break
+            fires.append(when)
+        return fires
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CronExpression):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> Tuple:
+        return (
+            self.minutes,
+            self.hours,
+            self.days,
+            self.months,
+            self.weekdays,
+            self._day_any,
+            self._weekday_any,
+        )
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
@@ -0,0 +1,294 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Dependency graph scheduling for orchestrator tasks.
+
+Tasks name their parents in ``Task.dependencies``. The scheduler keeps a
+remaining-dependency count per waiting task and a child list per unfinished
+parent, so a task is dispatched the moment its last parent completes:
+
+- Graphs are topologically sorted up front; cycles raise ``CycleError``
+- A failed or cancelled parent cancels every descendant
+- ``critical_path`` reports the longest chain of task durations
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from . import Task
+
+
+class CycleError(ValueError):
+    """Raised when task dependencies form a cycle."""
+
+    def __init__(self, task_ids: List[str]):
+        self.task_ids = task_ids
+        super().__init__(f"Dependency cycle among tasks: {', '.join(task_ids)}")
+
+
+@dataclass
+class DAGReport:
+    """Outcome and timing of a dependency graph run."""
+
+    order: List[str] = field(default_factory=list)
+    completed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every task completed."""
+        return not self.failed and not self.cancelled
+
+    @property
+    def parallelism(self) -> float:
+        """Critical-path time over wall time; 1.0 means the graph ran as fast as possible."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.critical_path_seconds / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "order": self.order,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "critical_path": self.critical_path,
+            "critical_path_seconds": self.critical_path_seconds,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+
+def topological_sort(tasks: Iterable["Task"]) -> List["Task"]:
+    """
+    Order tasks so every task follows its dependencies.
+
+    Dependencies on tasks outside ``tasks`` are ignored. Ties keep the
+    input order.
+
+    Args:
+        tasks: Tasks to order
+
+    Returns:
+        Tasks in dependency order
+
+    Raises:
+        CycleError: If the dependencies form a cycle
+    """
+    tasks = list(tasks)
+    by_id = {task.id: task for task in tasks}
+    in_degree = {task.id: 0 for task in tasks}
+    children: Dict[str, List[str]] = {}
+    for task in tasks:
+        for dep_id in set(task.dependencies):
+            if dep_id in by_id:
+                in_degree[task.id] += 1
+                children.setdefault(dep_id, []).append(task.id)
+
+    ready = deque(task.id for task in tasks if in_degree[task.id] == 0)
+    order: List["Task"] = []
+    while ready:
+        task_id = ready.popleft()
+        order.append(by_id[task_id])
+        for child_id in children.get(task_id, []):
+            in_degree[child_id] -= 1
+            if in_degree[child_id] == 0:
+                ready.append(child_id)
+
+    if len(order) < len(tasks):
+        raise CycleError([task.id for task in tasks if in_degree[task.id] > 0])
+    return order
+
+
+def _duration(task: "Task") -> float:
+    if task.started_at and task.completed_at:
+        return max((task.completed_at - task.started_at).total_seconds(), 0.0)
+    return 0.0
+
+
+def critical_path(tasks: Iterable["Task"]) -> Tuple[List["Task"], float]:
+    """
+    Find the chain of dependent tasks with the longest total run time.
+
+    Args:
+        tasks: Finished tasks of one graph
+
+    Returns:
+        Tuple of (tasks on the critical path, their summed duration in seconds)
+    """
+    ordered = topological_sort(tasks)
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for task in ordered:
+        parents = [dep_id for dep_id in set(task.dependencies) if dep_id in finish]
+        parent = max(parents, key=finish.__getitem__, default=None)
+        previous[task.id] = parent
+        finish[task.id] = _duration(task) + (finish[parent] if parent else 0.0)
+
+    if not finish:
+        return [], 0.0
+
+    by_id = {task.id: task for task in ordered}
+    end = max(finish, key=finish.__getitem__)
+    path: List["Task"] = []
+    node: Optional[str] = end
+    while node is not None:
+        path.append(by_id[node])
+        node = previous[node]
+    path.reverse()
+    return path, finish[end]
+
+
+class DAGScheduler:
+    """
+    Event-driven dispatcher for tasks with dependencies.
+
+    The scheduler never polls: ``task_finished`` must be called once a task
+    reaches a final status, and releases or cancels its children.
+
+    Example:
+        >>> scheduler = DAGScheduler(dispatch=pool_submit, cancel=mark_cancelled,
+        ...                          lookup=tasks.get)
+        >>> scheduler.add_all([extract, transform, load])
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[["Task"], None],
+        cancel: Callable[["Task", str], None],
+        lookup: Callable[[str], Optional["Task"]],
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            dispatch: Called with each task once its dependencies completed
+            cancel: Called with a task and reason when a dependency did not complete
+            lookup: Resolves a dependency ID to a task already known elsewhere
+        """
+        self._dispatch = dispatch
+        self._cancel = cancel
+        self._lookup = lookup
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, int] = {}
+        self._children: Dict[str, List["Task"]] = {}
+
+    def add(self, task: "Task") -> None:
+        """Schedule a single task."""
+        self.add_all([task])
+
+    def add_all(self, tasks: Iterable["Task"]) -> List["Task"]:
+        """
+        Schedule a batch of tasks that may depend on each other.
+
+        Args:
+            tasks: Tasks to schedule
+
+        Returns:
+            The tasks in topological order
+
+        Raises:
+            CycleError: If the batch contains a dependency cycle (nothing is scheduled)
+        """
+        from . import TaskStatus
+
+        ordered = topological_sort(tasks)
+        batch = {task.id for task in ordered}
+        ready: List["Task"] = []
+        cancelled: List[Tuple["Task", str]] = []
+        cancelled_ids = set()
+
+        with self._lock:
+            for task in ordered:
+                remaining = 0
+                reason = None
+                for dep_id in set(task.dependencies):
+                    if dep_id in cancelled_ids:
+                        reason = f"Dependency {dep_id} cancelled"
+                        break
+                    if dep_id not in batch:
+                        parent = self._lookup(dep_id)
+                        if parent is None or parent.status == TaskStatus.COMPLETED:
+                            continue
+                        if parent.done:
+                            reason = f"Dependency {dep_id} {parent.status.value}"
+                            break
+                    remaining += 1
+                    self._children.setdefault(dep_id, []).append(task)
+
+                if reason is not None:
+                    cancelled.append((task, reason))
+                    cancelled_ids.add(task.id)
+                elif remaining:
+                    self._waiting[task.id] = remaining
+                else:
+                    ready.append(task)
+
+        for task, reason in cancelled:
+            self._cancel(task, reason)
+        for task in ready:
+            self._dispatch(task)
+        return ordered
+
+    def task_finished(self, task: "Task") -> None:
+        """Release or cancel the children of a task that reached a final status."""
+        from . import TaskStatus
+
+        ready: List["Task"] = []
+        cancelled: List[Tuple["Task", str]] = []
+
+        with self._lock:
+            children = self._children.pop(task.id, [])
+            if task.status == TaskStatus.COMPLETED:
+                for child in children:
+                    if child.id not in self._waiting:
+                        continue
+                    self._waiting[child.id] -= 1
+                    if self._waiting[child.id] == 0:
+                        del self._waiting[child.id]
+                        ready.append(child)
+            else:
+                reason = f"Dependency {task.id} {task.status.value}"
+                stack = [(child, reason) for child in children]
+                while stack:
+                    child, child_reason = stack.pop()
+                    if self._waiting.pop(child.id, None) is None:
+                        continue
+                    cancelled.append((child, child_reason))
+                    grandchild_reason = f"Dependency {child.id} cancelled"
+                    stack.extend(
+                        (grandchild, grandchild_reason)
+                        for grandchild in self._children.pop(child.id, [])
+                    )
+
+        for child, reason in cancelled:
+            self._cancel(child, reason)
+        for child in ready:
+            self._dispatch(child)
+
+    def clear(self) -> List["Task"]:
+        """Forget every waiting task and return them."""
+        with self._lock:
+            waiting_ids = set(self._waiting)
+            tasks = {
+                child.id: child
+                for children in self._children.values()
+                for child in children
+                if child.id in waiting_ids
+            }
+            self._waiting.clear()
+            self._children.clear()
+        return list(tasks.values())
+
+    @property
+    def waiting(self) -> int:
+        """Number of tasks waiting on dependencies."""
+        with self._lock:
+            return len(self._waiting)
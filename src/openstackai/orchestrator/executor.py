@@ -0,0 +1,340 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Bounded worker pool for the orchestrator.
+
+A fixed set of worker threads pulls callables off a priority queue:
+
+- At most ``max_workers`` callables run at once
+- Higher priority items run first, FIFO within a priority
+- ``submit`` blocks (or raises ``queue.Full``) once ``max_queue`` items wait
+- ``submit_after`` re-enqueues work after a delay without holding a worker
+
+With ``backend="process"`` each worker hands its callable to a process pool
+of the same size, so CPU-bound functions escape the GIL. Such callables and
+their arguments must be picklable; ``on_start`` hooks and future callbacks
+still run in this process.
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+BACKENDS = ("thread", "process")
+
+
+def _cancel_future(future: Future) -> None:
+    """Cancel a future that was never started and wake anything waiting on it."""
+    if future.cancel():
+        # Moves it to the state concurrent.futures.wait() counts as done
+        future.set_running_or_notify_cancel()
+
+
+class _WorkItem:
+    """A queued callable and the future that receives its outcome."""
+
+    __slots__ = ("future", "fn", "args", "kwargs", "on_start")
+
+    def __init__(
+        self,
+        future: Future,
+        fn: Callable,
+        args: tuple,
+        kwargs: dict,
+        on_start: Optional[Callable[[], Any]] = None,
+    ):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.on_start = on_start
+
+
+class WorkerPool:
+    """
+    Priority-ordered pool of worker threads.
+
+    Workers are started lazily, one per submission until ``max_workers``
+    are alive, and sleep on a condition variable while the queue is empty.
+
+    Example:
+        >>> pool = WorkerPool(max_workers=8, max_queue=1000)
+        >>> future = pool.submit(fetch, url, priority=10)
+        >>> future.result()
+        >>> pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        *,
+        max_queue: int = 0,
+        backend: str = "thread",
+        name: str = "openstackai-worker",
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Maximum number of callables running at once
+            max_queue: Maximum number of queued callables (0 = unbounded)
+            backend: "thread" to run callables in the workers, "process" to
+                run them in a process pool of the same size
+            name: Worker thread name prefix
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.backend = backend
+        self.name = name
+
+        self._ready: List[Tuple[int, int, _WorkItem]] = []
+        self._delayed: List[Tuple[float, int, int, _WorkItem]] = []
+        self._sequence = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._idle = 0
+        self._active = 0
+        self._shutdown = False
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._space_available = threading.Condition(self._lock)
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        priority: int = 0,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        on_start: Optional[Callable[[], Any]] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Queue a callable for execution.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments
+            priority: Higher values run first
+            block: Wait for queue space when the queue is full
+            timeout: Maximum seconds to wait for queue space
+            on_start: Called on the worker thread just before ``fn`` runs
+            **kwargs: Keyword arguments
+
+        Returns:
+            Future resolved with the callable's result
+
+        Raises:
+            queue.Full: If the queue stays full (non-blocking or timed out)
+            RuntimeError: If the pool has been shut down
+        """
+        item = _WorkItem(Future(), fn, args, kwargs, on_start)
+        with self._lock:
+            self._check_open()
+            if self.max_queue and len(self._ready) >= self.max_queue:
+                if not block:
+                    raise queue.Full("Worker pool queue is full")
+                has_space = self._space_available.wait_for(
+                    lambda: self._shutdown or len(self._ready) < self.max_queue, timeout
+                )
+                if not has_space:
+                    raise queue.Full("Timed out waiting for worker pool queue space")
+                self._check_open()
+
+            heapq.heappush(self._ready, (-priority, next(self._sequence), item))
+            self._wake_worker()
+        return item.future
+
+    def submit_after(
+        self,
+        delay: float,
+        fn: Callable,
+        *args,
+        priority: int = 0,
+        on_start: Optional[Callable[[], Any]] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Queue a callable once ``delay`` seconds have passed.
+
+        Delayed items do not count against ``max_queue`` until they are due,
+        and no worker is held while they wait.
+
+        Args:
+            delay: Seconds to wait before the callable becomes runnable
+            fn: Callable to run
+            *args: Positional arguments
+            priority: Higher values run first once due
+            on_start: Called on the worker thread just before ``fn`` runs
+            **kwargs: Keyword arguments
+
+        Returns:
+            Future resolved with the callable's result
+        """
+        item = _WorkItem(Future(), fn, args, kwargs, on_start)
+        due = time.monotonic() + max(delay, 0.0)
+        with self._lock:
+            self._check_open()
+            heapq.heappush(self._delayed, (due, next(self._sequence), -priority, item))
+            self._wake_worker()
+        return item.future
+
+    def _check_open(self) -> None:
+        if self._shutdown:
+            raise RuntimeError("Cannot submit to a worker pool after shutdown")
+
+    def _wake_worker(self) -> None:
+        """Notify an idle worker, starting another if the backlog outgrows them (lock held)."""
+        self._work_available.notify()
+        if len(self._workers) < self.max_workers and (
+            len(self._ready) > self._idle or not self._workers
+        ):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"{self.name}-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    # =========================================================================
+    # Workers
+    # =========================================================================
+
+    def _next_item(self) -> Optional[_WorkItem]:
+        """Block until an item is runnable; None once shut down and drained."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, sequence, neg_priority, item = heapq.heappop(self._delayed)
+                    heapq.heappush(self._ready, (neg_priority, sequence, item))
+
+                if self._ready:
+                    _, _, item = heapq.heappop(self._ready)
+                    self._active += 1
+                    self._space_available.notify()
+                    if self._ready and self._idle:
+                        self._work_available.notify()
+                    return item
+
+                if self._shutdown and not self._delayed:
+                    return None
+
+                wait = self._delayed[0][0] - now if self._delayed else None
+                self._idle += 1
+                try:
+                    self._work_available.wait(wait)
+                finally:
+                    self._idle -= 1
+
+    def _worker_loop(self) -> None:
+        while True:
+            item = self._next_item()
+            if item is None:
+                return
+            try:
+                self._run(item)
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+    def _run(self, item: _WorkItem) -> None:
+        if not item.future.set_running_or_notify_cancel():
+            return
+        try:
+            if item.on_start is not None:
+                item.on_start()
+            if self.backend == "process":
+                result = self._process_pool().submit(item.fn, *item.args, **item.kwargs).result()
+            else:
+                result = item.fn(*item.args, **item.kwargs)
+        except BaseException as e:
+            item.future.set_exception(e)
+        else:
+            item.future.set_result(result)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes
+
+    # =========================================================================
+    # Lifecycle & Monitoring
+    # =========================================================================
+
+    def shutdown(self, wait: bool = True, *, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting work.
+
+        Args:
+            wait: Block until queued and running callables finish
+            cancel_pending: Cancel callables that have not started
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_pending:
+                pending = [entry[-1] for entry in self._ready + self._delayed]
+                self._ready.clear()
+                self._delayed.clear()
+                for item in pending:
+                    _cancel_future(item.future)
+            self._work_available.notify_all()
+            self._space_available.notify_all()
+            workers = list(self._workers)
+
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+
+    @property
+    def pending(self) -> int:
+        """Number of queued callables, including delayed ones."""
+        with self._lock:
+            return len(self._ready) + len(self._delayed)
+
+    @property
+    def active(self) -> int:
+        """Number of callables currently running."""
+        with self._lock:
+            return self._active
+
+    def stats(self) -> dict:
+        """Get pool statistics."""
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "max_workers": self.max_workers,
+                "workers": len(self._workers),
+                "active": self._active,
+                "queued": len(self._ready),
+                "delayed": len(self._delayed),
+            }
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        return f"WorkerPool(backend={self.backend!r}, max_workers={self.max_workers})"
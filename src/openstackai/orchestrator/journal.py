@@ -0,0 +1,296 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Append-only state journal for the orchestrator.
+
+State lives in two files:
+
+- ``{path}``: JSON snapshot (``{"version": 1, "tasks": {...}, "jobs": {...}}``)
+- ``{path}.journal``: JSON Lines log of task records written since the snapshot
+
+``append`` only enqueues a record. A writer thread drains the queue and
+writes everything pending in one ``write`` call (group commit), so the
+tasks themselves never wait on disk I/O. After ``compact_every`` records
+the writer folds the log into a fresh snapshot (written to a temporary
+file and renamed) and truncates the log.
+
+``replay`` folds the snapshot and the log into the latest record per task;
+a torn final line from a crash is ignored.
+"""
+
+import importlib
+import json
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+SNAPSHOT_VERSION = 1
+
+
+def callable_ref(func: Optional[Callable]) -> Optional[str]:
+    """
+    Get an importable "module:qualname" reference to a function.
+
+    Returns:
+        The reference, or None for lambdas, closures and other callables
+        that cannot be re-imported after a restart
+    """
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def resolve_callable(ref: Optional[str]) -> Optional[Callable]:
+    """Import the function named by ``callable_ref``; None if it is gone."""
+    if not ref:
+        return None
+    module_name, _, qualname = ref.partition(":")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for attribute in qualname.split("."):
+            target = getattr(target, attribute)
+    except (ImportError, AttributeError):
+        return None
+    return target if callable(target) else None
+
+
+def jsonable(value: Any) -> Any:
+    """Return ``value`` if it is JSON-serializable, else None."""
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+class _Flush:
+    """Queue marker: set ``done`` once every earlier record is on disk."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _Snapshot:
+    """Queue marker: replace the snapshot with ``state`` and truncate the log."""
+
+    def __init__(self, state: Dict[str, Any]):
+        self.state = state
+        self.done = threading.Event()
+
+
+_CLOSE = object()
+
+
+class StateJournal:
+    """
+    Write-ahead journal of task records.
+
+    Example:
+        >>> journal = StateJournal("state.json")
+        >>> journal.append({"id": "a1b2", "status": "pending"})
+        >>> journal.flush()
+        >>> journal.replay()["tasks"]["a1b2"]["status"]
+        'pending'
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        batch_size: int = 512,
+        compact_every: int = 10000,
+        fsync: bool = False,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Snapshot path; the log is written next to it
+            batch_size: Most records written per group commit
+            compact_every: Log records between automatic compactions
+            fsync: fsync after each group commit (survives power loss, slower)
+        """
+        self.path = path
+        self.log_path = f"{path}.journal"
+        self.batch_size = batch_size
+        self.compact_every = compact_every
+        self.fsync = fsync
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._log = None
+        self._log_records = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Queue a task record (keyed by its ``id``) for the next group commit."""
+        self._ensure_writer()
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every record appended so far is written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._thread is None:
+            return True
+        marker = _Flush()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def snapshot(self, state: Dict[str, Any], wait: bool = True) -> None:
+        """
+        Replace the snapshot with ``state`` and truncate the log.
+
+        Args:
+            state: Full state with "tasks" (and optionally "jobs") mappings
+            wait: Block until the snapshot is written
+        """
+        self._ensure_writer()
+        marker = _Snapshot(state)
+        self._queue.put(marker)
+        if wait:
+            marker.done.wait()
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_CLOSE)
+            thread.join()
+
+    def _ensure_writer(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("State journal is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._writer, name="openstackai-journal", daemon=True
+                )
+                self._thread.start()
+
+    def _writer(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            # Group commit: take everything that queued up meanwhile
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records: List[Dict[str, Any]] = []
+            for item in items:
+                if isinstance(item, dict):
+                    records.append(item)
+                    continue
+                self._write(records)
+                records = []
+                if item is _CLOSE:
+                    self._close_log()
+                    return
+                if isinstance(item, _Snapshot):
+                    try:
+                        self._write_snapshot(item.state)
+                    except OSError as e:
+                        print(f"Failed to write state snapshot: {e}")
+                item.done.set()
+            self._write(records)
+
+            if self._log_records >= self.compact_every:
+                try:
+                    self._compact()
+                except (OSError, ValueError) as e:
+                    print(f"Failed to compact state journal: {e}")
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        try:
+            if self._log is None:
+                self._log = open(self.log_path, "a", encoding="utf-8")
+            self._log.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+            self._log.flush()
+            if self.fsync:
+                os.fsync(self._log.fileno())
+        except OSError as e:
+            print(f"Failed to write state journal: {e}")
+            return
+        self._log_records += len(records)
+
+    def _close_log(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    # =========================================================================
+    # Snapshots & Replay
+    # =========================================================================
+
+    def _compact(self) -> None:
+        """Fold the log into the snapshot (writer thread only)."""
+        self._write_snapshot(self.replay())
+
+    def _write_snapshot(self, state: Dict[str, Any]) -> None:
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "tasks": state.get("tasks", {}),
+            "jobs": state.get("jobs", {}),
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, default=str)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        # Records in the old log are now part of the snapshot
+        self._close_log()
+        open(self.log_path, "w").close()
+        self._log_records = 0
+
+    def replay(self) -> Dict[str, Any]:
+        """
+        Load the snapshot and apply the log.
+
+        Returns:
+            Dict with "tasks" (latest record per task ID) and "jobs"
+        """
+        tasks: Dict[str, Dict[str, Any]] = {}
+        jobs: Dict[str, Any] = {}
+
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            tasks.update(snapshot.get("tasks") or {})
+            jobs.update(snapshot.get("jobs") or {})
+
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write at the tail of a crashed process
+                        continue
+                    tasks[record["id"]] = record
+
+        return {"tasks": tasks, "jobs": jobs}
@@ -0,0 +1,242 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Timer heap for scheduled orchestrator jobs.
+
+Jobs sit in a min-heap keyed by ``next_run``. A single timer thread sleeps
+on a condition variable until the earliest job is due (or an earlier job is
+added), so adding, cancelling and firing a job are O(log n) and nothing is
+polled. Firing only hands the job to a ``dispatch`` callable; execution
+happens elsewhere, so a slow job never delays the others.
+
+Misfires (jobs found late, e.g. after the process was suspended) follow the
+job's policy:
+
+- ``misfire_grace_time``: occurrences later than this many seconds are skipped
+- ``coalesce``: several missed occurrences run once instead of once each
+
+A job whose previous run is still in progress is not started again.
+"""
+
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .cron import CronExpression
+
+if TYPE_CHECKING:
+    from . import ScheduledJob
+
+# Longest single sleep; bounds the effect of wall-clock adjustments
+MAX_SLEEP = 60.0
+
+# Most missed occurrences replayed for a non-coalescing job
+MAX_CATCH_UP = 100
+
+
+class JobScheduler:
+    """
+    Heap-ordered timer for ScheduledJob objects.
+
+    Example:
+        >>> timers = JobScheduler(dispatch=lambda job, runs: pool.submit(run, job, runs))
+        >>> timers.add(job)
+        >>> timers.start()
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[["ScheduledJob", int], Optional[Future]],
+        *,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            dispatch: Called with a due job and how many times to run it
+                back to back; may return a Future so that overlapping runs
+                of the same job are skipped
+            clock: Current-time source
+        """
+        self._dispatch = dispatch
+        self._clock = clock
+        self._heap: List[Tuple[datetime, int, "ScheduledJob"]] = []
+        # job ID -> sequence number of its live heap entry (others are stale)
+        self._entries: Dict[str, int] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._crons: Dict[str, CronExpression] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # =========================================================================
+    # Jobs
+    # =========================================================================
+
+    def add(self, job: "ScheduledJob") -> None:
+        """Add or reschedule a job at its ``next_run``."""
+        if job.cron and job.cron not in self._crons:
+            self._crons[job.cron] = CronExpression(job.cron)
+        with self._lock:
+            self._push(job)
+
+    def _push(self, job: "ScheduledJob") -> None:
+        """Push a job's live heap entry (lock held)."""
+        if not job.enabled or job.next_run is None:
+            self._entries.pop(job.id, None)
+            return
+        sequence = next(self._sequence)
+        self._entries[job.id] = sequence
+        heapq.heappush(self._heap, (job.next_run, sequence, job))
+        if self._heap[0][1] == sequence:
+            # New earliest job: shorten the timer thread's sleep
+            self._wakeup.notify()
+
+    def remove(self, job_id: str) -> bool:
+        """Unschedule a job; its heap entry is discarded lazily."""
+        with self._lock:
+            return self._entries.pop(job_id, None) is not None
+
+    def next_fire(self, job: "ScheduledJob", after: datetime) -> Optional[datetime]:
+        """Get the first occurrence of a recurring job after ``after``."""
+        if job.interval:
+            missed = int((after - job.next_run).total_seconds() // job.interval) + 1
+            return job.next_run + timedelta(seconds=job.interval * max(missed, 1))
+        if job.cron:
+            cron = self._crons.get(job.cron) or CronExpression(job.cron)
+            return cron.next_fire(after)
+        return None
+
+    def _missed(self, job: "ScheduledJob", now: datetime) -> List[datetime]:
+        """Occurrences of a job from ``next_run`` up to ``now``."""
+        occurrences = [job.next_run]
+        while len(occurrences) < MAX_CATCH_UP:
+            if job.interval:
+                following = occurrences[-1] + timedelta(seconds=job.interval)
+            elif job.cron:
+                following = self._crons[job.cron].next_fire(occurrences[-1])
+            else:
+                break
+            if following > now:
+                break
+            occurrences.append(following)
+        return occurrences
+
+    def _fire(self, job: "ScheduledJob", now: datetime) -> int:
+        """Work out how many runs a due job gets and reschedule it (lock held)."""
+        occurrences = self._missed(job, now)
+        if job.misfire_grace_time is not None:
+            grace = timedelta(seconds=job.misfire_grace_time)
+            on_time = [when for when in occurrences if now - when <= grace]
+        else:
+            on_time = occurrences
+        runs = min(len(on_time), 1) if job.coalesce else len(on_time)
+
+        previous = self._inflight.get(job.id)
+        if runs and previous is not None and not previous.done():
+            runs = 0
+        job.misfire_count += len(occurrences) - runs
+
+        job.next_run = self.next_fire(job, now)
+        if job.next_run is None:
+            job.enabled = False  # One-time job
+        self._push(job)
+        return runs
+
+    # =========================================================================
+    # Timer Thread
+    # =========================================================================
+
+    def _due(self) -> List[Tuple["ScheduledJob", int]]:
+        """Sleep until at least one job is due; return (job, runs) pairs."""
+        with self._lock:
+            while self._running:
+                if not self._heap:
+                    self._wakeup.wait(MAX_SLEEP)
+                    continue
+
+                next_run, sequence, job = self._heap[0]
+                if self._entries.get(job.id) != sequence:
+                    heapq.heappop(self._heap)
+                    continue
+
+                now = self._clock()
+                delay = (next_run - now).total_seconds()
+                if delay > 0:
+                    self._wakeup.wait(min(delay, MAX_SLEEP))
+                    continue
+
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, sequence, job = heapq.heappop(self._heap)
+                    if self._entries.get(job.id) == sequence:
+                        del self._entries[job.id]
+                        due.append((job, self._fire(job, now)))
+                return due
+        return []
+
+    def _loop(self) -> None:
+        while self._running:
+            for job, runs in self._due():
+                if not runs:
+                    continue
+                job.last_run = self._clock()
+                job.run_count += runs
+                future = self._dispatch(job, runs)
+                if future is not None:
+                    with self._lock:
+                        self._inflight[job.id] = future
+                    future.add_done_callback(
+                        lambda f, job_id=job.id: self._clear_inflight(job_id, f)
+                    )
+
+    def _clear_inflight(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(job_id) is future:
+                del self._inflight[job_id]
+
+    def start(self) -> None:
+        """Start the timer thread."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._loop, name="openstackai-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the timer thread; jobs stay scheduled."""
+        with self._lock:
+            self._running = False
+            self._wakeup.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the timer thread is running."""
+        return self._running
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def peek(self) -> Optional[datetime]:
+        """Earliest ``next_run`` among scheduled jobs."""
+        with self._lock:
+            while self._heap:
+                next_run, sequence, job = self._heap[0]
+                if self._entries.get(job.id) == sequence:
+                    return next_run
+                heapq.heappop(self._heap)
+        return None
@@ -26,7 +26,7 @@ Example:
     store.save(session)
 """
 
-from .base import Session, SessionCheckpoint, SessionMessage, SessionState
+from .base import Session, SessionCheckpoint, SessionInfo, SessionMessage, SessionState
 from .manager import SessionManager, create_session, get_session
 from .memory import MemorySessionStore
 from .redis import RedisSessionStore
@@ -38,6 +38,7 @@ __all__ = [
     "SessionMessage",
     "SessionState",
     "SessionCheckpoint",
+    "SessionInfo",
     # Stores
     "MemorySessionStore",
     "SQLiteSessionStore",
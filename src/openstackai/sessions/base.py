@@ -7,13 +7,14 @@ Base Session Classes
 Core abstractions for session management.
 """
 
+import copy
 import json
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional
 
 
 class SessionState(Enum):
@@ -137,6 +138,39 @@ class SessionCheckpoint:
         )
 
 
+@dataclass
+class SessionInfo:
+    """Session metadata without messages (a listing projection).
+
+    Attributes:
+        id: Session identifier
+        user_id: Associated user ID
+        agent_id: Associated agent ID
+        state: Current session state
+        metadata: Session metadata
+        created_at: When the session was created
+        updated_at: When the session was last updated
+        message_count: Number of stored messages
+    """
+
+    id: str
+    user_id: Optional[str] = None
+    agent_id: Optional[str] = None
+    state: SessionState = SessionState.ACTIVE
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    message_count: int = 0
+
+    def sort_key(self) -> tuple:
+        """Listing order key: most recently updated first, then by ID."""
+        return (self.updated_at, self.id)
+
+    def is_after(self, cursor: Optional["SessionInfo"]) -> bool:
+        """Whether this entry comes after ``cursor`` in listing order."""
+        return cursor is None or self.sort_key() < cursor.sort_key()
+
+
 @dataclass
 class Session:
     """A conversation session.
@@ -165,6 +199,59 @@ class Session:
     context: Dict[str, Any] = field(default_factory=dict)
     checkpoints: List[SessionCheckpoint] = field(default_factory=list)
 
+    # Lowest message index removed or edited since the last save. Stores use
+    # it to persist only the changed tail (None = only appends since then).
+    _dirty_from: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    # Index of messages[0] in the full history when loaded with last_n
+    _message_offset: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def message_offset(self) -> int:
+        """Number of earlier messages not loaded (see ``load(last_n=...)``)."""
+        return self._message_offset
+
+    def info(self) -> SessionInfo:
+        """Metadata projection of this session."""
+        return SessionInfo(
+            id=self.id,
+            user_id=self.user_id,
+            agent_id=self.agent_id,
+            state=self.state,
+            metadata=self.metadata,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            message_count=self._message_offset + len(self.messages),
+        )
+
+    def tail(self, last_n: Optional[int]) -> "Session":
+        """Shallow copy holding only the last ``last_n`` messages.
+
+        Args:
+            last_n: Messages to keep (None = all)
+
+        Returns:
+            Session whose ``message_offset`` records the skipped messages
+        """
+        window = copy.copy(self)
+        window.messages = list(self.messages[-last_n:] if last_n else self.messages)
+        window.checkpoints = list(self.checkpoints)
+        window._message_offset = self._message_offset + len(self.messages) - len(window.messages)
+        window._dirty_from = None
+        return window
+
+    def mark_dirty(self, index: int = 0) -> None:
+        """Record that messages from ``index`` on were removed or edited.
+
+        Appends are detected automatically; call this after editing an
+        existing message in place so the next save rewrites it.
+
+        Args:
+            index: First changed message index
+        """
+        if self._dirty_from is None or index < self._dirty_from:
+            self._dirty_from = max(index, 0)
+
     def add_message(self, role: str, content: str, **kwargs) -> SessionMessage:
         """Add a message to the session.
 
@@ -220,11 +307,16 @@ class Session:
 
     def clear(self) -> None:
         """Clear all messages except system messages."""
+        first_removed = next(
+            (i for i, m in enumerate(self.messages) if m.role != "system"), len(self.messages)
+        )
+        self.mark_dirty(first_removed)
         self.messages = [m for m in self.messages if m.role == "system"]
         self.updated_at = datetime.utcnow()
 
     def reset(self) -> None:
         """Reset the session completely."""
+        self.mark_dirty(0)
         self.messages = []
         self.context = {}
         self.state = SessionState.ACTIVE
@@ -243,6 +335,7 @@ class Session:
         """
         for i, msg in enumerate(self.messages):
             if msg.id == message_id:
+                self.mark_dirty(i)
                 self.messages = self.messages[:i]
                 self.updated_at = datetime.utcnow()
                 return True
@@ -270,7 +363,7 @@ class Session:
 
         checkpoint = SessionCheckpoint(
             name=name,
-            message_index=len(self.messages),
+            message_index=self._message_offset + len(self.messages),
             context_snapshot=copy.deepcopy(self.context),
         )
         self.checkpoints.append(checkpoint)
@@ -289,7 +382,9 @@ class Session:
         """
         for checkpoint in self.checkpoints:
             if checkpoint.id == checkpoint_id:
-                self.messages = self.messages[: checkpoint.message_index]
+                index = max(checkpoint.message_index - self._message_offset, 0)
+                self.mark_dirty(index)
+                self.messages = self.messages[:index]
                 if restore_context:
                     import copy
 
@@ -338,6 +433,7 @@ class Session:
         self.messages = self.messages[:-n] if n > 0 else self.messages
         removed = original_count - len(self.messages)
         if removed > 0:
+            self.mark_dirty(len(self.messages))
             self.updated_at = datetime.utcnow()
         return removed
 
@@ -414,6 +510,44 @@ class Session:
         return len(self.messages)
 
 
+def incremental_start(
+    session: Session,
+    stored_count: Optional[int],
+    last_message_id: Optional[str],
+    id_at: Callable[[int], Optional[str]],
+) -> int:
+    """Position of the first message a store must (re)write.
+
+    Stores that persist messages by position use this to append only the
+    new tail and to turn rewinds into range deletes. The stored prefix is
+    verified by message ID, so sessions edited out of band fall back to a
+    full rewrite. Messages before ``session.message_offset`` (not loaded)
+    are never rewritten.
+
+    Args:
+        session: Session being saved
+        stored_count: Messages currently stored (None if unknown or new)
+        last_message_id: ID of the last stored message
+        id_at: Looks up the stored message ID at a position
+
+    Returns:
+        Absolute position to truncate at and write from
+    """
+    offset = session.message_offset
+    if stored_count is None:
+        return offset
+
+    start = min(stored_count, offset + len(session.messages))
+    if session._dirty_from is not None:
+        start = min(start, offset + session._dirty_from)
+    if start <= offset:
+        return offset
+
+    # The kept prefix must end with the message the store has there
+    stored_id = last_message_id if start == stored_count else id_at(start - 1)
+    return start if session.messages[start - 1 - offset].id == stored_id else offset
+
+
 class BaseSessionStore(ABC):
     """Abstract base class for session stores.
 
@@ -426,8 +560,17 @@ class BaseSessionStore(ABC):
         pass
 
     @abstractmethod
-    def load(self, session_id: str) -> Optional[Session]:
-        """Load a session by ID."""
+    def load(self, session_id: str, last_n: Optional[int] = None) -> Optional[Session]:
+        """Load a session by ID.
+
+        Args:
+            session_id: Session ID
+            last_n: Only load the last N messages; saving the session back
+                keeps the earlier ones
+
+        Returns:
+            Session, or None if not found
+        """
         pass
 
     @abstractmethod
@@ -442,9 +585,81 @@ class BaseSessionStore(ABC):
         """List sessions with optional filtering."""
         pass
 
+    def get_info(self, session_id: str) -> Optional[SessionInfo]:
+        """Get a session's metadata without its messages.
+
+        Stores override this with a native projection; the default loads
+        the session.
+        """
+        session = self.load(session_id)
+        return session.info() if session else None
+
+    def list_session_info(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 100,
+        after: Optional[SessionInfo] = None,
+    ) -> List[SessionInfo]:
+        """List session metadata, most recently updated first.
+
+        Args:
+            user_id: Filter by user
+            agent_id: Filter by agent
+            limit: Maximum entries to return
+            after: Keyset cursor: the last entry of the previous page
+
+        Returns:
+            Session metadata, without messages
+        """
+        infos = [s.info() for s in self.list_sessions(user_id, agent_id, limit=2**31)]
+        infos = [info for info in infos if info.is_after(after)]
+        infos.sort(key=SessionInfo.sort_key, reverse=True)
+        return infos[:limit]
+
+    def load_messages(
+        self, session_id: str, start: int = 0, stop: Optional[int] = None
+    ) -> List[SessionMessage]:
+        """Load a range of a session's messages (slice semantics).
+
+        Args:
+            session_id: Session ID
+            start: First message index (negative counts from the end)
+            stop: End index, exclusive (None = through the last message)
+
+        Returns:
+            Messages in the range, oldest first
+        """
+        session = self.load(session_id)
+        return session.messages[start:stop] if session else []
+
+    def iter_messages(
+        self, session_id: str, batch_size: int = 100, reverse: bool = False
+    ) -> Iterator[SessionMessage]:
+        """Lazily iterate a session's messages, loading them in batches.
+
+        Args:
+            session_id: Session ID
+            batch_size: Messages fetched per round trip
+            reverse: Newest first
+
+        Yields:
+            Messages
+        """
+        info = self.get_info(session_id)
+        if info is None:
+            return
+        count = info.message_count
+        if reverse:
+            for stop in range(count, 0, -batch_size):
+                yield from reversed(self.load_messages(session_id, max(stop - batch_size, 0), stop))
+        else:
+            for start in range(0, count, batch_size):
+                yield from self.load_messages(session_id, start, start + batch_size)
+
     def exists(self, session_id: str) -> bool:
         """Check if a session exists."""
-        return self.load(session_id) is not None
+        return self.get_info(session_id) is not None
 
     def get_or_create(
         self, session_id: str, user_id: Optional[str] = None, agent_id: Optional[str] = None
@@ -7,9 +7,11 @@ In-Memory Session Store
 Simple in-memory session storage for development and testing.
 """
 
+import copy
+import heapq
 from typing import Dict, List, Optional
 
-from .base import BaseSessionStore, Session
+from .base import BaseSessionStore, Session, SessionInfo, SessionMessage
 
 
 class MemorySessionStore(BaseSessionStore):
@@ -35,11 +37,54 @@ class MemorySessionStore(BaseSessionStore):
 
     def save(self, session: Session) -> None:
         """Save a session to memory."""
+        stored = self._sessions.get(session.id)
+        if session.message_offset and stored is not None:
+            # A last_n window: keep the stored messages it didn't load
+            full = copy.copy(session)
+            full.messages = stored.messages[: session.message_offset] + session.messages
+            full._message_offset = 0
+            session = full
+        session._dirty_from = None
         self._sessions[session.id] = session
 
-    def load(self, session_id: str) -> Optional[Session]:
-        """Load a session from memory."""
-        return self._sessions.get(session_id)
+    def load(self, session_id: str, last_n: Optional[int] = None) -> Optional[Session]:
+        """Load a session from memory.
+
+        The stored object itself is returned, unless ``last_n`` asks for a
+        window (a shallow copy holding only those messages).
+        """
+        session = self._sessions.get(session_id)
+        if session is None or not last_n:
+            return session
+        return session.tail(last_n)
+
+    def get_info(self, session_id: str) -> Optional[SessionInfo]:
+        """Get a session's metadata."""
+        session = self._sessions.get(session_id)
+        return session.info() if session else None
+
+    def list_session_info(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 100,
+        after: Optional[SessionInfo] = None,
+    ) -> List[SessionInfo]:
+        """List session metadata, most recently updated first."""
+        infos = (
+            s.info()
+            for s in self._sessions.values()
+            if (not user_id or s.user_id == user_id) and (not agent_id or s.agent_id == agent_id)
+        )
+        infos = (info for info in infos if info.is_after(after))
+        return heapq.nlargest(limit, infos, key=SessionInfo.sort_key)
+
+    def load_messages(
+        self, session_id: str, start: int = 0, stop: Optional[int] = None
+    ) -> List[SessionMessage]:
+        """Load a range of messages."""
+        session = self._sessions.get(session_id)
+        return session.messages[start:stop] if session else []
 
     def delete(self, session_id: str) -> bool:
         """Delete a session from memory."""
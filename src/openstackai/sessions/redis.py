@@ -8,9 +8,39 @@ Distributed session storage using Redis.
 Like OpenAI Agents SDK's RedisSession.
 """
 
-from typing import List, Optional
-
-from .base import BaseSessionStore, Session
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import (
+    BaseSessionStore,
+    Session,
+    SessionCheckpoint,
+    SessionInfo,
+    SessionMessage,
+    SessionState,
+    incremental_start,
+)
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Hash fields that make up a SessionInfo (no context or checkpoints)
+_INFO_FIELDS = (
+    "id",
+    "user_id",
+    "agent_id",
+    "state",
+    "metadata",
+    "created_at",
+    "updated_at",
+    "message_count",
+)
+
+
+def _score(timestamp: datetime) -> float:
+    """Sorted-set score for a timestamp."""
+    return (timestamp.replace(tzinfo=None) - _EPOCH).total_seconds()
 
 
 class RedisSessionStore(BaseSessionStore):
@@ -22,6 +52,15 @@ class RedisSessionStore(BaseSessionStore):
     - High availability requirements
     - Session sharing across services
 
+    Layout (all keys under ``prefix``):
+    - ``{id}``: hash with session fields, message_count and last_message_id
+    - ``{id}:messages``: list of message JSON, appended with RPUSH
+    - ``index:updated``, ``index:user:{user}``, ``index:agent:{agent}``:
+      sorted sets of session IDs scored by updated_at
+
+    Saves append only new messages and run in one MULTI/EXEC round trip;
+    listings read a sorted-set page and fetch metadata in one pipeline.
+
     Example:
         store = RedisSessionStore(host="redis.example.com")
         session = Session(id="my-session")
@@ -31,6 +70,10 @@ class RedisSessionStore(BaseSessionStore):
         loaded = store.load("my-session")
     """
 
+    # Connection pools shared by stores with the same connection settings
+    _pools: Dict[str, Any] = {}
+    _pools_lock = threading.Lock()
+
     def __init__(
         self,
         host: str = "localhost",
@@ -39,6 +82,8 @@ class RedisSessionStore(BaseSessionStore):
         password: Optional[str] = None,
         prefix: str = "openstackai:session:",
         ttl: Optional[int] = None,
+        max_connections: int = 50,
+        connection_pool: Any = None,
         **kwargs,
     ):
         """Initialize Redis session store.
@@ -50,10 +95,14 @@ class RedisSessionStore(BaseSessionStore):
             password: Redis password
             prefix: Key prefix for sessions
             ttl: Session TTL in seconds (None = no expiry)
+            max_connections: Size of the shared connection pool
+            connection_pool: Existing redis ConnectionPool to use
             **kwargs: Additional Redis connection arguments
         """
         self.prefix = prefix
         self.ttl = ttl
+        self.max_connections = max_connections
+        self._connection_pool = connection_pool
         self._client = None
 
         self._connection_kwargs = {
@@ -66,109 +115,313 @@ class RedisSessionStore(BaseSessionStore):
         }
 
     def _get_client(self):
-        """Get or create Redis client."""
+        """Get or create Redis client backed by a shared connection pool."""
         if self._client is None:
             try:
                 import redis
             except ImportError:
                 raise ImportError("redis package required. Install with: pip install redis")
 
-            self._client = redis.Redis(**self._connection_kwargs)
+            pool = self._connection_pool
+            if pool is None:
+                pool_key = repr(sorted(self._connection_kwargs.items()))
+                with self._pools_lock:
+                    pool = self._pools.get(pool_key)
+                    if pool is None:
+                        pool = redis.ConnectionPool(
+                            max_connections=self.max_connections, **self._connection_kwargs
+                        )
+                        self._pools[pool_key] = pool
+            self._client = redis.Redis(connection_pool=pool)
         return self._client
 
     def _key(self, session_id: str) -> str:
-        """Get Redis key for a session."""
+        """Get Redis key for a session's hash."""
         return f"{self.prefix}{session_id}"
 
-    def _index_key(self, index_type: str, value: str) -> str:
-        """Get Redis key for an index."""
+    def _messages_key(self, session_id: str) -> str:
+        """Get Redis key for a session's message list."""
+        return f"{self.prefix}{session_id}:messages"
+
+    def _index_key(self, index_type: str, value: str = "") -> str:
+        """Get Redis key for a sorted-set index."""
+        if not value:
+            return f"{self.prefix}index:{index_type}"
         return f"{self.prefix}index:{index_type}:{value}"
 
     def save(self, session: Session) -> None:
-        """Save a session to Redis."""
-        client = self._get_client()
+        """Save a session to Redis.
+
+        Only messages appended since the stored copy are pushed; rewinds
+        become an LTRIM. Concurrent writers are serialized with WATCH.
+        """
+        from redis.exceptions import WatchError
 
+        client = self._get_client()
         key = self._key(session.id)
-        data = session.to_json()
+        messages_key = self._messages_key(session.id)
+        offset = session.message_offset
 
-        if self.ttl:
-            client.setex(key, self.ttl, data)
-        else:
-            client.set(key, data)
+        with client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key, messages_key)
+                    stored = pipe.hmget(
+                        key, "message_count", "last_message_id", "user_id", "agent_id"
+                    )
+
+                    def id_at(position: int) -> Optional[str]:
+                        raw = pipe.lindex(messages_key, position)
+                        return json.loads(raw)["id"] if raw else None
+
+                    stored_count = int(stored[0]) if stored[0] is not None else None
+                    start = incremental_start(session, stored_count, stored[1], id_at)
+                    if session.messages:
+                        last_id = session.messages[-1].id
+                    else:
+                        # Everything loaded was rewound; the stored prefix ends the history
+                        last_id = id_at(offset - 1) if offset else None
+
+                    pipe.multi()
+                    if start == 0:
+                        pipe.delete(messages_key)
+                    else:
+                        pipe.ltrim(messages_key, 0, start - 1)
+                    new = [
+                        json.dumps(m.to_dict(), default=str)
+                        for m in session.messages[start - offset :]
+                    ]
+                    if new:
+                        pipe.rpush(messages_key, *new)
+
+                    count = offset + len(session.messages)
+                    pipe.hset(key, mapping=self._to_hash(session, count, last_id))
+                    self._index(pipe, session, previous_user=stored[2], previous_agent=stored[3])
+                    if self.ttl:
+                        pipe.expire(key, self.ttl)
+                        pipe.expire(messages_key, self.ttl)
+                    pipe.execute()
+                    break
+                except WatchError:
+                    continue
+
+        session._dirty_from = None
+
+    def _to_hash(
+        self, session: Session, message_count: int, last_id: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
+            "id": session.id,
+            "user_id": session.user_id or "",
+            "agent_id": session.agent_id or "",
+            "state": session.state.value,
+            "metadata": json.dumps(session.metadata, default=str),
+            "context": json.dumps(session.context, default=str),
+            "checkpoints": json.dumps([cp.to_dict() for cp in session.checkpoints], default=str),
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "message_count": message_count,
+            "last_message_id": last_id or "",
+        }
 
-        # Update indexes
+    def _index(
+        self,
+        pipe: Any,
+        session: Session,
+        previous_user: Optional[str] = None,
+        previous_agent: Optional[str] = None,
+    ) -> None:
+        """Queue sorted-set index updates for a saved session."""
+        entry = {session.id: _score(session.updated_at)}
+        pipe.zadd(self._index_key("updated"), entry)
+        if previous_user and previous_user != session.user_id:
+            pipe.zrem(self._index_key("user", previous_user), session.id)
+        if previous_agent and previous_agent != session.agent_id:
+            pipe.zrem(self._index_key("agent", previous_agent), session.id)
         if session.user_id:
-            client.sadd(self._index_key("user", session.user_id), session.id)
+            pipe.zadd(self._index_key("user", session.user_id), entry)
         if session.agent_id:
-            client.sadd(self._index_key("agent", session.agent_id), session.id)
+            pipe.zadd(self._index_key("agent", session.agent_id), entry)
 
-    def load(self, session_id: str) -> Optional[Session]:
-        """Load a session from Redis."""
-        client = self._get_client()
+    def load(self, session_id: str, last_n: Optional[int] = None) -> Optional[Session]:
+        """Load a session from Redis in one round trip.
 
-        data = client.get(self._key(session_id))
-        if data is None:
+        Args:
+            session_id: Session ID
+            last_n: Only fetch the last N messages (LRANGE on the tail)
+        """
+        pipe = self._get_client().pipeline(transaction=False)
+        pipe.hgetall(self._key(session_id))
+        pipe.lrange(self._messages_key(session_id), -last_n if last_n else 0, -1)
+        fields, raw_messages = pipe.execute()
+        if not fields:
+            return None
+        return self._from_hash(fields, raw_messages)
+
+    def _from_hash(self, fields: Dict[str, str], raw_messages: List[str]) -> Session:
+        info = self._parse_info(fields)
+        session = Session(
+            id=info.id,
+            user_id=info.user_id,
+            agent_id=info.agent_id,
+            messages=[SessionMessage.from_dict(json.loads(m)) for m in raw_messages],
+            state=info.state,
+            metadata=info.metadata,
+            created_at=info.created_at,
+            updated_at=info.updated_at,
+            context=json.loads(fields.get("context") or "{}"),
+            checkpoints=[
+                SessionCheckpoint.from_dict(cp)
+                for cp in json.loads(fields.get("checkpoints") or "[]")
+            ],
+        )
+        session._message_offset = max(info.message_count - len(session.messages), 0)
+        return session
+
+    def get_info(self, session_id: str) -> Optional[SessionInfo]:
+        """Get a session's metadata with one HMGET."""
+        values = self._get_client().hmget(self._key(session_id), _INFO_FIELDS)
+        if values[0] is None:
             return None
+        return self._parse_info(dict(zip(_INFO_FIELDS, values)))
 
-        return Session.from_json(data)
+    def list_session_info(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 100,
+        after: Optional[SessionInfo] = None,
+    ) -> List[SessionInfo]:
+        """List session metadata from the updated_at index.
+
+        Reads one sorted-set page and fetches its metadata in a single
+        pipeline, repeating only if filtering leaves the page short.
+        """
+        client = self._get_client()
+        if user_id:
+            index = self._index_key("user", user_id)
+        elif agent_id:
+            index = self._index_key("agent", agent_id)
+        else:
+            index = self._index_key("updated")
+
+        max_score: Any = "+inf"
+        if after is not None:
+            max_score = _score(after.updated_at)
+
+        infos: List[SessionInfo] = []
+        offset = 0
+        page_size = max(limit, 16)
+        while len(infos) < limit:
+            page: List[Tuple[str, float]] = client.zrevrangebyscore(
+                index, max_score, "-inf", start=offset, num=page_size, withscores=True
+            )
+            if not page:
+                break
+            offset += len(page)
+
+            # Equal scores list members in reverse order; skip the cursor's ties
+            if after is not None:
+                page = [(sid, score) for sid, score in page if score < max_score or sid < after.id]
+
+            pipe = client.pipeline(transaction=False)
+            for session_id, _ in page:
+                pipe.hmget(self._key(session_id), _INFO_FIELDS)
+            expired = []
+            for (session_id, _), values in zip(page, pipe.execute()):
+                if values[0] is None:
+                    expired.append(session_id)
+                    continue
+                info = self._parse_info(dict(zip(_INFO_FIELDS, values)))
+                if agent_id and info.agent_id != agent_id:
+                    continue
+                infos.append(info)
+            if expired:
+                # Sessions that hit their TTL leave stale index entries
+                client.zrem(index, *expired)
+
+        return infos[:limit]
+
+    def load_messages(
+        self, session_id: str, start: int = 0, stop: Optional[int] = None
+    ) -> List[SessionMessage]:
+        """Load a range of messages with one LRANGE."""
+        if stop is not None and (stop == 0 or (stop > 0 and start >= 0 and stop <= start)):
+            return []
+        end = -1 if stop is None else stop - 1
+        raw = self._get_client().lrange(self._messages_key(session_id), start, end)
+        return [SessionMessage.from_dict(json.loads(m)) for m in raw]
+
+    @staticmethod
+    def _parse_info(fields: Dict[str, Any]) -> SessionInfo:
+        return SessionInfo(
+            id=fields["id"],
+            user_id=fields.get("user_id") or None,
+            agent_id=fields.get("agent_id") or None,
+            state=SessionState(fields.get("state") or "active"),
+            metadata=json.loads(fields.get("metadata") or "{}"),
+            created_at=datetime.fromisoformat(fields["created_at"]),
+            updated_at=datetime.fromisoformat(fields["updated_at"]),
+            message_count=int(fields.get("message_count") or 0),
+        )
 
     def delete(self, session_id: str) -> bool:
         """Delete a session from Redis."""
         client = self._get_client()
+        user_id, agent_id = client.hmget(self._key(session_id), "user_id", "agent_id")
 
-        # Load session to get user_id/agent_id for index cleanup
-        session = self.load(session_id)
-        if session:
-            if session.user_id:
-                client.srem(self._index_key("user", session.user_id), session_id)
-            if session.agent_id:
-                client.srem(self._index_key("agent", session.agent_id), session_id)
-
-        return client.delete(self._key(session_id)) > 0
+        pipe = client.pipeline()
+        pipe.delete(self._key(session_id), self._messages_key(session_id))
+        pipe.zrem(self._index_key("updated"), session_id)
+        if user_id:
+            pipe.zrem(self._index_key("user", user_id), session_id)
+        if agent_id:
+            pipe.zrem(self._index_key("agent", agent_id), session_id)
+        return pipe.execute()[0] > 0
 
     def list_sessions(
         self, user_id: Optional[str] = None, agent_id: Optional[str] = None, limit: int = 100
     ) -> List[Session]:
         """List sessions with optional filtering."""
-        client = self._get_client()
+        infos = self.list_session_info(user_id, agent_id, limit)
 
-        session_ids = set()
+        # Fetch every session on the page in one round trip
+        pipe = self._get_client().pipeline(transaction=False)
+        for info in infos:
+            pipe.hgetall(self._key(info.id))
+            pipe.lrange(self._messages_key(info.id), 0, -1)
+        results = pipe.execute()
 
-        if user_id:
-            session_ids = client.smembers(self._index_key("user", user_id))
-        elif agent_id:
-            session_ids = client.smembers(self._index_key("agent", agent_id))
-        else:
-            # Scan all session keys
-            cursor = 0
-            pattern = f"{self.prefix}*"
-            while True:
-                cursor, keys = client.scan(cursor, match=pattern, count=100)
-                for key in keys:
-                    if ":index:" not in key:
-                        session_id = key.replace(self.prefix, "")
-                        session_ids.add(session_id)
-                if cursor == 0:
-                    break
-
-        # Load sessions
         sessions = []
-        for session_id in list(session_ids)[:limit]:
-            session = self.load(session_id)
-            if session:
-                if agent_id and user_id:
-                    if session.user_id == user_id and session.agent_id == agent_id:
-                        sessions.append(session)
-                elif agent_id:
-                    if session.agent_id == agent_id:
-                        sessions.append(session)
-                else:
-                    sessions.append(session)
-
-        # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
-
-        return sessions[:limit]
+        for fields, raw_messages in zip(results[::2], results[1::2]):
+            if fields:
+                sessions.append(self._from_hash(fields, raw_messages))
+        return sessions
+
+    def migrate(self) -> int:
+        """Convert sessions saved as JSON blobs to the hash/list layout.
+
+        Run once after upgrading from the single-blob layout.
+
+        Returns:
+            Number of sessions migrated
+        """
+        client = self._get_client()
+        migrated = 0
+        for key in list(client.scan_iter(match=f"{self.prefix}*", count=100)):
+            kind = client.type(key)
+            rest = key[len(self.prefix) :]
+            if rest.startswith("index:") and kind == "set":
+                # Old unordered indexes are rebuilt as sorted sets below
+                client.delete(key)
+            elif rest.startswith("info:") and kind == "string":
+                client.delete(key)
+            elif kind == "string":
+                session = Session.from_json(client.get(key))
+                client.delete(key)
+                self.save(session)
+                migrated += 1
+        return migrated
 
     def clear(self) -> None:
         """Clear all sessions."""
@@ -13,9 +13,72 @@ import sqlite3
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-
-from .base import BaseSessionStore, Session
+from typing import Any, List, Optional
+
+from .base import (
+    BaseSessionStore,
+    Session,
+    SessionInfo,
+    SessionMessage,
+    SessionState,
+    incremental_start,
+)
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache reuses the prepared form on every save.
+_UPSERT_SESSION = """
+    INSERT INTO sessions
+    (id, user_id, agent_id, state, metadata, context, created_at, updated_at,
+     message_count, last_message_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        user_id = excluded.user_id, agent_id = excluded.agent_id,
+        state = excluded.state, metadata = excluded.metadata,
+        context = excluded.context, created_at = excluded.created_at,
+        updated_at = excluded.updated_at, message_count = excluded.message_count,
+        last_message_id = excluded.last_message_id
+"""
+_INSERT_MESSAGE = """
+    INSERT INTO messages
+    (id, session_id, role, content, timestamp, metadata, tool_calls, tool_call_id, position)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_DELETE_MESSAGES_FROM = "DELETE FROM messages WHERE session_id = ? AND position >= ?"
+_SELECT_SYNC_STATE = "SELECT message_count, last_message_id FROM sessions WHERE id = ?"
+_SELECT_MESSAGE_AT = "SELECT id FROM messages WHERE session_id = ? AND position = ?"
+_SELECT_MESSAGE_RANGE = """
+    SELECT * FROM messages WHERE session_id = ? AND position >= ? AND position < ?
+    ORDER BY position
+"""
+# Session info queries; sessions saved before message_count existed are
+# counted on the fly
+_SELECT_SESSION = """
+    SELECT id, user_id, agent_id, state, metadata, created_at, updated_at,
+        COALESCE(message_count,
+                 (SELECT COUNT(*) FROM messages WHERE messages.session_id = sessions.id))
+            AS message_count,
+        context
+    FROM sessions WHERE id = ?
+"""
+_SELECT_INFO = """
+    SELECT id, user_id, agent_id, state, metadata, created_at, updated_at,
+        COALESCE(message_count,
+                 (SELECT COUNT(*) FROM messages WHERE messages.session_id = sessions.id))
+            AS message_count
+    FROM sessions WHERE id = ?
+"""
+_LIST_INFO = """
+    SELECT id, user_id, agent_id, state, metadata, created_at, updated_at,
+        COALESCE(message_count,
+                 (SELECT COUNT(*) FROM messages WHERE messages.session_id = sessions.id))
+            AS message_count
+    FROM sessions WHERE 1=1
+"""
+# Optional filters and the keyset page appended to _LIST_INFO
+_FILTER_USER = " AND user_id = ?"
+_FILTER_AGENT = " AND agent_id = ?"
+_FILTER_AFTER = " AND (updated_at < ? OR (updated_at = ? AND id < ?))"
+_ORDER_PAGE = " ORDER BY updated_at DESC, id DESC LIMIT ?"
 
 
 class SQLiteSessionStore(BaseSessionStore):
@@ -26,6 +89,10 @@ class SQLiteSessionStore(BaseSessionStore):
     - Single-server deployments
     - Persistent sessions across restarts
 
+    Saves are incremental: only messages appended since the last save are
+    inserted, and rewinds become a single range delete, so per-turn cost
+    does not grow with conversation length.
+
     Example:
         store = SQLiteSessionStore("sessions.db")
         session = Session(id="my-session", user_id="user-123")
@@ -37,21 +104,35 @@ class SQLiteSessionStore(BaseSessionStore):
         print(loaded.messages)
     """
 
-    def __init__(self, db_path: str = "pyai_sessions.db"):
+    def __init__(self, db_path: str = "pyai_sessions.db", cached_statements: int = 128):
         """Initialize SQLite session store.
 
         Args:
             db_path: Path to SQLite database file
+            cached_statements: Prepared statements cached per connection
         """
         self.db_path = Path(db_path)
+        self.cached_statements = cached_statements
         self._local = threading.local()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local, "connection"):
-            self._local.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            self._local.connection.row_factory = sqlite3.Row
+            conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                cached_statements=self.cached_statements,
+            )
+            conn.row_factory = sqlite3.Row
+            # WAL lets readers proceed during writes; NORMAL sync is durable
+            # across application crashes and much cheaper than FULL
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = conn
         return self._local.connection
 
     def _init_db(self) -> None:
@@ -66,7 +147,9 @@ class SQLiteSessionStore(BaseSessionStore):
                 metadata TEXT DEFAULT '{}',
                 context TEXT DEFAULT '{}',
                 created_at TEXT,
-                updated_at TEXT
+                updated_at TEXT,
+                message_count INTEGER,
+                last_message_id TEXT
             )
         """)
         conn.execute("""
@@ -83,114 +166,213 @@ class SQLiteSessionStore(BaseSessionStore):
                 FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
             )
         """)
+
+        # Databases created before incremental saves lack the sync columns;
+        # NULL counts make the first save a full rewrite
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(sessions)")}
+        for column, sql_type in (("message_count", "INTEGER"), ("last_message_id", "TEXT")):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE sessions ADD COLUMN {column} {sql_type}")
+
         conn.execute("CREATE INDEX IF NOT EXISTS idx_session_user ON sessions(user_id)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_session_agent ON sessions(agent_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_message_session ON messages(session_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_session_updated ON sessions(updated_at, id)")
+        conn.execute("DROP INDEX IF EXISTS idx_message_session")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_message_position ON messages(session_id, position)"
+        )
         conn.commit()
 
     def save(self, session: Session) -> None:
-        """Save a session to SQLite."""
-        conn = self._get_connection()
+        """Save a session to SQLite.
 
-        # Upsert session
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO sessions
-            (id, user_id, agent_id, state, metadata, context, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                session.id,
-                session.user_id,
-                session.agent_id,
-                session.state.value,
-                json.dumps(session.metadata),
-                json.dumps(session.context),
-                session.created_at.isoformat(),
-                datetime.utcnow().isoformat(),
-            ),
-        )
-
-        # Delete existing messages
-        conn.execute("DELETE FROM messages WHERE session_id = ?", (session.id,))
+        Only messages that are new or changed since the stored copy are
+        written; a session whose stored copy can't be verified (e.g. its
+        message list was replaced wholesale) is rewritten in full.
+        """
+        conn = self._get_connection()
+        messages = session.messages
+        offset = session.message_offset
+        last_id = messages[-1].id if messages else None
+
+        with conn:
+            # Take the write lock before reading the stored count and last
+            # ID, so a concurrent save can't change them under us
+            conn.execute("BEGIN IMMEDIATE")
+            start = self._sync_start(conn, session)
+            if last_id is None and offset:
+                # Everything loaded was rewound; the stored prefix ends the history
+                found = conn.execute(_SELECT_MESSAGE_AT, (session.id, offset - 1)).fetchone()
+                last_id = found["id"] if found else None
 
-        # Insert messages
-        for i, msg in enumerate(session.messages):
             conn.execute(
-                """
-                INSERT INTO messages
-                (id, session_id, role, content, timestamp, metadata, tool_calls, tool_call_id, position)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+                _UPSERT_SESSION,
                 (
-                    msg.id,
                     session.id,
-                    msg.role,
-                    msg.content,
-                    msg.timestamp.isoformat(),
-                    json.dumps(msg.metadata),
-                    json.dumps(msg.tool_calls) if msg.tool_calls else None,
-                    msg.tool_call_id,
-                    i,
+                    session.user_id,
+                    session.agent_id,
+                    session.state.value,
+                    json.dumps(session.metadata),
+                    json.dumps(session.context),
+                    session.created_at.isoformat(),
+                    datetime.utcnow().isoformat(),
+                    offset + len(messages),
+                    last_id,
                 ),
             )
 
-        conn.commit()
+            # Drop rewound/changed rows, then append the new tail
+            conn.execute(_DELETE_MESSAGES_FROM, (session.id, start))
+            conn.executemany(
+                _INSERT_MESSAGE,
+                (
+                    (
+                        msg.id,
+                        session.id,
+                        msg.role,
+                        msg.content,
+                        msg.timestamp.isoformat(),
+                        json.dumps(msg.metadata),
+                        json.dumps(msg.tool_calls) if msg.tool_calls else None,
+                        msg.tool_call_id,
+                        i,
+                    )
+                    for i, msg in enumerate(messages[start - offset :], start)
+                ),
+            )
+
+        session._dirty_from = None
+
+    def _sync_start(self, conn: sqlite3.Connection, session: Session) -> int:
+        """Position of the first message that must be (re)written."""
+        row = conn.execute(_SELECT_SYNC_STATE, (session.id,)).fetchone()
+
+        def id_at(position: int) -> Optional[str]:
+            found = conn.execute(_SELECT_MESSAGE_AT, (session.id, position)).fetchone()
+            return found["id"] if found else None
+
+        if row is None:
+            return incremental_start(session, None, None, id_at)
+        return incremental_start(session, row["message_count"], row["last_message_id"], id_at)
 
-    def load(self, session_id: str) -> Optional[Session]:
-        """Load a session from SQLite."""
+    def load(self, session_id: str, last_n: Optional[int] = None) -> Optional[Session]:
+        """Load a session from SQLite.
+
+        Args:
+            session_id: Session ID
+            last_n: Only load the last N messages (one index range scan)
+        """
         conn = self._get_connection()
 
         # Load session
-        cursor = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
-        row = cursor.fetchone()
+        row = conn.execute(_SELECT_SESSION, (session_id,)).fetchone()
 
         if row is None:
             return None
 
-        # Load messages
-        cursor = conn.execute(
-            "SELECT * FROM messages WHERE session_id = ? ORDER BY position", (session_id,)
+        count = row["message_count"]
+        offset = max(count - last_n, 0) if last_n else 0
+        cursor = conn.execute(_SELECT_MESSAGE_RANGE, (session_id, offset, count))
+        messages = [self._row_to_message(msg_row) for msg_row in cursor]
+
+        info = self._row_to_info(row)
+        session = Session(
+            id=info.id,
+            user_id=info.user_id,
+            agent_id=info.agent_id,
+            messages=messages,
+            state=info.state,
+            metadata=info.metadata,
+            context=json.loads(row["context"] or "{}"),
+            created_at=info.created_at,
+            updated_at=info.updated_at,
         )
-        messages = []
-        for msg_row in cursor.fetchall():
-            from .base import SessionMessage
-
-            tool_calls = msg_row["tool_calls"]
-            if tool_calls:
-                tool_calls = json.loads(tool_calls)
-
-            messages.append(
-                SessionMessage(
-                    id=msg_row["id"],
-                    role=msg_row["role"],
-                    content=msg_row["content"],
-                    timestamp=datetime.fromisoformat(msg_row["timestamp"]),
-                    metadata=json.loads(msg_row["metadata"] or "{}"),
-                    tool_calls=tool_calls,
-                    tool_call_id=msg_row["tool_call_id"],
-                )
-            )
+        session._message_offset = offset
+        return session
 
-        from .base import SessionState
+    def get_info(self, session_id: str) -> Optional[SessionInfo]:
+        """Get a session's metadata without reading its messages."""
+        conn = self._get_connection()
+        row = conn.execute(_SELECT_INFO, (session_id,)).fetchone()
+        return self._row_to_info(row) if row else None
+
+    def list_session_info(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 100,
+        after: Optional[SessionInfo] = None,
+    ) -> List[SessionInfo]:
+        """List session metadata with keyset pagination; no message rows are read."""
+        conn = self._get_connection()
 
-        return Session(
+        query = _LIST_INFO
+        params: List[Any] = []
+
+        if user_id:
+            query += _FILTER_USER
+            params.append(user_id)
+        if agent_id:
+            query += _FILTER_AGENT
+            params.append(agent_id)
+        if after is not None:
+            cursor_time = after.updated_at.isoformat()
+            query += _FILTER_AFTER
+            params.extend([cursor_time, cursor_time, after.id])
+
+        query += _ORDER_PAGE
+        params.append(limit)
+
+        return [self._row_to_info(row) for row in conn.execute(query, params)]
+
+    def load_messages(
+        self, session_id: str, start: int = 0, stop: Optional[int] = None
+    ) -> List[SessionMessage]:
+        """Load a range of messages with one index range scan."""
+        if start < 0 or stop is None or stop < 0:
+            info = self.get_info(session_id)
+            if info is None:
+                return []
+            start, stop, _ = slice(start, stop).indices(info.message_count)
+        conn = self._get_connection()
+        cursor = conn.execute(_SELECT_MESSAGE_RANGE, (session_id, start, stop))
+        return [self._row_to_message(row) for row in cursor]
+
+    @staticmethod
+    def _row_to_message(row: sqlite3.Row) -> SessionMessage:
+        tool_calls = row["tool_calls"]
+        if tool_calls:
+            tool_calls = json.loads(tool_calls)
+
+        return SessionMessage(
+            id=row["id"],
+            role=row["role"],
+            content=row["content"],
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            metadata=json.loads(row["metadata"] or "{}"),
+            tool_calls=tool_calls,
+            tool_call_id=row["tool_call_id"],
+        )
+
+    @staticmethod
+    def _row_to_info(row: sqlite3.Row) -> SessionInfo:
+        return SessionInfo(
             id=row["id"],
             user_id=row["user_id"],
             agent_id=row["agent_id"],
-            messages=messages,
             state=SessionState(row["state"]),
             metadata=json.loads(row["metadata"] or "{}"),
-            context=json.loads(row["context"] or "{}"),
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
+            message_count=row["message_count"],
         )
 
     def delete(self, session_id: str) -> bool:
         """Delete a session from SQLite."""
         conn = self._get_connection()
-        cursor = conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
-        conn.commit()
+        with conn:
+            conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            cursor = conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
         return cursor.rowcount > 0
 
     def list_sessions(
@@ -209,7 +391,7 @@ class SQLiteSessionStore(BaseSessionStore):
             query += " AND agent_id = ?"
             params.append(agent_id)
 
-        query += " ORDER BY updated_at DESC LIMIT ?"
+        query += " ORDER BY updated_at DESC, id DESC LIMIT ?"
         params.append(limit)
 
         cursor = conn.execute(query, params)
@@ -14,14 +14,20 @@ from .cost import (
     calculate_cost,
 )
 from .counter import (
+    ConversationTokenCounter,
     TokenCounter,
     count_tokens,
     estimate_tokens,
+    get_counter,
+    get_encoder,
 )
 
 __all__ = [
     # Counter
     "TokenCounter",
+    "ConversationTokenCounter",
+    "get_counter",
+    "get_encoder",
     "count_tokens",
     "estimate_tokens",
     # Cost
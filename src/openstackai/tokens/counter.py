@@ -7,8 +7,12 @@ Token Counter
 Count tokens for various model providers.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 # Try to import tiktoken for OpenAI models
 try:
@@ -19,6 +23,78 @@ except ImportError:
     TIKTOKEN_AVAILABLE = False
 
 
+# Process-wide encoder registry: tiktoken encoders are expensive to build
+_ENCODERS: Dict[str, Any] = {}
+_ENCODERS_LOCK = threading.Lock()
+
+
+def get_encoder(encoding_name: str) -> Optional[Any]:
+    """Get a shared tiktoken encoder by name.
+
+    Encoders are built once per process; failures are remembered too.
+
+    Args:
+        encoding_name: tiktoken encoding name (e.g. "cl100k_base")
+
+    Returns:
+        Encoder, or None if tiktoken or the encoding is unavailable
+    """
+    if not TIKTOKEN_AVAILABLE or encoding_name == "char_estimate":
+        return None
+    encoder = _ENCODERS.get(encoding_name, False)
+    if encoder is not False:
+        return encoder
+    with _ENCODERS_LOCK:
+        if encoding_name not in _ENCODERS:
+            try:
+                _ENCODERS[encoding_name] = tiktoken.get_encoding(encoding_name)
+            except Exception:
+                _ENCODERS[encoding_name] = None
+        return _ENCODERS[encoding_name]
+
+
+class _CountCache:
+    """Thread-safe LRU of token counts keyed by (encoding, content hash)."""
+
+    def __init__(self, maxsize: int = 16384):
+        self.maxsize = maxsize
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(encoding: str, text: str) -> Tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16)
+        return encoding, digest.digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._counts.move_to_end(key)
+            self.hits += 1
+            return count
+
+    def put(self, key: Tuple[str, bytes], count: int) -> None:
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_COUNT_CACHE = _CountCache()
+
+
 @dataclass
 class TokenCount:
     """Result of token counting.
@@ -96,6 +172,12 @@ class TokenCounter:
     # Average characters per token for estimation
     CHARS_PER_TOKEN = 4
 
+    # Per-message overhead for chat-format models (role and separators)
+    MESSAGE_OVERHEAD = 4
+
+    # Texts shorter than this are counted without consulting the cache
+    MIN_CACHED_LENGTH = 64
+
     def __init__(self, model: str = "gpt-4", encoding: Optional[str] = None):
         """Initialize token counter.
 
@@ -105,15 +187,12 @@ class TokenCounter:
         """
         self.model = model
         self._encoding_name = encoding or self._get_encoding_name(model)
-        self._encoder = None
 
-        # Initialize tiktoken encoder if available
-        if TIKTOKEN_AVAILABLE and self._encoding_name not in ["char_estimate"]:
-            try:
-                self._encoder = tiktoken.get_encoding(self._encoding_name)
-            except Exception:
-                # Fall back to estimation
-                self._encoding_name = "char_estimate"
+        # Shared tiktoken encoder if available
+        self._encoder = get_encoder(self._encoding_name)
+        if self._encoder is None:
+            # Fall back to estimation
+            self._encoding_name = "char_estimate"
 
     def _get_encoding_name(self, model: str) -> str:
         """Get encoding name for a model."""
@@ -129,6 +208,11 @@ class TokenCounter:
         # Default to character estimation
         return "char_estimate"
 
+    @property
+    def method(self) -> str:
+        """Counting method: "tiktoken" or "char_estimate"."""
+        return "tiktoken" if self._encoder else "char_estimate"
+
     def count(self, text: Union[str, List[Dict[str, Any]]], is_output: bool = False) -> TokenCount:
         """Count tokens in text or messages.
 
@@ -144,12 +228,8 @@ class TokenCounter:
             text = self._messages_to_text(text)
 
         # Count tokens
-        if self._encoder:
-            tokens = len(self._encoder.encode(text))
-            method = "tiktoken"
-        else:
-            tokens = self._estimate_tokens(text)
-            method = "char_estimate"
+        tokens = self.count_text(text)
+        method = self.method
 
         # Create result
         if is_output:
@@ -161,11 +241,94 @@ class TokenCounter:
                 input_tokens=tokens, total_tokens=tokens, model=self.model, method=method
             )
 
+    def count_text(self, text: str) -> int:
+        """Count tokens in a string, using the shared count cache.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Number of tokens
+        """
+        if len(text) < self.MIN_CACHED_LENGTH:
+            return self._count_uncached(text)
+        key = _CountCache.key(self._encoding_name, text)
+        tokens = _COUNT_CACHE.get(key)
+        if tokens is None:
+            tokens = self._count_uncached(text)
+            _COUNT_CACHE.put(key, tokens)
+        return tokens
+
+    def count_batch(self, texts: Iterable[str], max_workers: Optional[int] = None) -> List[int]:
+        """Count tokens for many texts in one call.
+
+        Cached texts are answered immediately; the rest are encoded together
+        with the encoder's batch API (tiktoken's ``encode_batch``). Encoders
+        without one use a thread pool when ``max_workers`` is set.
+
+        Args:
+            texts: Texts to count
+            max_workers: Encoder threads (None = the batch encoder's default,
+                or the calling thread for encoders without a batch API)
+
+        Returns:
+            Token count per text, in input order
+        """
+        texts = list(texts)
+        counts: List[Optional[int]] = [None] * len(texts)
+        keys: Dict[int, Tuple[str, bytes]] = {}
+        pending: List[int] = []
+
+        for i, text in enumerate(texts):
+            if len(text) >= self.MIN_CACHED_LENGTH:
+                keys[i] = _CountCache.key(self._encoding_name, text)
+                counts[i] = _COUNT_CACHE.get(keys[i])
+            if counts[i] is None:
+                pending.append(i)
+
+        if pending:
+            batch = [texts[i] for i in pending]
+            if self._encoder is None:
+                results = [self._estimate_tokens(t) for t in batch]
+            elif hasattr(self._encoder, "encode_batch"):
+                options = {"num_threads": max_workers} if max_workers else {}
+                encoded = self._encoder.encode_batch(batch, **options)
+                results = [len(tokens) for tokens in encoded]
+            elif max_workers:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    results = list(pool.map(self._count_uncached, batch))
+            else:
+                results = [self._count_uncached(t) for t in batch]
+
+            for i, tokens in zip(pending, results):
+                counts[i] = tokens
+                if i in keys:
+                    _COUNT_CACHE.put(keys[i], tokens)
+
+        return counts  # type: ignore[return-value]
+
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """Count tokens in a single chat message, including overhead.
+
+        Args:
+            message: Message dict with role/content
+
+        Returns:
+            Number of tokens
+        """
+        tokens = self.count_text(self._messages_to_text([message]))
+        if self._encoder:
+            tokens += self.MESSAGE_OVERHEAD
+        return tokens
+
     def count_messages(
         self, messages: List[Dict[str, Any]], completion: Optional[str] = None
     ) -> TokenCount:
         """Count tokens in a conversation.
 
+        Messages are counted individually, so repeated calls over a growing
+        conversation only encode messages that haven't been seen before.
+
         Args:
             messages: List of message dicts with role/content
             completion: Optional assistant completion
@@ -174,33 +337,32 @@ class TokenCounter:
             TokenCount with input and output tokens
         """
         # Count input tokens (messages)
-        input_text = self._messages_to_text(messages)
-
+        texts = [self._messages_to_text([msg]) for msg in messages]
+        input_tokens = sum(self.count_batch(texts))
         if self._encoder:
-            input_tokens = len(self._encoder.encode(input_text))
             # Add per-message overhead (4 tokens per message for GPT models)
-            input_tokens += len(messages) * 4
-            method = "tiktoken"
-        else:
-            input_tokens = self._estimate_tokens(input_text)
-            method = "char_estimate"
+            input_tokens += len(messages) * self.MESSAGE_OVERHEAD
 
         # Count output tokens
-        output_tokens = 0
-        if completion:
-            if self._encoder:
-                output_tokens = len(self._encoder.encode(completion))
-            else:
-                output_tokens = self._estimate_tokens(completion)
+        output_tokens = self.count_text(completion) if completion else 0
 
         return TokenCount(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=input_tokens + output_tokens,
             model=self.model,
-            method=method,
+            method=self.method,
         )
 
+    def conversation(self) -> "ConversationTokenCounter":
+        """Create an incremental counter for a growing conversation."""
+        return ConversationTokenCounter(self)
+
+    def _count_uncached(self, text: str) -> int:
+        if self._encoder:
+            return len(self._encoder.encode(text))
+        return self._estimate_tokens(text)
+
     def _messages_to_text(self, messages: List[Dict[str, Any]]) -> str:
         """Convert message list to text."""
         parts = []
@@ -257,6 +419,112 @@ class TokenCounter:
             return f"[{len(tokens)} tokens]"
 
 
+class ConversationTokenCounter:
+    """Running token tally for a conversation that only grows.
+
+    Each message is counted once when added; ``update`` accepts the full
+    message list and counts only the new tail.
+
+    Example:
+        tally = TokenCounter("gpt-4").conversation()
+        tally.update(session.messages)   # counts everything
+        session.add_user_message("Hi")
+        tally.update(session.messages)   # counts one message
+        print(tally.total)
+    """
+
+    def __init__(self, counter: Optional[TokenCounter] = None, model: str = "gpt-4"):
+        """Initialize tally.
+
+        Args:
+            counter: TokenCounter to use (default: shared counter for ``model``)
+            model: Model name when no counter is given
+        """
+        self.counter = counter or get_counter(model)
+        self.total = 0
+        self._counts: List[int] = []
+        self._seen: List[Tuple[Any, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, message: Dict[str, Any]) -> int:
+        """Count one new message.
+
+        Returns:
+            Tokens in the message
+        """
+        tokens = self.counter.count_message(message)
+        self._counts.append(tokens)
+        self._seen.append((message.get("role"), message.get("content")))
+        self.total += tokens
+        return tokens
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> int:
+        """Count several new messages.
+
+        Returns:
+            Updated total
+        """
+        for message in messages:
+            self.add(message)
+        return self.total
+
+    def update(self, messages: List[Dict[str, Any]]) -> int:
+        """Sync with the full conversation, counting only unseen messages.
+
+        If the conversation was truncated or rewritten (shorter than the
+        tally, or its last counted message changed), it is recounted.
+
+        Returns:
+            Updated total
+        """
+        seen = len(self._counts)
+        if seen > len(messages) or (
+            seen
+            and (messages[seen - 1].get("role"), messages[seen - 1].get("content"))
+            != self._seen[-1]
+        ):
+            self.reset()
+            seen = 0
+        return self.extend(messages[seen:])
+
+    def pop(self) -> int:
+        """Forget the most recent message.
+
+        Returns:
+            Tokens removed
+        """
+        tokens = self._counts.pop()
+        self._seen.pop()
+        self.total -= tokens
+        return tokens
+
+    def reset(self) -> None:
+        """Clear the tally."""
+        self.total = 0
+        self._counts.clear()
+        self._seen.clear()
+
+
+_COUNTERS: Dict[str, TokenCounter] = {}
+
+
+def get_counter(model: str = "gpt-4") -> TokenCounter:
+    """Get a shared TokenCounter for a model.
+
+    Args:
+        model: Model for encoding
+
+    Returns:
+        TokenCounter reused across calls
+    """
+    counter = _COUNTERS.get(model)
+    if counter is None:
+        counter = _COUNTERS.setdefault(model, TokenCounter(model))
+    return counter
+
+
 def count_tokens(text: Union[str, List[Dict[str, Any]]], model: str = "gpt-4") -> int:
     """Count tokens in text.
 
@@ -272,8 +540,7 @@ def count_tokens(text: Union[str, List[Dict[str, Any]]], model: str = "gpt-4") -
     Example:
         tokens = count_tokens("Hello, world!", model="gpt-4")
     """
-    counter = TokenCounter(model)
-    result = counter.count(text)
+    result = get_counter(model).count(text)
     return result.input_tokens
 
 
@@ -8,14 +8,85 @@ Automatically discover and load tools from directories.
 Like Strands Agents' load_tools_from_directory.
 """
 
+import ast
+import hashlib
 import importlib.util
 import inspect
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 from .base import Tool
 
 
+@dataclass
+class ToolDiff:
+    """Tools added, changed and removed by (re)loading files.
+
+    Attributes:
+        added: Tools that were not registered before
+        changed: Registered tools whose definition changed
+        removed: Names of tools that disappeared
+    """
+
+    added: List[Tool] = field(default_factory=list)
+    changed: List[Tool] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def tools(self) -> List[Tool]:
+        """Added and changed tools."""
+        return self.added + self.changed
+
+    def merge(self, other: "ToolDiff") -> "ToolDiff":
+        """Fold another diff into this one."""
+        self.added.extend(other.added)
+        self.changed.extend(other.changed)
+        self.removed.extend(other.removed)
+        return self
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def _fingerprints(tools: List[Tool], source: bytes) -> Dict[str, str]:
+    """Hash each tool's definition.
+
+    A fingerprint covers the tool's metadata, the code of its own function and
+    every other top-level statement in the file (imports, constants, helpers),
+    since the function may read any of them. Formatting and comments are
+    ignored.
+    """
+    module = ast.parse(source)
+    defs = {
+        node.name: node
+        for node in module.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+    func_names = {tool.name: getattr(inspect.unwrap(tool.func), "__name__", None) for tool in tools}
+    own = {name for name in func_names.values() if name in defs}
+    shared = "".join(
+        ast.dump(node)
+        for node in module.body
+        if not (isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in own)
+    )
+
+    fingerprints = {}
+    for tool in tools:
+        func_name = func_names[tool.name]
+        body = ast.dump(defs[func_name]) if func_name in own else ""
+        payload = json.dumps(
+            [tool.description, tool.parameters, tool.returns, tool.tags, body, shared],
+            sort_keys=True,
+            default=str,
+        )
+        fingerprints[tool.name] = hashlib.blake2b(
+            payload.encode("utf-8"), digest_size=16
+        ).hexdigest()
+    return fingerprints
+
+
 class ToolDiscovery:
     """Discover and manage tools from directories.
 
@@ -33,6 +104,7 @@ class ToolDiscovery:
         self._tools: Dict[str, Tool] = {}
         self._watched_dirs: Dict[str, Path] = {}
         self._tool_sources: Dict[str, str] = {}  # tool_name -> source_file
+        self._file_tools: Dict[str, Dict[str, str]] = {}  # source_file -> {tool: fingerprint}
 
     def scan(
         self, directory: Union[str, Path], recursive: bool = True, pattern: str = "*.py"
@@ -80,49 +152,112 @@ class ToolDiscovery:
         Returns:
             List of tools found in file
         """
-        tools = []
+        self.load_file(file_path)
+        return [self._tools[name] for name in self._file_tools.get(str(file_path), {})]
 
-        try:
-            # Load module from file
-            spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
-            if spec is None or spec.loader is None:
-                return []
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Find tools in module
-            for name, obj in inspect.getmembers(module):
-                # Skip private/dunder names
-                if name.startswith("_"):
-                    continue
-
-                # Check if it's already a Tool
-                if isinstance(obj, Tool):
-                    self._tools[obj.name] = obj
-                    self._tool_sources[obj.name] = str(file_path)
-                    tools.append(obj)
-
-                # Check if it's a decorated function with tool marker
-                elif callable(obj) and hasattr(obj, "_is_tool"):
-                    tool = Tool.from_function(obj)
-                    self._tools[tool.name] = tool
-                    self._tool_sources[tool.name] = str(file_path)
-                    tools.append(tool)
-
-                # Check if it's a function that looks like a tool
-                elif callable(obj) and inspect.isfunction(obj) and obj.__doc__ is not None:
-                    # Has docstring, could be a tool
-                    tool = Tool.from_function(obj)
-                    self._tools[tool.name] = tool
-                    self._tool_sources[tool.name] = str(file_path)
-                    tools.append(tool)
+    def load_file(self, file_path: Union[str, Path], source: Optional[bytes] = None) -> ToolDiff:
+        """Load or reload the tools defined in a file.
+
+        Every tool is replaced by the object from the new execution, but
+        only tools whose definition changed (see ``_fingerprints``) are
+        reported as changed. Tools no longer defined in the file are
+        unregistered. If the file fails to load, its previous tools stay
+        registered.
 
+        Args:
+            file_path: Path to Python file
+            source: File content, if already read
+
+        Returns:
+            What changed in the registry
+        """
+        file_path = Path(file_path)
+        path = str(file_path)
+        try:
+            if source is None:
+                source = file_path.read_bytes()
+            tools = self._exec_tools(file_path, source)
         except Exception as e:
             # Log but don't fail on individual file errors
             print(f"Warning: Error loading tools from {file_path}: {e}")
+            return ToolDiff()
+
+        previous = self._file_tools.get(path, {})
+        current = _fingerprints(tools, source)
+        diff = ToolDiff()
+
+        for tool in tools:
+            # Always take the new object: unchanged-looking tools still close over
+            # the freshly executed module's globals
+            if tool.name in previous and tool.name in self._tools:
+                if previous[tool.name] != current[tool.name]:
+                    diff.changed.append(tool)
+            elif tool.name in self._tools:
+                diff.changed.append(tool)
+            else:
+                diff.added.append(tool)
+            self._tools[tool.name] = tool
+            self._tool_sources[tool.name] = path
+
+        for name in previous:
+            if name not in current and self._tool_sources.get(name) == path:
+                del self._tools[name]
+                del self._tool_sources[name]
+                diff.removed.append(name)
+
+        self._file_tools[path] = current
+        return diff
+
+    def unload_file(self, file_path: Union[str, Path]) -> ToolDiff:
+        """Unregister every tool loaded from a file.
+
+        Args:
+            file_path: Path of the (usually deleted) file
+
+        Returns:
+            Diff listing the removed tools
+        """
+        path = str(file_path)
+        diff = ToolDiff()
+        for name in self._file_tools.pop(path, {}):
+            if self._tool_sources.get(name) == path:
+                del self._tools[name]
+                del self._tool_sources[name]
+                diff.removed.append(name)
+        return diff
+
+    def _exec_tools(self, file_path: Path, source: bytes) -> List[Tool]:
+        """Execute a module's source and collect its tools without registering them."""
+        spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
+        if spec is None or spec.loader is None:
+            return []
+
+        module = importlib.util.module_from_spec(spec)
+        # Compile the given bytes so the tools match the content that was hashed
+        exec(compile(source, str(file_path), "exec"), module.__dict__)
+
+        tools: Dict[str, Tool] = {}
+        for name, obj in inspect.getmembers(module):
+            # Skip private/dunder names
+            if name.startswith("_"):
+                continue
+
+            # Check if it's already a Tool
+            if isinstance(obj, Tool):
+                tools[obj.name] = obj
+
+            # Check if it's a decorated function with tool marker
+            elif callable(obj) and hasattr(obj, "_is_tool"):
+                tool = Tool.from_function(obj)
+                tools[tool.name] = tool
+
+            # Check if it's a function that looks like a tool
+            elif callable(obj) and inspect.isfunction(obj) and obj.__doc__ is not None:
+                # Has docstring, could be a tool
+                tool = Tool.from_function(obj)
+                tools[tool.name] = tool
 
-        return tools
+        return list(tools.values())
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
@@ -165,8 +300,9 @@ class ToolDiscovery:
         """Remove a tool."""
         if tool_name in self._tools:
             del self._tools[tool_name]
-            if tool_name in self._tool_sources:
-                del self._tool_sources[tool_name]
+            source = self._tool_sources.pop(tool_name, None)
+            if source is not None:
+                self._file_tools.get(source, {}).pop(tool_name, None)
             return True
         return False
 
@@ -174,6 +310,7 @@ class ToolDiscovery:
         """Clear all discovered tools."""
         self._tools.clear()
         self._tool_sources.clear()
+        self._file_tools.clear()
 
 
 def discover_tools(
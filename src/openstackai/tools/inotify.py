@@ -0,0 +1,227 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+Minimal Linux inotify binding.
+
+Uses the C library through ctypes, so no extra dependency is needed. The
+watcher thread blocks in ``select`` on the inotify descriptor and a wakeup
+pipe, which costs no CPU while nothing changes.
+
+``inotify_available()`` reports whether the running platform supports it;
+callers fall back to polling otherwise.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+# Event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# Everything that can change the set or content of files in a directory
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.inotify_rm_watch.restype = ctypes.c_int
+        _libc = libc
+    return _libc
+
+
+def inotify_available() -> bool:
+    """Whether inotify can be used on this platform."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = _load_libc()
+    except (OSError, AttributeError):
+        return False
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        return False
+    os.close(fd)
+    return True
+
+
+class InotifyEvent(NamedTuple):
+    """A decoded inotify event."""
+
+    path: str  # Watched directory joined with the entry name
+    mask: int
+    cookie: int
+
+    @property
+    def is_dir(self) -> bool:
+        return bool(self.mask & IN_ISDIR)
+
+
+class Inotify:
+    """
+    An inotify instance watching a set of directories.
+
+    Example:
+        >>> with Inotify() as notifier:
+        ...     notifier.add_watch("./tools")
+        ...     for event in notifier.read(timeout=1.0):
+        ...         print(event.path)
+    """
+
+    def __init__(self):
+        """
+        Create the inotify descriptor and wakeup pipe.
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        libc = _load_libc()
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        self._paths: Dict[int, str] = {}
+        self._closed = False
+
+    def add_watch(self, path: str, mask: int = WATCH_MASK) -> int:
+        """
+        Watch a directory.
+
+        Returns:
+            Watch descriptor
+
+        Raises:
+            OSError: If the watch cannot be added (missing path, watch limit)
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}", path)
+        self._paths[wd] = path
+        return wd
+
+    def remove_watch(self, path: str) -> None:
+        """Stop watching a directory (no-op if it is not watched)."""
+        for wd, watched in list(self._paths.items()):
+            if watched == path:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._paths[wd]
+
+    @property
+    def watched(self) -> List[str]:
+        """Directories currently watched."""
+        return list(self._paths.values())
+
+    def read(self, timeout: Optional[float] = None) -> List[InotifyEvent]:
+        """
+        Wait for events.
+
+        Args:
+            timeout: Seconds to wait (None = until an event or ``wake``)
+
+        Returns:
+            Decoded events; empty on timeout or wakeup. An ``IN_Q_OVERFLOW``
+            event (path "") means events were lost and callers should rescan.
+        """
+        if self._closed:
+            return []
+        readable, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+        if self._wake_read in readable:
+            try:
+                while os.read(self._wake_read, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        if self._fd not in readable:
+            return []
+
+        events: List[InotifyEvent] = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            events.extend(self._decode(data))
+        return events
+
+    def _decode(self, data: bytes) -> List[InotifyEvent]:
+        events = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            directory = self._paths.get(wd, "")
+            if mask & IN_IGNORED:
+                # Watch removed by the kernel (directory deleted or unmounted)
+                self._paths.pop(wd, None)
+            path = os.path.join(directory, name) if name else directory
+            events.append(InotifyEvent(path, mask, cookie))
+        return events
+
+    def wake(self) -> None:
+        """Make a blocked ``read`` return immediately."""
+        try:
+            os.write(self._wake_write, b"x")
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Release the descriptors."""
+        if self._closed:
+            return
+        self._closed = True
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._paths.clear()
+
+    def __enter__(self) -> "Inotify":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
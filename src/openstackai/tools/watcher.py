@@ -5,16 +5,44 @@
 Tool Watcher
 
 Watch directories for tool changes and hot-reload.
+
+On Linux the watcher blocks on inotify events, so an idle watcher uses no
+CPU however many files it covers; elsewhere it polls file stats. Bursts of
+events (an editor's save, a git checkout) are debounced into one reload.
+A file is only re-executed when its content hash changed, and every reload
+reports which tools were added, changed or removed.
 """
 
+import hashlib
 import os
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from .base import Tool
-from .discovery import ToolDiscovery
+from .discovery import ToolDiff, ToolDiscovery
+from .inotify import (
+    IN_CREATE,
+    IN_DELETE,
+    IN_DELETE_SELF,
+    IN_MOVE_SELF,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    Inotify,
+    InotifyEvent,
+    inotify_available,
+)
+
+BACKENDS = ("auto", "inotify", "poll")
+
+# Longest a steady stream of events can postpone a reload, in debounce periods
+_MAX_DEBOUNCE_PERIODS = 10
+
+
+def _is_tool_file(name: str) -> bool:
+    return name.endswith(".py") and name != "__init__.py"
 
 
 class ToolWatcher:
@@ -25,6 +53,7 @@ class ToolWatcher:
     Example:
         watcher = ToolWatcher("./my_tools/")
         watcher.on_change = lambda tools: print(f"Reloaded {len(tools)} tools")
+        watcher.on_diff = lambda diff: print(f"Removed {diff.removed}")
         watcher.start()
 
         # Later...
@@ -38,26 +67,43 @@ class ToolWatcher:
         poll_interval: float = 1.0,
         on_change: Optional[Callable[[List[Tool]], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        *,
+        on_diff: Optional[Callable[[ToolDiff], None]] = None,
+        backend: str = "auto",
+        debounce: float = 0.1,
     ):
         """Initialize watcher.
 
         Args:
             directory: Directory to watch
             recursive: Watch subdirectories
-            poll_interval: Seconds between checks
-            on_change: Callback when tools change
+            poll_interval: Seconds between checks (poll backend)
+            on_change: Callback with the added and changed tools
             on_error: Callback on errors
+            on_diff: Callback with the full ToolDiff, including removals
+            backend: "inotify", "poll", or "auto" (inotify where available)
+            debounce: Seconds without events before a burst is reloaded
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+
         self.directory = Path(directory)
         self.recursive = recursive
         self.poll_interval = poll_interval
         self.on_change = on_change
         self.on_error = on_error
+        self.on_diff = on_diff
+        self.backend = backend
+        self.debounce = debounce
 
         self._discovery = ToolDiscovery()
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._file_mtimes: Dict[str, float] = {}
+        self._stop = threading.Event()
+        self._notifier: Optional[Inotify] = None
+        self._active_backend: Optional[str] = None
+        self._hashes: Dict[str, str] = {}  # path -> content hash of the loaded version
+        self._stats: Dict[str, Tuple[int, int]] = {}  # path -> (mtime_ns, size), poll backend
         self._lock = threading.Lock()
 
     def start(self, daemon: bool = True):
@@ -65,121 +111,230 @@ class ToolWatcher:
 
         Args:
             daemon: Run as daemon thread (stops with main thread)
+
+        Raises:
+            RuntimeError: If backend="inotify" and inotify is unavailable
         """
         if self._running:
             return
 
+        use_inotify = self.backend != "poll" and inotify_available()
+        if self.backend == "inotify" and not use_inotify:
+            raise RuntimeError("inotify is not available on this platform")
+
         self._running = True
+        self._stop.clear()
+
+        if use_inotify:
+            # Watch before the initial scan so no change slips in between
+            self._notifier = Inotify()
+            self._watch_tree(str(self.directory))
+            self._active_backend = "inotify"
+            target = self._inotify_loop
+        else:
+            self._stats = self._stat_files()
+            self._active_backend = "poll"
+            target = self._poll_loop
 
         # Initial scan
-        self._scan_files()
-        self._discovery.scan(self.directory, self.recursive)
+        self.refresh(self._list_files())
 
         # Start watch thread
-        self._thread = threading.Thread(target=self._watch_loop, daemon=daemon)
+        self._thread = threading.Thread(
+            target=target, name="openstackai-tool-watcher", daemon=daemon
+        )
         self._thread.start()
 
     def stop(self):
         """Stop watching."""
         self._running = False
+        self._stop.set()
+        if self._notifier:
+            self._notifier.wake()
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        if self._notifier:
+            self._notifier.close()
+            self._notifier = None
 
-    def _watch_loop(self):
-        """Main watch loop."""
-        while self._running:
-            try:
-                changed_files = self._check_changes()
-
-                if changed_files:
-                    # Reload changed files
-                    new_tools = []
-                    for file_path in changed_files:
-                        tools = self._discovery._load_tools_from_file(Path(file_path))
-                        new_tools.extend(tools)
-
-                    # Trigger callback
-                    if self.on_change and new_tools:
-                        try:
-                            self.on_change(new_tools)
-                        except Exception as e:
-                            if self.on_error:
-                                self.on_error(e)
+    # ========== Reloading ==========
 
-            except Exception as e:
-                if self.on_error:
-                    self.on_error(e)
-
-            time.sleep(self.poll_interval)
+    def refresh(self, paths: Iterable[Union[str, Path]]) -> ToolDiff:
+        """Reload the given files if their content changed.
 
-    def _scan_files(self) -> Set[str]:
-        """Scan directory for Python files."""
-        files = set()
+        Missing files have their tools unregistered.
 
-        if self.recursive:
-            for file_path in self.directory.rglob("*.py"):
-                if "__pycache__" not in str(file_path):
-                    files.add(str(file_path))
-                    self._file_mtimes[str(file_path)] = os.path.getmtime(file_path)
-        else:
-            for file_path in self.directory.glob("*.py"):
-                files.add(str(file_path))
-                self._file_mtimes[str(file_path)] = os.path.getmtime(file_path)
-
-        return files
-
-    def _check_changes(self) -> List[str]:
-        """Check for file changes.
+        Args:
+            paths: Files to check
 
         Returns:
-            List of changed file paths
+            Combined diff of the reloads
         """
-        changed = []
-        current_files = set()
-
-        # Scan current files
-        if self.recursive:
-            iterator = self.directory.rglob("*.py")
-        else:
-            iterator = self.directory.glob("*.py")
-
-        for file_path in iterator:
-            if "__pycache__" in str(file_path):
+        diff = ToolDiff()
+        with self._lock:
+            for path in sorted({str(p) for p in paths}):
+                try:
+                    source = Path(path).read_bytes()
+                except OSError:
+                    if self._hashes.pop(path, None) is not None:
+                        diff.merge(self._discovery.unload_file(path))
+                    continue
+
+                digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+                if self._hashes.get(path) == digest:
+                    continue
+                self._hashes[path] = digest
+                diff.merge(self._discovery.load_file(path, source))
+        return diff
+
+    def _emit(self, diff: ToolDiff) -> None:
+        """Trigger callbacks for a non-empty diff."""
+        if not diff:
+            return
+        try:
+            if self.on_diff:
+                self.on_diff(diff)
+            if self.on_change and diff.tools:
+                self.on_change(diff.tools)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(e)
+
+    # ========== Directory Walking ==========
+
+    def _walk(self, top: str) -> Iterable[Tuple[str, List[os.DirEntry]]]:
+        """Yield each directory under ``top`` with its entries."""
+        pending = [top]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
                 continue
+            yield directory, entries
+            if self.recursive:
+                for entry in entries:
+                    if entry.name != "__pycache__" and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+
+    def _list_files(self, top: Optional[str] = None) -> List[str]:
+        """List tool files under ``top`` (default: the watched directory)."""
+        return [
+            entry.path
+            for _, entries in self._walk(top or str(self.directory))
+            for entry in entries
+            if _is_tool_file(entry.name) and entry.is_file()
+        ]
+
+    # ========== Inotify Backend ==========
+
+    def _watch_tree(self, top: str) -> List[str]:
+        """Watch ``top`` and its subdirectories; return the tool files inside."""
+        files = []
+        for directory, entries in self._walk(top):
+            try:
+                self._notifier.add_watch(directory)
+            except OSError as e:
+                if self.on_error:
+                    self.on_error(e)
+            files.extend(
+                entry.path for entry in entries if _is_tool_file(entry.name) and entry.is_file()
+            )
+        return files
 
-            file_str = str(file_path)
-            current_files.add(file_str)
-
+    def _inotify_loop(self):
+        """Block on inotify; reload once a burst of events goes quiet."""
+        notifier = self._notifier
+        while self._running:
             try:
-                mtime = os.path.getmtime(file_path)
+                events = notifier.read()
+                if not events:
+                    continue
 
-                if file_str not in self._file_mtimes:
-                    # New file
-                    self._file_mtimes[file_str] = mtime
-                    changed.append(file_str)
-                elif mtime > self._file_mtimes[file_str]:
-                    # Modified file
-                    self._file_mtimes[file_str] = mtime
-                    changed.append(file_str)
+                deadline = time.monotonic() + self.debounce * _MAX_DEBOUNCE_PERIODS
+                while self._running and time.monotonic() < deadline:
+                    more = notifier.read(timeout=self.debounce)
+                    if not more:
+                        break
+                    events.extend(more)
 
-            except OSError:
-                # File might have been deleted
-                pass
+                self._emit(self.refresh(self._changed_paths(events)))
 
-        # Check for deleted files
-        with self._lock:
-            deleted = set(self._file_mtimes.keys()) - current_files
-            for file_str in deleted:
-                del self._file_mtimes[file_str]
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
 
-        return changed
+    def _changed_paths(self, events: List[InotifyEvent]) -> Set[str]:
+        """Turn inotify events into the set of files to re-check."""
+        paths: Set[str] = set()
+        rescan = False
+        for event in events:
+            if event.mask & IN_Q_OVERFLOW:
+                # The kernel dropped events; re-check everything
+                rescan = True
+            elif event.mask & (IN_DELETE_SELF | IN_MOVE_SELF) or (
+                event.is_dir and event.mask & (IN_DELETE | IN_MOVED_FROM)
+            ):
+                prefix = event.path + os.sep
+                paths.update(path for path in self._hashes if path.startswith(prefix))
+                if event.mask & IN_MOVED_FROM:
+                    self._notifier.remove_watch(event.path)
+            elif event.is_dir:
+                if self.recursive and event.mask & (IN_CREATE | IN_MOVED_TO):
+                    paths.update(self._watch_tree(event.path))
+            elif _is_tool_file(os.path.basename(event.path)):
+                paths.add(event.path)
+
+        if rescan:
+            paths.update(self._hashes)
+            paths.update(self._list_files())
+        return paths
+
+    # ========== Poll Backend ==========
+
+    def _stat_files(self) -> Dict[str, Tuple[int, int]]:
+        """Get (mtime_ns, size) for every tool file."""
+        stats = {}
+        for _, entries in self._walk(str(self.directory)):
+            for entry in entries:
+                if not _is_tool_file(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                stats[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _poll_loop(self):
+        """Compare file stats every poll_interval."""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                current = self._stat_files()
+                previous, self._stats = self._stats, current
+                changed = {path for path, stat in current.items() if previous.get(path) != stat}
+                changed.update(path for path in previous if path not in current)
+                if changed:
+                    self._emit(self.refresh(changed))
+
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+
+    # ========== Properties ==========
 
     @property
     def tools(self) -> List[Tool]:
         """Get current tools."""
         return self._discovery.get_all_tools()
 
+    @property
+    def active_backend(self) -> Optional[str]:
+        """Backend in use ("inotify" or "poll"), or None before start."""
+        return self._active_backend
+
     @property
     def is_running(self) -> bool:
         """Check if watcher is running."""
@@ -192,6 +347,7 @@ def watch_tools(
     recursive: bool = True,
     poll_interval: float = 1.0,
     background: bool = True,
+    backend: str = "auto",
 ) -> ToolWatcher:
     """Watch a directory for tool changes.
 
@@ -201,8 +357,9 @@ def watch_tools(
         directory: Directory to watch
         on_change: Callback when tools change
         recursive: Watch subdirectories
-        poll_interval: Seconds between checks
+        poll_interval: Seconds between checks (poll backend)
         background: Start in background
+        backend: "inotify", "poll", or "auto"
 
     Returns:
         ToolWatcher instance
@@ -216,7 +373,11 @@ def watch_tools(
         # watcher.stop() when done
     """
     watcher = ToolWatcher(
-        directory=directory, recursive=recursive, poll_interval=poll_interval, on_change=on_change
+        directory=directory,
+        recursive=recursive,
+        poll_interval=poll_interval,
+        on_change=on_change,
+        backend=backend,
     )
 
     if background:
@@ -9,6 +9,7 @@ Unified interface for vector databases with support for:
 - Pinecone (cloud)
 - Weaviate (cloud/self-hosted)
 - Qdrant (cloud/self-hosted)
+- IVF approximate nearest-neighbour index (local, NumPy)
 - In-memory (testing)
 
 Example:
@@ -21,6 +22,9 @@ Example:
     # Search
     results = store.search("greeting", k=5)
 
+    # Filter on metadata
+    results = store.search("greeting", filter={"source": {"$in": ["example", "docs"]}})
+
     # Use ChromaDB
     store = ChromaStore(collection="my_docs")
 """
@@ -29,8 +33,12 @@ from .base import (
     Document,
     SearchResult,
     VectorStore,
+    evaluate_filter,
+    matches_filter,
+    normalize_filter,
 )
 from .chroma import ChromaStore
+from .ivf import IVFStore
 from .memory import MemoryVectorStore
 from .pinecone import PineconeStore
 from .qdrant import QdrantStore
@@ -41,8 +49,13 @@ __all__ = [
     "VectorStore",
     "SearchResult",
     "Document",
+    # Filters
+    "normalize_filter",
+    "matches_filter",
+    "evaluate_filter",
     # Implementations
     "MemoryVectorStore",
+    "IVFStore",
     "ChromaStore",
     "PineconeStore",
     "WeaviateStore",
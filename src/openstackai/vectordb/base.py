@@ -10,6 +10,136 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+# Metadata filter grammar shared by all stores. A filter is either
+#   {"field": value}                       - equality (shorthand for $eq)
+#   {"field": {"$op": value}}              - comparison
+#   {"$and": [filter, ...]} / {"$or": [...]} - logical combinations
+# and a dict with several keys is an implicit $and. Backends receive the
+# canonical form from normalize_filter() and may push it down natively.
+COMPARISON_OPERATORS = ("$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$nin")
+LOGICAL_OPERATORS = ("$and", "$or")
+
+
+def normalize_filter(filter: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Validate a metadata filter and convert it to canonical form.
+
+    In canonical form every dict has exactly one key: either a logical
+    operator mapping to a list of canonical filters, or a field name mapping
+    to a single ``{"$op": value}`` comparison.
+
+    Args:
+        filter: Filter in the shared grammar (or None)
+
+    Returns:
+        Canonical filter, or None for an empty filter
+
+    Raises:
+        ValueError: If the filter uses an unknown operator or bad operand
+    """
+    if not filter:
+        return None
+    if not isinstance(filter, dict):
+        raise ValueError(f"Filter must be a dict, got {type(filter).__name__}")
+
+    clauses = []
+    for key, value in filter.items():
+        if key in LOGICAL_OPERATORS:
+            if not isinstance(value, (list, tuple)) or not value:
+                raise ValueError(f"{key} requires a non-empty list of filters")
+            children = [normalize_filter(child) for child in value]
+            children = [child for child in children if child is not None]
+            if len(children) == 1:
+                clauses.append(children[0])
+            elif children:
+                clauses.append({key: children})
+        elif key.startswith("$"):
+            raise ValueError(f"Unknown filter operator: {key}")
+        elif isinstance(value, dict) and any(k.startswith("$") for k in value):
+            for op, operand in value.items():
+                if op not in COMPARISON_OPERATORS:
+                    raise ValueError(f"Unknown filter operator: {op}")
+                if op in ("$in", "$nin") and not isinstance(operand, (list, tuple, set)):
+                    raise ValueError(f"{op} requires a list of values")
+                clauses.append({key: {op: operand}})
+        else:
+            clauses.append({key: {"$eq": value}})
+
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+def matches_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a metadata dict satisfies a filter.
+
+    Comparisons only match documents that have the field, so ``$ne`` and
+    ``$nin`` do not match documents missing it.
+
+    Args:
+        metadata: Document metadata
+        filter: Filter in the shared grammar (canonical or not)
+
+    Returns:
+        True if the metadata matches
+    """
+    return evaluate_filter(metadata, normalize_filter(filter))
+
+
+def evaluate_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a canonical filter against metadata.
+
+    Like ``matches_filter`` but skips normalization, for stores that
+    normalize a filter once and test it against many documents.
+
+    Args:
+        metadata: Document metadata
+        filter: Filter already passed through ``normalize_filter``
+
+    Returns:
+        True if the metadata matches
+    """
+    if filter is None:
+        return True
+    key, value = next(iter(filter.items()))
+    if key == "$and":
+        return all(evaluate_filter(metadata, child) for child in value)
+    if key == "$or":
+        return any(evaluate_filter(metadata, child) for child in value)
+    if key not in metadata:
+        return False
+    op, operand = next(iter(value.items()))
+    return compare_values(metadata[key], op, operand)
+
+
+def compare_values(actual: Any, op: str, operand: Any) -> bool:
+    """Apply a single comparison operator.
+
+    Range operators return False for values that cannot be ordered against
+    the operand instead of raising.
+    """
+    if op == "$eq":
+        return actual == operand
+    if op == "$ne":
+        return actual != operand
+    if op == "$in":
+        return actual in operand
+    if op == "$nin":
+        return actual not in operand
+    try:
+        if op == "$gt":
+            return actual > operand
+        if op == "$gte":
+            return actual >= operand
+        if op == "$lt":
+            return actual < operand
+        if op == "$lte":
+            return actual <= operand
+    except TypeError:
+        return False
+    raise ValueError(f"Unknown filter operator: {op}")
+
 
 @dataclass
 class Document:
@@ -168,7 +298,10 @@ class VectorStore(ABC):
         Args:
             query: Query text
             k: Number of results to return
-            filter: Metadata filter
+            filter: Metadata filter in the shared grammar (see
+                ``normalize_filter``): equality, ``$eq``/``$ne``,
+                ``$gt``/``$gte``/``$lt``/``$lte``, ``$in``/``$nin``
+                and ``$and``/``$or``
 
         Returns:
             List of search results
@@ -271,6 +404,25 @@ class EmbeddingFunction(ABC):
         """
         return self.embed([query])[0]
 
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed several queries.
+
+        Goes through ``embed_query`` when a subclass overrides it (e.g. an
+        asymmetric model with a separate query encoder), so batched and
+        single-query search give the same vectors. Otherwise the queries
+        are embedded in one ``embed`` call. Override to batch a dedicated
+        query encoder.
+
+        Args:
+            queries: Query texts
+
+        Returns:
+            One embedding per query, in input order
+        """
+        if type(self).embed_query is not EmbeddingFunction.embed_query:
+            return [self.embed_query(query) for query in queries]
+        return self.embed(list(queries))
+
     def embed_documents(self, documents: List[str]) -> List[List[float]]:
         """Embed documents (alias for embed).
 
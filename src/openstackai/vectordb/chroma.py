@@ -9,7 +9,7 @@ Requires: pip install chromadb
 
 from typing import Any, Dict, List, Optional
 
-from .base import Document, EmbeddingFunction, SearchResult, VectorStore
+from .base import Document, EmbeddingFunction, SearchResult, VectorStore, normalize_filter
 
 
 class ChromaStore(VectorStore):
@@ -168,8 +168,10 @@ class ChromaStore(VectorStore):
             "include": ["documents", "metadatas", "distances"],
         }
 
-        if filter:
-            kwargs["where"] = filter
+        # Chroma's where clause uses the same operator grammar
+        where = normalize_filter(filter)
+        if where:
+            kwargs["where"] = where
 
         results = collection.query(**kwargs)
 
@@ -0,0 +1,459 @@
+# Copyright (c) 2026 openstackai Contributors
+# Licensed under the MIT License
+
+"""
+IVF (inverted file) approximate nearest-neighbour vector store.
+
+Local ANN backend that needs no external service, only NumPy.
+
+Requires: pip install numpy
+"""
+
+import heapq
+import json
+import os
+from typing import Any, Dict, List, Optional, Set
+
+from .base import Document, EmbeddingFunction, SearchResult, VectorStore, normalize_filter
+from .memory import NUMPY_AVAILABLE, _MatrixIndex, _MetadataIndex
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+class IVFStore(VectorStore):
+    """Approximate nearest-neighbour store using an IVF-flat index.
+
+    Vectors are clustered with spherical k-means into ``n_lists``
+    inverted lists. A query is compared against the centroids and only the
+    ``nprobe`` closest lists are scanned, which trades a little recall for
+    a large latency win on big collections. Until ``train_size`` vectors
+    have been added (or ``train()`` is called) the store searches exactly.
+
+    Example:
+        store = IVFStore(embedding_function=embedder, n_lists=1024, nprobe=16)
+        store.add_texts(texts)
+
+        results = store.search("hello", k=5)
+        results = store.search("hello", k=5, nprobe=64)  # higher recall
+
+        store.save("./ivf_index")
+        store = IVFStore.load("./ivf_index", embedding_function=embedder)
+    """
+
+    def __init__(
+        self,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        n_lists: int = 256,
+        nprobe: int = 8,
+        train_size: Optional[int] = None,
+        kmeans_iterations: int = 20,
+        exact_filter_threshold: int = 10000,
+        indexed_fields: Optional[List[str]] = None,
+        seed: int = 0,
+    ):
+        """Initialize IVF store.
+
+        Args:
+            embedding_function: Function to compute embeddings
+            n_lists: Number of inverted lists (k-means clusters)
+            nprobe: Default number of lists scanned per query
+            train_size: Vectors needed before clustering runs automatically
+                (default: 39 per list)
+            kmeans_iterations: Lloyd iterations when training
+            exact_filter_threshold: Filters selecting at most this many
+                documents are searched exactly instead of by probing
+            indexed_fields: Metadata fields to index for filtering
+            seed: Random seed for k-means initialisation
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy package required. Install with: pip install numpy")
+
+        self._embedding_function = embedding_function
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.train_size = train_size if train_size is not None else n_lists * 39
+        self.kmeans_iterations = kmeans_iterations
+        self.exact_filter_threshold = exact_filter_threshold
+        self._seed = seed
+
+        self._documents: Dict[str, Document] = {}
+        self._metadata_index = _MetadataIndex(self._documents, indexed_fields)
+        self._centroids = None
+        self._lists: List[_MatrixIndex] = [self._new_list()]
+        self._assignments: Dict[str, int] = {}
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether vectors have been clustered into inverted lists."""
+        return self._centroids is not None
+
+    def add(
+        self,
+        id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        """Add a document to the store."""
+        if embedding is None:
+            if self._embedding_function is None:
+                raise ValueError("Embedding or embedding function required for IVFStore")
+            embedding = self._embedding_function.embed([content])[0]
+        self._insert(id, content, metadata, embedding)
+
+        if not self.is_trained and len(self._assignments) >= self.train_size:
+            self.train()
+
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Add multiple texts, embedding them in a single batch call."""
+        if ids is None:
+            ids = [Document.create(t).id for t in texts]
+        if metadatas is None:
+            metadatas = [{}] * len(texts)
+        if not texts:
+            return ids
+        if self._embedding_function is None:
+            raise ValueError("Embedding function required for add_texts")
+
+        embeddings = self._embedding_function.embed(list(texts))
+        for id, text, metadata, emb in zip(ids, texts, metadatas, embeddings):
+            self._insert(id, text, metadata, emb)
+
+        if not self.is_trained and len(self._assignments) >= self.train_size:
+            self.train()
+        return ids
+
+    def _insert(
+        self,
+        id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]],
+        embedding: List[float],
+    ) -> None:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        list_no = self._assign(vector[None, :])[0] if self.is_trained else 0
+
+        previous = self._assignments.get(id)
+        if previous is not None and previous != list_no:
+            self._lists[previous].remove(id)
+        self._lists[list_no].add(id, vector)
+        self._assignments[id] = list_no
+
+        document = Document(id=id, content=content, metadata=metadata or {}, embedding=None)
+        self._documents[id] = document
+        self._metadata_index.add(id, document.metadata)
+
+    def train(self, n_lists: Optional[int] = None) -> None:
+        """Cluster all stored vectors and rebuild the inverted lists.
+
+        Runs automatically once ``train_size`` vectors are stored; call it
+        again to rebalance after heavy inserts or deletes.
+
+        Args:
+            n_lists: Override the number of lists
+        """
+        if n_lists is not None:
+            self.n_lists = n_lists
+
+        ids: List[str] = []
+        parts = []
+        for index in self._lists:
+            list_ids, matrix = index.export()
+            if list_ids:
+                ids.extend(list_ids)
+                parts.append(matrix)
+        if not ids:
+            return
+
+        vectors = np.concatenate(parts)
+        n_lists = max(1, min(self.n_lists, len(ids)))
+        self._centroids = _spherical_kmeans(
+            vectors, n_lists, self.kmeans_iterations, np.random.default_rng(self._seed)
+        )
+
+        assignments = self._assign(vectors)
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(n_lists + 1))
+        self._lists = []
+        for list_no in range(n_lists):
+            rows = order[bounds[list_no] : bounds[list_no + 1]]
+            self._lists.append(
+                _MatrixIndex.from_matrix(
+                    [ids[row] for row in rows], vectors[rows], initial_capacity=16
+                )
+            )
+        self._assignments = {ids[row]: int(assignments[row]) for row in range(len(ids))}
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[SearchResult]:
+        """Search for similar documents.
+
+        Args:
+            query: Query text
+            k: Number of results to return
+            filter: Metadata filter
+            nprobe: Lists to scan for this query (default: ``self.nprobe``)
+
+        Returns:
+            List of search results
+        """
+        if self._embedding_function is None:
+            raise ValueError("Embedding function required for search")
+        return self.search_by_vector(self._embedding_function.embed_query(query), k, filter, nprobe)
+
+    def search_batch(
+        self,
+        queries: List[str],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for many queries, embedding them with ``embed_queries``."""
+        if not queries:
+            return []
+        embedder = self._embedding_function
+        if embedder is None:
+            raise ValueError("Embedding function required for search")
+        if hasattr(embedder, "embed_queries"):
+            embeddings = embedder.embed_queries(list(queries))
+        else:
+            embeddings = [embedder.embed_query(query) for query in queries]
+        return [self.search_by_vector(emb, k, filter, nprobe) for emb in embeddings]
+
+    def search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[SearchResult]:
+        """Search using a pre-computed query embedding.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results to return
+            filter: Metadata filter
+            nprobe: Lists to scan for this query (default: ``self.nprobe``)
+
+        Returns:
+            List of search results
+        """
+        if not self._documents:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+        candidates = self._filter_candidates(filter)
+
+        if candidates is not None:
+            by_list: Dict[int, List[str]] = {}
+            for id in candidates:
+                by_list.setdefault(self._assignments[id], []).append(id)
+            if len(candidates) <= self.exact_filter_threshold:
+                probe = list(by_list)
+            else:
+                probe = [n for n in self._probe(query, nprobe) if n in by_list]
+            hits = [self._lists[n].top_k(query, k, by_list[n])[0] for n in probe]
+        else:
+            hits = [self._lists[n].top_k(query, k)[0] for n in self._probe(query, nprobe)]
+
+        best = heapq.nlargest(k, (hit for group in hits for hit in group), key=lambda h: h[1])
+        return [
+            SearchResult(document=self._documents[id], score=score, distance=1 - score)
+            for id, score in best
+        ]
+
+    def _probe(self, query, nprobe: Optional[int]) -> List[int]:
+        """Return the lists closest to the query."""
+        if not self.is_trained:
+            return [0]
+        nprobe = min(nprobe or self.nprobe, len(self._lists))
+        scores = (query @ self._centroids.T)[0]
+        if nprobe < len(scores):
+            return np.argpartition(-scores, nprobe - 1)[:nprobe].tolist()
+        return list(range(len(scores)))
+
+    def _assign(self, vectors) -> Any:
+        """Map normalized vectors to their nearest centroid."""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return _nearest_centroid(vectors / norms, self._centroids)
+
+    def _filter_candidates(self, filter: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+        filter = normalize_filter(filter)
+        if filter is None:
+            return None
+        return self._metadata_index.resolve(filter)
+
+    def _new_list(self) -> _MatrixIndex:
+        return _MatrixIndex(initial_capacity=16)
+
+    def delete(self, id: str) -> bool:
+        """Delete a document by ID."""
+        list_no = self._assignments.pop(id, None)
+        if list_no is None:
+            return False
+        self._lists[list_no].remove(id)
+        self._metadata_index.remove(id)
+        del self._documents[id]
+        return True
+
+    def get(self, id: str) -> Optional[Document]:
+        """Get a document by ID."""
+        return self._documents.get(id)
+
+    def count(self) -> int:
+        """Get document count."""
+        return len(self._documents)
+
+    def clear(self) -> None:
+        """Clear all documents and the trained centroids."""
+        self._documents.clear()
+        self._metadata_index.clear()
+        self._assignments.clear()
+        self._centroids = None
+        self._lists = [self._new_list()]
+
+    def list_ids(self) -> List[str]:
+        """List all document IDs."""
+        return list(self._documents.keys())
+
+    def save(self, path: str) -> None:
+        """Save the index to a directory.
+
+        Vectors are written list by list into one ``vectors.npy`` so that
+        ``load(mmap=True)`` can map them without reading the file.
+
+        Args:
+            path: Target directory (created if missing)
+        """
+        os.makedirs(path, exist_ok=True)
+
+        ids: List[str] = []
+        parts = []
+        offsets = [0]
+        for index in self._lists:
+            list_ids, matrix = index.export()
+            ids.extend(list_ids)
+            if list_ids:
+                parts.append(matrix)
+            offsets.append(len(ids))
+
+        dimension = parts[0].shape[1] if parts else 0
+        vectors = np.concatenate(parts) if parts else np.zeros((0, dimension), np.float32)
+        np.save(os.path.join(path, "vectors.npy"), vectors)
+        if self.is_trained:
+            np.save(os.path.join(path, "centroids.npy"), self._centroids)
+
+        state = {
+            "config": {
+                "n_lists": self.n_lists,
+                "nprobe": self.nprobe,
+                "train_size": self.train_size,
+                "kmeans_iterations": self.kmeans_iterations,
+                "exact_filter_threshold": self.exact_filter_threshold,
+                "seed": self._seed,
+            },
+            "trained": self.is_trained,
+            "offsets": offsets,
+            "documents": [
+                {
+                    "id": id,
+                    "content": self._documents[id].content,
+                    "metadata": self._documents[id].metadata,
+                }
+                for id in ids
+            ],
+        }
+        with open(os.path.join(path, "index.json"), "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        mmap: bool = True,
+        indexed_fields: Optional[List[str]] = None,
+    ) -> "IVFStore":
+        """Load an index saved with ``save``.
+
+        Args:
+            path: Directory written by ``save``
+            embedding_function: Function to compute embeddings
+            mmap: Memory-map the vectors (copy-on-write) instead of reading them
+            indexed_fields: Metadata fields to index for filtering
+
+        Returns:
+            IVFStore instance
+        """
+        with open(os.path.join(path, "index.json"), encoding="utf-8") as f:
+            state = json.load(f)
+
+        store = cls(
+            embedding_function=embedding_function,
+            indexed_fields=indexed_fields,
+            **state["config"],
+        )
+        vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="c" if mmap else None)
+        if state["trained"]:
+            store._centroids = np.load(os.path.join(path, "centroids.npy"))
+
+        ids = [doc["id"] for doc in state["documents"]]
+        offsets = state["offsets"]
+        store._lists = []
+        for list_no in range(len(offsets) - 1):
+            start, end = offsets[list_no], offsets[list_no + 1]
+            store._lists.append(
+                _MatrixIndex.from_matrix(ids[start:end], vectors[start:end], initial_capacity=16)
+            )
+            for id in ids[start:end]:
+                store._assignments[id] = list_no
+
+        for doc in state["documents"]:
+            document = Document(id=doc["id"], content=doc["content"], metadata=doc["metadata"])
+            store._documents[document.id] = document
+            store._metadata_index.add(document.id, document.metadata)
+        return store
+
+
+def _nearest_centroid(vectors, centroids, chunk_size: int = 8192):
+    """Index of the most similar centroid for each row, computed in chunks."""
+    result = np.empty(len(vectors), dtype=np.intp)
+    for start in range(0, len(vectors), chunk_size):
+        block = vectors[start : start + chunk_size]
+        result[start : start + chunk_size] = np.argmax(block @ centroids.T, axis=1)
+    return result
+
+
+def _spherical_kmeans(vectors, n_clusters: int, iterations: int, rng) -> Any:
+    """Cluster unit vectors by cosine similarity; returns unit centroids."""
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _nearest_centroid(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=n_clusters)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        nonempty = counts > 0
+
+        sums = np.zeros_like(centroids)
+        sums[nonempty] = np.add.reduceat(vectors[order], starts[nonempty], axis=0)
+        # Re-seed empty clusters with random points so every list is used
+        empty = np.flatnonzero(~nonempty)
+        if len(empty):
+            sums[empty] = vectors[rng.choice(len(vectors), len(empty), replace=False)]
+
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+    return centroids
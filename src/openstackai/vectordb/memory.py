@@ -4,19 +4,568 @@
 """
 In-memory vector store implementation.
 
-Simple vector store for testing and small datasets.
+Simple vector store for testing and small datasets. When NumPy is
+installed, embeddings are kept in a contiguous float32 matrix so search
+is a single matrix product followed by a partial top-k selection. Text
+search without embeddings goes through an incremental BM25 inverted index,
+and metadata filters are resolved to candidate IDs through hash indexes
+before any scoring happens.
 """
 
+import heapq
 import math
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from .base import Document, EmbeddingFunction, SearchResult, VectorStore
+from .base import (
+    Document,
+    EmbeddingFunction,
+    SearchResult,
+    VectorStore,
+    compare_values,
+    evaluate_filter,
+    matches_filter,
+    normalize_filter,
+)
+
+# Try to import numpy for the matrix-backed index
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length (zero vectors are returned unchanged)."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase and split text into word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class _BM25Index:
+    """Incremental inverted index with Okapi BM25 scoring.
+
+    Postings map each term to ``{doc_id: term_frequency}`` and are updated
+    on every add/remove, so a query only touches the posting lists of its
+    own terms instead of rescanning the corpus.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, id: str, text: str) -> None:
+        """Index (or re-index) a document."""
+        if id in self._doc_terms:
+            self.remove(id)
+
+        tokens = _tokenize(text)
+        terms: Dict[str, int] = {}
+        for token in tokens:
+            terms[token] = terms.get(token, 0) + 1
+
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[id] = tf
+        self._doc_terms[id] = terms
+        self._doc_lengths[id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, id: str) -> bool:
+        """Remove a document from every posting list it appears in."""
+        terms = self._doc_terms.pop(id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            postings = self._postings[term]
+            del postings[id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(id)
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._total_length = 0
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        candidates: Optional[Set[str]] = None,
+        require_all: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """Return the ``k`` best ``(id, score)`` pairs for a query.
+
+        Args:
+            query: Query text
+            k: Number of results
+            candidates: Restrict scoring to these document IDs
+            require_all: Only match documents containing every query term
+                (posting lists are intersected, smallest first)
+        """
+        terms = list(dict.fromkeys(_tokenize(query)))
+        postings = [self._postings.get(t) for t in terms]
+        if require_all and not all(postings):
+            return []
+        postings = [p for p in postings if p]
+        if not postings or k <= 0:
+            return []
+
+        allowed = candidates
+        if require_all:
+            postings.sort(key=len)
+            allowed = set(postings[0]) if allowed is None else allowed & postings[0].keys()
+            for p in postings[1:]:
+                allowed &= p.keys()
+                if not allowed:
+                    return []
+
+        n_docs = len(self._doc_terms)
+        avg_length = self._total_length / n_docs if n_docs else 0.0
+        k1, b = self.k1, self.b
+        lengths = self._doc_lengths
+
+        scores: Dict[str, float] = {}
+        for p in postings:
+            df = len(p)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            if allowed is not None and len(allowed) < df:
+                entries = ((id, p[id]) for id in allowed if id in p)
+            else:
+                entries = p.items()
+            for id, tf in entries:
+                if allowed is not None and id not in allowed:
+                    continue
+                norm = k1 * (1 - b + b * lengths[id] / avg_length) if avg_length else k1
+                scores[id] = scores.get(id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+
+class _MetadataIndex:
+    """Secondary hash indexes over metadata fields.
+
+    Each indexed field maps ``value -> {doc_id}``. Filters are resolved to a
+    set of candidate IDs before scoring, so a selective filter only pays for
+    the documents it selects. Fields are indexed automatically unless an
+    explicit list is given; a field that ever holds an unhashable value
+    (e.g. a list) stops being indexed and clauses on it fall back to
+    evaluating document metadata.
+    """
+
+    def __init__(self, documents: Dict[str, Document], fields: Optional[Iterable[str]] = None):
+        self._documents = documents
+        self._auto = fields is None
+        self._values: Dict[str, Dict[Any, Set[str]]] = {f: {} for f in fields or ()}
+        self._field_ids: Dict[str, Set[str]] = {f: set() for f in fields or ()}
+        self._unindexable: Set[str] = set()
+        self._doc_fields: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the currently indexed fields."""
+        return sorted(self._values)
+
+    def add_field(self, field: str) -> None:
+        """Start indexing a field, back-filling existing documents."""
+        if field in self._values:
+            return
+        self._unindexable.discard(field)
+        self._values[field] = {}
+        self._field_ids[field] = set()
+        for id, doc in self._documents.items():
+            if field in doc.metadata:
+                self._index_value(id, field, doc.metadata[field])
+
+    def add(self, id: str, metadata: Dict[str, Any]) -> None:
+        """Index a document's metadata (replacing any previous entry)."""
+        self.remove(id)
+        for field, value in metadata.items():
+            if field in self._values or (self._auto and field not in self._unindexable):
+                self._index_value(id, field, value)
+
+    def remove(self, id: str) -> None:
+        """Drop a document from every field index."""
+        for field, value in self._doc_fields.pop(id, {}).items():
+            buckets = self._values.get(field)
+            if buckets is None:
+                continue
+            bucket = buckets.get(value)
+            if bucket is not None:
+                bucket.discard(id)
+                if not bucket:
+                    del buckets[value]
+            self._field_ids[field].discard(id)
+
+    def clear(self) -> None:
+        """Empty every field index, keeping registered fields."""
+        for field in self._values:
+            self._values[field] = {}
+            self._field_ids[field] = set()
+        self._doc_fields.clear()
+
+    def resolve(self, filter: Dict[str, Any]) -> Set[str]:
+        """Resolve a canonical filter to the set of matching document IDs."""
+        key, value = next(iter(filter.items()))
+        if key == "$or":
+            result: Set[str] = set()
+            for child in value:
+                result |= self.resolve(child)
+            return result
+        if key == "$and":
+            indexed = [child for child in value if self._is_indexed(child)]
+            others = [child for child in value if not self._is_indexed(child)]
+            if not indexed:
+                return self._scan(filter)
+            sets = sorted((self.resolve(child) for child in indexed), key=len)
+            result = sets[0]
+            for other in sets[1:]:
+                if not result:
+                    break
+                result &= other
+            docs = self._documents
+            return {
+                id
+                for id in result
+                if all(evaluate_filter(docs[id].metadata, child) for child in others)
+            }
+        if key not in self._values:
+            return self._scan(filter)
+
+        op, operand = next(iter(value.items()))
+        buckets = self._values[key]
+        if op in ("$eq", "$ne"):
+            matched = set(self._bucket(buckets, operand))
+        elif op in ("$in", "$nin"):
+            matched = set()
+            for item in operand:
+                matched |= self._bucket(buckets, item)
+        else:
+            matched = set()
+            for candidate, ids in buckets.items():
+                if compare_values(candidate, op, operand):
+                    matched |= ids
+        if op in ("$ne", "$nin"):
+            return self._field_ids[key] - matched
+        return matched
+
+    def _is_indexed(self, filter: Dict[str, Any]) -> bool:
+        key, value = next(iter(filter.items()))
+        if key in ("$and", "$or"):
+            return all(self._is_indexed(child) for child in value)
+        return key in self._values
+
+    def _scan(self, filter: Dict[str, Any]) -> Set[str]:
+        return {id for id, doc in self._documents.items() if evaluate_filter(doc.metadata, filter)}
+
+    @staticmethod
+    def _bucket(buckets: Dict[Any, Set[str]], value: Any) -> Set[str]:
+        try:
+            return buckets.get(value, set())
+        except TypeError:
+            return set()
+
+    def _index_value(self, id: str, field: str, value: Any) -> None:
+        try:
+            hash(value)
+        except TypeError:
+            # Unhashable values can't live in a hash index: stop indexing the field
+            self._values.pop(field, None)
+            self._field_ids.pop(field, None)
+            self._unindexable.add(field)
+            return
+        if field not in self._values:
+            self._values[field] = {}
+            self._field_ids[field] = set()
+        self._values[field].setdefault(value, set()).add(id)
+        self._field_ids[field].add(id)
+        self._doc_fields.setdefault(id, {})[field] = value
+
+
+class _ListIndex:
+    """Pure-Python embedding index used when NumPy is unavailable.
+
+    Rows are stored pre-normalized so scoring is a plain dot product.
+    """
+
+    def __init__(self):
+        self._vectors: Dict[str, List[float]] = {}
+        self.dimension: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._vectors
+
+    def add(self, id: str, embedding: List[float]) -> None:
+        """Insert or replace the embedding for a document."""
+        if self.dimension is None:
+            self.dimension = len(embedding)
+        elif len(embedding) != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {len(embedding)} does not match index "
+                f"dimension {self.dimension}"
+            )
+        self._vectors[id] = _normalize(embedding)
+
+    def remove(self, id: str) -> bool:
+        """Remove the embedding for a document."""
+        return self._vectors.pop(id, None) is not None
+
+    def clear(self) -> None:
+        """Remove all embeddings."""
+        self._vectors.clear()
+        self.dimension = None
+
+    def top_k(
+        self,
+        queries: List[List[float]],
+        k: int,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """Return the ``k`` best ``(id, score)`` pairs for each query."""
+        if candidates is None:
+            items = list(self._vectors.items())
+        else:
+            items = [(id, self._vectors[id]) for id in candidates if id in self._vectors]
+
+        results = []
+        for query in queries:
+            self._check_dimension(query)
+            q = _normalize(query)
+            scored = ((id, sum(a * b for a, b in zip(q, vec))) for id, vec in items)
+            results.append(heapq.nlargest(k, scored, key=lambda item: item[1]))
+        return results
+
+    def _check_dimension(self, query: List[float]) -> None:
+        if self.dimension is not None and len(query) != self.dimension:
+            raise ValueError(
+                f"Query dimension {len(query)} does not match index dimension {self.dimension}"
+            )
+
+
+class _MatrixIndex:
+    """NumPy embedding index backed by a contiguous float32 matrix.
+
+    Rows are L2-normalized on insert so cosine similarity reduces to a dot
+    product. Capacity doubles when full, giving amortized O(1) appends.
+    Deletes only tombstone a row; rows are compacted once tombstones exceed
+    ``compact_ratio`` of the used rows.
+    """
+
+    def __init__(self, initial_capacity: int = 1024, compact_ratio: float = 0.25):
+        self.dimension: Optional[int] = None
+        self._initial_capacity = max(1, initial_capacity)
+        self._compact_ratio = compact_ratio
+        self._matrix = None
+        self._alive = None
+        self._row_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        self._tombstones = 0
+
+    @classmethod
+    def from_matrix(
+        cls,
+        ids: List[str],
+        matrix,
+        initial_capacity: int = 1024,
+        compact_ratio: float = 0.25,
+    ) -> "_MatrixIndex":
+        """Wrap an existing matrix of normalized rows without copying it.
+
+        The matrix may be a memory-mapped array; it is only copied into
+        memory when the index next grows or compacts.
+        """
+        index = cls(initial_capacity, compact_ratio)
+        if len(ids):
+            index.dimension = matrix.shape[1]
+            index._matrix = matrix
+            index._alive = np.ones(len(ids), dtype=bool)
+            index._row_ids = list(ids)
+            index._rows = {id: row for row, id in enumerate(ids)}
+            index._size = len(ids)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._rows
+
+    def export(self) -> Tuple[List[str], Any]:
+        """Return the live IDs and a copy of their (normalized) rows."""
+        if self.dimension is None:
+            return [], None
+        keep = np.flatnonzero(self._alive[: self._size])
+        return [self._row_ids[row] for row in keep], np.array(self._matrix[keep])
+
+    def add(self, id: str, embedding: List[float]) -> None:
+        """Insert or replace the embedding for a document."""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self.dimension is None:
+            self.dimension = vector.shape[0]
+            self._allocate(self._initial_capacity)
+        elif vector.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match index "
+                f"dimension {self.dimension}"
+            )
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+
+        row = self._rows.get(id)
+        if row is None:
+            if self._size == self._matrix.shape[0]:
+                self._allocate(self._matrix.shape[0] * 2)
+            row = self._size
+            self._size += 1
+            self._rows[id] = row
+            self._row_ids.append(id)
+            self._alive[row] = True
+        self._matrix[row] = vector
+
+    def remove(self, id: str) -> bool:
+        """Tombstone the row for a document."""
+        row = self._rows.pop(id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._row_ids[row] = None
+        self._tombstones += 1
+        if self._tombstones > self._compact_ratio * self._size:
+            self.compact()
+        return True
+
+    def clear(self) -> None:
+        """Remove all embeddings and release the matrix."""
+        self.dimension = None
+        self._matrix = None
+        self._alive = None
+        self._row_ids = []
+        self._rows = {}
+        self._size = 0
+        self._tombstones = 0
+
+    def compact(self) -> None:
+        """Drop tombstoned rows, keeping the surviving rows in insertion order."""
+        if self._tombstones == 0:
+            return
+        keep = np.flatnonzero(self._alive[: self._size])
+        capacity = max(self._initial_capacity, len(keep))
+        matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+        matrix[: len(keep)] = self._matrix[keep]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: len(keep)] = True
+
+        self._row_ids = [self._row_ids[row] for row in keep]
+        self._rows = {id: row for row, id in enumerate(self._row_ids)}
+        self._matrix = matrix
+        self._alive = alive
+        self._size = len(keep)
+        self._tombstones = 0
+
+    def top_k(
+        self,
+        queries: List[List[float]],
+        k: int,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """Return the ``k`` best ``(id, score)`` pairs for each query.
+
+        All queries are scored in one matrix multiply. When ``candidates`` is
+        given only those rows are gathered and scored.
+        """
+        if self.dimension is None or not self._rows:
+            return [[] for _ in queries]
+
+        q = np.asarray(queries, dtype=np.float32).reshape(len(queries), -1)
+        if q.shape[1] != self.dimension:
+            raise ValueError(
+                f"Query dimension {q.shape[1]} does not match index dimension {self.dimension}"
+            )
+        norms = np.linalg.norm(q, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        q = q / norms
+
+        if candidates is None:
+            rows = None
+            scores = q @ self._matrix[: self._size].T
+            if self._tombstones:
+                scores[:, ~self._alive[: self._size]] = -np.inf
+            n_valid = len(self._rows)
+        else:
+            rows = np.fromiter(
+                (self._rows[id] for id in candidates if id in self._rows), dtype=np.intp
+            )
+            if rows.size == 0:
+                return [[] for _ in queries]
+            scores = q @ self._matrix[rows].T
+            n_valid = rows.size
+
+        k = min(k, n_valid)
+        if k <= 0:
+            return [[] for _ in queries]
+
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        results = []
+        for cols, vals in zip(top, top_scores):
+            hits = []
+            for col, score in zip(cols, vals):
+                row = col if rows is None else rows[col]
+                hits.append((self._row_ids[row], float(score)))
+            results.append(hits)
+        return results
+
+    def _allocate(self, capacity: int) -> None:
+        matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+        alive = np.zeros(capacity, dtype=bool)
+        if self._matrix is not None:
+            matrix[: self._size] = self._matrix[: self._size]
+            alive[: self._size] = self._alive[: self._size]
+        self._matrix = matrix
+        self._alive = alive
 
 
 class MemoryVectorStore(VectorStore):
     """In-memory vector store.
 
-    Useful for testing, prototyping, and small datasets.
+    Useful for testing, prototyping, and small datasets. Embeddings are
+    indexed in a NumPy matrix when NumPy is installed, otherwise in plain
+    Python lists.
 
     Example:
         store = MemoryVectorStore()
@@ -30,15 +579,35 @@ class MemoryVectorStore(VectorStore):
     def __init__(
         self,
         embedding_function: Optional[EmbeddingFunction] = None,
+        initial_capacity: int = 1024,
+        compact_ratio: float = 0.25,
+        bm25_k1: float = 1.5,
+        bm25_b: float = 0.75,
+        match_all_terms: bool = False,
+        indexed_fields: Optional[List[str]] = None,
     ):
         """Initialize memory vector store.
 
         Args:
             embedding_function: Function to compute embeddings
+            initial_capacity: Initial row capacity of the embedding matrix
+            compact_ratio: Fraction of deleted rows that triggers compaction
+            bm25_k1: BM25 term-frequency saturation for text search
+            bm25_b: BM25 length normalization for text search
+            match_all_terms: Text search only returns documents containing
+                every query term
+            indexed_fields: Metadata fields to index for filtering
+                (default: index every field with hashable values)
         """
         self._documents: Dict[str, Document] = {}
-        self._embeddings: Dict[str, List[float]] = {}
         self._embedding_function = embedding_function
+        if NUMPY_AVAILABLE:
+            self._index = _MatrixIndex(initial_capacity, compact_ratio)
+        else:
+            self._index = _ListIndex()
+        self._text_index = _BM25Index(k1=bm25_k1, b=bm25_b)
+        self._match_all_terms = match_all_terms
+        self._metadata_index = _MetadataIndex(self._documents, indexed_fields)
 
     def add(
         self,
@@ -56,13 +625,38 @@ class MemoryVectorStore(VectorStore):
         )
 
         self._documents[id] = document
+        self._text_index.add(id, content)
+        self._metadata_index.add(id, document.metadata)
 
         # Compute or store embedding
         if embedding:
-            self._embeddings[id] = embedding
+            self._index.add(id, embedding)
         elif self._embedding_function:
             emb = self._embedding_function.embed([content])[0]
-            self._embeddings[id] = emb
+            self._index.add(id, emb)
+        else:
+            self._index.remove(id)
+
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Add multiple texts, embedding them in a single batch call."""
+        if not self._embedding_function:
+            return super().add_texts(texts, metadatas, ids)
+
+        if ids is None:
+            ids = [Document.create(t).id for t in texts]
+        if metadatas is None:
+            metadatas = [{}] * len(texts)
+
+        embeddings = self._embedding_function.embed(list(texts)) if texts else []
+        for id, text, metadata, emb in zip(ids, texts, metadatas, embeddings):
+            self.add(id, text, metadata, embedding=emb)
+
+        return ids
 
     def search(
         self,
@@ -75,42 +669,104 @@ class MemoryVectorStore(VectorStore):
             return []
 
         # If we have embeddings, use vector search
-        if self._embeddings and self._embedding_function:
-            return self._vector_search(query, k, filter)
+        if len(self._index) and self._embedding_function:
+            return self._vector_search([query], k, filter)[0]
 
         # Fall back to text similarity
         return self._text_search(query, k, filter)
 
+    def search_batch(
+        self,
+        queries: List[str],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for many queries at once.
+
+        Queries are embedded with the embedding function's ``embed_queries``
+        (one ``embed`` call unless it has a separate query encoder) and
+        scored against the index in a single matrix multiply.
+
+        Args:
+            queries: Query texts
+            k: Number of results per query
+            filter: Metadata filter applied to every query
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not queries:
+            return []
+        if not self._documents:
+            return [[] for _ in queries]
+
+        if len(self._index) and self._embedding_function:
+            return self._vector_search(queries, k, filter)
+
+        return [self._text_search(query, k, filter) for query in queries]
+
+    def search_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """Search using a pre-computed query embedding.
+
+        Args:
+            embedding: Query embedding
+            k: Number of results to return
+            filter: Metadata filter
+
+        Returns:
+            List of search results
+        """
+        hits = self._index.top_k([embedding], k, self._filter_candidates(filter))[0]
+        return self._to_results(hits)
+
     def _vector_search(
         self,
-        query: str,
+        queries: List[str],
         k: int,
         filter: Optional[Dict[str, Any]],
-    ) -> List[SearchResult]:
+    ) -> List[List[SearchResult]]:
         """Search using vector similarity."""
-        query_embedding = self._embedding_function.embed_query(query)
+        embedder = self._embedding_function
+        if hasattr(embedder, "embed_queries"):
+            query_embeddings = embedder.embed_queries(list(queries))
+        else:
+            query_embeddings = [embedder.embed_query(query) for query in queries]
+        candidates = self._filter_candidates(filter)
+        hits_per_query = self._index.top_k(query_embeddings, k, candidates)
+        return [self._to_results(hits) for hits in hits_per_query]
 
-        results = []
-        for id, doc in self._documents.items():
-            # Apply filter
-            if filter and not self._matches_filter(doc, filter):
-                continue
+    def create_index(self, field: str) -> None:
+        """Index a metadata field for filtering.
 
-            embedding = self._embeddings.get(id)
-            if embedding:
-                # Compute cosine similarity
-                score = self._cosine_similarity(query_embedding, embedding)
-                results.append(
-                    SearchResult(
-                        document=doc,
-                        score=score,
-                        distance=1 - score,
-                    )
-                )
-
-        # Sort by score (descending)
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:k]
+        Only needed when the store was created with ``indexed_fields``;
+        otherwise fields are indexed as they are first seen.
+
+        Args:
+            field: Metadata field name
+        """
+        self._metadata_index.add_field(field)
+
+    def _filter_candidates(self, filter: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+        """Resolve a metadata filter to the set of matching document IDs."""
+        filter = normalize_filter(filter)
+        if filter is None:
+            return None
+        return self._metadata_index.resolve(filter)
+
+    def _to_results(self, hits: List[Tuple[str, float]]) -> List[SearchResult]:
+        return [
+            SearchResult(
+                document=self._documents[id],
+                score=score,
+                distance=1 - score,
+            )
+            for id, score in hits
+        ]
 
     def _text_search(
         self,
@@ -118,37 +774,21 @@ class MemoryVectorStore(VectorStore):
         k: int,
         filter: Optional[Dict[str, Any]],
     ) -> List[SearchResult]:
-        """Search using simple text matching."""
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-
-        results = []
-        for id, doc in self._documents.items():
-            # Apply filter
-            if filter and not self._matches_filter(doc, filter):
-                continue
-
-            content_lower = doc.content.lower()
-            content_words = set(content_lower.split())
-
-            # Compute simple word overlap score
-            overlap = len(query_words & content_words)
-            if overlap > 0 or query_lower in content_lower:
-                # Boost score if query is substring
-                score = overlap / max(len(query_words), 1)
-                if query_lower in content_lower:
-                    score += 0.5
-
-                results.append(
-                    SearchResult(
-                        document=doc,
-                        score=score,
-                        distance=1 - score,
-                    )
-                )
-
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:k]
+        """Search using BM25 over the inverted text index."""
+        hits = self._text_index.search(
+            query,
+            k,
+            candidates=self._filter_candidates(filter),
+            require_all=self._match_all_terms,
+        )
+        return [
+            SearchResult(
+                document=self._documents[id],
+                score=score,
+                distance=1.0 / (1.0 + score),
+            )
+            for id, score in hits
+        ]
 
     def _matches_filter(
         self,
@@ -156,12 +796,7 @@ class MemoryVectorStore(VectorStore):
         filter: Dict[str, Any],
     ) -> bool:
         """Check if document matches metadata filter."""
-        for key, value in filter.items():
-            if key not in doc.metadata:
-                return False
-            if doc.metadata[key] != value:
-                return False
-        return True
+        return matches_filter(doc.metadata, filter)
 
     def _cosine_similarity(
         self,
@@ -185,7 +820,9 @@ class MemoryVectorStore(VectorStore):
         """Delete a document by ID."""
         if id in self._documents:
             del self._documents[id]
-            self._embeddings.pop(id, None)
+            self._index.remove(id)
+            self._text_index.remove(id)
+            self._metadata_index.remove(id)
             return True
         return False
 
@@ -200,7 +837,9 @@ class MemoryVectorStore(VectorStore):
     def clear(self) -> None:
         """Clear all documents."""
         self._documents.clear()
-        self._embeddings.clear()
+        self._index.clear()
+        self._text_index.clear()
+        self._metadata_index.clear()
 
     def list_ids(self) -> List[str]:
         """List all document IDs."""
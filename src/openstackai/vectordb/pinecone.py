@@ -10,7 +10,7 @@ Requires: pip install pinecone-client
 import os
 from typing import Any, Dict, List, Optional
 
-from .base import Document, EmbeddingFunction, SearchResult, VectorStore
+from .base import Document, EmbeddingFunction, SearchResult, VectorStore, normalize_filter
 
 
 class PineconeStore(VectorStore):
@@ -176,7 +176,7 @@ class PineconeStore(VectorStore):
             vector=query_embedding,
             top_k=k,
             include_metadata=True,
-            filter=filter,
+            filter=normalize_filter(filter),
             namespace=self._namespace,
         )
 
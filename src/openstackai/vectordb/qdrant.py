@@ -11,7 +11,7 @@ import os
 import uuid as uuid_lib
 from typing import Any, Dict, List, Optional
 
-from .base import Document, EmbeddingFunction, SearchResult, VectorStore
+from .base import Document, EmbeddingFunction, SearchResult, VectorStore, normalize_filter
 
 
 class QdrantStore(VectorStore):
@@ -220,6 +220,40 @@ class QdrantStore(VectorStore):
                 points=points,
             )
 
+    def _build_filter(self, filter: Dict[str, Any]):
+        """Translate a canonical metadata filter into a Qdrant ``Filter``."""
+        from qdrant_client.models import (
+            FieldCondition,
+            Filter,
+            IsEmptyCondition,
+            MatchAny,
+            MatchValue,
+            PayloadField,
+            Range,
+        )
+
+        key, value = next(iter(filter.items()))
+        if key == "$and":
+            return Filter(must=[self._build_filter(child) for child in value])
+        if key == "$or":
+            return Filter(should=[self._build_filter(child) for child in value])
+
+        op, operand = next(iter(value.items()))
+        if op in ("$eq", "$ne"):
+            condition = FieldCondition(key=key, match=MatchValue(value=operand))
+        elif op in ("$in", "$nin"):
+            condition = FieldCondition(key=key, match=MatchAny(any=list(operand)))
+        else:
+            bound = {"$gt": "gt", "$gte": "gte", "$lt": "lt", "$lte": "lte"}[op]
+            condition = FieldCondition(key=key, range=Range(**{bound: operand}))
+
+        if op in ("$ne", "$nin"):
+            # must_not alone would also match points missing the field;
+            # the shared grammar requires the field to be present
+            present = Filter(must_not=[IsEmptyCondition(is_empty=PayloadField(key=key))])
+            return Filter(must=[present], must_not=[condition])
+        return Filter(must=[condition])
+
     def search(
         self,
         query: str,
@@ -238,16 +272,7 @@ class QdrantStore(VectorStore):
         qdrant_filter = None
         if filter:
             try:
-                from qdrant_client.models import FieldCondition, Filter, MatchValue
-
-                conditions = [
-                    FieldCondition(
-                        key=key,
-                        match=MatchValue(value=value),
-                    )
-                    for key, value in filter.items()
-                ]
-                qdrant_filter = Filter(must=conditions)
+                qdrant_filter = self._build_filter(normalize_filter(filter))
             except ImportError:
                 pass
 
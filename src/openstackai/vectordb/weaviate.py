@@ -10,7 +10,7 @@ Requires: pip install weaviate-client
 import os
 from typing import Any, Dict, List, Optional
 
-from .base import Document, EmbeddingFunction, SearchResult, VectorStore
+from .base import Document, EmbeddingFunction, SearchResult, VectorStore, matches_filter
 
 
 class WeaviateStore(VectorStore):
@@ -36,6 +36,9 @@ class WeaviateStore(VectorStore):
         results = store.search("hello", k=5)
     """
 
+    # Extra results fetched per requested result when a metadata filter is applied
+    FILTER_OVERFETCH = 4
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -177,7 +180,11 @@ class WeaviateStore(VectorStore):
         k: int = 10,
         filter: Optional[Dict[str, Any]] = None,
     ) -> List[SearchResult]:
-        """Search Weaviate for similar documents."""
+        """Search Weaviate for similar documents.
+
+        Metadata is stored as a JSON blob, so filters are applied to the
+        returned objects; the query over-fetches to compensate.
+        """
         import json
 
         client = self._get_client()
@@ -194,7 +201,8 @@ class WeaviateStore(VectorStore):
                 self._class_name, ["content", "doc_id", "metadata_json"]
             ).with_near_text({"concepts": [query]})
 
-        query_builder = query_builder.with_additional(["certainty", "distance"]).with_limit(k)
+        limit = k * self.FILTER_OVERFETCH if filter else k
+        query_builder = query_builder.with_additional(["certainty", "distance"]).with_limit(limit)
 
         result = query_builder.do()
 
@@ -209,6 +217,9 @@ class WeaviateStore(VectorStore):
                 except:
                     pass
 
+            if filter and not matches_filter(metadata, filter):
+                continue
+
             additional = item.get("_additional", {})
             certainty = additional.get("certainty", 0.0)
             distance = additional.get("distance", 1 - certainty)
@@ -227,7 +238,7 @@ class WeaviateStore(VectorStore):
                 )
             )
 
-        return search_results
+        return search_results[:k]
 
     def delete(self, id: str) -> bool:
         """Delete a document from Weaviate."""
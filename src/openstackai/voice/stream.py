@@ -100,7 +100,13 @@ class AudioStream:
         self._closed = False
         self._position = 0
         self._async_queue: Optional[asyncio.Queue] = None
-        self._event = asyncio.Event() if asyncio.get_event_loop().is_running() else None
+        try:
+            asyncio.get_running_loop()
+            self._event: Optional[asyncio.Event] = asyncio.Event()
+        except RuntimeError:
+            # Created outside a running loop (get_event_loop() would raise
+            # once the thread's loop has been closed and unset)
+            self._event = None
 
     def add(self, chunk: AudioChunk):
         """Add a chunk to the stream.
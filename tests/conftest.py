@@ -34,3 +34,22 @@ def enable_mock_mode():
     config.enable_mock(True)
     yield
     config.enable_mock(original)
+
+
+class KeywordEmbedding:
+    """Deterministic embedding: one dimension per keyword, set when the text contains it."""
+
+    def __init__(self, *keywords):
+        self.keywords = keywords
+
+    def embed(self, texts):
+        return [[float(word in text.lower()) for word in self.keywords] for text in texts]
+
+    def embed_query(self, query):
+        return self.embed([query])[0]
+
+
+@pytest.fixture
+def keyword_embedding():
+    """Fixture providing the KeywordEmbedding fake; call it with the vocabulary."""
+    return KeywordEmbedding
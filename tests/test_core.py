@@ -140,6 +140,97 @@ class TestMemory:
         assert VectorMemory is not None
 
 
+class TestContextWindow:
+    """Unit tests for token-budgeted context assembly."""
+
+    def test_window_keeps_pinned_and_recent_turns(self):
+        """Test the window fits the budget, newest turns first."""
+        from openstackai.core.memory import ContextWindow, Message
+
+        window = ContextWindow(max_tokens=0)
+        system = Message("system", "You are helpful.")
+        history = [Message("user", f"turn {i} " + "x" * 40) for i in range(10)]
+        per_turn = window.tokens(history[0])
+
+        budget = window.tokens(system) + 3 * per_turn
+        messages = window.assemble(history, pinned=[system], max_tokens=budget)
+
+        assert messages[0]["role"] == "system"
+        assert [m["content"][:6] for m in messages[1:]] == ["turn 7", "turn 8", "turn 9"]
+        assert window.last_tokens <= budget
+
+        # The latest turn is kept even when nothing fits
+        assert len(window.assemble(history, max_tokens=0)) == 1
+
+    def test_conversation_memory_context_with_retrieval(self):
+        """Test retrieved older turns are added when budget remains."""
+        from openstackai.core.memory import ConversationMemory
+
+        memory = ConversationMemory(retrieve_limit=2)
+        memory.add_message("user", "My favourite colour is teal")
+        for i in range(20):
+            memory.add_message("user", f"filler message number {i}")
+
+        full = memory.get_context()
+        assert len(full) == 21
+
+        context = memory.get_context(max_tokens=40, query="colour")
+        assert context[0]["content"] == "My favourite colour is teal"
+        assert context[-1]["content"] == "filler message number 19"
+        assert len(context) < 21
+
+        # Prompt dicts are built once and reused between calls
+        assert memory.get_context(max_tokens=40)[-1] is context[-1]
+
+    def test_buffer_memory_enforces_budget_and_summarizes(self):
+        """Test BufferMemory checks max_tokens and folds old turns into a summary."""
+        from openstackai.core.memory import BufferMemory
+
+        folded = []
+
+        def summarize(previous, messages):
+            folded.extend(messages)
+            return f"{len(folded)} earlier turns"
+
+        memory = BufferMemory(max_tokens=60, summary_threshold=50, summarizer=summarize)
+        for i in range(30):
+            memory.add_message("user", f"message {i} with some padding text")
+
+        assert folded
+        assert memory.total_tokens <= 50
+        messages = memory.get_messages()
+        assert messages[0]["content"].startswith("Previous conversation summary")
+        assert messages[-1]["content"].startswith("message 29")
+
+    @pytest.mark.asyncio
+    async def test_agent_run_uses_budgeted_context(self):
+        """Test Agent.run never sends more history than the budget allows."""
+        from openstackai.core.agent import Agent, AgentConfig
+        from openstackai.core.llm import LLMProvider
+
+        sent = []
+
+        class RecordingProvider(LLMProvider):
+            async def complete(self, system_prompt, messages, **kwargs):
+                sent.append(list(messages))
+                return "ok"
+
+            async def complete_with_tools(self, system_prompt, messages, tools, **kwargs):
+                raise NotImplementedError
+
+            async def stream(self, system_prompt, messages, **kwargs):
+                yield "ok"
+
+        config = AgentConfig(max_context_tokens=120, reserve_output_tokens=20)
+        agent = Agent(llm=RecordingProvider(), config=config)
+
+        for i in range(30):
+            await agent.run(f"question {i} " + "y" * 40)
+
+        assert len(sent[-1]) < 30
+        assert sent[-1][-1]["content"].startswith("question 29")
+
+
 class TestLLMInterface:
     """Unit tests for LLM interface."""
     
@@ -165,6 +256,117 @@ class TestLLMInterface:
         assert callable(llm.complete)
 
 
+def _echo_provider(calls):
+    from openstackai.core.llm import LLMProvider
+
+    class EchoProvider(LLMProvider):
+        async def complete(self, system_prompt, messages, **kwargs):
+            calls.append(messages[-1]["content"])
+            return f"answer to {messages[-1]['content']}"
+
+        async def complete_with_tools(self, system_prompt, messages, tools, **kwargs):
+            raise NotImplementedError
+
+        async def stream(self, system_prompt, messages, **kwargs):
+            yield "chunk"
+
+    return EchoProvider()
+
+
+class TestSemanticCache:
+    """Unit tests for the semantic LLM response cache."""
+
+    @pytest.fixture
+    def embedding(self, keyword_embedding):
+        return keyword_embedding("weather", "paris", "london", "capital", "france")
+
+    async def _ask(self, provider, question, **kwargs):
+        return await provider.complete("Be brief", [{"role": "user", "content": question}], **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_exact_and_semantic_hits(self, embedding):
+        from openstackai.core.llm import CachedLLMProvider, SemanticCache
+
+        calls = []
+        cache = SemanticCache(embedding, threshold=0.99)
+        provider = CachedLLMProvider(_echo_provider(calls), cache)
+
+        first = await self._ask(provider, "Weather in Paris?")
+        assert await self._ask(provider, "Weather in Paris?") == first
+        assert await self._ask(provider, "what's the weather like in paris") == first
+        assert await self._ask(provider, "Weather in London?") != first
+
+        assert len(calls) == 2
+        stats = cache.stats
+        assert stats["exact_hits"] == 1
+        assert stats["semantic_hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_namespaces_by_model_params(self, embedding):
+        from openstackai.core.llm import CachedLLMProvider, SemanticCache
+
+        calls = []
+        provider = CachedLLMProvider(_echo_provider(calls), SemanticCache(embedding))
+
+        await self._ask(provider, "Capital of France?")
+        await self._ask(provider, "Capital of France?", temperature=0.0)
+        await self._ask(provider, "Capital of France?", temperature=0.0)
+        assert len(calls) == 2
+
+    def test_ttl_and_max_entries(self, embedding):
+        import time
+        from openstackai.core.llm import SemanticCache
+
+        cache = SemanticCache(embedding, ttl=0.01, max_entries=2)
+        messages = [{"role": "user", "content": "weather in paris"}]
+        cache.store("", messages, "sunny")
+        assert cache.lookup("", messages) == "sunny"
+        time.sleep(0.02)
+        assert cache.lookup("", messages) is None
+
+        for city in ("paris", "london", "france"):
+            cache.store("", [{"role": "user", "content": city}], city)
+        assert cache.stats["entries"] == 2
+        assert cache.vector_store.count() == 2
+
+
+    @pytest.mark.asyncio
+    async def test_miss_embeds_prompt_once(self, keyword_embedding):
+        from openstackai.core.llm import CachedLLMProvider, SemanticCache
+
+        embedded = []
+
+        class CountingEmbedding(keyword_embedding):
+            def embed(self, texts):
+                embedded.extend(texts)
+                return super().embed(texts)
+
+        calls = []
+        provider = CachedLLMProvider(_echo_provider(calls), SemanticCache(CountingEmbedding("weather", "paris")))
+        await provider.complete("Be brief", [{"role": "user", "content": "Weather in Paris?"}])
+
+        assert len(calls) == 1
+        assert len(embedded) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_failure_falls_through(self):
+        from openstackai.core.llm import CachedLLMProvider, SemanticCache
+
+        class BrokenEmbedding:
+            def embed_query(self, text):
+                raise ConnectionError("embedding service down")
+
+        calls = []
+        provider = CachedLLMProvider(_echo_provider(calls), SemanticCache(BrokenEmbedding()))
+        messages = [{"role": "user", "content": "Weather in Paris?"}]
+
+        assert await provider.complete("Be brief", messages) == "answer to Weather in Paris?"
+        assert await provider.complete("Be brief", messages) == "answer to Weather in Paris?"
+        assert len(calls) == 2
+
+
 class TestConfig:
     """Unit tests for configuration."""
     
@@ -324,5 +526,396 @@ class TestBlueprint:
         assert Pipeline is not None
 
 
+
+class TestPipelineStream:
+    """Tests for streaming pipeline execution."""
+    
+    async def _collect(self, pipeline, source, **kwargs):
+        return [item async for item in pipeline.stream(source, **kwargs)]
+    
+    @pytest.mark.asyncio
+    async def test_stream_ordered(self):
+        """Test that results keep input order across concurrent workers."""
+        import asyncio
+        from openstackai.blueprint import Pipeline, PipelineStage
+        
+        async def slow_double(x):
+            await asyncio.sleep(0.01 * (5 - x % 5))
+            return x * 2
+        
+        pipeline = (Pipeline("p")
+            .add_stage(PipelineStage("double", slow_double, concurrency=4))
+            .add_transform("inc", lambda x: x + 1))
+        
+        assert await self._collect(pipeline, range(20)) == [x * 2 + 1 for x in range(20)]
+        unordered = await self._collect(pipeline, range(20), ordered=False)
+        assert sorted(unordered) == [x * 2 + 1 for x in range(20)]
+    
+    @pytest.mark.asyncio
+    async def test_stages_overlap(self):
+        """Test that concurrent I/O-bound stages overlap instead of serializing."""
+        import asyncio
+        import time
+        from openstackai.blueprint import Pipeline, PipelineStage
+        
+        async def io(x):
+            await asyncio.sleep(0.05)
+            return x
+        
+        pipeline = (Pipeline("p")
+            .add_stage(PipelineStage("a", io, concurrency=5))
+            .add_stage(PipelineStage("b", io, concurrency=5)))
+        
+        start = time.monotonic()
+        assert await self._collect(pipeline, range(10)) == list(range(10))
+        # 10 items x 2 stages x 0.05s = 1s serially
+        assert time.monotonic() - start < 0.5
+    
+    @pytest.mark.asyncio
+    async def test_micro_batching(self):
+        """Test that batched stages receive lists."""
+        from openstackai.blueprint import Pipeline, PipelineStage
+        
+        sizes = []
+        
+        def embed(batch):
+            sizes.append(len(batch))
+            return [len(text) for text in batch]
+        
+        pipeline = Pipeline("p").add_stage(
+            PipelineStage("embed", embed, batch_size=4, batch_timeout=0.05)
+        )
+        
+        words = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+        assert await self._collect(pipeline, words) == [1, 2, 3, 4, 5, 6]
+        assert sum(sizes) == 6
+        assert max(sizes) == 4
+    
+    @pytest.mark.asyncio
+    async def test_backpressure(self):
+        """Test that the source is not read far ahead of the consumer."""
+        from openstackai.blueprint import Pipeline, PipelineStage
+        
+        produced = []
+        
+        async def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+        
+        async def first_three():
+            pipeline = Pipeline("p").add_stage(PipelineStage("id", lambda x: x))
+            results = []
+            stream = pipeline.stream(source(), buffer_size=2, max_in_flight=4)
+            async for item in stream:
+                results.append(item)
+                if len(results) == 3:
+                    break
+            await stream.aclose()
+            return results
+        
+        assert await first_three() == [0, 1, 2]
+        assert len(produced) <= 8
+    
+    @pytest.mark.asyncio
+    async def test_stream_error(self):
+        """Test that a stage error surfaces from the stream."""
+        from openstackai.blueprint import Pipeline
+        
+        def boom(x):
+            if x == 3:
+                raise RuntimeError("bad item")
+            return x
+        
+        pipeline = Pipeline("p").add_transform("boom", boom)
+        with pytest.raises(RuntimeError, match="bad item"):
+            await self._collect(pipeline, range(10))
+    
+    @pytest.mark.asyncio
+    async def test_data_pipeline_bounded_map(self):
+        """Test bounded concurrency for DataPipeline.map."""
+        import asyncio
+        from openstackai.blueprint.pipeline import DataPipeline
+        
+        active = [0]
+        peak = [0]
+        
+        async def work(x):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return x * x
+        
+        pipeline = DataPipeline("d").map(work, concurrency=3)
+        assert await pipeline.run([1, 2, 3, 4, 5]) == [1, 4, 9, 16, 25]
+        assert peak[0] == 3
+
+
+class TestMapReducePattern:
+    """Tests for bounded map and tree reduce."""
+    
+    class _Agent:
+        def __init__(self, name, delay=0.0, reply=None):
+            self.name = name
+            self.delay = delay
+            self.reply = reply or (lambda prompt: f"{name}:{len(prompt)}")
+            self.prompts = []
+            self.active = 0
+            self.peak = 0
+        
+        async def run(self, prompt, **kwargs):
+            import asyncio
+            from types import SimpleNamespace
+            
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(self.delay)
+            self.active -= 1
+            return SimpleNamespace(content=self.reply(prompt))
+    
+    @pytest.mark.asyncio
+    async def test_map_respects_num_workers(self):
+        """Test that at most num_workers mapper calls run at once."""
+        from openstackai.blueprint import MapReducePattern
+        
+        mapper = self._Agent("map", delay=0.01, reply=lambda p: p.rsplit(" ", 1)[-1])
+        reducer = self._Agent("reduce")
+        mr = MapReducePattern(mapper, reducer, num_workers=3)
+        
+        partial = []
+        await mr.run("task", items=range(12), on_result=lambda i, out: partial.append(i))
+        
+        assert mapper.peak == 3
+        assert sorted(partial) == list(range(12))
+        assert len(reducer.prompts) == 1
+        assert "--- Result 12 ---\n11" in reducer.prompts[0]
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit(self):
+        """Test that mapper starts are spaced by the rate limit."""
+        import time
+        from openstackai.blueprint import MapReducePattern
+        
+        mr = MapReducePattern(self._Agent("map"), self._Agent("reduce"), num_workers=5,
+                              rate_limit=50)
+        start = time.monotonic()
+        await mr.run("task", items=range(6))
+        assert time.monotonic() - start >= 0.09
+    
+    @pytest.mark.asyncio
+    async def test_tree_reduce(self):
+        """Test that large result sets are reduced level by level within budget."""
+        from openstackai.blueprint import MapReducePattern
+        
+        from openstackai.tokens import get_counter
+        counter = get_counter("gpt-4")
+        
+        # Five results fill a 300-token prompt, so 6 leaves a lone trailing one
+        for count in (6, 40):
+            mapper = self._Agent("map", reply=lambda p: "x" * 200)
+            reducer = self._Agent("reduce", reply=lambda p: "summary")
+            mr = MapReducePattern(mapper, reducer, num_workers=4, reduce_token_budget=300)
+            
+            result = await mr.run("task", items=range(count))
+            
+            assert result == "summary"
+            assert len(reducer.prompts) > 1
+            assert max(counter.count_text(p) for p in reducer.prompts) <= 300
+            assert reducer.prompts[-1].count("--- Result") < count
+    
+    @pytest.mark.asyncio
+    async def test_iter_map_is_lazy(self):
+        """Test that items are pulled from the iterable on demand."""
+        from openstackai.blueprint import MapReducePattern
+        
+        pulled = []
+        
+        def items():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+        
+        async def first_two(mr):
+            results = []
+            stream = mr.iter_map("task", items())
+            async for entry in stream:
+                results.append(entry)
+                if len(results) == 2:
+                    break
+            await stream.aclose()
+            return results
+        
+        mr = MapReducePattern(self._Agent("map"), self._Agent("reduce"), num_workers=2)
+        assert len(await first_two(mr)) == 2
+        assert len(pulled) < 20
+
+class TestWorkflowGraph:
+    """Tests for dependency-graph workflows, fan-out and memoization."""
+    
+    @pytest.mark.asyncio
+    async def test_branches_overlap_and_join(self):
+        """Test that independent branches run concurrently and meet at a join."""
+        import asyncio
+        from openstackai.blueprint.workflow import Workflow, function_step, join_step
+        
+        active = [0]
+        peak = [0]
+        
+        def branch(value):
+            async def handler(context):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.02)
+                active[0] -= 1
+                return value
+            return handler
+        
+        workflow = (Workflow("graph")
+            .add_step(function_step("a", branch(1)))
+            .add_step(function_step("b", branch(2)))
+            .add_step(function_step("c", branch(3)))
+            .add_step(join_step("gather", ["a", "b", "c"]))
+            .add_step(function_step(
+                "total", lambda ctx: sum(ctx.get("gather").values()), depends_on=["gather"]
+            ))
+        )
+        context = await workflow.run()
+        
+        assert peak[0] == 3
+        assert context.get("gather") == {"a": 1, "b": 2, "c": 3}
+        assert context.get("total") == 6
+    
+    @pytest.mark.asyncio
+    async def test_fan_out_filters_and_bounds_concurrency(self):
+        """Test that a loop step runs its step per matching item, bounded."""
+        import asyncio
+        from openstackai.blueprint.workflow import Workflow, function_step, loop_step
+        
+        active = [0]
+        peak = [0]
+        
+        async def square(context):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return context.get("item") ** 2
+        
+        workflow = Workflow("fan").add_step(loop_step(
+            "squares", function_step("square", square), items_key="numbers",
+            max_concurrency=2, item_filter=lambda n: n % 2 == 1,
+        ))
+        context = await workflow.run(numbers=[1, 2, 3, 4, 5, 7])
+        
+        assert context.get("squares") == [1, 9, 25, 49]
+        assert peak[0] == 2
+    
+    @pytest.mark.asyncio
+    async def test_memoized_steps_are_skipped(self):
+        """Test that re-running with the same inputs reuses step results."""
+        from openstackai.blueprint.workflow import StepStatus, Workflow, function_step
+        
+        calls = []
+        
+        def fetch(context, topic):
+            calls.append(topic)
+            return topic.upper()
+        
+        workflow = (Workflow("memo", memoize=True)
+            .add_step(function_step("fetch", fetch, input_mapping={"topic": "topic"}))
+            .add_step(function_step(
+                "shout", lambda ctx: ctx.get("fetch") + "!", depends_on=["fetch"]
+            ))
+        )
+        assert (await workflow.run(topic="ai")).get("shout") == "AI!"
+        assert (await workflow.run(topic="ai")).get("shout") == "AI!"
+        assert calls == ["ai"]
+        assert workflow.get_step("fetch").status == StepStatus.COMPLETED
+        
+        assert (await workflow.run(topic="ml")).get("shout") == "ML!"
+        workflow.clear_cache()
+        await workflow.run(topic="ai")
+        assert calls == ["ai", "ml", "ai"]
+        
+        # Function steps read the context directly, so all of it keys the memo
+        reads = (Workflow("reads", memoize=True)
+            .add_step(function_step("greet", lambda ctx: "A:" + ctx.get("topic")))
+        )
+        assert (await reads.run(topic="cats")).get("greet") == "A:cats"
+        assert (await reads.run(topic="dogs")).get("greet") == "A:dogs"
+    
+    @pytest.mark.asyncio
+    async def test_failures_and_cycles(self):
+        """Test error handlers, skipped descendants and cycle detection."""
+        from openstackai.blueprint.workflow import (
+            StepStatus, Workflow, function_step,
+        )
+        
+        def boom(context):
+            raise RuntimeError("boom")
+        
+        handled = (Workflow("handled")
+            .add_step(function_step("risky", boom, on_error="fallback"))
+            .add_step(function_step("fallback", lambda ctx: "recovered"))
+            .add_step(function_step("after", lambda ctx: "done", depends_on=["risky"]))
+        )
+        context = await handled.run()
+        assert context.get("fallback") == "recovered"
+        assert context.get("after") is None
+        assert handled.get_step("after").status == StepStatus.SKIPPED
+        
+        unhandled = (Workflow("unhandled")
+            .add_step(function_step("risky", boom))
+            .add_step(function_step("after", lambda ctx: "done", depends_on=["risky"]))
+        )
+        with pytest.raises(RuntimeError):
+            await unhandled.run()
+        assert unhandled.get_step("risky").status == StepStatus.FAILED
+        assert unhandled.get_step("after").status == StepStatus.SKIPPED
+        
+        cyclic = (Workflow("cyclic")
+            .add_step(function_step("x", lambda ctx: 1, depends_on=["y"]))
+            .add_step(function_step("y", lambda ctx: 2, depends_on=["x"]))
+        )
+        with pytest.raises(ValueError, match="cycle"):
+            await cyclic.run()
+
+    
+    @pytest.mark.asyncio
+    async def test_handled_failure_skips_dependents(self):
+        """Test that on_error runs but the failed step's dependents never start."""
+        from openstackai.blueprint.workflow import StepStatus, Workflow, function_step
+        
+        started = []
+        
+        def boom(context):
+            raise RuntimeError("boom")
+        
+        def record(name):
+            def run(context):
+                started.append((name, context.get("risky")))
+                return name
+            return run
+        
+        workflow = (Workflow("handled")
+            .add_step(function_step("risky", boom, on_error="fallback"))
+            .add_step(function_step("fallback", lambda ctx: "recovered"))
+            .add_step(function_step("child", record("child"), depends_on=["risky"]))
+            .add_step(function_step("grandchild", record("grandchild"), depends_on=["child"]))
+            .add_step(function_step("other", record("other"), depends_on=[]))
+            .add_step(function_step("joined", record("joined"), depends_on=["child", "other"]))
+        )
+        context = await workflow.run()
+        
+        assert context.get("fallback") == "recovered"
+        assert started == [("other", None)]
+        assert workflow.get_step("risky").status == StepStatus.FAILED
+        assert workflow.get_step("other").status == StepStatus.COMPLETED
+        for name in ("child", "grandchild", "joined"):
+            assert workflow.get_step(name).status == StepStatus.SKIPPED
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
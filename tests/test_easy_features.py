@@ -244,5 +244,135 @@ class TestTraceFunction:
         assert summary["total_spans"] >= 1
 
 
+class TestTracer:
+    """Tests for context-aware spans, the ring buffer, sampling and export."""
+    
+    def _tracer(self, **kwargs):
+        from openstackai.easy.trace import Tracer
+        
+        tracer = Tracer(**kwargs)
+        tracer.enable()
+        return tracer
+    
+    @pytest.mark.asyncio
+    async def test_nesting_follows_tasks_and_threads(self):
+        """Test that each asyncio task and thread has its own current span."""
+        import asyncio
+        import threading
+        
+        tracer = self._tracer()
+        
+        async def job(name):
+            with tracer.span(name) as outer:
+                await asyncio.sleep(0.01)
+                with tracer.span(f"{name}.inner") as inner:
+                    await asyncio.sleep(0.01)
+            return outer, inner
+        
+        pairs = await asyncio.gather(job("a"), job("b"))
+        for outer, inner in pairs:
+            assert inner.parent_span_id == outer.span_id
+            assert inner.trace_id == outer.trace_id
+            assert outer.parent_span_id is None
+        
+        with tracer.span("main"):
+            seen = []
+            worker = threading.Thread(target=lambda: seen.append(tracer.current_span))
+            worker.start()
+            worker.join()
+            assert seen == [None]
+        assert tracer.current_span is None
+    
+    def test_ring_buffer_is_bounded(self):
+        """Test that only the newest spans are kept."""
+        from openstackai.easy.trace import Span, SpanRingBuffer
+        
+        tracer = self._tracer(buffer_size=5)
+        for i in range(12):
+            with tracer.span(f"s{i}"):
+                pass
+        assert [s.name for s in tracer.get_spans()] == ["s7", "s8", "s9", "s10", "s11"]
+        
+        ring = SpanRingBuffer(4)
+        for i in range(3):
+            ring.append(Span(name=f"r{i}"))
+        spans, sequence, dropped = ring.read_since(0, limit=10)
+        assert [s.name for s in spans] == ["r0", "r1", "r2"] and dropped == 0
+        for i in range(3, 10):
+            ring.append(Span(name=f"r{i}"))
+        spans, sequence, dropped = ring.read_since(sequence, limit=10)
+        assert [s.name for s in spans] == ["r6", "r7", "r8", "r9"]
+        assert (sequence, dropped) == (10, 3)
+    
+    def test_disabled_and_head_sampling(self):
+        """Test the no-op span and per-trace head sampling."""
+        from openstackai.easy.trace import Tracer
+        
+        disabled = Tracer()
+        span = disabled.span("off")
+        with span as entered:
+            entered.log("ignored")
+        assert disabled.span("again") is span
+        assert disabled.get_spans() == []
+        
+        tracer = self._tracer(sample_rate=0.0)
+        with tracer.span("root"):
+            with tracer.span("child") as child:
+                child.log("ignored")
+            tracer.log("ignored")
+        assert tracer.get_spans() == []
+    
+    def test_tail_sampling_keeps_failed_traces(self):
+        """Test that tail sampling decides per trace once the root ends."""
+        tracer = self._tracer(tail_sample_rate=0.0)
+        
+        with tracer.span("ok"):
+            with tracer.span("ok.child"):
+                pass
+        with pytest.raises(RuntimeError):
+            with tracer.span("bad"):
+                with tracer.span("bad.child"):
+                    pass
+                raise RuntimeError("boom")
+        
+        assert [s.name for s in tracer.get_spans()] == ["bad.child", "bad"]
+        assert tracer.get_spans()[1].status == "error"
+        
+        # configure() leaves options that are not passed alone
+        tracer.configure(sample_rate=1.0, slow_ms=500)
+        assert (tracer.tail_sample_rate, tracer.slow_ms) == (0.0, 500)
+        tracer.configure(tail_sample_rate=None)
+        assert (tracer.tail_sample_rate, tracer.slow_ms) == (None, 500)
+        tracer.configure(max_span_events=None)
+        assert tracer.max_span_events is None
+    
+    def test_background_export_and_handlers(self, tmp_path):
+        """Test batched JSONL export, OTLP encoding and async handlers."""
+        import json
+        from openstackai.easy.trace import JSONLSink, OTLPSink
+        
+        tracer = self._tracer()
+        events = []
+        tracer.handler(events.append)
+        exporter = tracer.add_exporter(JSONLSink(str(tmp_path / "spans.jsonl")), interval=60)
+        
+        with tracer.span("parent", user="u1") as parent:
+            with tracer.span("child") as child:
+                child.log("working", step=1)
+        tracer.flush()
+        
+        lines = (tmp_path / "spans.jsonl").read_text().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["child", "parent"]
+        assert exporter.exported == 2
+        assert [e.type for e in events] == ["start", "start", "log"]
+        
+        body = OTLPSink().to_otlp(tracer.get_spans())
+        otlp_spans = body["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert otlp_spans[0]["parentSpanId"] == parent.span_id
+        assert otlp_spans[0]["traceId"] == child.trace_id and len(child.trace_id) == 32
+        assert otlp_spans[1]["attributes"] == [{"key": "user", "value": {"stringValue": "u1"}}]
+        tracer.shutdown()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -498,6 +498,288 @@ class TestEvalStatus:
         assert EvalStatus.SKIPPED.value == "skipped"
 
 
+class TestEvalRunner:
+    """Tests for bounded, cached and resumable evaluation runs."""
+    
+    def _cases(self, n=6):
+        from openstackai.evaluation import TestCase
+        return [
+            TestCase(id=f"case-{i}", input=f"q{i}", expected_contains=[f"q{i}"])
+            for i in range(n)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_async_caps_concurrency(self):
+        """Test that evaluate_async never runs more than max_concurrency cases."""
+        import asyncio
+        from openstackai.evaluation import Evaluator, EvalConfig
+        
+        state = {"active": 0, "peak": 0}
+        
+        async def agent(question):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return f"answer to {question}"
+        
+        evaluator = Evaluator(agent, EvalConfig(verbose=False, max_concurrency=2))
+        metrics = await evaluator.evaluate_async(self._cases(8))
+        
+        assert metrics.total == 8
+        assert metrics.passed == 8
+        assert state["peak"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_async_sync_agent_runs_once(self):
+        """Test that sync agents are called once per case on the shared pool."""
+        from openstackai.evaluation import Evaluator, EvalConfig
+        
+        calls = []
+        
+        def agent(question):
+            calls.append(question)
+            return question
+        
+        evaluator = Evaluator(agent, EvalConfig(verbose=False))
+        try:
+            metrics = await evaluator.evaluate_async(self._cases(3))
+            pool = evaluator._executor
+            evaluator.evaluate(self._cases(3))
+            assert evaluator._executor is pool
+        finally:
+            evaluator.close()
+        
+        assert metrics.passed == 3
+        assert len(calls) == 6
+    
+    def test_criteria_do_not_mutate_context(self):
+        """Test that scoring leaves the test case context untouched."""
+        from openstackai.evaluation import Evaluator, EvalConfig, TestCase
+        
+        case = TestCase(input="hi", expected_contains=["hi"], context={"user": "a"})
+        Evaluator(lambda q: q, EvalConfig(verbose=False)).evaluate([case])
+        
+        assert case.context == {"user": "a"}
+    
+    def test_rerun_uses_cache(self):
+        """Test that an unchanged rerun does not call the agent."""
+        from openstackai.evaluation import EvalRunner, EvalConfig
+        
+        calls = []
+        
+        def agent(question):
+            calls.append(question)
+            return question
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "cache.jsonl")
+            runner = EvalRunner(agent, EvalConfig(verbose=False), cache_path=cache_path)
+            first = runner.run(self._cases())
+            runner.close()
+            
+            runner = EvalRunner(agent, EvalConfig(verbose=False), cache_path=cache_path)
+            second = runner.run(self._cases())
+            runner.close()
+        
+        assert len(calls) == 6
+        assert first.passed == second.passed == 6
+        assert runner.cache_hits == 6
+        assert runner.executed == 0
+    
+    def test_changed_case_reruns_only_that_case(self):
+        """Test that only cases whose key changed call the agent again."""
+        from openstackai.evaluation import EvalRunner, EvalConfig
+        
+        calls = []
+        
+        def agent(question):
+            calls.append(question)
+            return question
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "cache.jsonl")
+            runner = EvalRunner(agent, EvalConfig(verbose=False), cache_path=cache_path)
+            runner.run(self._cases())
+            
+            cases = self._cases()
+            cases[2].input = "changed"
+            calls.clear()
+            metrics = runner.run(cases)
+            runner.close()
+        
+        assert calls == ["changed"]
+        assert runner.cache_hits == 5
+        assert metrics.total == 6
+    
+    def test_agent_change_invalidates_cache(self):
+        """Test that editing the agent's prompt changes every key."""
+        from openstackai.evaluation import EvalRunner, EvalConfig, agent_fingerprint
+        
+        class PromptAgent:
+            def __init__(self, instructions):
+                self.instructions = instructions
+            
+            def run(self, question):
+                return question
+        
+        assert agent_fingerprint(PromptAgent("a")) == agent_fingerprint(PromptAgent("a"))
+        assert agent_fingerprint(PromptAgent("a")) != agent_fingerprint(PromptAgent("b"))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "cache.jsonl")
+            for instructions, expected_hits in (("a", 0), ("a", 6), ("b", 0)):
+                runner = EvalRunner(
+                    PromptAgent(instructions), EvalConfig(verbose=False), cache_path=cache_path
+                )
+                runner.run(self._cases())
+                runner.close()
+                assert runner.cache_hits == expected_hits
+    
+    def test_module_global_change_invalidates_cache(self):
+        """Test that function agents are fingerprinted with the globals they read."""
+        from openstackai.evaluation import agent_fingerprint
+        
+        module = {"PROMPT": "Answer briefly: ", "SEEN": []}
+        exec(
+            "def agent(question):\n"
+            "    SEEN.append(question)\n"
+            "    return PROMPT + question\n",
+            module,
+        )
+        before = agent_fingerprint(module["agent"])
+        module["agent"]("q")
+        assert agent_fingerprint(module["agent"]) == before
+        
+        module["PROMPT"] = "Answer in detail: "
+        assert agent_fingerprint(module["agent"]) != before
+    
+    def test_fingerprint_is_stable_across_processes(self):
+        """Test that set literals don't make fingerprints depend on PYTHONHASHSEED."""
+        import subprocess
+        import sys
+        import openstackai
+        
+        script = (
+            "from openstackai.evaluation import agent_fingerprint\n"
+            "def agent(question):\n"
+            "    if question in {'alpha', 'beta', 'gamma', 'delta'}:\n"
+            "        return ('known', frozenset({'x', 'y', 'z'}))\n"
+            "    return question\n"
+            "print(agent_fingerprint(agent))\n"
+        )
+        src = os.path.dirname(os.path.dirname(openstackai.__file__))
+        fingerprints = set()
+        for seed in ("1", "2", "3", "4"):
+            env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=src)
+            output = subprocess.run(
+                [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+            )
+            fingerprints.add(output.stdout.strip())
+        assert len(fingerprints) == 1
+    
+    def test_resume_from_checkpoint(self):
+        """Test that an interrupted run resumes without redoing finished cases."""
+        from openstackai.evaluation import EvalRunner, EvalConfig
+        
+        calls = []
+        
+        def agent(question):
+            calls.append(question)
+            return question
+        
+        class Interrupted(Exception):
+            pass
+        
+        def interrupt(result, metrics):
+            if metrics.total == 3:
+                raise Interrupted()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "run.jsonl")
+            config = EvalConfig(verbose=False, max_concurrency=1)
+            runner = EvalRunner(agent, config, checkpoint_path=checkpoint, on_result=interrupt)
+            with pytest.raises(Interrupted):
+                runner.run(self._cases())
+            runner.close()
+            
+            # Simulate a torn final line
+            with open(checkpoint, "a") as f:
+                f.write('{"key": "trunc')
+            
+            calls.clear()
+            runner = EvalRunner(agent, config, checkpoint_path=checkpoint)
+            metrics = runner.run(self._cases())
+            runner.close()
+        
+        assert calls == ["q3", "q4", "q5"]
+        assert runner.resumed == 3
+        assert metrics.total == 6
+        assert metrics.passed == 6
+    
+    def test_errors_are_retried(self):
+        """Test that errored cases are not cached."""
+        from openstackai.evaluation import EvalRunner, EvalConfig
+        
+        failing = {"on": True}
+        
+        def agent(question):
+            if failing["on"] and question == "q1":
+                raise ValueError("flaky")
+            return question
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runner = EvalRunner(
+                agent, EvalConfig(verbose=False),
+                cache_path=os.path.join(tmpdir, "cache.jsonl"),
+                checkpoint_path=os.path.join(tmpdir, "run.jsonl"),
+            )
+            first = runner.run(self._cases(3))
+            failing["on"] = False
+            second = runner.run(self._cases(3))
+            runner.close()
+        
+        assert first.errors == 1
+        assert second.errors == 0
+        assert runner.executed == 1
+    
+    def test_streaming_metrics(self):
+        """Test that on_result sees the metrics update after each case."""
+        from openstackai.evaluation import EvalRunner, EvalConfig
+        
+        totals = []
+        runner = EvalRunner(
+            lambda q: q,
+            EvalConfig(verbose=False),
+            on_result=lambda result, metrics: totals.append(metrics.total),
+        )
+        runner.run(self._cases(4))
+        runner.close()
+        
+        assert totals == [1, 2, 3, 4]
+    
+    def test_result_cache_compact(self):
+        """Test that compaction keeps only the latest result per key."""
+        from openstackai.evaluation import ResultCache, EvalResult, EvalStatus, TestCase
+        
+        case = TestCase(input="hi")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.jsonl")
+            cache = ResultCache(path)
+            cache.put("k", EvalResult(case, EvalStatus.FAILED, "a"))
+            cache.put("k", EvalResult(case, EvalStatus.PASSED, "b", score=1.0))
+            cache.compact()
+            cache.close()
+            
+            with open(path) as f:
+                assert len(f.readlines()) == 1
+            restored = ResultCache(path).get("k", case)
+        
+        assert restored.passed
+        assert restored.actual_output == "b"
+        assert restored.test_case is case
+
+
 class TestEvalIntegration:
     """Integration tests for evaluation module."""
     
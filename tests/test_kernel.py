@@ -503,3 +503,188 @@ class TestInvocationContext:
         
         assert not inv.success
         assert inv.error is error
+
+
+class TestKernelInvocation:
+    """Tests for compiled invocation, filter chains and bounded history."""
+    
+    def _kernel(self, **kwargs):
+        from openstackai.kernel import Kernel
+        from openstackai.plugins import Plugin, function
+        
+        class MathPlugin(Plugin):
+            name = "math"
+            
+            @function
+            def add(self, a: int, b: int) -> int:
+                """Add two numbers."""
+                return a + b
+            
+            @function
+            async def double(self, value: int) -> int:
+                """Double a number."""
+                return value * 2
+        
+        return Kernel(**kwargs).add_plugin(MathPlugin())
+    
+    def test_sync_and_async_functions(self):
+        """Test invoking sync and async functions without a running loop."""
+        kernel = self._kernel()
+        assert kernel.invoke("math", "add", a=1, b=2) == 3
+        assert kernel.invoke("math", "double", value=4) == 8
+        assert kernel.invoke("math", "double", value=5) == 10
+        kernel.close()
+        
+        with pytest.raises(ValueError):
+            kernel.invoke("math", "missing")
+    
+    def test_invoke_from_many_threads(self):
+        """Test that each calling thread's event loop is closed when it exits."""
+        import gc
+        import threading
+        
+        kernel = self._kernel()
+        loops = []
+        results = []
+        
+        def call(value):
+            results.append(kernel.invoke("math", "double", value=value))
+            loops.append(kernel._local.loop.loop)
+        
+        for start in range(0, 100, 20):
+            threads = [threading.Thread(target=call, args=(i,)) for i in range(start, start + 20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        gc.collect()
+        
+        assert sorted(results) == [i * 2 for i in range(100)]
+        assert len(set(map(id, loops))) == 100
+        assert all(loop.is_closed() for loop in loops)
+        assert len(kernel._loops) == 0
+        
+        assert kernel.invoke("math", "double", value=1) == 2
+        loop = kernel._local.loop.loop
+        kernel.close()
+        assert loop.is_closed()
+        assert kernel.invoke("math", "double", value=2) == 4
+        kernel.close()
+    
+    @pytest.mark.asyncio
+    async def test_invoke_async(self):
+        """Test awaiting sync and async functions inside a running loop."""
+        kernel = self._kernel()
+        assert await kernel.invoke_async("math", "double", value=3) == 6
+        assert await kernel.invoke_async("math", "add", a=2, b=2) == 4
+    
+    def test_filter_chain_invalidation(self):
+        """Test that compiled chains follow filter additions and removals."""
+        from openstackai.kernel import FilterType, FunctionFilter, PromptFilter
+        
+        class Offset(FunctionFilter):
+            def on_function_invoked(self, ctx, result):
+                return result + 10
+        
+        kernel = self._kernel()
+        assert kernel.invoke("math", "add", a=1, b=1) == 2
+        
+        offset = Offset()
+        kernel.add_filter(offset)
+        kernel.add_filter(PromptFilter())
+        assert kernel.filters.chain(FilterType.FUNCTION) == (offset,)
+        assert kernel.invoke("math", "add", a=1, b=1) == 12
+        
+        kernel.filters.remove(offset)
+        assert kernel.invoke("math", "add", a=1, b=1) == 2
+        assert len(kernel.filters.get_filters()) == 1
+    
+    def test_resolution_cache_follows_registry(self):
+        """Test that cached lookups are dropped when plugins change."""
+        kernel = self._kernel()
+        assert kernel.invoke("math", "add", a=1, b=2) == 3
+        
+        plugin = kernel.plugins.get_plugin("math")
+        plugin.add_function(lambda a, b: 100, name="add")
+        assert kernel.invoke("math", "add", a=1, b=2) == 100
+        
+        kernel.plugins.unregister("math")
+        with pytest.raises(ValueError):
+            kernel.invoke("math", "add", a=1, b=2)
+    
+    def test_bounded_and_sampled_history(self):
+        """Test that invocation history is capped and can be sampled."""
+        kernel = self._kernel(max_invocations=5)
+        for i in range(12):
+            kernel.invoke("math", "add", a=i, b=0)
+        history = kernel.context.invocations
+        assert len(history) == 5
+        assert [inv.result for inv in history] == [7, 8, 9, 10, 11]
+        assert kernel.context.dropped_invocations == 7
+        
+        sampled = self._kernel(invocation_sample_rate=0.25)
+        for i in range(20):
+            sampled.invoke("math", "add", a=i, b=0)
+        assert sampled.context.total_invocations == 5
+        assert sampled.create_context().sample_rate == 0.25
+    
+    def test_invoke_many_runs_sync_calls_in_parallel(self):
+        """Test that invoke_many offloads sync functions and bounds concurrency."""
+        import threading
+        import time
+        
+        kernel = self._kernel()
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+        
+        def slow(value):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return value
+        
+        kernel.get_plugin("math").add_function(slow, name="slow")
+        
+        start = time.perf_counter()
+        results = kernel.invoke_many([("math", "slow", {"value": i}) for i in range(4)])
+        assert time.perf_counter() - start < 0.15
+        assert [inv.result for inv in results] == [0, 1, 2, 3]
+        
+        peak[0] = 0
+        kernel.invoke_many(
+            [("math", "slow", {"value": i}) for i in range(6)], max_concurrency=2
+        )
+        assert peak[0] == 2
+        kernel.close()
+    
+    def test_invoke_many_collects_errors_and_timeouts(self):
+        """Test that failures and timeouts are reported per call."""
+        import asyncio
+        
+        kernel = self._kernel()
+        
+        async def stall():
+            await asyncio.sleep(5)
+        
+        kernel.get_plugin("math").add_function(stall, name="stall")
+        
+        results = kernel.invoke_many(
+            [
+                ("math", "add", {"a": 1, "b": 2}),
+                ("math", "stall"),
+                ("math", "missing"),
+                ("math", "double", {"value": 4}),
+            ],
+            timeout=0.05,
+        )
+        kernel.close()
+        
+        assert [inv.success for inv in results] == [True, False, False, True]
+        assert results[0].result == 3
+        assert isinstance(results[1].error, asyncio.TimeoutError)
+        assert isinstance(results[2].error, ValueError)
+        assert results[3].result == 8
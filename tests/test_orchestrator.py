@@ -206,6 +206,544 @@ class TestOrchestrator:
         assert callable(orch.emit)
 
 
+class TestWorkerPool:
+    """Tests for the bounded worker pool."""
+    
+    def test_runs_at_most_max_workers(self):
+        """Test that concurrency never exceeds max_workers."""
+        import threading
+        import time
+        from openstackai.orchestrator import WorkerPool
+        
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+        
+        def work():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+        
+        with WorkerPool(max_workers=3) as pool:
+            futures = [pool.submit(work) for _ in range(30)]
+            for future in futures:
+                future.result(timeout=5)
+            assert pool.stats()["workers"] <= 3
+        
+        assert peak[0] <= 3
+    
+    def test_priority_order(self):
+        """Test that higher priority items are dequeued first."""
+        import threading
+        from openstackai.orchestrator import WorkerPool
+        
+        gate = threading.Event()
+        order = []
+        pool = WorkerPool(max_workers=1)
+        pool.submit(gate.wait)
+        for priority in (1, 5, 3):
+            pool.submit(order.append, priority, priority=priority)
+        gate.set()
+        pool.shutdown()
+        
+        assert order == [5, 3, 1]
+    
+    def test_backpressure(self):
+        """Test that a full queue rejects non-blocking submits."""
+        import queue
+        import threading
+        from openstackai.orchestrator import WorkerPool
+        
+        started = threading.Event()
+        gate = threading.Event()
+        pool = WorkerPool(max_workers=1, max_queue=1)
+        pool.submit(lambda: (started.set(), gate.wait()))
+        started.wait(timeout=5)
+        pool.submit(lambda: None)
+        
+        with pytest.raises(queue.Full):
+            pool.submit(lambda: None, block=False)
+        with pytest.raises(queue.Full):
+            pool.submit(lambda: None, timeout=0.01)
+        
+        gate.set()
+        pool.shutdown()
+    
+    def test_submit_after_does_not_hold_worker(self):
+        """Test that delayed items leave the worker free."""
+        import time
+        from openstackai.orchestrator import WorkerPool
+        
+        with WorkerPool(max_workers=1) as pool:
+            delayed = pool.submit_after(0.2, lambda: "late")
+            start = time.monotonic()
+            assert pool.submit(lambda: "now").result(timeout=1) == "now"
+            assert time.monotonic() - start < 0.2
+            assert delayed.result(timeout=2) == "late"
+    
+    def test_shutdown_cancels_pending(self):
+        """Test cancelling queued work on shutdown."""
+        import threading
+        from openstackai.orchestrator import WorkerPool
+        
+        gate = threading.Event()
+        pool = WorkerPool(max_workers=1)
+        pool.submit(gate.wait)
+        pending = pool.submit(lambda: None)
+        pool.shutdown(wait=False, cancel_pending=True)
+        gate.set()
+        
+        assert pending.cancelled()
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda: None)
+
+
+class TestOrchestratorExecution:
+    """Tests for running tasks through the orchestrator."""
+    
+    def test_submit_and_wait(self):
+        """Test submitting a task and waiting for its result."""
+        from openstackai.orchestrator import Orchestrator, TaskStatus
+        
+        orch = Orchestrator(max_workers=2)
+        task = orch.submit(lambda x: x * 2, 21)
+        
+        assert orch.wait(task, timeout=5) == 42
+        assert task.status == TaskStatus.COMPLETED
+        orch.shutdown()
+    
+    def test_retry_then_fail(self):
+        """Test that retries are re-enqueued and the final failure surfaces."""
+        from openstackai.orchestrator import Orchestrator, TaskStatus
+        
+        calls = []
+        
+        def flaky():
+            calls.append(1)
+            raise ValueError("boom")
+        
+        failed = []
+        orch = Orchestrator(max_workers=1, retry_backoff=0.001)
+        orch.on("task_failed", failed.append)
+        task = orch.submit(flaky, max_retries=2)
+        
+        with pytest.raises(Exception, match="boom"):
+            orch.wait(task, timeout=5)
+        assert len(calls) == 3
+        assert task.status == TaskStatus.FAILED
+        assert failed == [task]
+        orch.shutdown()
+    
+    def test_dependent_step_waits_without_worker(self):
+        """Test that a step with unfinished dependencies is parked, not run."""
+        import threading
+        from openstackai.orchestrator import Orchestrator, Task
+        
+        gate = threading.Event()
+        orch = Orchestrator(max_workers=1)
+        parent = orch.submit(gate.wait)
+        child = Task(name="child", func=lambda: "done", dependencies=[parent.id])
+        orch._execute_task(child)
+        
+        assert not child.future.done()
+        gate.set()
+        assert orch.wait(child, timeout=5) == "done"
+        orch.shutdown()
+    
+    def test_wait_timeout(self):
+        """Test that wait raises TimeoutError."""
+        import threading
+        from openstackai.orchestrator import Orchestrator
+        
+        gate = threading.Event()
+        orch = Orchestrator(max_workers=1)
+        task = orch.submit(gate.wait)
+        
+        with pytest.raises(TimeoutError):
+            orch.wait(task, timeout=0.01)
+        gate.set()
+        orch.shutdown()
+    
+    def test_rerun_workflow(self):
+        """Test that a workflow can run more than once."""
+        from openstackai.orchestrator import ExecutionPattern, Orchestrator, Task
+        
+        orch = Orchestrator(max_workers=2)
+        wf = orch.create_workflow("twice", pattern=ExecutionPattern.PARALLEL)
+        wf.add_step(Task(name="a", func=lambda: 1))
+        wf.add_step(Task(name="b", func=lambda: 2))
+        
+        assert orch.run_workflow(wf) == {"a": 1, "b": 2}
+        assert orch.run_workflow(wf) == {"a": 1, "b": 2}
+        orch.shutdown()
+
+    def test_process_backend(self):
+        """Test that the process backend runs tasks and surfaces their errors."""
+        import operator
+        from openstackai.orchestrator import Orchestrator, TaskStatus
+
+        orch = Orchestrator(max_workers=2, backend="process", retry_backoff=0.001)
+        task = orch.submit(operator.add, 2, 3)
+        failing = orch.submit(operator.truediv, 1, 0, max_retries=1)
+
+        assert orch.wait(task, timeout=10) == 5
+        assert task.status == TaskStatus.COMPLETED
+        assert task.started_at is not None
+        with pytest.raises(ZeroDivisionError):
+            failing.future.result(timeout=10)
+        assert failing.status == TaskStatus.FAILED
+        assert failing.retry_count == 1
+        orch.shutdown()
+
+
+class TestDAGScheduling:
+    """Tests for dependency graph scheduling."""
+    
+    def test_topological_sort_and_cycles(self):
+        """Test ordering and up-front cycle detection."""
+        from openstackai.orchestrator import CycleError, Task, topological_sort
+        
+        a = Task(id="a", name="a")
+        b = Task(id="b", name="b", dependencies=["a"])
+        c = Task(id="c", name="c", dependencies=["b", "a"])
+        assert [t.id for t in topological_sort([c, b, a])] == ["a", "b", "c"]
+        
+        a.dependencies = ["c"]
+        with pytest.raises(CycleError) as exc:
+            topological_sort([a, b, c])
+        assert sorted(exc.value.task_ids) == ["a", "b", "c"]
+    
+    def test_cycle_runs_nothing(self):
+        """Test that a cyclic graph is rejected before any task runs."""
+        from openstackai.orchestrator import CycleError, Orchestrator, Task
+        
+        ran = []
+        a = Task(id="a", name="a", func=lambda: ran.append("a"), dependencies=["b"])
+        b = Task(id="b", name="b", func=lambda: ran.append("b"), dependencies=["a"])
+        orch = Orchestrator()
+        
+        with pytest.raises(CycleError):
+            orch.run_graph([a, b])
+        orch.shutdown()
+        assert ran == []
+    
+    def test_fan_out_fan_in(self):
+        """Test that independent branches run in parallel."""
+        import time
+        from openstackai.orchestrator import ExecutionPattern, Orchestrator, Task
+        
+        def branch(n):
+            time.sleep(0.05)
+            return n
+        
+        orch = Orchestrator(max_workers=4)
+        wf = orch.create_workflow("fan", pattern=ExecutionPattern.DAG)
+        wf.add_step(Task(name="source", func=lambda: "start"))
+        for i in range(4):
+            wf.add_step(Task(name=f"b{i}", func=branch, args=(i,), dependencies=["source"]))
+        wf.add_step(Task(name="sink", func=lambda: "end", dependencies=[f"b{i}" for i in range(4)]))
+        
+        state = orch.run_workflow(wf)
+        orch.shutdown()
+        
+        assert state["sink"] == "end"
+        assert state["b3"] == 3
+        report = wf.report
+        assert report.succeeded
+        assert report.elapsed_seconds < 0.2  # 4 x 0.05s if run serially
+        assert len(report.critical_path) == 3
+        assert report.critical_path_seconds >= 0.05
+    
+    def test_failure_cancels_descendants(self):
+        """Test that a failed task cancels its descendants only."""
+        from openstackai.orchestrator import Orchestrator, Task, TaskStatus
+        
+        def fail():
+            raise ValueError("boom")
+        
+        bad = Task(id="bad", name="bad", func=fail, max_retries=0)
+        child = Task(id="child", name="child", func=lambda: 1, dependencies=["bad"])
+        grandchild = Task(id="gc", name="gc", func=lambda: 2, dependencies=["child"])
+        other = Task(id="other", name="other", func=lambda: 3)
+        
+        orch = Orchestrator()
+        report = orch.run_graph([bad, child, grandchild, other], timeout=5)
+        orch.shutdown()
+        
+        assert report.failed == ["bad"]
+        assert sorted(report.cancelled) == ["child", "gc"]
+        assert report.completed == ["other"]
+        assert grandchild.status == TaskStatus.CANCELLED
+        with pytest.raises(Exception, match="cancelled"):
+            orch.wait(child)
+    
+    def test_fan_out_wider_than_max_queue(self):
+        """Test that releasing more dependents than the queue holds does not deadlock."""
+        from openstackai.orchestrator import Orchestrator, Task
+        
+        root = Task(name="root", func=lambda: "root")
+        children = [
+            Task(name=f"c{i}", func=lambda i=i: i, dependencies=["root"]) for i in range(5)
+        ]
+        sink = Task(name="sink", func=lambda: "sink", dependencies=[f"c{i}" for i in range(5)])
+        
+        orch = Orchestrator(max_workers=1, max_queue=1)
+        report = orch.run_graph([root, *children, sink], timeout=5)
+        stats = orch.status()["pool"]
+        orch.shutdown()
+        
+        assert report.succeeded
+        assert [child.result for child in children] == [0, 1, 2, 3, 4]
+        assert sink.result == "sink"
+        assert stats["queued"] == 0
+    
+    def test_submit_with_dependencies(self):
+        """Test that submitted tasks with dependencies run after their parents."""
+        import threading
+        from openstackai.orchestrator import Orchestrator
+        
+        gate = threading.Event()
+        order = []
+        orch = Orchestrator(max_workers=2)
+        parent = orch.submit(lambda: (gate.wait(), order.append("parent")))
+        child = orch.submit(lambda: order.append("child"), dependencies=[parent.id])
+        
+        assert orch.status()["tasks"]["waiting"] == 1
+        gate.set()
+        orch.wait(child, timeout=5)
+        orch.shutdown()
+        assert order == ["parent", "child"]
+
+
+class TestCronExpression:
+    """Tests for cron parsing and next-fire computation."""
+    
+    def test_next_fire(self):
+        """Test next firing times for common expressions."""
+        from openstackai.orchestrator import CronExpression
+        
+        after = datetime(2024, 1, 5, 17, 50)  # Friday
+        assert CronExpression("0 9 * * *").next_fire(after) == datetime(2024, 1, 6, 9, 0)
+        weekdays = CronExpression("*/15 9-17 * * mon-fri")
+        assert weekdays.next_fire(after) == datetime(2024, 1, 8, 9, 0)
+        assert CronExpression("55 17 * * *").next_fire(after) == datetime(2024, 1, 5, 17, 55)
+        assert CronExpression("@monthly").next_fire(after) == datetime(2024, 2, 1, 0, 0)
+        assert CronExpression("0 0 29 2 *").next_fire(after) == datetime(2024, 2, 29, 0, 0)
+        assert CronExpression("0 12 * dec 7").next_fire(after) == datetime(2024, 12, 1, 12, 0)
+    
+    def test_day_fields_are_ored(self):
+        """Test that restricted day-of-month and day-of-week both match."""
+        from openstackai.orchestrator import CronExpression
+        
+        cron = CronExpression("0 0 13 * fri")
+        fires = cron.fires_between(datetime(2024, 9, 1), datetime(2024, 9, 30))
+        assert [f.day for f in fires] == [6, 13, 20, 27]
+    
+    def test_invalid_expressions(self):
+        """Test that malformed or impossible expressions are rejected."""
+        from openstackai.orchestrator import CronExpression
+        
+        for expression in ["* * * *", "60 * * * *", "* * * foo *", "*/0 * * * *"]:
+            with pytest.raises(ValueError):
+                CronExpression(expression)
+        with pytest.raises(ValueError):
+            CronExpression("0 0 30 2 *").next_fire(datetime(2024, 1, 1))
+
+
+class TestJobScheduler:
+    """Tests for the scheduled job timer heap."""
+    
+    def _job(self, **kwargs):
+        from openstackai.orchestrator import ScheduledJob
+        return ScheduledJob(**kwargs)
+    
+    def test_misfire_policies(self):
+        """Test coalescing and grace time for late jobs."""
+        from datetime import timedelta
+        from openstackai.orchestrator import JobScheduler
+        
+        timers = JobScheduler(dispatch=lambda job, runs: None)
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        now = start + timedelta(seconds=35)
+        
+        def fire(job):
+            with timers._lock:
+                return timers._fire(job, now)
+        
+        coalesced = self._job(interval=10, next_run=start)
+        assert fire(coalesced) == 1
+        assert coalesced.misfire_count == 3
+        assert coalesced.next_run == start + timedelta(seconds=40)
+        
+        every = self._job(interval=10, next_run=start, coalesce=False)
+        assert fire(every) == 4
+        
+        graced = self._job(interval=10, next_run=start, coalesce=False, misfire_grace_time=16)
+        assert fire(graced) == 2
+        
+        expired = self._job(run_at=start, next_run=start, misfire_grace_time=5)
+        assert fire(expired) == 0
+        assert not expired.enabled
+    
+    def test_fires_in_due_order(self):
+        """Test that jobs fire earliest first without polling."""
+        import threading
+        from datetime import timedelta
+        from openstackai.orchestrator import JobScheduler
+        
+        fired = []
+        done = threading.Event()
+        
+        def dispatch(job, runs):
+            fired.append(job.id)
+            if len(fired) == 3:
+                done.set()
+        
+        timers = JobScheduler(dispatch=dispatch)
+        now = datetime.now()
+        for job_id, delay in [("c", 0.15), ("a", 0.05), ("b", 0.1)]:
+            timers.add(self._job(id=job_id, next_run=now + timedelta(seconds=delay)))
+        timers.add(self._job(id="gone", next_run=now))
+        timers.remove("gone")
+        
+        timers.start()
+        assert done.wait(timeout=5)
+        timers.stop()
+        assert fired == ["a", "b", "c"]
+        assert len(timers) == 0
+    
+    def test_slow_job_does_not_delay_others(self):
+        """Test that jobs run off the timer thread."""
+        import threading
+        import time
+        from openstackai.orchestrator import Orchestrator
+        
+        release = threading.Event()
+        ticks = []
+        orch = Orchestrator(max_workers=2)
+        slow = orch.schedule(release.wait, interval=60)
+        orch.schedule(lambda: ticks.append(1), interval=0.02)
+        
+        orch.start()
+        deadline = time.monotonic() + 5
+        while len(ticks) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        orch.shutdown()
+        
+        assert len(ticks) >= 3
+        assert slow.run_count == 1
+    
+    def test_schedule_cron_waits_for_next_fire(self):
+        """Test that cron jobs are not run immediately."""
+        from openstackai.orchestrator import Orchestrator
+        
+        orch = Orchestrator()
+        job = orch.schedule(lambda: None, cron="0 9 * * *")
+        
+        assert job.next_run > datetime.now()
+        assert (job.next_run.hour, job.next_run.minute) == (9, 0)
+        assert orch.unschedule(job)
+
+
+class TestStateJournal:
+    """Tests for the orchestrator state journal."""
+    
+    def test_append_and_replay(self, tmp_path):
+        """Test that the latest record per task wins and torn lines are skipped."""
+        from openstackai.orchestrator import StateJournal
+        
+        path = str(tmp_path / "state.json")
+        journal = StateJournal(path)
+        journal.append({"id": "a", "status": "pending"})
+        journal.append({"id": "b", "status": "pending"})
+        journal.append({"id": "a", "status": "completed"})
+        journal.close()
+        with open(journal.log_path, "a") as f:
+            f.write('{"id": "b", "stat')
+        
+        tasks = StateJournal(path).replay()["tasks"]
+        assert tasks["a"]["status"] == "completed"
+        assert tasks["b"]["status"] == "pending"
+    
+    def test_compaction(self, tmp_path):
+        """Test that the log is folded into the snapshot."""
+        import os
+        from openstackai.orchestrator import StateJournal
+        
+        path = str(tmp_path / "state.json")
+        journal = StateJournal(path, batch_size=5, compact_every=10)
+        for i in range(25):
+            journal.append({"id": f"t{i % 12}", "status": "completed", "n": i})
+        journal.close()
+        
+        assert os.path.exists(path)
+        with open(journal.log_path) as f:
+            assert len(f.readlines()) < 10
+        tasks = StateJournal(path).replay()["tasks"]
+        assert len(tasks) == 12
+        assert tasks["t0"]["n"] == 24
+    
+    def test_orchestrator_journals_tasks(self, tmp_path):
+        """Test that task transitions are journaled and snapshots compact."""
+        import operator
+        from openstackai.orchestrator import Orchestrator, StateJournal
+        
+        path = str(tmp_path / "state.json")
+        orch = Orchestrator(state_file=path)
+        task = orch.submit(operator.add, 2, 3)
+        orch.wait(task, timeout=5)
+        orch._save_state()
+        orch.shutdown()
+        
+        with open(f"{path}.journal") as f:
+            assert f.read() == ""
+        record = StateJournal(path).replay()["tasks"][task.id]
+        assert record["status"] == "completed"
+        assert record["func"] == "_operator:add"
+    
+    def test_resume_after_crash(self, tmp_path):
+        """Test that unfinished tasks are resumed from the journal."""
+        import operator
+        from openstackai.orchestrator import Orchestrator, StateJournal, Task, TaskStatus
+        
+        path = str(tmp_path / "state.json")
+        journal = StateJournal(path)
+        result = {"summary": "x" * 200, "scores": [1, 2]}
+        done = Task(id="done", name="done", status=TaskStatus.COMPLETED, result=result)
+        pending = Task(id="pending", name="add", func=operator.add, args=(2, 3))
+        child = Task(
+            id="child",
+            name="neg",
+            func=operator.neg,
+            args=(1,),
+            dependencies=["pending"],
+            status=TaskStatus.RETRYING,
+            retry_count=1,
+        )
+        closure = Task(id="closure", name="closure", func=lambda: None)
+        for task in (done, pending, child, closure):
+            journal.append(task.to_record())
+        journal.close()
+        
+        orch = Orchestrator(state_file=path)
+        resumed = orch.get_task("pending")
+        assert orch.wait(resumed, timeout=5) == 5
+        assert orch.wait(orch.get_task("child"), timeout=5) == -1
+        assert orch.get_task("child").retry_count == 1
+        assert orch.get_task("done").status == TaskStatus.COMPLETED
+        assert orch.wait(orch.get_task("done"), timeout=5) == result
+        assert orch.get_task("closure").status == TaskStatus.FAILED
+        orch.shutdown()
+        
+        tasks = StateJournal(path).replay()["tasks"]
+        assert tasks["pending"]["status"] == "completed"
+        assert tasks["closure"]["status"] == "failed"
+
+
 class TestAgentPatterns:
     """Tests for AgentPatterns class."""
     
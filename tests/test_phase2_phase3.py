@@ -120,6 +120,101 @@ class TestToolWatcher:
         assert watcher is not None
         assert hasattr(watcher, 'start')
         assert hasattr(watcher, 'stop')
+    
+    @staticmethod
+    def _tools_source(**bodies):
+        return "".join(
+            f'def {name}(a, b):\n    "{name.title()} two numbers."\n    return {body}\n\n'
+            for name, body in bodies.items()
+        )
+    
+    def test_reload_reports_diff(self, tmp_path):
+        from openstackai.tools import ToolDiscovery
+        
+        source = tmp_path / "math_tools.py"
+        source.write_text(self._tools_source(add="a + b", sub="a - b"))
+        discovery = ToolDiscovery()
+        diff = discovery.load_file(source)
+        assert sorted(t.name for t in diff.added) == ["add", "sub"]
+        add_tool = discovery.get_tool("add")
+        
+        source.write_text(self._tools_source(add="a + b", sub="b - a", mul="a * b"))
+        diff = discovery.load_file(source)
+        assert [t.name for t in diff.added] == ["mul"]
+        assert [t.name for t in diff.changed] == ["sub"]
+        # Unchanged tools still come from the new execution
+        assert discovery.get_tool("add") is not add_tool
+        
+        source.write_text(self._tools_source(mul="a * b"))
+        assert sorted(discovery.load_file(source).removed) == ["add", "sub"]
+        
+        assert discovery.unload_file(source).removed == ["mul"]
+        assert discovery.list_tools() == []
+    
+    def test_reload_picks_up_module_globals(self, tmp_path):
+        from openstackai.tools import ToolDiscovery
+        
+        def greeting(prefix):
+            return (
+                f'PREFIX = "{prefix}"\n\n\n'
+                'def greet(name):\n    "Greet someone."\n    return f"{PREFIX}, {name}"\n'
+            )
+        
+        source = tmp_path / "greetings.py"
+        source.write_text(greeting("Hello"))
+        discovery = ToolDiscovery()
+        discovery.load_file(source)
+        assert discovery.get_tool("greet").func("Bob") == "Hello, Bob"
+        
+        source.write_text(greeting("Hi"))
+        diff = discovery.load_file(source)
+        assert [t.name for t in diff.changed] == ["greet"]
+        assert discovery.get_tool("greet").func("Bob") == "Hi, Bob"
+    
+    def _exercise_watcher(self, tmp_path, backend):
+        import queue
+        from openstackai.tools import ToolWatcher
+        
+        (tmp_path / "a.py").write_text(self._tools_source(ping="1"))
+        diffs = queue.Queue()
+        watcher = ToolWatcher(
+            tmp_path, poll_interval=0.05, on_diff=diffs.put, backend=backend, debounce=0.05
+        )
+        watcher.start()
+        try:
+            assert watcher.active_backend == backend
+            assert [t.name for t in watcher.tools] == ["ping"]
+            
+            (tmp_path / "sub").mkdir()
+            (tmp_path / "sub" / "b.py").write_text(self._tools_source(pong="2"))
+            assert [t.name for t in diffs.get(timeout=5).added] == ["pong"]
+            
+            # Rewriting identical content is not a change
+            (tmp_path / "a.py").write_text(self._tools_source(ping="1"))
+            os.utime(tmp_path / "a.py", ns=(0, 0))
+            (tmp_path / "a.py").write_text(self._tools_source(ping="10"))
+            diff = diffs.get(timeout=5)
+            assert [t.name for t in diff.changed] == ["ping"]
+            assert not diff.added and not diff.removed
+            
+            (tmp_path / "sub" / "b.py").unlink()
+            assert diffs.get(timeout=5).removed == ["pong"]
+            assert [t.name for t in watcher.tools] == ["ping"]
+            time.sleep(0.2)
+            assert diffs.empty()
+        finally:
+            watcher.stop()
+        assert not watcher.is_running
+    
+    def test_poll_backend(self, tmp_path):
+        self._exercise_watcher(tmp_path, "poll")
+    
+    def test_inotify_backend(self, tmp_path):
+        from openstackai.tools.inotify import inotify_available
+        
+        if not inotify_available():
+            pytest.skip("inotify not available")
+        self._exercise_watcher(tmp_path, "inotify")
 
 
 # =============================================================================
@@ -193,6 +288,308 @@ class TestContextCache:
         assert stats["hits"] == 1
         assert stats["misses"] == 1
 
+    def test_cache_lru_eviction(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache(max_entries=2, policy="lru")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.has("a") and cache.has("c")
+        assert not cache.has("b")
+        assert cache.stats["evictions"] == 1
+
+    def test_cache_lfu_eviction(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache(max_entries=2, policy="lfu")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        for _ in range(3):
+            cache.get("b")
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert not cache.has("a")
+        assert cache.has("b") and cache.has("c")
+
+    def test_cache_tinylfu_admission(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache(max_entries=2, policy="tinylfu")
+        for key in ("a", "b"):
+            cache.set(key, key)
+            cache.get(key)
+
+        cache.set("one_off", "x")
+        assert not cache.has("one_off")
+        assert cache.stats["rejections"] == 1
+
+        for _ in range(3):
+            cache.get("popular")
+        cache.set("popular", "y")
+        assert cache.has("popular")
+
+    def test_cache_gdsf_prefers_evicting_large_entries(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache(max_tokens=120, policy="gdsf")
+        cache.set("small", "s", tokens=10)
+        cache.set("large", "l", tokens=100)
+        cache.set("new", "n", tokens=20)
+
+        assert cache.has("small") and cache.has("new")
+        assert not cache.has("large")
+        assert cache.stats["policy"]["name"] == "gdsf"
+
+    def test_cache_token_limit_evicts_until_fit(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache(max_tokens=100)
+        for i in range(10):
+            cache.set(f"k{i}", i, tokens=10)
+        cache.set("big", "x", tokens=55)
+
+        assert cache.stats["total_tokens"] <= 100
+        assert cache.stats["evictions"] == 6
+
+    def test_cache_sweeps_expired_entries(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache(ttl=0.01)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+        time.sleep(0.02)
+
+        assert cache.purge_expired() == 5
+        assert cache.stats["entries"] == 0
+        assert cache.stats["expirations"] == 5
+
+    def test_cache_unknown_policy(self):
+        from openstackai.core.cache import ContextCache
+
+        with pytest.raises(ValueError):
+            ContextCache(policy="random")
+
+    def test_cache_decorator_caches_falsy_results(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache()
+        calls = []
+
+        @cache.cached
+        def empty():
+            calls.append(1)
+            return []
+
+        assert empty() == []
+        assert empty() == []
+        assert len(calls) == 1
+
+    def test_cache_decorator_coalesces_threads(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache()
+        calls = []
+        results = []
+
+        @cache.cached
+        def slow_load():
+            calls.append(1)
+            time.sleep(0.05)
+            return "loaded"
+
+        threads = [threading.Thread(target=lambda: results.append(slow_load())) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["loaded"] * 10
+        assert len(calls) == 1
+        assert cache.stats["coalesced"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_cache_decorator_coalesces_tasks(self):
+        import asyncio
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache()
+        calls = []
+
+        @cache.cached
+        async def retrieve(query):
+            calls.append(query)
+            await asyncio.sleep(0.01)
+            return query.upper()
+
+        results = await asyncio.gather(*(retrieve("q") for _ in range(20)))
+        other = await retrieve("other")
+
+        assert results == ["Q"] * 20
+        assert calls == ["q", "other"]
+        assert other == "OTHER"
+
+    @pytest.mark.asyncio
+    async def test_cache_decorator_leader_cancellation(self):
+        import asyncio
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache()
+        calls = []
+
+        @cache.cached
+        async def retrieve(query):
+            calls.append(query)
+            await asyncio.sleep(0.05)
+            return query.upper()
+
+        leader = asyncio.ensure_future(retrieve("q"))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(retrieve("q")) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await asyncio.gather(*followers) == ["Q"] * 5
+        assert leader.cancelled()
+        assert calls == ["q", "q"]
+
+    def test_cache_decorator_negative_caching(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache()
+        calls = []
+
+        @cache.cached(negative_ttl=10)
+        def failing():
+            calls.append(1)
+            raise RuntimeError("backend down")
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                failing()
+        assert len(calls) == 1
+
+    def test_cache_decorator_stale_while_revalidate(self):
+        from openstackai.core.cache import ContextCache
+
+        cache = ContextCache()
+        version = [0]
+
+        @cache.cached(ttl=0.02, stale_ttl=10)
+        def config():
+            version[0] += 1
+            return version[0]
+
+        assert config() == 1
+        time.sleep(0.03)
+        assert config() == 1  # stale value served, refresh scheduled
+
+        deadline = time.time() + 1
+        while config() != 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert config() == 2
+        assert cache.stats["stale_hits"] >= 1
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        from openstackai.core.disk_cache import DiskCache
+
+        disk = DiskCache(str(tmp_path), inline_threshold=64, allow_pickle=True)
+        disk.set("text", "hello")
+        disk.set("json", {"a": [1, 2]})
+        disk.set("tuple", (1, "x"))
+        disk.set("big", "y" * 10_000)
+
+        assert disk.get("text") == "hello"
+        assert disk.get("json") == {"a": [1, 2]}
+        assert disk.get("tuple") == (1, "x")
+        assert disk.get("missing", "default") == "default"
+
+        with disk.get_mapped("big") as mapped:
+            assert len(mapped) == 10_000
+            assert mapped.text() == "y" * 10_000
+        disk.close()
+
+    def test_disk_cache_pickle_is_opt_in(self, tmp_path):
+        from openstackai.core.cache import ContextCache
+        from openstackai.core.disk_cache import DiskCache
+
+        DiskCache(str(tmp_path), allow_pickle=True).set("tuple", (1, "x"))
+
+        disk = DiskCache(str(tmp_path))
+        with pytest.raises(TypeError):
+            disk.set("set", {1, 2})
+        assert disk.get("tuple") is None  # pickled by another cache: not loaded
+
+        cache = ContextCache(ttl=60, disk=disk)
+        cache.set("set", {1, 2})
+        assert cache.get("set") == {1, 2}
+        assert not disk.has("set")
+        disk.close()
+
+    def test_disk_cache_batches_access_times(self, tmp_path):
+        from openstackai.core.disk_cache import DiskCache
+
+        disk = DiskCache(str(tmp_path), max_size=50_000, inline_threshold=64, touch_interval=60)
+        disk.set("a", "a" * 20_000)
+        disk.set("b", "b" * 20_000)
+
+        def accessed_at(key):
+            return disk._get_connection().execute(
+                "SELECT accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()[0]
+
+        before = accessed_at("a")
+        time.sleep(0.01)
+        assert disk.get("a") == "a" * 20_000
+        assert accessed_at("a") == before  # buffered, not written per read
+
+        # The next write applies pending reads before evicting, so "b" goes
+        disk.set("c", "c" * 20_000)
+        assert disk.has("a")
+        assert not disk.has("b")
+        assert accessed_at("a") > before
+        disk.close()
+
+    def test_disk_cache_dedup_expiry_and_eviction(self, tmp_path):
+        from openstackai.core.disk_cache import DiskCache
+
+        disk = DiskCache(str(tmp_path), max_size=50_000, inline_threshold=64)
+        blob = "z" * 20_000
+        assert disk.set("a", blob) == disk.set("b", blob)
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # one shard dir, one file
+
+        disk.set("short", "gone", ttl=0.01)
+        time.sleep(0.02)
+        assert not disk.has("short")
+        assert disk.purge_expired() == 1
+        assert disk.get("short") is None
+
+        disk.set("c", "w" * 20_000)
+        disk.set("d", "v" * 20_000)
+        assert disk.size <= 50_000
+        assert disk.get("d") == "v" * 20_000
+        disk.close()
+
+    def test_cache_disk_tier_persists(self, tmp_path):
+        from openstackai.core.cache import ContextCache
+        from openstackai.core.disk_cache import DiskCache
+
+        first = ContextCache(ttl=60, disk=DiskCache(str(tmp_path)))
+        first.set("prompt", "You are helpful", tokens=4)
+
+        second = ContextCache(ttl=60, disk=DiskCache(str(tmp_path)))
+        assert second.has("prompt")
+        assert second.get("prompt") == "You are helpful"
+        assert second.stats["disk_hits"] == 1
+        assert second.get("prompt") == "You are helpful"  # promoted to memory
+        assert second.stats["hits"] == 1
+
+        assert second.delete("prompt") is True
+        assert first.disk.get("prompt") is None
+
 
 # =============================================================================
 # SESSION REWIND TESTS
@@ -376,6 +773,10 @@ class TestMultimodalContent:
 class TestMemoryVectorStore:
     """Test in-memory vector store."""
     
+    @pytest.fixture
+    def embedding(self, keyword_embedding):
+        return keyword_embedding("python", "cats", "dogs", "code")
+    
     def test_import_memory_store(self):
         from openstackai.vectordb import MemoryVectorStore
         assert MemoryVectorStore is not None
@@ -421,6 +822,264 @@ class TestMemoryVectorStore:
         assert store.count() == 2
         assert len(store) == 2
 
+    def test_vector_search_top_k(self, embedding):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore(embedding_function=embedding)
+        store.add("doc1", "python code")
+        store.add("doc2", "cats and dogs")
+        store.add("doc3", "python snakes")
+
+        results = store.search("python", k=2)
+        assert [r.id for r in results][0] in ("doc1", "doc3")
+        assert {r.id for r in results} == {"doc1", "doc3"}
+        assert results[0].score >= results[1].score
+
+    def test_vector_search_after_delete_and_compaction(self, embedding):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore(embedding_function=embedding, initial_capacity=2)
+        for i in range(20):
+            store.add(f"doc{i}", "python" if i % 2 else "cats")
+        for i in range(0, 20, 2):
+            store.delete(f"doc{i}")
+
+        results = store.search("cats", k=20)
+        assert len(results) == 10
+        assert all(int(r.id[3:]) % 2 == 1 for r in results)
+
+    def test_search_batch(self, embedding):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore(embedding_function=embedding)
+        store.add("doc1", "python code")
+        store.add("doc2", "cats and dogs")
+
+        results = store.search_batch(["python", "cats"], k=1)
+        assert [r[0].id for r in results] == ["doc1", "doc2"]
+
+    def test_search_batch_uses_query_encoder(self, embedding):
+        from openstackai.vectordb import MemoryVectorStore
+        from openstackai.vectordb.base import EmbeddingFunction
+
+        class AsymmetricEmbedding(EmbeddingFunction):
+            """Queries are encoded into the opposite keyword."""
+
+            def embed(self, texts):
+                return embedding.embed(texts)
+
+            def embed_query(self, query):
+                return self.embed(["cats" if "python" in query else "python"])[0]
+
+        store = MemoryVectorStore(embedding_function=AsymmetricEmbedding())
+        store.add("doc1", "python code")
+        store.add("doc2", "cats and dogs")
+
+        batch = store.search_batch(["python", "cats"], k=1)
+        single = [store.search(q, k=1) for q in ["python", "cats"]]
+        assert [r[0].id for r in batch] == [r[0].id for r in single] == ["doc2", "doc1"]
+
+    def test_list_index_fallback(self, embedding, monkeypatch):
+        from openstackai.vectordb import memory
+
+        monkeypatch.setattr(memory, "NUMPY_AVAILABLE", False)
+        store = memory.MemoryVectorStore(embedding_function=embedding)
+        store.add("doc1", "python code", {"lang": "en"})
+        store.add("doc2", "cats and dogs", {"lang": "en"})
+
+        assert isinstance(store._index, memory._ListIndex)
+        assert store.search("cats", k=1)[0].id == "doc2"
+        assert store.search("cats", k=5, filter={"lang": "fr"}) == []
+
+    def test_text_search_bm25_ranking(self):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore()
+        store.add("doc1", "python python python guide")
+        store.add("doc2", "a python mention in a much longer text about other topics")
+        store.add("doc3", "cats are animals")
+
+        results = store.search("python", k=5)
+        assert [r.id for r in results] == ["doc1", "doc2"]
+        assert results[0].score > results[1].score > 0
+
+    def test_text_index_tracks_updates_and_deletes(self):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore()
+        store.add("doc1", "python code")
+        store.add("doc2", "rust code")
+        store.add("doc1", "cats and dogs")
+        store.delete("doc2")
+
+        assert store.search("python") == []
+        assert store.search("code") == []
+        assert [r.id for r in store.search("dogs")] == ["doc1"]
+
+        store.clear()
+        assert store.search("dogs") == []
+
+    def test_text_search_match_all_terms(self):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore(match_all_terms=True)
+        store.add("doc1", "python code review")
+        store.add("doc2", "python snakes")
+        store.add("doc3", "code review checklist")
+
+        assert [r.id for r in store.search("python code")] == ["doc1"]
+        assert store.search("python missing") == []
+
+    def test_metadata_filter_operators(self):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore()
+        store.add("doc1", "report", {"tenant": "acme", "year": 2023})
+        store.add("doc2", "report", {"tenant": "acme", "year": 2025})
+        store.add("doc3", "report", {"tenant": "globex", "year": 2024})
+        store.add("doc4", "report", {"year": 2022})
+
+        def ids(filter):
+            return sorted(r.id for r in store.search("report", k=10, filter=filter))
+
+        assert ids({"tenant": "acme"}) == ["doc1", "doc2"]
+        assert ids({"tenant": {"$ne": "acme"}}) == ["doc3"]
+        assert ids({"tenant": {"$in": ["globex", "initech"]}}) == ["doc3"]
+        assert ids({"year": {"$gte": 2024}}) == ["doc2", "doc3"]
+        assert ids({"tenant": "acme", "year": {"$lt": 2024}}) == ["doc1"]
+        assert ids({"$or": [{"tenant": "globex"}, {"year": 2022}]}) == ["doc3", "doc4"]
+
+    def test_metadata_index_updates_and_unhashable_fields(self, embedding):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore(embedding_function=embedding)
+        store.add("doc1", "python", {"tenant": "acme", "tags": ["a", "b"]})
+        store.add("doc2", "python", {"tenant": "acme", "tags": ["c"]})
+        store.add("doc1", "python", {"tenant": "globex", "tags": ["a", "b"]})
+        store.delete("doc2")
+
+        assert store.search("python", filter={"tenant": "acme"}) == []
+        assert [r.id for r in store.search("python", filter={"tenant": "globex"})] == ["doc1"]
+        assert [r.id for r in store.search("python", filter={"tags": ["a", "b"]})] == ["doc1"]
+
+    def test_registered_indexed_fields(self):
+        from openstackai.vectordb import MemoryVectorStore
+
+        store = MemoryVectorStore(indexed_fields=["tenant"])
+        store.add("doc1", "report", {"tenant": "acme", "region": "eu"})
+        store.add("doc2", "report", {"tenant": "acme", "region": "us"})
+
+        assert store._metadata_index.fields == ["tenant"]
+        assert [r.id for r in store.search("report", filter={"region": "us"})] == ["doc2"]
+
+        store.create_index("region")
+        assert store._metadata_index.fields == ["region", "tenant"]
+        assert [r.id for r in store.search("report", filter={"region": "eu"})] == ["doc1"]
+
+    def test_filter_grammar(self):
+        from openstackai.vectordb import matches_filter, normalize_filter
+
+        assert normalize_filter({"a": 1, "b": {"$gt": 2}}) == {
+            "$and": [{"a": {"$eq": 1}}, {"b": {"$gt": 2}}]
+        }
+        assert normalize_filter({}) is None
+        assert matches_filter({"a": 1}, {"$or": [{"a": 2}, {"a": {"$lte": 1}}]})
+        assert not matches_filter({"a": "x"}, {"a": {"$gt": 1}})
+        assert not matches_filter({}, {"a": {"$ne": 1}})
+        with pytest.raises(ValueError):
+            normalize_filter({"a": {"$regex": "x"}})
+
+    def test_qdrant_negation_requires_field(self):
+        pytest.importorskip("qdrant_client")
+        from qdrant_client.models import IsEmptyCondition
+
+        from openstackai.vectordb import QdrantStore, normalize_filter
+
+        store = QdrantStore.__new__(QdrantStore)
+        for filter in ({"a": {"$ne": 1}}, {"a": {"$nin": [1, 2]}}):
+            built = store._build_filter(normalize_filter(filter))
+            assert len(built.must_not) == 1
+            (present,) = built.must
+            assert isinstance(present.must_not[0], IsEmptyCondition)
+            assert present.must_not[0].is_empty.key == "a"
+
+
+class TestIVFStore:
+    """Test IVF approximate nearest-neighbour store."""
+
+    @pytest.fixture
+    def vectors(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(8, 16))
+        return (centers[np.arange(400) % 8] + 0.1 * rng.normal(size=(400, 16))).tolist()
+
+    def test_exact_before_training(self, vectors):
+        from openstackai.vectordb import IVFStore
+
+        store = IVFStore(n_lists=8)
+        for i, vec in enumerate(vectors[:50]):
+            store.add(f"doc{i}", f"text {i}", embedding=vec)
+
+        assert not store.is_trained
+        assert store.search_by_vector(vectors[7], k=1)[0].id == "doc7"
+
+    def test_trains_automatically_and_searches(self, vectors):
+        from openstackai.vectordb import IVFStore
+
+        store = IVFStore(n_lists=8, nprobe=2, train_size=200)
+        for i, vec in enumerate(vectors):
+            store.add(f"doc{i}", f"text {i}", {"group": i % 8}, embedding=vec)
+
+        assert store.is_trained
+        results = store.search_by_vector(vectors[3], k=5)
+        assert results[0].id == "doc3"
+        assert all(int(r.id[3:]) % 8 == 3 for r in results)
+
+        filtered = store.search_by_vector(vectors[3], k=5, filter={"group": 4})
+        assert filtered and all(r.metadata["group"] == 4 for r in filtered)
+
+    def test_delete_and_update(self, vectors):
+        from openstackai.vectordb import IVFStore
+
+        store = IVFStore(n_lists=8, nprobe=8, train_size=100)
+        for i, vec in enumerate(vectors[:100]):
+            store.add(f"doc{i}", f"text {i}", embedding=vec)
+
+        assert store.delete("doc3") is True
+        assert store.delete("doc3") is False
+        assert store.search_by_vector(vectors[3], k=1)[0].id != "doc3"
+
+        store.add("doc5", "moved", embedding=vectors[3])
+        assert store.search_by_vector(vectors[3], k=1)[0].id == "doc5"
+        assert store.count() == 99
+
+    def test_save_and_load_mmap(self, vectors, tmp_path):
+        from openstackai.vectordb import IVFStore
+
+        store = IVFStore(n_lists=8, nprobe=3, train_size=100)
+        for i, vec in enumerate(vectors):
+            store.add(f"doc{i}", f"text {i}", {"group": i % 8}, embedding=vec)
+        store.save(str(tmp_path / "index"))
+
+        loaded = IVFStore.load(str(tmp_path / "index"))
+        assert loaded.count() == store.count()
+        assert loaded.nprobe == 3
+        expected = [r.id for r in store.search_by_vector(vectors[10], k=5)]
+        assert [r.id for r in loaded.search_by_vector(vectors[10], k=5)] == expected
+
+        loaded.add("new", "new doc", embedding=vectors[10])
+        assert loaded.get("new") is not None
+        assert loaded.search_by_vector(vectors[10], k=1, filter={"group": 2})[0].id == "doc10"
+
+    def test_search_requires_embedding_function(self, vectors):
+        from openstackai.vectordb import IVFStore
+
+        store = IVFStore()
+        store.add("doc1", "text", embedding=vectors[0])
+        with pytest.raises(ValueError):
+            store.search("text")
+
 
 class TestDocument:
     """Test Document class."""
@@ -311,6 +311,77 @@ class TestSQLiteSessionStore:
         store.delete("user-123")
         assert store.load("user-123") is None
 
+    def test_incremental_save_appends_only_new_messages(self):
+        """Test that a save only inserts messages added since the last save."""
+        from openstackai.sessions.sqlite import SQLiteSessionStore
+        from openstackai.sessions.base import Session
+
+        store = SQLiteSessionStore(":memory:")
+        session = Session(id="long")
+        for i in range(50):
+            session.add_user_message(f"message {i}")
+        store.save(session)
+
+        statements = []
+        store._get_connection().set_trace_callback(statements.append)
+        session.add_assistant_message("reply")
+        store.save(session)
+        store._get_connection().set_trace_callback(None)
+
+        inserts = [s for s in statements if "INSERT INTO messages" in s]
+        assert len(inserts) == 1
+        loaded = store.load("long")
+        assert len(loaded.messages) == 51
+        assert loaded.messages[-1].content == "reply"
+
+    def test_save_takes_write_lock_before_reading(self):
+        """Test that save reads its sync state inside an immediate transaction."""
+        from openstackai.sessions.sqlite import SQLiteSessionStore
+        from openstackai.sessions.base import Session
+
+        store = SQLiteSessionStore(":memory:")
+        session = Session(id="locked")
+        session.add_user_message("hello")
+
+        statements = []
+        store._get_connection().set_trace_callback(statements.append)
+        store.save(session)
+        store._get_connection().set_trace_callback(None)
+
+        assert statements[0] == "BEGIN IMMEDIATE"
+        assert "SELECT message_count" in statements[1]
+        assert not store._get_connection().in_transaction
+
+    def test_incremental_save_applies_rewinds(self):
+        """Test that rewinds and replaced histories are persisted correctly."""
+        from openstackai.sessions.sqlite import SQLiteSessionStore
+        from openstackai.sessions.base import Session
+
+        store = SQLiteSessionStore(":memory:")
+        session = Session(id="rewind")
+        for i in range(5):
+            session.add_user_message(f"message {i}")
+        store.save(session)
+
+        session.rewind_n_messages(3)
+        session.add_user_message("new 2")
+        store.save(session)
+        assert [m.content for m in store.load("rewind").messages] == [
+            "message 0", "message 1", "new 2"
+        ]
+
+        # A reloaded copy that was edited out of band is still saved exactly
+        other = store.load("rewind")
+        other.messages = other.messages[:1]
+        store.save(other)
+        assert [m.content for m in store.load("rewind").messages] == ["message 0"]
+
+        # Edits in place are saved once flagged
+        other.messages[0].content = "edited"
+        other.mark_dirty(0)
+        store.save(other)
+        assert store.load("rewind").messages[0].content == "edited"
+
 
 class TestRedisSessionStore:
     """Tests for Redis session store (mocked)."""
@@ -334,6 +405,159 @@ class TestRedisSessionStore:
         
         assert store.prefix == "openstackai:"
 
+    def _store(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        from openstackai.sessions.redis import RedisSessionStore
+
+        store = RedisSessionStore(prefix="test:")
+        store._client = fakeredis.FakeRedis(decode_responses=True)
+        return store
+
+    def test_append_pushes_only_new_messages(self):
+        """Saving after an append RPUSHes the new message instead of rewriting."""
+        from openstackai.sessions import Session
+
+        store = self._store()
+        session = Session(id="s1")
+        session.add_message("user", "one")
+        store.save(session)
+        first = store._client.lindex("test:s1:messages", 0)
+
+        session.add_message("assistant", "two")
+        store.save(session)
+
+        assert store._client.llen("test:s1:messages") == 2
+        assert store._client.lindex("test:s1:messages", 0) == first
+        assert store._client.hget("test:s1", "message_count") == "2"
+
+    def test_rewind_trims_list(self):
+        from openstackai.sessions import Session
+
+        store = self._store()
+        session = Session(id="s1")
+        for i in range(4):
+            session.add_message("user", f"m{i}")
+        store.save(session)
+
+        session.rewind_n_messages(2)
+        session.add_message("user", "new")
+        store.save(session)
+
+        contents = [m.content for m in store.load("s1").messages]
+        assert contents == ["m0", "m1", "new"]
+
+    def test_delete_cleans_indexes(self):
+        from openstackai.sessions import Session
+
+        store = self._store()
+        store.save(Session(id="s1", user_id="u1", agent_id="a1"))
+        assert store.delete("s1")
+
+        assert store._client.zcard("test:index:updated") == 0
+        assert store._client.zcard("test:index:user:u1") == 0
+        assert store._client.zcard("test:index:agent:a1") == 0
+        assert not store.delete("s1")
+
+    def test_migrate_blob_sessions(self):
+        from openstackai.sessions import Session
+
+        store = self._store()
+        legacy = Session(id="old", user_id="u1")
+        legacy.add_message("user", "hello")
+        store._client.set("test:old", legacy.to_json())
+        store._client.sadd("test:index:user:u1", "old")
+
+        assert store.migrate() == 1
+        loaded = store.load("old")
+        assert loaded.messages[0].content == "hello"
+        assert [s.id for s in store.list_sessions(user_id="u1")] == ["old"]
+
+    def test_shared_connection_pool(self):
+        pytest.importorskip("redis")
+        from openstackai.sessions.redis import RedisSessionStore
+
+        first = RedisSessionStore(host="pool-test", port=6390)
+        second = RedisSessionStore(host="pool-test", port=6390)
+        other = RedisSessionStore(host="pool-test", port=6391)
+
+        pool = first._get_client().connection_pool
+        assert second._get_client().connection_pool is pool
+        assert other._get_client().connection_pool is not pool
+
+
+def _make_store(kind):
+    """Build a session store backend for parametrized tests."""
+    if kind == "memory":
+        from openstackai.sessions.memory import MemorySessionStore
+        return MemorySessionStore()
+    if kind == "sqlite":
+        from openstackai.sessions.sqlite import SQLiteSessionStore
+        return SQLiteSessionStore(":memory:")
+    fakeredis = pytest.importorskip("fakeredis")
+    from openstackai.sessions.redis import RedisSessionStore
+    store = RedisSessionStore(prefix="test:")
+    store._client = fakeredis.FakeRedis(decode_responses=True)
+    return store
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite", "redis"])
+class TestSessionProjections:
+    """Tests for metadata listing, message windows and lazy iteration."""
+
+    def _populate(self, store):
+        from datetime import datetime, timedelta
+        from openstackai.sessions.base import Session
+
+        base = datetime(2026, 1, 1)
+        for i in range(5):
+            session = Session(id=f"s{i}", user_id="u1" if i % 2 else "u2")
+            for j in range(i * 10):
+                session.add_user_message(f"{i}-{j}")
+            session.updated_at = base + timedelta(minutes=i)
+            store.save(session)
+
+    def test_list_session_info_paginates(self, kind):
+        store = _make_store(kind)
+        self._populate(store)
+
+        first = store.list_session_info(limit=2)
+        assert [info.id for info in first] == ["s4", "s3"]
+        assert first[0].message_count == 40
+
+        rest = store.list_session_info(limit=10, after=first[-1])
+        assert [info.id for info in rest] == ["s2", "s1", "s0"]
+        assert [i.id for i in store.list_session_info(user_id="u1")] == ["s3", "s1"]
+
+    def test_load_last_n_and_save_back(self, kind):
+        store = _make_store(kind)
+        self._populate(store)
+
+        window = store.load("s3", last_n=5)
+        assert [m.content for m in window.messages] == [f"3-{j}" for j in range(25, 30)]
+        assert window.message_offset == 25
+
+        window.rewind_n_messages(2)
+        window.add_user_message("new")
+        store.save(window)
+
+        messages = store.load_messages("s3")
+        assert len(messages) == 29
+        assert messages[0].content == "3-0"
+        assert messages[-1].content == "new"
+
+    def test_load_messages_and_iterate(self, kind):
+        store = _make_store(kind)
+        self._populate(store)
+
+        assert [m.content for m in store.load_messages("s2", -3)] == ["2-17", "2-18", "2-19"]
+        assert [m.content for m in store.load_messages("s2", 5, 7)] == ["2-5", "2-6"]
+
+        contents = [m.content for m in store.iter_messages("s4", batch_size=7)]
+        assert contents == [f"4-{j}" for j in range(40)]
+        newest = next(iter(store.iter_messages("s4", batch_size=7, reverse=True)))
+        assert newest.content == "4-39"
+        assert list(store.iter_messages("missing")) == []
+
 
 class TestSessionManager:
     """Tests for SessionManager."""
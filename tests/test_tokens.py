@@ -142,6 +142,87 @@ class TestCountTokensFunction:
         # Should be at least 1 (minimum)
         assert tokens >= 0
 
+    def test_count_tokens_reuses_counter(self):
+        """Test count_tokens shares one counter per model."""
+        from openstackai.tokens import get_counter
+
+        assert get_counter("gpt-4") is get_counter("gpt-4")
+        assert get_counter("gpt-4") is not get_counter("claude-3-opus")
+
+
+class TestBatchAndIncrementalCounting:
+    """Tests for batched, cached and incremental counting."""
+
+    def test_count_batch_matches_count(self):
+        """Test count_batch agrees with per-text counting."""
+        from openstackai.tokens import TokenCounter
+
+        counter = TokenCounter("gpt-4")
+        texts = ["short", "x" * 200, "y" * 500, "x" * 200]
+
+        expected = [counter.count(t).input_tokens for t in texts]
+        assert counter.count_batch(texts) == expected
+        assert counter.count_batch(texts, max_workers=2) == expected
+
+    def test_count_batch_uses_batch_encoder(self):
+        """Test count_batch encodes misses in one encode_batch call by default."""
+        from openstackai.tokens import TokenCounter
+
+        class BatchEncoder:
+            def __init__(self):
+                self.batches = []
+
+            def encode(self, text):
+                raise AssertionError("encoded one text at a time")
+
+            def encode_batch(self, texts, num_threads=8):
+                self.batches.append(list(texts))
+                return [text.split() for text in texts]
+
+        counter = TokenCounter("gpt-4")
+        counter._encoder = BatchEncoder()
+        counter._encoding_name = "fake-batch"
+
+        assert counter.count_batch(["a b", "c d e", "f"]) == [2, 3, 1]
+        assert counter._encoder.batches == [["a b", "c d e", "f"]]
+
+    def test_count_cache_hits(self):
+        """Test repeated long texts are served from the count cache."""
+        from openstackai.tokens import counter as counter_module
+
+        counter = counter_module.TokenCounter("gpt-4")
+        text = "cache me " * 50
+        counter.count_text(text)
+        hits = counter_module._COUNT_CACHE.hits
+        counter.count_text(text)
+        assert counter_module._COUNT_CACHE.hits == hits + 1
+
+    def test_conversation_counter_is_incremental(self):
+        """Test the tally only counts new messages and matches count_messages."""
+        from openstackai.tokens import ConversationTokenCounter, TokenCounter
+
+        counter = TokenCounter("gpt-4")
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "Hello!"},
+        ]
+        tally = ConversationTokenCounter(counter)
+        tally.update(messages)
+        assert len(tally) == 2
+
+        messages.append({"role": "assistant", "content": "Hi there, how can I help?"})
+        tally.update(messages)
+        assert len(tally) == 3
+        assert tally.total == counter.count_messages(messages).input_tokens
+
+        # A rewritten history is recounted from scratch
+        rewritten = [{"role": "user", "content": "Different start"}]
+        tally.update(rewritten)
+        assert tally.total == counter.count_messages(rewritten).input_tokens
+
+        tally.pop()
+        assert tally.total == 0
+
 
 class TestEstimateTokensFunction:
     """Tests for estimate_tokens utility function."""